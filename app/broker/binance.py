@@ -16,6 +16,7 @@ import httpx
 from .base import Broker, CancelAllResult
 from .. import ledger
 from ..metrics.observability import record_order_error
+from ..net import get_transport
 from ..secrets_store import get_secrets_store
 
 
@@ -177,13 +178,14 @@ class _BaseBinanceBroker(Broker):
             params.setdefault("recvWindow", _DEFAULT_RECV_WINDOW)
             params["timestamp"] = _timestamp_ms()
             self._sign(params)
-        async with httpx.AsyncClient(base_url=self.base_url, timeout=_HTTP_TIMEOUT) as client:
-            response = await client.request(
-                method,
-                path,
-                params=params,
-                headers=self._headers(),
-            )
+        client = get_transport().client(self.venue, base_url=self.base_url)
+        response = await client.arequest(
+            method,
+            path,
+            params=params,
+            headers=self._headers(),
+            timeout=_HTTP_TIMEOUT,
+        )
         response.raise_for_status()
         return response.json()
 
@@ -417,6 +419,8 @@ class _BaseBinanceBroker(Broker):
         )
         payload["exchange_order_id"] = response.get("orderId")
         payload["status"] = status
+        if response.get("executedQty") is not None:
+            payload["filled_qty"] = float(response["executedQty"])
         return payload
 
     async def cancel(self, *, venue: str, order_id: int) -> None:
@@ -5,6 +5,8 @@ import hashlib
 import inspect
 import json
 import logging
+import os
+import time
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Dict, Iterable, List, Mapping, Sequence
 
@@ -14,8 +16,18 @@ from .paper import PaperBroker
 from .testnet import TestnetBroker
 from .. import ledger, risk_governor
 from ..config.profile import is_live
+from ..config.runtime_settings import get_runtime_settings
+from ..hedge.partial import PartialHedgePlanner
+from ..metrics.execution import (
+    EXECUTION_PHASE_SECONDS,
+    LEG_ACK_LATENCY_SECONDS,
+    LEG_ACK_SKEW_SECONDS,
+    LEG_SEND_SKEW_SECONDS,
+    LEG_UNWIND_TOTAL,
+)
 from ..runtime.live_guard import LiveTradingDisabledError, LiveTradingGuard
-from ..services import portfolio, risk
+from ..services import risk
+from ..services.post_trade import get_post_trade_refresher
 from ..golden.recorder import golden_replay_enabled
 from ..services.runtime import (
     HoldActiveError,
@@ -42,6 +54,9 @@ if TYPE_CHECKING:  # pragma: no cover
 
 ORDER_TIMEOUT_SEC = 2.0
 MAX_ORDER_ATTEMPTS = 3
+_UNFILLED_STATUSES = frozenset({"new", "open", "pending", "submitted", "accepted"})
+_PARTIAL_STATUSES = frozenset({"partially_filled", "partial", "partial_fill"})
+_CLOSED_STATUSES = frozenset({"cancelled", "canceled", "rejected", "expired", "failed", "skipped"})
 
 
 LOGGER = logging.getLogger(__name__)
@@ -54,6 +69,75 @@ def _maybe_float(value: object) -> float | None:
         return None
 
 
+def _leg_attempt_key(plan_key: str, index: int, attempt: int) -> str:
+    return f"{plan_key}:{index}" if attempt == 0 else f"{plan_key}:{index}:{attempt}"
+
+
+def _filled_qty(order: Mapping[str, object]) -> float | None:
+    for key in ("filled_qty", "executed_qty"):
+        value = _maybe_float(order.get(key))
+        if value is not None:
+            return abs(value)
+    return None
+
+
+def _emit_ops_alert(kind: str, text: str, extra: Dict[str, object] | None = None) -> None:
+    try:
+        from ..opsbot.notifier import emit_alert
+    except Exception as exc:
+        LOGGER.warning("ops notifier import failed kind=%s error=%s", kind, exc)
+        return
+    try:
+        emit_alert(kind=kind, text=text, extra=extra or None)
+    except Exception as exc:
+        LOGGER.warning("ops notifier emit failed kind=%s error=%s", kind, exc)
+
+
+def _leg_dispatch_mode() -> str:
+    return get_runtime_settings().leg_dispatch_mode
+
+
+def _leg_dispatch_deadline() -> float:
+    return get_runtime_settings().leg_dispatch_deadline_sec
+
+
+def _leg_timing_summary(
+    mode: str, timings: Sequence[Mapping[str, object]], started: float | None = None
+) -> Dict[str, object]:
+    sent = [float(t["sent_mono"]) for t in timings if t.get("sent_mono") is not None]
+    acked = [float(t["ack_mono"]) for t in timings if t.get("ack_mono") is not None]
+    send_skew = max(sent) - min(sent) if len(sent) > 1 else 0.0
+    ack_skew = max(acked) - min(acked) if len(acked) > 1 else 0.0
+    phases: Dict[str, float] = {}
+    if started is not None and sent:
+        phases["send_ms"] = (max(sent) - started) * 1000.0
+        EXECUTION_PHASE_SECONDS.labels(phase="send").observe(max(sent) - started)
+        if acked:
+            phases["ack_ms"] = (max(acked) - max(sent)) * 1000.0
+            EXECUTION_PHASE_SECONDS.labels(phase="ack").observe(max(max(acked) - max(sent), 0.0))
+    if len(sent) > 1:
+        LEG_SEND_SKEW_SECONDS.labels(mode=mode).observe(send_skew)
+    if len(acked) > 1:
+        LEG_ACK_SKEW_SECONDS.labels(mode=mode).observe(ack_skew)
+    legs: List[Dict[str, object]] = []
+    for timing in timings:
+        entry = {key: value for key, value in timing.items() if not key.endswith("_mono")}
+        if timing.get("sent_mono") is not None and timing.get("ack_mono") is not None:
+            latency = float(timing["ack_mono"]) - float(timing["sent_mono"])
+            entry["ack_latency_ms"] = latency * 1000.0
+            LEG_ACK_LATENCY_SECONDS.labels(venue=str(timing.get("venue")), mode=mode).observe(
+                latency
+            )
+        legs.append(entry)
+    return {
+        "mode": mode,
+        "legs": legs,
+        "send_skew_ms": send_skew * 1000.0,
+        "ack_skew_ms": ack_skew * 1000.0,
+        **phases,
+    }
+
+
 def _batch_id_for_orders(orders: Iterable[Mapping[str, object]]) -> str:
     timestamp = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
     hasher = hashlib.sha256()
@@ -265,11 +349,18 @@ class ExecutionRouter:
         plan_key: str,
         index: int,
         strategy_id: str | None,
+        timing: Dict[str, object] | None = None,
     ) -> Dict[str, object]:
+        """Place one plan leg, retrying up to ``MAX_ORDER_ATTEMPTS`` times.
+
+        ``timing`` receives wall-clock and monotonic send/ack stamps for the
+        first send and the acknowledged attempt.
+        """
+
         attempt = 0
         last_error: Exception | None = None
         while attempt < MAX_ORDER_ATTEMPTS:
-            attempt_key = f"{plan_key}:{index}" if attempt == 0 else f"{plan_key}:{index}:{attempt}"
+            attempt_key = _leg_attempt_key(plan_key, index, attempt)
             price_to_use = price
             if post_only and attempt > 0:
                 price_to_use = self._nudge_price(
@@ -337,7 +428,14 @@ class ExecutionRouter:
                     fee=fee,
                     idemp_key=attempt_key,
                 )
+                if timing is not None and "sent_mono" not in timing:
+                    timing["sent_ts"] = time.time()
+                    timing["sent_mono"] = time.perf_counter()
                 order = await asyncio.wait_for(create_task, timeout=ORDER_TIMEOUT_SEC)
+                if timing is not None:
+                    timing["ack_ts"] = time.time()
+                    timing["ack_mono"] = time.perf_counter()
+                    timing["attempts"] = attempt + 1
                 record_risk_order_success(venue=venue, category="accepted")
                 return order
             except HoldActiveError:
@@ -412,6 +510,7 @@ class ExecutionRouter:
         post_only = bool(state.control.post_only)
         reduce_only = bool(state.control.reduce_only)
         shadow_mode = golden_replay_enabled()
+        leg_timing: Dict[str, object] | None = None
         if (
             not simulate
             and not self.dry_run_only
@@ -433,41 +532,337 @@ class ExecutionRouter:
                         "simulated": True,
                     }
                 )
-            open_orders = await self._refresh_open_orders()
         else:
             hold_reason = await risk_governor.validate(context="order_execution")
             if hold_reason:
                 raise HoldActiveError(hold_reason)
             strategy_id = getattr(plan, "strategy_id", None) or getattr(plan, "strategy", None)
-            for index, leg in enumerate(plan.legs):
-                broker = self._resolve_broker(leg.exchange)
-                venue = self._venue_for_exchange(leg.exchange)
-                order = await self._place_leg_with_retry(
-                    broker=broker,
-                    venue=venue,
-                    symbol=plan.symbol,
-                    side=leg.side,
-                    qty=leg.qty,
-                    price=leg.price,
-                    fee=leg.fee_usdt,
+            started = time.perf_counter()
+            mode = _leg_dispatch_mode()
+            timings: List[Dict[str, object]] = [
+                {"index": index, "venue": self._venue_for_exchange(leg.exchange)}
+                for index, leg in enumerate(plan.legs)
+            ]
+            if mode == "parallel":
+                orders = await self._dispatch_legs_parallel(
+                    plan,
+                    plan_key=plan_key,
                     post_only=post_only,
                     reduce_only=reduce_only,
-                    plan_key=plan_key,
-                    index=index,
                     strategy_id=strategy_id,
+                    timings=timings,
                 )
-                orders.append(order)
-            open_orders = await self._refresh_open_orders()
-        snapshot = await portfolio.snapshot()
-        risk.refresh_runtime_state(snapshot=snapshot, open_orders=open_orders)
-        return {
+            else:
+                for index, leg in enumerate(plan.legs):
+                    orders.append(
+                        await self._place_leg_with_retry(
+                            **self._leg_kwargs(
+                                plan,
+                                index,
+                                plan_key=plan_key,
+                                post_only=post_only,
+                                reduce_only=reduce_only,
+                                strategy_id=strategy_id,
+                            ),
+                            timing=timings[index],
+                        )
+                    )
+            leg_timing = _leg_timing_summary(mode, timings, started)
+            risk.apply_execution(orders)
+        # The full portfolio/risk refresh runs in the background; the result
+        # carries the most recent completed snapshot (taken inline only on a
+        # cold start, when there is none yet).
+        refresher = get_post_trade_refresher()
+        if refresher.last_snapshot is None:
+            snapshot = await refresher.refresh()
+        else:
+            snapshot = refresher.last_snapshot
+            refresher.schedule()
+        age = refresher.snapshot_age()
+        result: Dict[str, object] = {
             "orders": orders,
             "exposures": snapshot.exposures(),
             "pnl": dict(snapshot.pnl_totals),
             "portfolio": snapshot.as_dict(),
-            "open_orders": open_orders,
+            "open_orders": list(refresher.last_open_orders),
+            "post_trade": {
+                "refresh_pending": refresher.pending,
+                "snapshot_age_ms": age * 1000.0 if age is not None else None,
+            },
+        }
+        if leg_timing is not None:
+            result["leg_timing"] = leg_timing
+        return result
+
+    def _leg_kwargs(
+        self,
+        plan: "Plan",
+        index: int,
+        *,
+        plan_key: str,
+        post_only: bool,
+        reduce_only: bool,
+        strategy_id: str | None,
+    ) -> Dict[str, object]:
+        leg = plan.legs[index]
+        return {
+            "broker": self._resolve_broker(leg.exchange),
+            "venue": self._venue_for_exchange(leg.exchange),
+            "symbol": plan.symbol,
+            "side": leg.side,
+            "qty": leg.qty,
+            "price": leg.price,
+            "fee": leg.fee_usdt,
+            "post_only": post_only,
+            "reduce_only": reduce_only,
+            "plan_key": plan_key,
+            "index": index,
+            "strategy_id": strategy_id,
         }
 
+    async def _dispatch_legs_parallel(
+        self,
+        plan: "Plan",
+        *,
+        plan_key: str,
+        post_only: bool,
+        reduce_only: bool,
+        strategy_id: str | None,
+        timings: List[Dict[str, object]],
+    ) -> List[Dict[str, object]]:
+        """Send every leg at once under one deadline; unwind siblings on failure."""
+
+        tasks = [
+            asyncio.create_task(
+                self._place_leg_with_retry(
+                    **self._leg_kwargs(
+                        plan,
+                        index,
+                        plan_key=plan_key,
+                        post_only=post_only,
+                        reduce_only=reduce_only,
+                        strategy_id=strategy_id,
+                    ),
+                    timing=timings[index],
+                )
+            )
+            for index in range(len(plan.legs))
+        ]
+        deadline = _leg_dispatch_deadline()
+        _, pending = await asyncio.wait(
+            tasks, timeout=deadline, return_when=asyncio.FIRST_EXCEPTION
+        )
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        placed: List[tuple[int, Dict[str, object]]] = []
+        failure: BaseException | None = None
+        for index, task in enumerate(tasks):
+            if task.cancelled():
+                continue
+            error = task.exception()
+            if error is not None:
+                failure = failure or error
+            else:
+                placed.append((index, task.result()))
+        if failure is None and len(placed) == len(tasks):
+            return [order for _, order in placed]
+
+        abandoned = [index for index, task in enumerate(tasks) if task.cancelled()]
+        if failure is None:
+            failure = RuntimeError(f"order_failed:leg_deadline_exceeded:{deadline:.2f}s")
+        await self._unwind_legs(
+            plan, placed, abandoned=abandoned, plan_key=plan_key, reason=str(failure)
+        )
+        raise failure
+
+    async def _unwind_legs(
+        self,
+        plan: "Plan",
+        placed: Sequence[tuple[int, Mapping[str, object]]],
+        *,
+        abandoned: Sequence[int],
+        plan_key: str,
+        reason: str,
+    ) -> None:
+        """Cancel resting sibling legs and flatten filled ones via the partial hedger.
+
+        ``placed`` pairs each acknowledged order with its plan leg index. Legs
+        cancelled in flight at the deadline are looked up in the ledger under
+        their idempotency keys: whatever the broker already submitted is
+        cancelled or unwound like an acknowledged leg, and only legs with no
+        order on record are left ``abandoned`` for recon.
+        """
+
+        settled: List[tuple[int, Mapping[str, object]]] = list(placed)
+        unresolved: List[str] = []
+        for index in abandoned:
+            recorded = await self._recorded_leg_orders(plan_key, index)
+            if recorded:
+                settled.extend((index, order) for order in recorded)
+                continue
+            venue = self._venue_for_exchange(plan.legs[index].exchange)
+            LEG_UNWIND_TOTAL.labels(venue=venue, action="abandon").inc()
+            unresolved.append(f"{plan_key}:{index}")
+
+        residuals: List[Dict[str, object]] = []
+        unhedged: List[Dict[str, object]] = []
+        for index, order in settled:
+            residual = await self._leg_residual(plan, index, order)
+            if residual is None:
+                continue
+            if "error" in residual:
+                unhedged.append(residual)
+            else:
+                residuals.append(residual)
+        hedge_orders: List[Dict[str, object]] = []
+        for residual in residuals:
+            # One residual at a time so each filled leg is flattened on its own venue.
+            planner = PartialHedgePlanner(
+                min_notional_usdt=0.0,
+                max_notional_usdt_per_order=max(float(residual["notional_usdt"]), 1.0),
+                max_orders=1,
+                positions_fetcher=lambda: (),
+                balances_fetcher=lambda: (),
+            )
+            hedge_orders.extend(planner.plan([residual]))
+        unwound: List[Dict[str, object]] = []
+        for index, hedge in enumerate(hedge_orders):
+            venue = str(hedge.get("venue") or "")
+            try:
+                register_order_attempt(
+                    reason="runaway_orders_per_min",
+                    source=f"execution_router:unwind:{venue}",
+                )
+                await self.broker_for_venue(venue).create_order(
+                    venue=venue,
+                    symbol=str(hedge.get("symbol") or plan.symbol),
+                    side=str(hedge.get("side") or "").lower(),
+                    qty=float(hedge.get("qty") or 0.0),
+                    type="MARKET",
+                    post_only=False,
+                    reduce_only=True,
+                    idemp_key=f"{plan_key}:unwind:{index}",
+                )
+                LEG_UNWIND_TOTAL.labels(venue=venue, action="unwind").inc()
+                unwound.append(dict(hedge))
+            except Exception as exc:
+                LOGGER.error(
+                    "parallel leg unwind failed",
+                    extra={"venue": venue, "hedge": dict(hedge), "error": str(exc)},
+                )
+        if unhedged:
+            for residual in unhedged:
+                LEG_UNWIND_TOTAL.labels(venue=str(residual["venue"]), action="unhedged").inc()
+            _emit_ops_alert(
+                "parallel_leg_unhedged",
+                f"{plan.symbol}: {len(unhedged)} filled leg(s) left open after a failed dispatch",
+                {"symbol": plan.symbol, "reason": reason, "legs": unhedged},
+            )
+        await asyncio.to_thread(
+            ledger.record_event,
+            level="ERROR",
+            code="parallel_legs_unwound",
+            payload={
+                "symbol": plan.symbol,
+                "reason": reason,
+                "unwound": unwound,
+                "planned_unwinds": len(hedge_orders),
+                "unhedged": unhedged,
+                # Cancelled in flight with nothing on record: the venue may
+                # still accept the order under its idempotency key, so recon
+                # has to settle these.
+                "abandoned": unresolved,
+            },
+        )
+
+    async def _recorded_leg_orders(self, plan_key: str, index: int) -> List[Dict[str, object]]:
+        """Return the ledger orders of every attempt of a leg cancelled in flight."""
+
+        recorded: List[Dict[str, object]] = []
+        for attempt in range(MAX_ORDER_ATTEMPTS):
+            key = _leg_attempt_key(plan_key, index, attempt)
+            try:
+                row = await asyncio.to_thread(ledger.get_order_by_key, key)
+            except Exception as exc:  # pragma: no cover - defensive logging
+                LOGGER.error(
+                    "parallel leg lookup failed", extra={"idemp_key": key, "error": str(exc)}
+                )
+                continue
+            if row is not None:
+                recorded.append({**row, "order_id": row.get("id")})
+        return recorded
+
+    async def _cancel_leg(self, venue: str, order_id: object) -> None:
+        try:
+            await self.broker_for_venue(venue).cancel(venue=venue, order_id=int(order_id))
+            LEG_UNWIND_TOTAL.labels(venue=venue, action="cancel").inc()
+        except Exception as exc:  # pragma: no cover - defensive logging
+            LOGGER.error(
+                "parallel leg cancel failed",
+                extra={"venue": venue, "order_id": order_id, "error": str(exc)},
+            )
+
+    def _mark_price(self, venue: str, symbol: str) -> float | None:
+        try:
+            book = self.market_data.top_of_book(venue, symbol)
+        except Exception:  # pragma: no cover - no book for the venue
+            return None
+        bid = _maybe_float(book.get("bid")) or 0.0
+        ask = _maybe_float(book.get("ask")) or 0.0
+        if bid > 0 and ask > 0:
+            return (bid + ask) / 2.0
+        return bid or ask or None
+
+    async def _leg_residual(
+        self, plan: "Plan", index: int, order: Mapping[str, object]
+    ) -> Dict[str, object] | None:
+        """Cancel what still rests of ``order`` and describe the filled qty to flatten.
+
+        Returns ``None`` when nothing filled. A residual carrying ``error`` is a
+        filled leg that cannot be unwound automatically (unknown fill size or
+        no price to size the hedge with).
+        """
+
+        leg = plan.legs[index]
+        venue = str(order.get("venue") or self._venue_for_exchange(leg.exchange))
+        status = str(order.get("status") or "filled").lower()
+        if status in _CLOSED_STATUSES:
+            return None
+        order_id = order.get("order_id")
+        if order_id is not None and (status in _UNFILLED_STATUSES or status in _PARTIAL_STATUSES):
+            await self._cancel_leg(venue, order_id)
+        if status in _UNFILLED_STATUSES:
+            return None
+        symbol = str(order.get("symbol") or plan.symbol)
+        qty = _filled_qty(order)
+        if qty is None and status not in _PARTIAL_STATUSES:
+            qty = abs(_maybe_float(order.get("qty")) or 0.0)
+        residual: Dict[str, object] = {
+            "venue": venue,
+            "symbol": symbol,
+            "side": "LONG" if str(order.get("side") or leg.side).lower() == "buy" else "SHORT",
+            "qty": qty,
+            "order_id": order_id,
+        }
+        if qty is None:
+            residual["error"] = "unknown_filled_qty"
+            return residual
+        if qty <= 0:
+            return None
+        price = (
+            _maybe_float(order.get("price"))
+            or _maybe_float(leg.price)
+            or self._mark_price(venue, symbol)
+        )
+        if not price or price <= 0:
+            residual["error"] = "no_price"
+            return residual
+        residual["notional_usdt"] = qty * price
+        return residual
+
     async def place_limit_order(
         self,
         *,
@@ -58,9 +58,42 @@ def _build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="enable uvicorn autoreload (development only)",
     )
+    pnl_parser = sub.add_parser(
+        "pnl-rebuild", help="rebuild incremental ledger PnL state from a full fill replay"
+    )
+    pnl_parser.add_argument(
+        "--check",
+        action="store_true",
+        help="only compare the stored state with a replay; exit 1 on mismatch",
+    )
     return parser
 
 
+def _run_pnl_rebuild(args: argparse.Namespace) -> int:
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)s [%(name)s] %(message)s"
+    )
+    from .. import ledger
+
+    ledger.init_db()
+    mismatches = ledger.verify_pnl_state()
+    for entry in mismatches:
+        logging.warning(
+            "pnl_state mismatch venue=%s symbol=%s fields=%s expected=%s stored=%s",
+            entry["venue"],
+            entry["symbol"],
+            ",".join(entry["fields"]),
+            entry["expected"],
+            entry["stored"],
+        )
+    if args.check:
+        logging.info("pnl_state check: %d mismatching positions", len(mismatches))
+        return 1 if mismatches else 0
+    rows = ledger.rebuild_pnl_state()
+    logging.info("pnl_state rebuilt: %d positions (%d corrected)", rows, len(mismatches))
+    return 0
+
+
 def _configure_environment(profile: str) -> None:
     os.environ.setdefault("PROFILE", profile)
     os.environ.setdefault("SAFE_MODE", "true")
@@ -203,6 +236,8 @@ def main(argv: Sequence[str] | None = None) -> int:
         return _run_loop(args)
     if args.command == "run-profile":
         return _run_profile_command(args)
+    if args.command == "pnl-rebuild":
+        return _run_pnl_rebuild(args)
     parser.error("unknown command")
     return 1
 
@@ -0,0 +1,200 @@
+"""Compiled snapshot of the environment settings read on hot paths.
+
+Routing, SOR scoring, leg dispatch, the post-trade refresher and the
+feature-flag helpers used to parse ``os.environ`` on every call. They now read attributes of one immutable
+:class:`RuntimeSettings`, built on first use and rebuilt only by
+:func:`reload_runtime_settings` (application startup and the runtime settings
+reload endpoint). Each rebuild swaps the whole snapshot at once and bumps
+``version``, so a reader never sees a mix of old and new values.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, field, fields
+from decimal import Decimal, InvalidOperation
+from types import MappingProxyType
+from typing import Callable, Mapping, TypeVar
+
+from .profile import normalise_profile_category
+
+LOGGER = logging.getLogger(__name__)
+
+TRUE_SET = {"1", "true", "on", "yes", "y", "True", "TRUE", "ON"}
+_FLAG_TRUE = {"1", "true", "yes", "on"}
+
+_DEFAULT_SOR_FEES_BPS = {"binance": 2.5, "okx": 2.5, "bybit": 3.0}
+_DEFAULT_SOR_FUNDING_BPS_1H = {"binance": 0.0, "okx": 0.0, "bybit": 0.0}
+_DEFAULT_SOR_VENUE_PREFS = {"binance": 1.0, "okx": 1.0, "bybit": 1.0}
+_LEG_DISPATCH_MODES = frozenset({"sequential", "parallel"})
+
+_T = TypeVar("_T")
+
+
+@dataclass(frozen=True, slots=True)
+class RuntimeSettings:
+    """Immutable, typed view of the environment at the last (re)load."""
+
+    version: int = 0
+    smart_router_enabled: bool = False
+    smart_router_latency_bps_per_ms: float = 0.01
+    sor_enabled: bool = False
+    sor_min_edge_bps: float = 1.5
+    sor_min_size_usd: Decimal = Decimal("50")
+    sor_max_slippage_bps: float = 5.0
+    sor_quote_ttl_ms: int = 200
+    sor_fees_bps: Mapping[str, float] = field(
+        default_factory=lambda: MappingProxyType(_DEFAULT_SOR_FEES_BPS)
+    )
+    sor_funding_bps_1h: Mapping[str, float] = field(
+        default_factory=lambda: MappingProxyType(_DEFAULT_SOR_FUNDING_BPS_1H)
+    )
+    sor_venue_prefs: Mapping[str, float] = field(
+        default_factory=lambda: MappingProxyType(_DEFAULT_SOR_VENUE_PREFS)
+    )
+    sor_edge_ref: str = "mid"
+    funding_router_enabled: bool = False
+    tca_router_enabled: bool = False
+    pretrade_strict: bool = False
+    risk_limits: bool = False
+    md_watchdog: bool = False
+    golden_record_enabled: bool = False
+    golden_replay_enabled: bool = False
+    leg_dispatch_mode: str = "sequential"
+    leg_dispatch_deadline_sec: float = 5.0
+    post_trade_debounce_ms: float = 250.0
+
+    def as_dict(self) -> dict[str, object]:
+        payload: dict[str, object] = {}
+        for item in fields(self):
+            value = getattr(self, item.name)
+            if isinstance(value, Mapping):
+                value = dict(value)
+            elif isinstance(value, Decimal):
+                value = str(value)
+            payload[item.name] = value
+        return payload
+
+
+def _flag(env: Mapping[str, str], name: str, default: bool = False) -> bool:
+    raw = env.get(name)
+    if raw is None or not raw.strip():
+        return default
+    return raw.strip().lower() in _FLAG_TRUE
+
+
+def _profile_flag(env: Mapping[str, str], name: str) -> bool:
+    """``FF_*`` flags: explicit value wins, else on for paper/testnet profiles."""
+
+    raw = env.get(name)
+    if raw is not None:
+        return raw in TRUE_SET
+    profile = env.get("DEFAULT_PROFILE")
+    if not profile:
+        return False
+    return normalise_profile_category(profile) in {"paper", "testnet"}
+
+
+def _parsed(env: Mapping[str, str], name: str, default: _T, parse: Callable[[str], _T]) -> _T:
+    raw = env.get(name)
+    if raw is None:
+        return default
+    try:
+        return parse(raw)
+    except (TypeError, ValueError, InvalidOperation):
+        LOGGER.warning("invalid-env %s=%r", name, raw)
+        return default
+
+
+def _positive(value: float, default: float) -> float:
+    return value if value > 0 else default
+
+
+def _json_map(env: Mapping[str, str], name: str, default: dict[str, float]) -> Mapping[str, float]:
+    raw = env.get(name, "")
+    if not raw:
+        return MappingProxyType(default)
+    try:
+        payload = json.loads(raw)
+    except (TypeError, ValueError):
+        LOGGER.warning("invalid-json-env %s=%r", name, raw)
+        return MappingProxyType(default)
+    if not payload or not isinstance(payload, Mapping):
+        return MappingProxyType(default)
+    return MappingProxyType(dict(payload))
+
+
+def _leg_dispatch_mode(env: Mapping[str, str]) -> str:
+    mode = (env.get("LEG_DISPATCH_MODE") or "sequential").strip().lower()
+    return mode if mode in _LEG_DISPATCH_MODES else "sequential"
+
+
+def load_runtime_settings(
+    env: Mapping[str, str] | None = None, *, version: int = 0
+) -> RuntimeSettings:
+    """Build a snapshot from ``env`` (``os.environ`` by default) without installing it."""
+
+    source = os.environ if env is None else env
+    return RuntimeSettings(
+        version=version,
+        smart_router_enabled=_flag(source, "FEATURE_SMART_ROUTER"),
+        smart_router_latency_bps_per_ms=max(
+            _parsed(source, "SMART_ROUTER_LATENCY_BPS_PER_MS", 0.01, float), 0.0
+        ),
+        sor_enabled=_flag(source, "FF_SOR_V1"),
+        sor_min_edge_bps=_parsed(source, "SOR_MIN_EDGE_BPS", 1.5, float),
+        sor_min_size_usd=_parsed(source, "SOR_MIN_SIZE_USD", Decimal("50"), Decimal),
+        sor_max_slippage_bps=_parsed(source, "SOR_MAX_SLIPPAGE_BPS", 5.0, float),
+        sor_quote_ttl_ms=_parsed(source, "SOR_QUOTE_TTL_MS", 200, int),
+        sor_fees_bps=_json_map(source, "SOR_FEES_BPS", _DEFAULT_SOR_FEES_BPS),
+        sor_funding_bps_1h=_json_map(source, "SOR_FUNDING_BPS_1H", _DEFAULT_SOR_FUNDING_BPS_1H),
+        sor_venue_prefs=_json_map(source, "SOR_VENUE_PREFS", _DEFAULT_SOR_VENUE_PREFS),
+        sor_edge_ref=source.get("SOR_EDGE_REF", "mid").lower(),
+        funding_router_enabled=_flag(source, "FEATURE_FUNDING_ROUTER"),
+        tca_router_enabled=_flag(source, "FEATURE_TCA_ROUTER"),
+        pretrade_strict=_profile_flag(source, "FF_PRETRADE_STRICT"),
+        risk_limits=_profile_flag(source, "FF_RISK_LIMITS"),
+        md_watchdog=_profile_flag(source, "FF_MD_WATCHDOG"),
+        golden_record_enabled=_flag(source, "GOLDEN_RECORD_ENABLED"),
+        golden_replay_enabled=_flag(source, "GOLDEN_REPLAY_ENABLED"),
+        leg_dispatch_mode=_leg_dispatch_mode(source),
+        leg_dispatch_deadline_sec=_positive(
+            _parsed(source, "LEG_DISPATCH_DEADLINE_SEC", 5.0, float), 5.0
+        ),
+        post_trade_debounce_ms=max(_parsed(source, "POST_TRADE_DEBOUNCE_MS", 250.0, float), 0.0),
+    )
+
+
+_SETTINGS_LOCK = threading.Lock()
+_SETTINGS: RuntimeSettings | None = None
+
+
+def get_runtime_settings() -> RuntimeSettings:
+    """Return the current snapshot, building it on first use."""
+
+    settings = _SETTINGS
+    if settings is None:
+        return reload_runtime_settings()
+    return settings
+
+
+def reload_runtime_settings() -> RuntimeSettings:
+    """Re-read the environment and atomically install a new snapshot."""
+
+    global _SETTINGS
+    with _SETTINGS_LOCK:
+        previous = _SETTINGS.version if _SETTINGS is not None else 0
+        _SETTINGS = load_runtime_settings(version=previous + 1)
+        return _SETTINGS
+
+
+__all__ = [
+    "RuntimeSettings",
+    "TRUE_SET",
+    "get_runtime_settings",
+    "load_runtime_settings",
+    "reload_runtime_settings",
+]
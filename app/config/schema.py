@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Literal
 
 from pydantic import BaseModel, Field, field_validator, ConfigDict, model_validator
 
@@ -357,6 +357,9 @@ class ReconConfig(BaseModel):
     position_size_warn: float = Field(0.001, ge=0.0)
     position_size_critical: float = Field(0.01, ge=0.0)
     order_critical_missing: bool = Field(True)
+    mode: Literal["full", "delta"] = Field("full")
+    full_sweep_sec: float = Field(300.0, ge=0.0)
+    cycle_deadline_sec: float = Field(10.0, gt=0.0)
 
 
 class ReadinessConfig(BaseModel):
@@ -2,11 +2,12 @@ from __future__ import annotations
 
 """Binance USD-M futures websocket resilience helpers."""
 
+from concurrent.futures import Executor
 from typing import Callable, Iterable, Mapping, Sequence, cast
 
 from app.market.orderbook.book_store import DiffEvent, OrderBookStore
 from app.market.streams.base_ws import WsConnector
-from app.market.streams.resync import BaseOrderBookStream
+from app.market.streams.resync import BaseOrderBookStream, shared_resync_executor
 
 
 def _convert_levels(levels: Sequence[Sequence[float | str]]) -> Iterable[tuple[float, float]]:
@@ -23,18 +24,16 @@ class BinanceOrderBookStream(BaseOrderBookStream):
         ts_ms = snapshot.get("ts_ms")
         return bids, asks, last_update, int(ts_ms) if ts_ms is not None else None
 
-    def handle_diff(self, event: DiffEvent) -> None:
-        symbol = event["symbol"]
+    def _prepare_diff(self, symbol: str, event: DiffEvent) -> DiffEvent | None:
         record = self._orderbook.get_or_create(self.venue, symbol)
         last_seq = record.last_applied_seq
         if last_seq is not None and event["seq_to"] <= last_seq:
-            return
+            return None
         if last_seq is not None and event["seq_from"] <= last_seq:
             adjusted = dict(event)
             adjusted["seq_from"] = last_seq + 1
-            super().handle_diff(cast(DiffEvent, adjusted))
-            return
-        super().handle_diff(event)
+            return cast(DiffEvent, adjusted)
+        return event
 
 
 def build_binance_stream(
@@ -42,12 +41,14 @@ def build_binance_stream(
     orderbook: OrderBookStore,
     connector: WsConnector,
     snapshot_fetcher: Callable[[str], Mapping[str, object]],
+    resync_executor: Executor | None = None,
 ) -> BinanceOrderBookStream:
     return BinanceOrderBookStream(
         venue="binance",
         orderbook=orderbook,
         connector=connector,
         snapshot_fetcher=snapshot_fetcher,
+        resync_executor=resync_executor or shared_resync_executor(),
     )
 
 
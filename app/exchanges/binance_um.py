@@ -26,6 +26,7 @@ except ImportError:  # pragma: no cover
     RequestError = Exception
 
 from . import InMemoryDerivClient, build_in_memory_client
+from app.net import VenueClient, get_transport
 from app.secrets_store import get_secrets_store
 from app.utils.chaos import apply_order_delay, maybe_raise_rest_timeout
 from app.watchdog.broker_watchdog import get_broker_watchdog
@@ -76,7 +77,7 @@ class BinanceUMClient:
         self.positions_data = self._fallback.positions_data
         self._filters_cache: Dict[str, Dict[str, float]] = {}
         self._fees_cache: Dict[str, Dict[str, float]] = {}
-        self._client: Optional[httpx.Client] = None
+        self._client: Optional[VenueClient] = None
         store_key, store_secret = _store_credentials()
         key_candidates = []
         secret_candidates = []
@@ -101,12 +102,12 @@ class BinanceUMClient:
         if not safe_mode:
             if not self._api_key or not self._api_secret:
                 raise RuntimeError("Binance UM credentials missing for testnet access")
-            self._client = httpx.Client(base_url=config.routing.rest, timeout=10.0)
+            self._client = get_transport().client(config.id, base_url=config.routing.rest)
 
     # ------------------------------------------------------------------
     # Helpers
 
-    def _ensure_http(self) -> httpx.Client:
+    def _ensure_http(self) -> VenueClient:
         if self.safe_mode:
             raise RuntimeError("HTTP client not available in SAFE_MODE")
         assert self._client is not None  # nosec B101  # for type-checkers
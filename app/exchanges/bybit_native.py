@@ -2,11 +2,12 @@ from __future__ import annotations
 
 """Bybit perpetual futures websocket resilience helpers."""
 
+from concurrent.futures import Executor
 from typing import Callable, Iterable, Mapping, Sequence
 
 from app.market.orderbook.book_store import DiffEvent, OrderBookStore
 from app.market.streams.base_ws import WsConnector
-from app.market.streams.resync import BaseOrderBookStream
+from app.market.streams.resync import BaseOrderBookStream, shared_resync_executor
 
 
 def _convert(levels: Sequence[Sequence[float | str]]) -> Iterable[tuple[float, float]]:
@@ -37,12 +38,14 @@ def build_bybit_stream(
     orderbook: OrderBookStore,
     connector: WsConnector,
     snapshot_fetcher: Callable[[str], Mapping[str, object]],
+    resync_executor: Executor | None = None,
 ) -> BybitOrderBookStream:
     return BybitOrderBookStream(
         venue="bybit",
         orderbook=orderbook,
         connector=connector,
         snapshot_fetcher=snapshot_fetcher,
+        resync_executor=resync_executor or shared_resync_executor(),
     )
 
 
@@ -4,38 +4,29 @@ from __future__ import annotations
 
 import json
 import logging
-import os
 import threading
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Iterable, Mapping, Sequence
 
+from ..config.runtime_settings import get_runtime_settings
+
 LOGGER = logging.getLogger(__name__)
 
 _GOLDEN_TRACE_PATH = Path("data/golden_trace.log")
 
 
-def _env_flag(name: str, default: bool = False) -> bool:
-    raw = os.getenv(name)
-    if raw is None:
-        return default
-    lowered = raw.strip().lower()
-    if not lowered:
-        return default
-    return lowered in {"1", "true", "yes", "on"}
-
-
 def golden_record_enabled() -> bool:
     """Return True when golden recording is enabled via env flag."""
 
-    return _env_flag("GOLDEN_RECORD_ENABLED", False)
+    return get_runtime_settings().golden_record_enabled
 
 
 def golden_replay_enabled() -> bool:
     """Return True when the golden replay harness should run."""
 
-    return _env_flag("GOLDEN_REPLAY_ENABLED", False)
+    return get_runtime_settings().golden_replay_enabled
 
 
 @dataclass(frozen=True)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import os
@@ -8,8 +9,11 @@ import threading
 import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, Iterable, List, Mapping, Sequence, Tuple
+from typing import Callable, Dict, List, Mapping, Sequence, TypeVar
 
+from . import events as _events
+from . import pnl_state as _pnl_state
+from .connection import LedgerConnections
 from .pnl_sources import build_ledger_from_history
 
 from ..runtime import leader_lock
@@ -17,7 +21,21 @@ from ..runtime import leader_lock
 LOGGER = logging.getLogger(__name__)
 
 LEDGER_PATH = Path("data/ledger.db")
-_LEDGER_LOCK = threading.Lock()
+_CONNECTIONS = LedgerConnections()
+# Held by the group-commit leader; ``order_journal`` takes it for its own writes.
+_LEDGER_LOCK: threading.Lock = _CONNECTIONS.write_lock
+
+T = TypeVar("T")
+
+# ``listener(path, seq, row)`` is called after every committed position write
+# with the new ``positions`` row, or ``row=None`` when the table was cleared.
+# ``seq`` increases in commit order, so listeners can drop updates that arrive
+# late from another thread.
+PositionListener = Callable[[Path, int, Dict[str, object] | None], None]
+_POSITION_LISTENERS: List[PositionListener] = []
+# Bumped inside write transactions, i.e. under the group-commit leader.
+_POSITION_SEQ = 0
+
 SAFE_RESET_TABLES = frozenset(
     {
         "orders",
@@ -26,6 +44,7 @@ SAFE_RESET_TABLES = frozenset(
         "balances",
         "events",
         "order_journal",
+        "pnl_state",
     }
 )
 
@@ -46,94 +65,116 @@ def _feature_enabled(name: str, default: bool = False) -> bool:
 
 
 def _connect() -> sqlite3.Connection:
-    LEDGER_PATH.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(LEDGER_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+    """This thread's long-lived read connection to the ledger."""
+
+    return _CONNECTIONS.reader(Path(LEDGER_PATH))
+
+
+def _write(fn: Callable[[sqlite3.Connection], T]) -> T:
+    """Run ``fn`` in a group-committed write transaction and return its result."""
+
+    return _CONNECTIONS.write(Path(LEDGER_PATH), fn)
+
+
+def close_connections() -> None:
+    """Close pooled ledger connections, e.g. before swapping ``LEDGER_PATH``."""
+
+    _CONNECTIONS.close()
 
 
 def init_db() -> None:
-    with _LEDGER_LOCK:
-        conn = _connect()
-        with conn:
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS orders (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    venue TEXT NOT NULL,
-                    symbol TEXT NOT NULL,
-                    side TEXT NOT NULL,
-                    qty REAL NOT NULL,
-                    price REAL,
-                    status TEXT NOT NULL,
-                    client_ts TEXT NOT NULL,
-                    exchange_ts TEXT,
-                    idemp_key TEXT UNIQUE
-                )
-                """
-            )
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS fills (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    order_id INTEGER NOT NULL,
-                    venue TEXT NOT NULL,
-                    symbol TEXT NOT NULL,
-                    side TEXT NOT NULL,
-                    qty REAL NOT NULL,
-                    price REAL NOT NULL,
-                    fee REAL NOT NULL,
-                    ts TEXT NOT NULL,
-                    FOREIGN KEY(order_id) REFERENCES orders(id)
-                )
-                """
-            )
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS positions (
-                    venue TEXT NOT NULL,
-                    symbol TEXT NOT NULL,
-                    base_qty REAL NOT NULL,
-                    avg_price REAL NOT NULL,
-                    ts TEXT NOT NULL,
-                    PRIMARY KEY(venue, symbol)
-                )
-                """
-            )
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS balances (
-                    venue TEXT NOT NULL,
-                    asset TEXT NOT NULL,
-                    qty REAL NOT NULL,
-                    ts TEXT NOT NULL,
-                    PRIMARY KEY(venue, asset)
-                )
-                """
-            )
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS events (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    ts TEXT NOT NULL,
-                    level TEXT NOT NULL,
-                    code TEXT NOT NULL,
-                    payload TEXT NOT NULL
-                )
-                """
+    _write(_create_tables)
+    # Legacy event rows get their extracted columns in small transactions so
+    # a large migration never holds the writer for long.
+    last_id: int | None = 0
+    while last_id is not None:
+        last_id = _write(functools.partial(_events.backfill, after=last_id))
+    _write(_events.ensure_fts)
+
+
+def _create_tables(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS orders (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            venue TEXT NOT NULL,
+            symbol TEXT NOT NULL,
+            side TEXT NOT NULL,
+            qty REAL NOT NULL,
+            price REAL,
+            status TEXT NOT NULL,
+            client_ts TEXT NOT NULL,
+            exchange_ts TEXT,
+            idemp_key TEXT UNIQUE
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS fills (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            order_id INTEGER NOT NULL,
+            venue TEXT NOT NULL,
+            symbol TEXT NOT NULL,
+            side TEXT NOT NULL,
+            qty REAL NOT NULL,
+            price REAL NOT NULL,
+            fee REAL NOT NULL,
+            ts TEXT NOT NULL,
+            FOREIGN KEY(order_id) REFERENCES orders(id)
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS positions (
+            venue TEXT NOT NULL,
+            symbol TEXT NOT NULL,
+            base_qty REAL NOT NULL,
+            avg_price REAL NOT NULL,
+            ts TEXT NOT NULL,
+            PRIMARY KEY(venue, symbol)
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS balances (
+            venue TEXT NOT NULL,
+            asset TEXT NOT NULL,
+            qty REAL NOT NULL,
+            ts TEXT NOT NULL,
+            PRIMARY KEY(venue, asset)
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS events (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            ts TEXT NOT NULL,
+            level TEXT NOT NULL,
+            code TEXT NOT NULL,
+            payload TEXT NOT NULL
+        )
+        """
+    )
+    _events.ensure_schema(conn)
+    if _pnl_state.create_table(conn):
+        # Databases written before the incremental state existed: seed it once.
+        _pnl_state.rebuild(conn)
+    if _feature_enabled("FEATURE_JOURNAL"):
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS order_journal (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                uuid TEXT NOT NULL UNIQUE,
+                ts TEXT NOT NULL,
+                type TEXT NOT NULL,
+                payload TEXT NOT NULL
             )
-            if _feature_enabled("FEATURE_JOURNAL"):
-                conn.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS order_journal (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        uuid TEXT NOT NULL UNIQUE,
-                        ts TEXT NOT NULL,
-                        type TEXT NOT NULL,
-                        payload TEXT NOT NULL
-                    )
-                    """
-                )
+            """
+        )
 
 
 def _now() -> str:
@@ -159,65 +200,65 @@ def record_order(
     exchange_ts: str | None,
     idemp_key: str,
 ) -> int:
-    with _LEDGER_LOCK:
-        conn = _connect()
-        with conn:
-            existing = _fetch_order_by_key(conn, idemp_key)
-            if existing:
-                conn.execute(
-                    """
-                    UPDATE orders
-                    SET venue = ?, symbol = ?, side = ?, qty = ?, price = ?, status = ?, client_ts = ?, exchange_ts = ?
-                    WHERE id = ?
-                    """,
-                    (
-                        venue,
-                        symbol,
-                        side,
-                        qty,
-                        price,
-                        status,
-                        client_ts,
-                        exchange_ts,
-                        int(existing["id"]),
-                    ),
-                )
-                _record_event_locked(
-                    conn,
-                    level="INFO",
-                    code="order_upserted",
-                    payload={
-                        "order_id": int(existing["id"]),
-                        "venue": venue,
-                        "symbol": symbol,
-                        "status": status,
-                        "idemp_key": idemp_key,
-                    },
-                )
-                return int(existing["id"])
-            cursor = conn.execute(
+    def _tx(conn: sqlite3.Connection) -> int:
+        existing = _fetch_order_by_key(conn, idemp_key)
+        if existing:
+            conn.execute(
                 """
-                INSERT INTO orders (venue, symbol, side, qty, price, status, client_ts, exchange_ts, idemp_key)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                UPDATE orders
+                SET venue = ?, symbol = ?, side = ?, qty = ?, price = ?, status = ?, client_ts = ?, exchange_ts = ?
+                WHERE id = ?
                 """,
-                (venue, symbol, side, qty, price, status, client_ts, exchange_ts, idemp_key),
+                (
+                    venue,
+                    symbol,
+                    side,
+                    qty,
+                    price,
+                    status,
+                    client_ts,
+                    exchange_ts,
+                    int(existing["id"]),
+                ),
             )
-            order_id = int(cursor.lastrowid)
             _record_event_locked(
                 conn,
                 level="INFO",
-                code="order_recorded",
+                code="order_upserted",
                 payload={
-                    "order_id": order_id,
+                    "order_id": int(existing["id"]),
                     "venue": venue,
                     "symbol": symbol,
-                    "side": side,
-                    "qty": qty,
-                    "price": price,
                     "status": status,
+                    "idemp_key": idemp_key,
                 },
             )
-            return order_id
+            return int(existing["id"])
+        cursor = conn.execute(
+            """
+            INSERT INTO orders (venue, symbol, side, qty, price, status, client_ts, exchange_ts, idemp_key)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (venue, symbol, side, qty, price, status, client_ts, exchange_ts, idemp_key),
+        )
+        order_id = int(cursor.lastrowid)
+        _record_event_locked(
+            conn,
+            level="INFO",
+            code="order_recorded",
+            payload={
+                "order_id": order_id,
+                "venue": venue,
+                "symbol": symbol,
+                "side": side,
+                "qty": qty,
+                "price": price,
+                "status": status,
+            },
+        )
+        return order_id
+
+    return _write(_tx)
 
 
 def get_order(order_id: int) -> Dict[str, object] | None:
@@ -233,17 +274,51 @@ def get_order(order_id: int) -> Dict[str, object] | None:
     return dict(row) if row else None
 
 
+def get_order_by_key(idemp_key: str) -> Dict[str, object] | None:
+    conn = _connect()
+    row = conn.execute(
+        """
+        SELECT id, venue, symbol, side, qty, price, status, client_ts, exchange_ts, idemp_key
+        FROM orders
+        WHERE idemp_key = ?
+        """,
+        (idemp_key,),
+    ).fetchone()
+    return dict(row) if row else None
+
+
 def update_order_status(order_id: int, status: str) -> None:
-    with _LEDGER_LOCK:
-        conn = _connect()
-        with conn:
-            conn.execute("UPDATE orders SET status = ? WHERE id = ?", (status, order_id))
-            _record_event_locked(
-                conn,
-                level="INFO",
-                code="order_status",
-                payload={"order_id": order_id, "status": status},
-            )
+    def _tx(conn: sqlite3.Connection) -> None:
+        conn.execute("UPDATE orders SET status = ? WHERE id = ?", (status, order_id))
+        _record_event_locked(
+            conn,
+            level="INFO",
+            code="order_status",
+            payload={"order_id": order_id, "status": status},
+        )
+
+    _write(_tx)
+
+
+def add_position_listener(listener: PositionListener) -> None:
+    """Subscribe ``listener`` to committed position updates (idempotent)."""
+
+    if listener not in _POSITION_LISTENERS:
+        _POSITION_LISTENERS.append(listener)
+
+
+def _next_position_seq() -> int:
+    global _POSITION_SEQ
+    _POSITION_SEQ += 1
+    return _POSITION_SEQ
+
+
+def _notify_position(path: Path, seq: int, row: Dict[str, object] | None) -> None:
+    for listener in list(_POSITION_LISTENERS):
+        try:
+            listener(path, seq, row)
+        except Exception as exc:  # pragma: no cover - defensive
+            LOGGER.warning("ledger.position_listener_failed", extra={"error": str(exc)})
 
 
 def _apply_position(
@@ -255,7 +330,7 @@ def _apply_position(
     qty: float,
     price: float,
     ts: str,
-) -> None:
+) -> tuple[int, Dict[str, object]]:
     row = conn.execute(
         "SELECT base_qty, avg_price FROM positions WHERE venue = ? AND symbol = ?",
         (venue, symbol),
@@ -306,6 +381,8 @@ def _apply_position(
         """,
         (venue, symbol, base_qty, avg_price, ts),
     )
+    row = {"venue": venue, "symbol": symbol, "base_qty": base_qty, "avg_price": avg_price, "ts": ts}
+    return _next_position_seq(), row
 
 
 def _apply_balance(
@@ -345,16 +422,28 @@ def record_fill(
     fee: float,
     ts: str,
 ) -> int:
-    with _LEDGER_LOCK:
-        conn = _connect()
-        with conn:
-            cursor = conn.execute(
-                """
-                INSERT INTO fills (order_id, venue, symbol, side, qty, price, fee, ts)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (order_id, venue, symbol, side, qty, price, fee, ts),
-            )
+    position: List[tuple[int, Dict[str, object]]] = []
+
+    def _tx(conn: sqlite3.Connection) -> int:
+        cursor = conn.execute(
+            """
+            INSERT INTO fills (order_id, venue, symbol, side, qty, price, fee, ts)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (order_id, venue, symbol, side, qty, price, fee, ts),
+        )
+        fill_id = int(cursor.lastrowid)
+        _pnl_state.apply_fill(
+            conn,
+            fill_id=fill_id,
+            venue=venue,
+            symbol=symbol,
+            side=side,
+            qty=qty,
+            price=price,
+            fee=fee,
+        )
+        position[:] = [
             _apply_position(
                 conn,
                 venue=venue,
@@ -364,50 +453,68 @@ def record_fill(
                 price=price,
                 ts=ts,
             )
-            cash_delta = price * qty
-            if side.lower() == "buy":
-                cash_delta = -cash_delta - fee
-            else:
-                cash_delta = cash_delta - fee
-            _apply_balance(
-                conn,
-                venue=venue,
-                asset="USDT",
-                delta=cash_delta,
-                ts=ts,
-            )
-            _record_event_locked(
-                conn,
-                level="INFO",
-                code="fill_recorded",
-                payload={
-                    "order_id": order_id,
-                    "venue": venue,
-                    "symbol": symbol,
-                    "side": side,
-                    "qty": qty,
-                    "price": price,
-                    "fee": fee,
-                },
-            )
-            return int(cursor.lastrowid)
+        ]
+        cash_delta = price * qty
+        if side.lower() == "buy":
+            cash_delta = -cash_delta - fee
+        else:
+            cash_delta = cash_delta - fee
+        _apply_balance(
+            conn,
+            venue=venue,
+            asset="USDT",
+            delta=cash_delta,
+            ts=ts,
+        )
+        _record_event_locked(
+            conn,
+            level="INFO",
+            code="fill_recorded",
+            payload={
+                "order_id": order_id,
+                "venue": venue,
+                "symbol": symbol,
+                "side": side,
+                "qty": qty,
+                "price": price,
+                "fee": fee,
+            },
+        )
+        return fill_id
+
+    path = Path(LEDGER_PATH)
+    fill_id = _write(_tx)
+    _notify_position(path, *position[0])
+    return fill_id
 
 
 def _record_event_locked(
     conn: sqlite3.Connection, *, level: str, code: str, payload: Dict[str, object]
 ) -> None:
     payload = _attach_fencing_meta(payload)
+    venue, symbol, message = _events.extract(payload)
     conn.execute(
-        "INSERT INTO events (ts, level, code, payload) VALUES (?, ?, ?, ?)",
-        (_now(), level, code, json.dumps(payload, separators=(",", ":"))),
+        """
+        INSERT INTO events (ts, level, code, payload, venue, symbol, message)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+        (
+            _now(),
+            level,
+            code,
+            json.dumps(payload, separators=(",", ":")),
+            venue,
+            symbol,
+            message,
+        ),
     )
 
 
 def record_event(*, level: str, code: str, payload: Dict[str, object]) -> None:
-    with _LEDGER_LOCK:
-        conn = _connect()
-        with conn:
-            _record_event_locked(conn, level=level, code=code, payload=payload)
+    def _tx(conn: sqlite3.Connection) -> None:
+        _record_event_locked(conn, level=level, code=code, payload=payload)
+
+    _write(_tx)
 
 
 def fetch_positions() -> List[Dict[str, object]]:
@@ -416,6 +523,22 @@ def fetch_positions() -> List[Dict[str, object]]:
     return [dict(row) for row in rows]
 
 
+def snapshot_positions() -> tuple[int, List[Dict[str, object]]]:
+    """Return ``(seq, rows)``: every position row and the update sequence they reflect.
+
+    Read inside a write transaction so that no position write can land between
+    the rows and the sequence number; updates with a higher ``seq`` are newer.
+    """
+
+    def _tx(conn: sqlite3.Connection) -> tuple[int, List[Dict[str, object]]]:
+        rows = conn.execute(
+            "SELECT venue, symbol, base_qty, avg_price, ts FROM positions"
+        ).fetchall()
+        return _POSITION_SEQ, [dict(row) for row in rows]
+
+    return _write(_tx)
+
+
 def fetch_balances() -> List[Dict[str, object]]:
     conn = _connect()
     rows = conn.execute("SELECT venue, asset, qty, ts FROM balances").fetchall()
@@ -548,68 +671,6 @@ def _normalise_level(level: str | None) -> str | None:
     return value
 
 
-def _event_message(payload: Mapping[str, object] | None) -> str:
-    if not payload:
-        return ""
-    message = payload.get("message") if isinstance(payload, dict) else None
-    if isinstance(message, str) and message:
-        return message
-    detail = payload.get("detail") if isinstance(payload, dict) else None
-    if isinstance(detail, str) and detail:
-        return detail
-    return json.dumps(payload, separators=(",", ":"), sort_keys=True)
-
-
-def _event_lookup(payload: Mapping[str, object] | None, keys: Sequence[str]) -> str | None:
-    if not isinstance(payload, dict):
-        return None
-    for key in keys:
-        value = payload.get(key)
-        if isinstance(value, str) and value:
-            return value
-    return None
-
-
-def _filter_events(
-    rows: Iterable[sqlite3.Row],
-    *,
-    venue: str | None,
-    symbol: str | None,
-    search: str | None,
-) -> List[Dict[str, object]]:
-    venue_filter = venue.lower() if venue else None
-    symbol_filter = symbol.lower() if symbol else None
-    search_filter = search.lower() if search else None
-    events: List[Dict[str, object]] = []
-    for row in rows:
-        payload = json.loads(row["payload"]) if row["payload"] else {}
-        venue_value = _event_lookup(payload, ("venue", "exchange", "source_venue"))
-        symbol_value = _event_lookup(payload, ("symbol", "pair"))
-        message_value = _event_message(payload)
-        if venue_filter and (venue_value or "").lower() != venue_filter:
-            continue
-        if symbol_filter and (symbol_value or "").lower() != symbol_filter:
-            continue
-        if search_filter and search_filter not in message_value.lower():
-            continue
-        level_value = str(row["level"]).upper()
-        code_value = row["code"]
-        events.append(
-            {
-                "id": int(row["id"]),
-                "ts": row["ts"],
-                "level": level_value,
-                "code": code_value,
-                "type": code_value,
-                "venue": venue_value,
-                "symbol": symbol_value,
-                "message": message_value,
-                "payload": payload,
-            }
-        )
-    return events
-
-
 def fetch_events_page(
     *,
     offset: int = 0,
@@ -621,7 +682,19 @@ def fetch_events_page(
     since: datetime | str | None = None,
     until: datetime | str | None = None,
     search: str | None = None,
+    codes: Sequence[str] | None = None,
+    cursor: str | None = None,
+    with_total: bool | None = None,
 ) -> Dict[str, object]:
+    """One page of events, filtered, ordered and paginated in SQL.
+
+    ``cursor`` (the ``next_cursor`` of a previous page) continues after the
+    last event of that page; ``offset`` is applied on top of it. ``total``
+    needs a ``COUNT(*)`` over the whole filter, so by default it is only
+    computed for the first page (no ``cursor``) and is ``None`` on the pages
+    after it; pass ``with_total`` to force it on or off.
+    """
+
     try:
         limit_value = int(limit)
     except (TypeError, ValueError) as exc:
@@ -639,6 +712,7 @@ def fetch_events_page(
     order_value = str(order or "desc").lower()
     if order_value not in {"asc", "desc"}:
         raise ValueError("order must be either 'asc' or 'desc'")
+    after = _events.decode_cursor(cursor) if cursor else None
 
     level_value = _normalise_level(level)
     since_dt = _parse_timestamp(since)
@@ -649,39 +723,50 @@ def fetch_events_page(
         raise ValueError("time window must not exceed 7 days")
 
     conn = _connect()
-    conditions: List[str] = []
-    params: List[object] = []
-    if since_dt:
-        conditions.append("ts >= ?")
-        params.append(since_dt.isoformat())
-    if until_dt:
-        conditions.append("ts <= ?")
-        params.append(until_dt.isoformat())
-    if level_value:
-        conditions.append("lower(level) = ?")
-        params.append(level_value)
-    query = "SELECT id, ts, level, code, payload FROM events"
-    if conditions:
-        query += " WHERE " + " AND ".join(conditions)
-    query += " ORDER BY ts DESC, id DESC"
-    rows = conn.execute(query, tuple(params)).fetchall()
-    events = _filter_events(rows, venue=venue, symbol=symbol, search=search)
-    if order_value == "asc":
-        events.reverse()
-    total = len(events)
-    start = min(offset_value, total)
-    end = min(start + limit_value, total)
-    items = events[start:end]
-    next_offset = end if end < total else end
-    has_more = end < total
+    conditions, params = _events.filter_clause(
+        since=since_dt.isoformat() if since_dt else None,
+        until=until_dt.isoformat() if until_dt else None,
+        level=level_value,
+        codes=list(codes) if codes else None,
+        venue=venue,
+        symbol=symbol,
+        search=search,
+        use_fts=_events.fts_available(conn),
+    )
+    if with_total is None:
+        with_total = cursor is None
+    total: int | None = None
+    if with_total:
+        where = " WHERE " + " AND ".join(conditions) if conditions else ""
+        total = int(conn.execute(f"SELECT COUNT(*) FROM events{where}", params).fetchone()[0])
+
+    direction = "DESC" if order_value == "desc" else "ASC"
+    page_conditions = list(conditions)
+    page_params = list(params)
+    if after is not None:
+        page_conditions.append("(ts, id) < (?, ?)" if direction == "DESC" else "(ts, id) > (?, ?)")
+        page_params.extend(after)
+    query = "SELECT id, ts, level, code, payload, venue, symbol, message FROM events"
+    if page_conditions:
+        query += " WHERE " + " AND ".join(page_conditions)
+    query += f" ORDER BY ts {direction}, id {direction} LIMIT ? OFFSET ?"
+    if after is None and total is not None:
+        offset_value = min(offset_value, total)
+    rows = conn.execute(query, (*page_params, limit_value + 1, offset_value)).fetchall()
+    has_more = len(rows) > limit_value
+    items = [_events.page_item(row) for row in rows[:limit_value]]
+    next_cursor = (
+        _events.encode_cursor(items[-1]["ts"], items[-1]["id"]) if has_more and items else None
+    )
     return {
         "items": items,
         "total": total,
-        "offset": start,
+        "offset": offset_value,
         "limit": limit_value,
         "order": order_value,
-        "next_offset": next_offset,
+        "next_offset": offset_value + len(items),
         "has_more": has_more,
+        "next_cursor": next_cursor,
     }
 
 
@@ -696,6 +781,7 @@ def fetch_events(
     since: datetime | str | None = None,
     until: datetime | str | None = None,
     search: str | None = None,
+    codes: Sequence[str] | None = None,
 ) -> List[Dict[str, object]]:
     page = fetch_events_page(
         offset=offset,
@@ -707,6 +793,8 @@ def fetch_events(
         since=since,
         until=until,
         search=search,
+        codes=codes,
+        with_total=False,
     )
     return page["items"]
 
@@ -730,36 +818,10 @@ def compute_exposures() -> List[Dict[str, object]]:
 
 
 def compute_pnl() -> Dict[str, float]:
+    """Realized PnL from the incremental ``pnl_state`` rows plus position notional."""
+
     conn = _connect()
-    rows = conn.execute(
-        "SELECT venue, symbol, side, qty, price, fee FROM fills ORDER BY id ASC"
-    ).fetchall()
-    position_state: Dict[Tuple[str, str], Dict[str, float]] = {}
-    realized = 0.0
-    for row in rows:
-        key = (row["venue"], row["symbol"])
-        state = position_state.setdefault(key, {"qty": 0.0, "avg": 0.0})
-        qty = float(row["qty"])
-        price = float(row["price"])
-        fee = float(row["fee"])
-        side = row["side"].lower()
-        if side == "buy":
-            prev_qty = state["qty"]
-            prev_cost = state["avg"] * prev_qty
-            new_qty = prev_qty + qty
-            total_cost = prev_cost + price * qty + fee
-            state["qty"] = new_qty
-            state["avg"] = total_cost / new_qty if new_qty else 0.0
-        else:
-            held_qty = state["qty"]
-            if held_qty <= 0:
-                realized += price * qty - fee
-            else:
-                trade_qty = min(qty, held_qty)
-                realized += (price - state["avg"]) * trade_qty - fee
-                state["qty"] = max(0.0, held_qty - trade_qty)
-                if state["qty"] == 0:
-                    state["avg"] = 0.0
+    realized = _pnl_state.realized_total(conn)
     unrealized = 0.0
     for row in conn.execute("SELECT base_qty, avg_price FROM positions").fetchall():
         unrealized += float(row["base_qty"]) * float(row["avg_price"])
@@ -767,27 +829,46 @@ def compute_pnl() -> Dict[str, float]:
     return {"realized": realized, "unrealized": unrealized, "total": total}
 
 
+def verify_pnl_state() -> List[Dict[str, object]]:
+    """Compare the incremental PnL state with a full replay of ``fills``."""
+
+    return _pnl_state.verify(_connect())
+
+
+def rebuild_pnl_state() -> int:
+    """Recompute ``pnl_state`` from every recorded fill; return the number of rows."""
+
+    return _write(_pnl_state.rebuild)
+
+
 def reset() -> None:
-    with _LEDGER_LOCK:
-        conn = _connect()
-        with conn:
-            tables = ["orders", "fills", "positions", "balances", "events"]
-            if _feature_enabled("FEATURE_JOURNAL"):
-                tables.append("order_journal")
-            for table in tables:
-                if table not in SAFE_RESET_TABLES:
-                    raise ValueError(f"Unexpected table name: {table}")
-                conn.execute(f"DELETE FROM {table}")  # nosec B608  # table name validated
+    seq: List[int] = []
+
+    def _tx(conn: sqlite3.Connection) -> None:
+        tables = ["orders", "fills", "positions", "balances", "events", "pnl_state"]
+        if _feature_enabled("FEATURE_JOURNAL"):
+            tables.append("order_journal")
+        for table in tables:
+            if table not in SAFE_RESET_TABLES:
+                raise ValueError(f"Unexpected table name: {table}")
+            conn.execute(f"DELETE FROM {table}")  # nosec B608  # table name validated
+        seq[:] = [_next_position_seq()]
+
+    path = Path(LEDGER_PATH)
+    _write(_tx)
+    _notify_position(path, seq[0], None)
 
 
 __all__ = [
     "LEDGER_PATH",
+    "add_position_listener",
     "compute_exposures",
     "compute_pnl",
     "fetch_open_orders",
     "fetch_recent_fills",
     "fetch_fills_since",
     "get_order",
+    "get_order_by_key",
     "fetch_balances",
     "fetch_events",
     "fetch_events_page",
@@ -797,6 +878,9 @@ __all__ = [
     "record_event",
     "record_fill",
     "record_order",
+    "rebuild_pnl_state",
     "reset",
+    "snapshot_positions",
     "update_order_status",
+    "verify_pnl_state",
 ]
@@ -0,0 +1,256 @@
+"""Indexed columns, full-text search and keyset pagination for ledger events.
+
+``record_event`` extracts ``venue``, ``symbol`` and the display ``message``
+from the payload at insert time, so the event log can filter, search and
+paginate entirely in SQL instead of decoding every payload in Python:
+
+* ``(ts, id)``, ``code``, ``venue`` and ``symbol`` are indexed, with
+  ``(ts, id)`` as the trailing key so filtered pages come back in order.
+* ``events_fts`` is an external-content FTS5 table over ``message`` using the
+  trigram tokenizer, which keeps the old case-insensitive substring semantics
+  of ``search``. Without FTS5 (or for terms shorter than three characters)
+  search falls back to ``LIKE``.
+* Pages are addressed by an opaque cursor encoding the last ``(ts, id)``.
+
+Databases created before these columns existed are migrated by
+:func:`ensure_schema` (columns and indexes), :func:`backfill` (extracted
+values for old rows, in batches) and :func:`ensure_fts` (index build).
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import logging
+import sqlite3
+from typing import Dict, List, Mapping, Sequence, Tuple
+
+LOGGER = logging.getLogger(__name__)
+
+_COLUMNS = (
+    ("venue", "TEXT COLLATE NOCASE"),
+    ("symbol", "TEXT COLLATE NOCASE"),
+    ("message", "TEXT"),
+)
+
+_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_events_ts_id ON events(ts, id)",
+    "CREATE INDEX IF NOT EXISTS idx_events_code ON events(code COLLATE NOCASE, ts, id)",
+    "CREATE INDEX IF NOT EXISTS idx_events_venue ON events(venue, ts, id)",
+    "CREATE INDEX IF NOT EXISTS idx_events_symbol ON events(symbol, ts, id)",
+)
+
+_FTS_TRIGGERS = (
+    """
+    CREATE TRIGGER IF NOT EXISTS events_fts_ai AFTER INSERT ON events BEGIN
+        INSERT INTO events_fts(rowid, message) VALUES (new.id, new.message);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS events_fts_ad AFTER DELETE ON events BEGIN
+        INSERT INTO events_fts(events_fts, rowid, message) VALUES ('delete', old.id, old.message);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS events_fts_au AFTER UPDATE OF message ON events BEGIN
+        INSERT INTO events_fts(events_fts, rowid, message) VALUES ('delete', old.id, old.message);
+        INSERT INTO events_fts(rowid, message) VALUES (new.id, new.message);
+    END
+    """,
+)
+
+_TRIGRAM = 3
+
+
+def event_lookup(payload: Mapping[str, object] | None, keys: Sequence[str]) -> str | None:
+    if not isinstance(payload, dict):
+        return None
+    for key in keys:
+        value = payload.get(key)
+        if isinstance(value, str) and value:
+            return value
+    return None
+
+
+def event_message(payload: Mapping[str, object] | None) -> str:
+    if not payload:
+        return ""
+    message = payload.get("message") if isinstance(payload, dict) else None
+    if isinstance(message, str) and message:
+        return message
+    detail = payload.get("detail") if isinstance(payload, dict) else None
+    if isinstance(detail, str) and detail:
+        return detail
+    return json.dumps(payload, separators=(",", ":"), sort_keys=True)
+
+
+def extract(payload: Mapping[str, object] | None) -> Tuple[str | None, str | None, str]:
+    """Return the ``(venue, symbol, message)`` columns stored for ``payload``."""
+
+    return (
+        event_lookup(payload, ("venue", "exchange", "source_venue")),
+        event_lookup(payload, ("symbol", "pair")),
+        event_message(payload),
+    )
+
+
+# ----------------------------------------------------------------------
+# Schema and migration
+
+
+def ensure_schema(conn: sqlite3.Connection) -> None:
+    """Add the extracted columns and indexes to ``events`` if they are missing."""
+
+    existing = {row[1] for row in conn.execute("PRAGMA table_info(events)")}
+    for name, decl in _COLUMNS:
+        if name not in existing:
+            conn.execute(f"ALTER TABLE events ADD COLUMN {name} {decl}")
+    for statement in _INDEXES:
+        conn.execute(statement)
+
+
+def backfill(conn: sqlite3.Connection, *, after: int = 0, batch: int = 5_000) -> int | None:
+    """Populate the extracted columns for up to ``batch`` legacy rows past id ``after``.
+
+    Returns the last id visited, to pass as ``after`` for the next batch, or
+    ``None`` once no legacy rows remain. Walking the primary key from
+    ``after`` keeps each batch from rescanning the rows already migrated.
+    """
+
+    rows = conn.execute(
+        "SELECT id, payload FROM events WHERE id > ? AND message IS NULL ORDER BY id LIMIT ?",
+        (after, batch),
+    ).fetchall()
+    if not rows:
+        return None
+    updates = []
+    for row in rows:
+        try:
+            payload = json.loads(row["payload"]) if row["payload"] else {}
+        except json.JSONDecodeError:
+            payload = {}
+        updates.append((*extract(payload), int(row["id"])))
+    conn.executemany("UPDATE events SET venue = ?, symbol = ?, message = ? WHERE id = ?", updates)
+    return updates[-1][-1]
+
+
+def ensure_fts(conn: sqlite3.Connection) -> bool:
+    """Create and populate ``events_fts`` if possible; return whether it is available."""
+
+    if fts_available(conn):
+        return True
+    try:
+        conn.execute(
+            "CREATE VIRTUAL TABLE events_fts USING fts5("
+            "message, content='events', content_rowid='id', tokenize='trigram')"
+        )
+    except sqlite3.OperationalError as exc:
+        LOGGER.warning("ledger.events_fts_unavailable", extra={"error": str(exc)})
+        return False
+    for statement in _FTS_TRIGGERS:
+        conn.execute(statement)
+    conn.execute("INSERT INTO events_fts(events_fts) VALUES ('rebuild')")
+    return True
+
+
+def fts_available(conn: sqlite3.Connection) -> bool:
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'events_fts'"
+    ).fetchone()
+    return row is not None
+
+
+# ----------------------------------------------------------------------
+# Queries
+
+
+def encode_cursor(ts: str, event_id: int) -> str:
+    raw = json.dumps([ts, int(event_id)], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        ts, event_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return str(ts), int(event_id)
+    except (ValueError, TypeError, UnicodeEncodeError) as exc:
+        raise ValueError("invalid cursor") from exc
+
+
+def _like_escape(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def filter_clause(
+    *,
+    since: str | None,
+    until: str | None,
+    level: str | None,
+    codes: Sequence[str] | None,
+    venue: str | None,
+    symbol: str | None,
+    search: str | None,
+    use_fts: bool,
+) -> Tuple[List[str], List[object]]:
+    """SQL conditions and parameters for the event filters (no pagination)."""
+
+    conditions: List[str] = []
+    params: List[object] = []
+    if since:
+        conditions.append("ts >= ?")
+        params.append(since)
+    if until:
+        conditions.append("ts <= ?")
+        params.append(until)
+    if level:
+        conditions.append("level = ? COLLATE NOCASE")
+        params.append(level)
+    if codes:
+        placeholders = ", ".join("?" for _ in codes)
+        conditions.append(f"code COLLATE NOCASE IN ({placeholders})")
+        params.extend(codes)
+    if venue:
+        conditions.append("venue = ?")
+        params.append(venue)
+    if symbol:
+        conditions.append("symbol = ?")
+        params.append(symbol)
+    if search:
+        if use_fts and len(search) >= _TRIGRAM:
+            phrase = '"' + search.replace('"', '""') + '"'
+            conditions.append("id IN (SELECT rowid FROM events_fts WHERE events_fts MATCH ?)")
+            params.append(phrase)
+        else:
+            conditions.append("message LIKE ? ESCAPE '\\'")
+            params.append(f"%{_like_escape(search)}%")
+    return conditions, params
+
+
+def page_item(row: Mapping[str, object]) -> Dict[str, object]:
+    payload = json.loads(row["payload"]) if row["payload"] else {}
+    code_value = row["code"]
+    return {
+        "id": int(row["id"]),
+        "ts": row["ts"],
+        "level": str(row["level"]).upper(),
+        "code": code_value,
+        "type": code_value,
+        "venue": row["venue"],
+        "symbol": row["symbol"],
+        "message": row["message"] or "",
+        "payload": payload,
+    }
+
+
+__all__ = [
+    "backfill",
+    "decode_cursor",
+    "encode_cursor",
+    "ensure_fts",
+    "ensure_schema",
+    "extract",
+    "filter_clause",
+    "fts_available",
+    "page_item",
+]
@@ -0,0 +1,218 @@
+"""Incremental realized-PnL state for the ledger.
+
+``pnl_state`` keeps one row per ``(venue, symbol)`` with the running long
+quantity, its fee-inclusive average cost and the realized PnL accumulated so
+far. ``record_fill`` folds each fill into its row inside the same transaction
+that inserts the fill, so ``compute_pnl`` only has to sum O(positions) rows
+instead of replaying the whole ``fills`` table.
+
+:func:`replay` is the reference implementation: a full replay of every fill in
+id order. :func:`verify` compares it with the stored rows and :func:`rebuild`
+replaces them with it.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Tuple
+
+Key = Tuple[str, str]
+
+TOLERANCE = 1e-6
+
+
+@dataclass
+class PnLState:
+    qty: float = 0.0
+    avg: float = 0.0
+    realized: float = 0.0
+    last_fill_id: int = 0
+
+    def apply(self, *, side: str, qty: float, price: float, fee: float) -> None:
+        """Fold one fill into the state.
+
+        Buys extend the long position at fee-inclusive cost; sells realise
+        against the average cost of what is held, and sells with nothing held
+        realise their full proceeds.
+        """
+
+        if side.lower() == "buy":
+            new_qty = self.qty + qty
+            total_cost = self.avg * self.qty + price * qty + fee
+            self.qty = new_qty
+            self.avg = total_cost / new_qty if new_qty else 0.0
+            return
+        held_qty = self.qty
+        if held_qty <= 0:
+            self.realized += price * qty - fee
+            return
+        trade_qty = min(qty, held_qty)
+        self.realized += (price - self.avg) * trade_qty - fee
+        self.qty = max(0.0, held_qty - trade_qty)
+        if self.qty == 0:
+            self.avg = 0.0
+
+
+def create_table(conn: sqlite3.Connection) -> bool:
+    """Create ``pnl_state`` if missing; return ``True`` when it was created."""
+
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'pnl_state'"
+    ).fetchone()
+    if exists:
+        return False
+    conn.execute(
+        """
+        CREATE TABLE pnl_state (
+            venue TEXT NOT NULL,
+            symbol TEXT NOT NULL,
+            qty REAL NOT NULL,
+            avg REAL NOT NULL,
+            realized REAL NOT NULL,
+            last_fill_id INTEGER NOT NULL,
+            PRIMARY KEY(venue, symbol)
+        )
+        """
+    )
+    return True
+
+
+def _row_state(row: Mapping[str, object] | None) -> PnLState:
+    if row is None:
+        return PnLState()
+    return PnLState(
+        qty=float(row["qty"]),
+        avg=float(row["avg"]),
+        realized=float(row["realized"]),
+        last_fill_id=int(row["last_fill_id"]),
+    )
+
+
+def _store(conn: sqlite3.Connection, key: Key, state: PnLState) -> None:
+    conn.execute(
+        """
+        INSERT INTO pnl_state (venue, symbol, qty, avg, realized, last_fill_id)
+        VALUES (?, ?, ?, ?, ?, ?)
+        ON CONFLICT(venue, symbol) DO UPDATE SET
+            qty = excluded.qty,
+            avg = excluded.avg,
+            realized = excluded.realized,
+            last_fill_id = excluded.last_fill_id
+        """,
+        (key[0], key[1], state.qty, state.avg, state.realized, state.last_fill_id),
+    )
+
+
+def apply_fill(
+    conn: sqlite3.Connection,
+    *,
+    fill_id: int,
+    venue: str,
+    symbol: str,
+    side: str,
+    qty: float,
+    price: float,
+    fee: float,
+) -> None:
+    """Fold a freshly inserted fill into its ``pnl_state`` row (same transaction)."""
+
+    row = conn.execute(
+        "SELECT qty, avg, realized, last_fill_id FROM pnl_state WHERE venue = ? AND symbol = ?",
+        (venue, symbol),
+    ).fetchone()
+    state = _row_state(row)
+    state.apply(side=side, qty=float(qty), price=float(price), fee=float(fee))
+    state.last_fill_id = fill_id
+    _store(conn, (venue, symbol), state)
+
+
+def load(conn: sqlite3.Connection) -> Dict[Key, PnLState]:
+    rows = conn.execute(
+        "SELECT venue, symbol, qty, avg, realized, last_fill_id FROM pnl_state"
+    ).fetchall()
+    return {(row["venue"], row["symbol"]): _row_state(row) for row in rows}
+
+
+def realized_total(conn: sqlite3.Connection) -> float:
+    row = conn.execute("SELECT COALESCE(SUM(realized), 0.0) FROM pnl_state").fetchone()
+    return float(row[0])
+
+
+def replay(rows: Iterable[Mapping[str, object]]) -> Dict[Key, PnLState]:
+    """Rebuild the state from fill rows given in id order."""
+
+    states: Dict[Key, PnLState] = {}
+    for row in rows:
+        state = states.setdefault((row["venue"], row["symbol"]), PnLState())
+        state.apply(
+            side=str(row["side"]),
+            qty=float(row["qty"]),
+            price=float(row["price"]),
+            fee=float(row["fee"]),
+        )
+        state.last_fill_id = int(row["id"])
+    return states
+
+
+def replay_fills(conn: sqlite3.Connection) -> Dict[Key, PnLState]:
+    rows = conn.execute(
+        "SELECT id, venue, symbol, side, qty, price, fee FROM fills ORDER BY id ASC"
+    )
+    return replay(rows)
+
+
+def _close(a: float, b: float) -> bool:
+    return abs(a - b) <= TOLERANCE * max(1.0, abs(a), abs(b))
+
+
+def verify(conn: sqlite3.Connection) -> List[Dict[str, object]]:
+    """Compare stored state with a full replay; return one entry per mismatching key."""
+
+    expected = replay_fills(conn)
+    stored = load(conn)
+    mismatches: List[Dict[str, object]] = []
+    for key in sorted(set(expected) | set(stored)):
+        want = expected.get(key, PnLState())
+        have = stored.get(key, PnLState())
+        fields = [
+            name
+            for name in ("qty", "avg", "realized")
+            if not _close(getattr(want, name), getattr(have, name))
+        ]
+        if want.last_fill_id != have.last_fill_id:
+            fields.append("last_fill_id")
+        if fields:
+            mismatches.append(
+                {
+                    "venue": key[0],
+                    "symbol": key[1],
+                    "fields": fields,
+                    "expected": vars(want),
+                    "stored": vars(have),
+                }
+            )
+    return mismatches
+
+
+def rebuild(conn: sqlite3.Connection) -> int:
+    """Replace ``pnl_state`` with a full replay of ``fills``; return the row count."""
+
+    states = replay_fills(conn)
+    conn.execute("DELETE FROM pnl_state")
+    for key, state in states.items():
+        _store(conn, key, state)
+    return len(states)
+
+
+__all__ = [
+    "PnLState",
+    "apply_fill",
+    "create_table",
+    "load",
+    "realized_total",
+    "rebuild",
+    "replay",
+    "replay_fills",
+    "verify",
+]
@@ -62,6 +62,7 @@ from .readiness.live import registry as readiness_registry
 from .alerts.registry import REGISTRY as alerts_registry
 from .market.watchdog import watchdog as market_watchdog
 from .ops.status_snapshot import build_ops_snapshot, ops_snapshot_to_dict
+from .risk.exposure_caps import setup_exposure_index_verifier
 from .risk.risk_governor import get_risk_governor
 from .ui.config_snapshot import build_ui_config_snapshot
 from .metrics.observability import observe_api_latency, register_slo_metrics
@@ -69,6 +70,7 @@ from .auto_hedge_daemon import setup_auto_hedge_daemon
 from .startup_validation import validate_startup
 from .profile_config import ProfileConfigError, load_profile_config
 from .config.profiles import resolve_guard_status
+from .config.runtime_settings import reload_runtime_settings
 from .startup_resume import perform_resume as perform_startup_resume
 from services.opportunity_scanner import setup_scanner as setup_opportunity_scanner
 from .services.autopilot import setup_autopilot
@@ -124,6 +126,7 @@ def _startup_timeout_seconds(state) -> float:
 def create_app() -> FastAPI:
     ledger.init_db()
     validate_startup()
+    reload_runtime_settings()
     profile = get_trading_profile()
     logger.info(
         "Trading profile active: %s limits(order=%s symbol=%s global=%s daily_loss=%s) allow_new_orders=%s closures_only=%s",
@@ -316,6 +319,7 @@ def create_app() -> FastAPI:
     setup_partial_hedge_runner(app)
     setup_stuck_resolver(app)
     setup_slo_monitor(app)
+    setup_exposure_index_verifier(app)
 
     @app.on_event("startup")
     async def _install_shutdown_handlers() -> None:  # pragma: no cover - integration glue
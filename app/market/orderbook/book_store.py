@@ -4,9 +4,21 @@ from __future__ import annotations
 
 import threading
 import time
+from bisect import bisect_left, insort
 from collections import deque
 from dataclasses import dataclass, field
-from typing import Callable, Deque, Dict, Iterable, List, Mapping, MutableMapping, Tuple, TypedDict
+from typing import (
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    MutableMapping,
+    Sequence,
+    Tuple,
+    TypedDict,
+)
 
 from app.metrics.observability import set_market_data_staleness
 from app.market.streams.base_ws import WsState
@@ -73,37 +85,152 @@ class BookSide:
         return [(p, self.levels[p]) for p in prices]
 
 
+@dataclass(slots=True)
+class LadderBookSide:
+    """Bisect-backed price ladder keeping levels sorted as diffs arrive.
+
+    Prices are held in an ascending array next to the price -> size map, so
+    the best level is read from one end of the array and depth slices are
+    taken without re-sorting the side.
+    """
+
+    descending: bool
+    levels: Dict[float, float] = field(default_factory=dict)
+    _prices: List[float] = field(default_factory=list)
+
+    def apply(self, updates: Iterable[Tuple[float, float]]) -> None:
+        levels = self.levels
+        prices = self._prices
+        for price, size in updates:
+            price_f = float(price)
+            size_f = float(size)
+            if size_f <= 0:
+                if levels.pop(price_f, None) is not None:
+                    del prices[bisect_left(prices, price_f)]
+                continue
+            if price_f not in levels:
+                insort(prices, price_f)
+            levels[price_f] = size_f
+
+    def top(self) -> Tuple[float | None, float | None]:
+        if not self._prices:
+            return None, None
+        price = self._prices[-1] if self.descending else self._prices[0]
+        return price, self.levels[price]
+
+    def as_list(self, depth: int | None = None) -> List[Tuple[float, float]]:
+        prices = self._prices
+        if not prices or (depth is not None and depth <= 0):
+            return []
+        if self.descending:
+            selected = prices[::-1] if depth is None else prices[: -depth - 1 : -1]
+        else:
+            selected = prices if depth is None else prices[:depth]
+        levels = self.levels
+        return [(p, levels[p]) for p in selected]
+
+
+BookSideEngine = BookSide | LadderBookSide
+BookSideFactory = Callable[[bool], BookSideEngine]
+
+
+def _ladder_side(descending: bool) -> BookSideEngine:
+    return LadderBookSide(descending=descending)
+
+
+@dataclass(frozen=True, slots=True)
+class TopOfBook:
+    """Immutable top-of-book view published after every book mutation."""
+
+    bid: float | None = None
+    bid_size: float | None = None
+    ask: float | None = None
+    ask_size: float | None = None
+    seq: int | None = None
+    version: int = 0
+
+    def as_dict(self) -> Dict[str, float | int | None]:
+        return {
+            "bid": self.bid,
+            "bid_size": self.bid_size,
+            "ask": self.ask,
+            "ask_size": self.ask_size,
+            "seq": self.seq,
+            "version": self.version,
+        }
+
+
+_EMPTY_TOP = TopOfBook()
+
+
 @dataclass(slots=True)
 class BookRecord:
     venue: str
     symbol: str
-    bids: BookSide = field(default_factory=lambda: BookSide(descending=True))
-    asks: BookSide = field(default_factory=lambda: BookSide(descending=False))
+    bids: BookSideEngine = field(default_factory=lambda: LadderBookSide(descending=True))
+    asks: BookSideEngine = field(default_factory=lambda: LadderBookSide(descending=False))
     last_applied_seq: int | None = None
     last_update_ts: float | None = None
     state: WsState = WsState.DOWN
     last_reason: str = ""
     resyncs: int = 0
     diff_history: RingBuffer = field(default_factory=lambda: RingBuffer(capacity=20))
+    top: TopOfBook = _EMPTY_TOP
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def publish_top(self) -> None:
+        """Swap in a fresh :class:`TopOfBook`; callers must hold ``lock``."""
+
+        bid_price, bid_size = self.bids.top()
+        ask_price, ask_size = self.asks.top()
+        self.top = TopOfBook(
+            bid=bid_price,
+            bid_size=bid_size,
+            ask=ask_price,
+            ask_size=ask_size,
+            seq=self.last_applied_seq,
+            version=self.top.version + 1,
+        )
 
 
 class OrderBookStore:
-    """Thread-safe order book cache supporting diff and snapshot application."""
+    """Order book cache supporting diff and snapshot application.
 
-    def __init__(self, *, now: Callable[[], float] | None = None) -> None:
+    Each book carries its own lock, so writers on one ``(venue, symbol)`` never
+    block another book. Top-of-book readers take no lock at all: every
+    mutation publishes an immutable :class:`TopOfBook` that readers pick up
+    with a single attribute read. The store-wide lock only guards creation of
+    new book records.
+    """
+
+    def __init__(
+        self,
+        *,
+        now: Callable[[], float] | None = None,
+        side_factory: BookSideFactory | None = None,
+    ) -> None:
         self._books: Dict[Tuple[str, str], BookRecord] = {}
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()
         self._now = now or time.time
+        self._side_factory = side_factory or _ladder_side
 
     def _key(self, venue: str, symbol: str) -> Tuple[str, str]:
         return (venue.lower(), symbol.upper())
 
     def get_or_create(self, venue: str, symbol: str) -> BookRecord:
         key = self._key(venue, symbol)
+        record = self._books.get(key)
+        if record is not None:
+            return record
         with self._lock:
             record = self._books.get(key)
             if record is None:
-                record = BookRecord(venue=venue, symbol=symbol)
+                record = BookRecord(
+                    venue=venue,
+                    symbol=symbol,
+                    bids=self._side_factory(True),
+                    asks=self._side_factory(False),
+                )
                 self._books[key] = record
             return record
 
@@ -118,9 +245,9 @@ class OrderBookStore:
         ts_ms: int | None = None,
     ) -> None:
         record = self.get_or_create(venue, symbol)
-        with self._lock:
-            record.bids = BookSide(descending=True)
-            record.asks = BookSide(descending=False)
+        with record.lock:
+            record.bids = self._side_factory(True)
+            record.asks = self._side_factory(False)
             record.bids.apply(bids)
             record.asks.apply(asks)
             record.last_applied_seq = last_seq
@@ -129,11 +256,12 @@ class OrderBookStore:
             record.last_update_ts = timestamp
             record.state = WsState.CONNECTED
             record.last_reason = "snapshot"
-            set_market_data_staleness(venue, symbol, 0.0)
+            record.publish_top()
+        set_market_data_staleness(venue, symbol, 0.0)
 
     def apply_diff(self, venue: str, event: DiffEvent) -> None:
         record = self.get_or_create(venue, event["symbol"])
-        with self._lock:
+        with record.lock:
             seq_from = int(event["seq_from"])
             seq_to = int(event["seq_to"])
             last_seq = record.last_applied_seq
@@ -149,64 +277,112 @@ class OrderBookStore:
             record.diff_history.append(event)
             record.state = WsState.CONNECTED
             record.last_reason = "diff"
-            age = max(self._now() - (record.last_update_ts or self._now()), 0.0)
-            set_market_data_staleness(venue, record.symbol, age)
-            self._books[self._key(venue, record.symbol)] = record
+            record.publish_top()
+            age = self._staleness(record, self._now())
+        set_market_data_staleness(venue, record.symbol, age)
+
+    def apply_diff_batch(self, venue: str, events: Sequence[DiffEvent]) -> DiffEvent | None:
+        """Apply a contiguous run of diffs for one symbol as a single update.
+
+        Sequence continuity is checked once across the run, level updates are
+        merged with last-write-wins per price, and the merged diff is applied
+        under one lock acquisition with a single history append and staleness
+        gauge update. Returns the merged diff, or ``None`` for an empty run.
+        """
+
+        if not events:
+            return None
+        first = events[0]
+        bids: Dict[float, float] = {}
+        asks: Dict[float, float] = {}
+        previous_to: int | None = None
+        for event in events:
+            if event["symbol"] != first["symbol"]:
+                raise ValueError(
+                    f"mixed symbols in diff batch for {venue}: {first['symbol']} != {event['symbol']}"
+                )
+            seq_from = int(event["seq_from"])
+            if previous_to is not None and seq_from != previous_to + 1:
+                raise ValueError(
+                    f"non-contiguous diff batch for {venue}/{first['symbol']}: "
+                    f"expected {previous_to + 1}, got {seq_from}"
+                )
+            previous_to = int(event["seq_to"])
+            for price, size in event.get("bids", []):
+                bids[float(price)] = float(size)
+            for price, size in event.get("asks", []):
+                asks[float(price)] = float(size)
+        merged: DiffEvent = {
+            "symbol": first["symbol"],
+            "bids": list(bids.items()),
+            "asks": list(asks.items()),
+            "seq_from": int(first["seq_from"]),
+            "seq_to": int(events[-1]["seq_to"]),
+            "ts_ms": events[-1].get("ts_ms") or 0,
+        }
+        self.apply_diff(venue, merged)
+        return merged
 
     def record_resync(self, venue: str, symbol: str, reason: str) -> None:
         record = self.get_or_create(venue, symbol)
-        with self._lock:
+        with record.lock:
             record.resyncs += 1
             record.state = WsState.RESYNCING
             record.last_reason = reason
 
     def set_state(self, venue: str, symbol: str, state: WsState, reason: str | None = None) -> None:
         record = self.get_or_create(venue, symbol)
-        with self._lock:
+        with record.lock:
             record.state = state
             if reason:
                 record.last_reason = reason
 
+    def get_top_snapshot(self, venue: str, symbol: str) -> TopOfBook:
+        """Return the latest published top-of-book without taking any lock."""
+
+        record = self._books.get(self._key(venue, symbol))
+        if record is None:
+            record = self.get_or_create(venue, symbol)
+        return record.top
+
     def get_top_of_book(self, venue: str, symbol: str) -> Mapping[str, float | int | None]:
-        record = self.get_or_create(venue, symbol)
-        with self._lock:
-            bid_price, bid_size = record.bids.top()
-            ask_price, ask_size = record.asks.top()
-            return {
-                "bid": bid_price,
-                "bid_size": bid_size,
-                "ask": ask_price,
-                "ask_size": ask_size,
-                "seq": record.last_applied_seq,
-            }
+        return self.get_top_snapshot(venue, symbol).as_dict()
+
+    @staticmethod
+    def _staleness(record: BookRecord, now: float) -> float:
+        if record.last_update_ts is None:
+            return float("inf")
+        return max(now - record.last_update_ts, 0.0)
 
     def get_staleness_s(self, venue: str, symbol: str) -> float:
-        record = self.get_or_create(venue, symbol)
-        with self._lock:
-            if record.last_update_ts is None:
-                return float("inf")
-            return max(self._now() - record.last_update_ts, 0.0)
+        return self._staleness(self.get_or_create(venue, symbol), self._now())
 
     def status_snapshot(self) -> List[Dict[str, object]]:
         with self._lock:
-            payload: List[Dict[str, object]] = []
-            for record in self._books.values():
-                payload.append(
-                    {
-                        "venue": record.venue,
-                        "symbol": record.symbol,
-                        "state": record.state.value,
-                        "last_seq": record.last_applied_seq,
-                        "staleness_s": self.get_staleness_s(record.venue, record.symbol),
-                        "resyncs": record.resyncs,
-                        "last_reason": record.last_reason,
-                    }
-                )
-            return sorted(payload, key=lambda item: (item["venue"], item["symbol"]))
+            records = list(self._books.values())
+        now = self._now()
+        payload: List[Dict[str, object]] = []
+        for record in records:
+            payload.append(
+                {
+                    "venue": record.venue,
+                    "symbol": record.symbol,
+                    "state": record.state.value,
+                    "last_seq": record.last_applied_seq,
+                    "staleness_s": self._staleness(record, now),
+                    "resyncs": record.resyncs,
+                    "last_reason": record.last_reason,
+                }
+            )
+        return sorted(payload, key=lambda item: (item["venue"], item["symbol"]))
 
 
 __all__ = [
+    "BookSide",
+    "BookSideFactory",
     "DiffEvent",
+    "LadderBookSide",
     "OrderBookStore",
     "RingBuffer",
+    "TopOfBook",
 ]
@@ -3,9 +3,20 @@ from __future__ import annotations
 """Shared helpers for venue specific websocket resync flows."""
 
 import logging
+import threading
 import time
-from collections import defaultdict
-from typing import Callable, DefaultDict, Iterable, Mapping
+from collections import defaultdict, deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Callable, DefaultDict, Deque, Iterable, Mapping
+
+from app.metrics.market_ws import (
+    WS_DIFF_BATCH_SIZE,
+    WS_DIFF_BATCH_TIME_SAVED_SECONDS,
+    WS_DIFF_COALESCED_TOTAL,
+    WS_PENDING_DROPPED_TOTAL,
+    WS_PENDING_HIGH_WATER,
+    WS_RESYNC_DURATION_SECONDS,
+)
 
 from .base_ws import GapDetector, WsConnector, WsState
 from ..orderbook.book_store import DiffEvent, OrderBookStore
@@ -13,8 +24,47 @@ from ..orderbook.book_store import DiffEvent, OrderBookStore
 logger = logging.getLogger(__name__)
 
 
+_EWMA_ALPHA = 0.2
+# How long the deadline flusher idles without open batches before exiting.
+_FLUSHER_IDLE_S = 1.0
+_RESYNC_WORKERS = 4
+
+_SHARED_EXECUTOR_LOCK = threading.Lock()
+_SHARED_EXECUTOR: ThreadPoolExecutor | None = None
+
+
+def shared_resync_executor() -> ThreadPoolExecutor:
+    """Return the process-wide pool the venue stream builders resync on."""
+
+    global _SHARED_EXECUTOR
+    with _SHARED_EXECUTOR_LOCK:
+        if _SHARED_EXECUTOR is None:
+            _SHARED_EXECUTOR = ThreadPoolExecutor(
+                max_workers=_RESYNC_WORKERS, thread_name_prefix="ob-resync"
+            )
+        return _SHARED_EXECUTOR
+
+
 class BaseOrderBookStream:
-    """Common logic for websocket driven order book maintenance."""
+    """Common logic for websocket driven order book maintenance.
+
+    With ``coalesce=True`` diffs for a ready symbol are queued instead of
+    applied one by one. The queue is drained into a single
+    :meth:`OrderBookStore.apply_diff_batch` call once it holds
+    ``max_batch_size`` diffs, once the oldest queued diff is older than
+    ``max_batch_latency_ms``, or when the transport calls :meth:`flush` /
+    :meth:`flush_due` (for example after draining its socket buffer). A
+    daemon flusher thread enforces the latency budget when no further diff
+    arrives to trigger it; it exits after idling with no open batch.
+
+    When a ``resync_executor`` is supplied (the ``build_*_stream`` helpers
+    pass :func:`shared_resync_executor`), snapshot fetches run on it instead
+    of the thread delivering diffs, so other symbols keep streaming while one
+    symbol resyncs. Resyncs are single-flight per symbol. Diffs that arrive
+    while a symbol awaits its snapshot go into a ring of ``max_pending``
+    entries; if the ring drops diffs the snapshot no longer covers, a fresh
+    resync is started instead of replaying an incomplete buffer.
+    """
 
     def __init__(
         self,
@@ -25,6 +75,11 @@ class BaseOrderBookStream:
         snapshot_fetcher: Callable[[str], Mapping[str, object]],
         gap_detector_factory: Callable[[str], GapDetector] | None = None,
         clock: Callable[[], float] | None = None,
+        coalesce: bool = False,
+        max_batch_latency_ms: float = 5.0,
+        max_batch_size: int = 256,
+        resync_executor: Executor | None = None,
+        max_pending: int = 5000,
     ) -> None:
         self.venue = venue
         self._orderbook = orderbook
@@ -35,8 +90,24 @@ class BaseOrderBookStream:
         )
         self._gaps: dict[str, GapDetector] = {}
         self._ready: dict[str, bool] = defaultdict(lambda: False)
-        self._pending: DefaultDict[str, list[DiffEvent]] = defaultdict(list)
+        self._max_pending = max(int(max_pending), 1)
+        self._pending: DefaultDict[str, Deque[DiffEvent]] = defaultdict(
+            lambda: deque(maxlen=self._max_pending)
+        )
+        self._pending_high_water: dict[str, int] = {}
+        self._overflowed: set[str] = set()
+        self._resync_executor = resync_executor
+        self._resyncing: set[str] = set()
+        self._lock = threading.RLock()
         self._clock = clock or time.monotonic
+        self._coalesce = bool(coalesce)
+        self._max_batch_latency_s = max(float(max_batch_latency_ms), 0.0) / 1000.0
+        self._max_batch_size = max(int(max_batch_size), 1)
+        self._batches: dict[str, list[DiffEvent]] = {}
+        self._batch_started: dict[str, float] = {}
+        self._batch_deadline = threading.Condition(self._lock)
+        self._flusher: threading.Thread | None = None
+        self._single_apply_s: float | None = None
 
     def _gap(self, symbol: str) -> GapDetector:
         detector = self._gaps.get(symbol)
@@ -54,9 +125,90 @@ class BaseOrderBookStream:
     def _validate_diff(self, symbol: str, event: DiffEvent) -> bool:
         return True
 
+    def _continues(self, symbol: str, previous: DiffEvent, event: DiffEvent) -> bool:
+        """Return whether ``event`` directly follows ``previous`` in a batch."""
+
+        return int(event["seq_from"]) == int(previous["seq_to"]) + 1
+
+    def _prepare_diff(self, symbol: str, event: DiffEvent) -> DiffEvent | None:
+        """Normalise ``event`` before routing; return ``None`` to drop it."""
+
+        return event
+
     # -- public API -----------------------------------------------------------
     def handle_snapshot(self, symbol: str, snapshot: Mapping[str, object]) -> None:
-        bids, asks, last_seq, ts_ms = self._parse_snapshot(symbol, snapshot)
+        with self._lock:
+            if self._coalesce:
+                self._flush_batch(symbol)
+            self._install_snapshot(symbol, self._parse_snapshot(symbol, snapshot))
+        self._connector.transition(WsState.CONNECTED, reason="snapshot_applied")
+
+    def handle_diff(self, event: DiffEvent) -> None:
+        symbol = event["symbol"]
+        self._connector.on_message(ts=(event.get("ts_ms") or 0) / 1000.0)
+        with self._lock:
+            self._route_diff(symbol, event)
+
+    def _route_diff(self, symbol: str, event: DiffEvent) -> None:
+        prepared = self._prepare_diff(symbol, event)
+        if prepared is None:
+            return
+        event = prepared
+        if not self._ready[symbol]:
+            self._buffer_pending(symbol, event)
+            return
+        if not self._coalesce:
+            self._apply_one(symbol, event)
+            return
+        queue = self._batches.get(symbol)
+        if queue is None:
+            queue = self._batches[symbol] = []
+            self._batch_started[symbol] = self._clock()
+            self._schedule_deadline()
+        queue.append(event)
+        if len(queue) >= self._max_batch_size or self._batch_expired(symbol, self._clock()):
+            self._flush_batch(symbol)
+
+    def flush(self, symbol: str | None = None) -> None:
+        """Apply every queued diff, or only those queued for ``symbol``."""
+
+        with self._lock:
+            symbols = [symbol] if symbol is not None else list(self._batches)
+            for item in symbols:
+                self._flush_batch(item)
+
+    def flush_due(self) -> None:
+        """Apply queued batches whose oldest diff exceeded the latency budget."""
+
+        with self._lock:
+            now = self._clock()
+            for symbol in [item for item in self._batches if self._batch_expired(item, now)]:
+                self._flush_batch(symbol)
+
+    def is_resyncing(self, symbol: str) -> bool:
+        with self._lock:
+            return symbol in self._resyncing
+
+    # -- helpers --------------------------------------------------------------
+    def _buffer_pending(self, symbol: str, event: DiffEvent) -> None:
+        pending = self._pending[symbol]
+        if len(pending) >= self._max_pending:
+            self._overflowed.add(symbol)
+            WS_PENDING_DROPPED_TOTAL.labels(venue=self.venue, symbol=symbol).inc()
+        pending.append(event)
+        size = len(pending)
+        if size > self._pending_high_water.get(symbol, 0):
+            self._pending_high_water[symbol] = size
+            WS_PENDING_HIGH_WATER.labels(venue=self.venue, symbol=symbol).set(size)
+
+    def _install_snapshot(
+        self,
+        symbol: str,
+        parsed: tuple[
+            Iterable[tuple[float, float]], Iterable[tuple[float, float]], int, int | None
+        ],
+    ) -> None:
+        bids, asks, last_seq, ts_ms = parsed
         self._orderbook.apply_snapshot(
             venue=self.venue,
             symbol=symbol,
@@ -65,18 +217,45 @@ class BaseOrderBookStream:
             last_seq=last_seq,
             ts_ms=ts_ms,
         )
-        detector = self._gap(symbol)
-        detector.reset(last_seq)
+        self._gap(symbol).reset(last_seq)
         self._ready[symbol] = True
+        self._overflowed.discard(symbol)
         self._drain_pending(symbol)
-        self._connector.transition(WsState.CONNECTED, reason="snapshot_applied")
 
-    def handle_diff(self, event: DiffEvent) -> None:
-        symbol = event["symbol"]
-        self._connector.on_message(ts=(event.get("ts_ms") or 0) / 1000.0)
-        if not self._ready[symbol]:
-            self._pending[symbol].append(event)
+    def _schedule_deadline(self) -> None:
+        if self._max_batch_latency_s <= 0:
             return
+        if self._flusher is not None and self._flusher.is_alive():
+            self._batch_deadline.notify()
+            return
+        self._flusher = threading.Thread(
+            target=self._flush_on_deadline,
+            name=f"ob-flush-{self.venue}",
+            daemon=True,
+        )
+        self._flusher.start()
+
+    def _flush_on_deadline(self) -> None:
+        with self._batch_deadline:
+            while True:
+                if not self._batch_started:
+                    self._batch_deadline.wait(_FLUSHER_IDLE_S)
+                    if not self._batch_started:
+                        self._flusher = None
+                        return
+                    continue
+                oldest = min(self._batch_started.values())
+                remaining = oldest + self._max_batch_latency_s - self._clock()
+                if remaining > 0:
+                    self._batch_deadline.wait(remaining)
+                    continue
+                self.flush_due()
+
+    def _batch_expired(self, symbol: str, now: float) -> bool:
+        started = self._batch_started.get(symbol)
+        return started is not None and now - started >= self._max_batch_latency_s
+
+    def _apply_one(self, symbol: str, event: DiffEvent) -> None:
         if not self._validate_diff(symbol, event):
             self._resync(symbol, reason="validation_failed")
             return
@@ -84,6 +263,7 @@ class BaseOrderBookStream:
         if gap_event is not None:
             self._resync(symbol, reason="gap_detected")
             return
+        started = time.perf_counter()
         try:
             self._orderbook.apply_diff(self.venue, event)
         except ValueError:
@@ -93,17 +273,98 @@ class BaseOrderBookStream:
             )
             self._resync(symbol, reason="apply_failed")
             return
+        elapsed = time.perf_counter() - started
+        if self._single_apply_s is None:
+            self._single_apply_s = elapsed
+        else:
+            self._single_apply_s += _EWMA_ALPHA * (elapsed - self._single_apply_s)
         self._connector.transition(WsState.CONNECTED, reason="diff")
 
-    # -- helpers --------------------------------------------------------------
+    def _flush_batch(self, symbol: str) -> None:
+        events = self._batches.pop(symbol, None)
+        self._batch_started.pop(symbol, None)
+        if not events:
+            return
+        # ``_validate_diff`` checks the head of the run against the applied
+        # book; every later diff must continue the one queued before it.
+        run: list[DiffEvent] = []
+        failure: str | None = None
+        for event in events:
+            if int(event["seq_to"]) < int(event["seq_from"]):
+                failure = "validation_failed"
+                break
+            if not run:
+                if not self._validate_diff(symbol, event):
+                    failure = "validation_failed"
+                    break
+            elif not self._continues(symbol, run[-1], event):
+                failure = "gap_detected"
+                break
+            run.append(event)
+        if run and not self._apply_run(symbol, run):
+            return
+        if failure is None:
+            return
+        broken = events[len(run)]
+        if failure == "gap_detected":
+            self._gap(symbol).observe(broken["seq_from"], broken["seq_to"])
+        self._resync(symbol, reason=failure)
+        # Mirror the one-by-one path: the offending diff is dropped and the
+        # diffs queued behind it are offered to the resynced book.
+        rest = events[len(run) + 1 :]
+        if rest:
+            for event in rest:
+                self._route_diff(symbol, event)
+            self._flush_batch(symbol)
+
+    def _apply_run(self, symbol: str, run: list[DiffEvent]) -> bool:
+        gap_event = self._gap(symbol).observe(run[0]["seq_from"], run[-1]["seq_to"])
+        if gap_event is not None:
+            self._resync(symbol, reason="gap_detected")
+            return False
+        started = time.perf_counter()
+        try:
+            self._orderbook.apply_diff_batch(self.venue, run)
+        except ValueError:
+            logger.exception(
+                "orderbook.diff.batch_apply_failed",
+                extra={"venue": self.venue, "symbol": symbol, "batch_size": len(run)},
+            )
+            self._resync(symbol, reason="apply_failed")
+            return False
+        elapsed = time.perf_counter() - started
+        WS_DIFF_BATCH_SIZE.labels(venue=self.venue).observe(len(run))
+        if len(run) > 1:
+            WS_DIFF_COALESCED_TOTAL.labels(venue=self.venue).inc(len(run) - 1)
+        if self._single_apply_s is not None:
+            saved = self._single_apply_s * len(run) - elapsed
+            if saved > 0:
+                WS_DIFF_BATCH_TIME_SAVED_SECONDS.labels(venue=self.venue).inc(saved)
+        self._connector.transition(WsState.CONNECTED, reason="diff_batch")
+        return True
+
     def _drain_pending(self, symbol: str) -> None:
-        if not self._pending[symbol]:
+        pending = self._pending.pop(symbol, None)
+        if not pending:
             return
-        queue = list(self._pending.pop(symbol))
-        for event in queue:
-            self.handle_diff(event)
+        for event in pending:
+            self._route_diff(symbol, event)
+        if self._coalesce:
+            self._flush_batch(symbol)
+
+    def _snapshot_covers_pending(self, symbol: str, last_seq: int) -> bool:
+        pending = self._pending.get(symbol)
+        if not pending:
+            return True
+        return int(pending[0]["seq_from"]) <= last_seq + 1
 
     def _resync(self, symbol: str, *, reason: str) -> None:
+        with self._lock:
+            if symbol in self._resyncing:
+                return
+            self._resyncing.add(symbol)
+            self._ready[symbol] = False
+            self._overflowed.discard(symbol)
         start = self._clock()
         logger.info(
             "orderbook.resync.start",
@@ -112,6 +373,28 @@ class BaseOrderBookStream:
         self._connector.transition(WsState.RESYNCING, reason=reason)
         self._orderbook.record_resync(self.venue, symbol, reason)
         self._connector.mark_resync(symbol)
+        if self._resync_executor is None:
+            self._complete_resync(symbol, reason, start)
+            return
+        try:
+            self._resync_executor.submit(self._complete_resync, symbol, reason, start)
+        except RuntimeError:
+            logger.exception(
+                "orderbook.resync.submit_failed",
+                extra={"venue": self.venue, "symbol": symbol, "reason": reason},
+            )
+            self._abort_resync(symbol)
+
+    def _abort_resync(self, symbol: str) -> None:
+        # Leave the symbol "ready" so the next diff trips the gap detector and
+        # retries the resync, matching the behaviour of a failed inline fetch.
+        with self._lock:
+            self._resyncing.discard(symbol)
+            self._pending.pop(symbol, None)
+            self._overflowed.discard(symbol)
+            self._ready[symbol] = True
+
+    def _complete_resync(self, symbol: str, reason: str, start: float) -> None:
         try:
             snapshot = self._snapshot_fetcher(symbol)
         except Exception as exc:
@@ -124,20 +407,27 @@ class BaseOrderBookStream:
                     "error": str(exc),
                 },
             )
+            self._abort_resync(symbol)
             self._connector.reconnect_now(reason)
             return
-        bids, asks, last_seq, ts_ms = self._parse_snapshot(symbol, snapshot)
-        self._orderbook.apply_snapshot(
-            venue=self.venue,
-            symbol=symbol,
-            bids=bids,
-            asks=asks,
-            last_seq=last_seq,
-            ts_ms=ts_ms,
-        )
-        self._gap(symbol).reset(last_seq)
-        self._ready[symbol] = True
+        parsed = self._parse_snapshot(symbol, snapshot)
+        last_seq = parsed[2]
+        with self._lock:
+            restart = symbol in self._overflowed and not self._snapshot_covers_pending(
+                symbol, last_seq
+            )
+            self._resyncing.discard(symbol)
+            if not restart:
+                self._install_snapshot(symbol, parsed)
+        if restart:
+            logger.warning(
+                "orderbook.resync.buffer_overflow",
+                extra={"venue": self.venue, "symbol": symbol, "snapshot_last_seq": last_seq},
+            )
+            self._resync(symbol, reason="buffer_overflow")
+            return
         duration = max(self._clock() - start, 0.0)
+        WS_RESYNC_DURATION_SECONDS.labels(venue=self.venue).observe(duration)
         logger.info(
             "orderbook.resync.finished",
             extra={
@@ -148,8 +438,7 @@ class BaseOrderBookStream:
                 "snapshot_last_seq": last_seq,
             },
         )
-        self._drain_pending(symbol)
         self._connector.transition(WsState.CONNECTED, reason="resync_complete")
 
 
-__all__ = ["BaseOrderBookStream"]
+__all__ = ["BaseOrderBookStream", "shared_resync_executor"]
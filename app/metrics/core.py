@@ -5,8 +5,11 @@ from __future__ import annotations
 import os
 import tempfile
 import threading
+from bisect import bisect_left
+from itertools import accumulate, count
 from pathlib import Path
-from typing import Dict, Mapping, MutableMapping, Sequence
+from threading import get_ident
+from typing import Dict, Generic, Iterator, Mapping, MutableMapping, Sequence, TypeVar
 
 DEFAULT_METRICS_PATH = "data/metrics/metrics.prom"
 METRICS_PATH_ENV = "METRICS_PATH"
@@ -57,16 +60,98 @@ def _format_value(value: float) -> str:
     return format(value, "g")
 
 
+_TICKS = count(1)
+# Bumped by every mutation; ``Registry.to_text`` reuses its last render while
+# this is unchanged. Each bump takes a fresh value from ``_TICKS``, so a racing
+# write can reorder bumps but never restore a value a render was cached under.
+_epoch = 0
+
+
+def _touch() -> None:
+    global _epoch
+    _epoch = next(_TICKS)
+
+
+class _ShardedValues(Mapping[tuple[str, ...], float]):
+    """Counter totals kept in one dict per writer thread.
+
+    A thread only ever adds to its own shard, so ``add`` runs without a lock;
+    reads merge the shards. Keys declared through ``labels()`` read as zero
+    until first incremented.
+    """
+
+    __slots__ = ("_shards", "_declared", "_lock")
+
+    def __init__(self) -> None:
+        self._shards: Dict[int, Dict[tuple[str, ...], float]] = {}
+        self._declared: Dict[tuple[str, ...], None] = {}
+        self._lock = threading.Lock()
+
+    def add(self, key: tuple[str, ...], value: float) -> None:
+        global _epoch
+        shard = self._shards.get(get_ident())
+        if shard is None:
+            with self._lock:
+                shard = self._shards.setdefault(get_ident(), {})
+        shard[key] = shard.get(key, 0.0) + value
+        _epoch = next(_TICKS)
+
+    def declare(self, key: tuple[str, ...]) -> None:
+        self._declared.setdefault(key, None)
+        _touch()
+
+    def merged(self) -> Dict[tuple[str, ...], float]:
+        with self._lock:
+            shards = list(self._shards.values())
+        totals = dict.fromkeys(self._declared, 0.0)
+        for shard in shards:
+            for key, value in list(shard.items()):
+                totals[key] = totals.get(key, 0.0) + value
+        return totals
+
+    def clear(self) -> None:
+        with self._lock:
+            for shard in self._shards.values():
+                shard.clear()
+            self._declared.clear()
+        _touch()
+
+    def __getitem__(self, key: tuple[str, ...]) -> float:
+        with self._lock:
+            shards = list(self._shards.values())
+        found = key in self._declared
+        total = 0.0
+        for shard in shards:
+            value = shard.get(key)
+            if value is not None:
+                found = True
+                total += value
+        if not found:
+            raise KeyError(key)
+        return total
+
+    def __iter__(self) -> Iterator[tuple[str, ...]]:
+        return iter(self.merged())
+
+    def __len__(self) -> int:
+        return len(self.merged())
+
+
 class CounterChild:
+    __slots__ = ("_values", "_label_values")
+
     def __init__(self, parent: Counter, label_values: tuple[str, ...]):
-        self._parent = parent
+        self._values = parent._values
         self._label_values = label_values
 
     def inc(self, value: float = 1.0) -> None:
-        self._parent._inc(self._label_values, float(value))
+        if value:
+            self._values.add(self._label_values, float(value))
 
 
 class GaugeChild:
+    __slots__ = ("_parent", "_label_values")
+
     def __init__(self, parent: Gauge, label_values: tuple[str, ...]):
         self._parent = parent
         self._label_values = label_values
@@ -82,21 +167,36 @@ class GaugeChild:
 
 
 class HistogramChild:
+    __slots__ = ("_parent", "_value")
+
     def __init__(self, parent: Histogram, label_values: tuple[str, ...]):
         self._parent = parent
-        self._label_values = label_values
+        self._value = parent._values[label_values]
 
     def observe(self, value: float) -> None:
-        self._parent._observe(self._label_values, float(value))
+        global _epoch
+        parent = self._parent
+        with parent._lock:
+            self._value.observe(float(value), parent.buckets)
+        _epoch = next(_TICKS)
+
+
+_ChildT = TypeVar("_ChildT", CounterChild, GaugeChild, HistogramChild)
 
 
-class Counter:
-    __slots__ = ("name", "label_names", "_values", "_lock")
+class _Family(Generic[_ChildT]):
+    """Label handling shared by the metric types.
+
+    ``labels()`` memoizes one child per keyword tuple, so the hot
+    ``metric.labels(...).inc()`` pattern is a dict lookup after the first call.
+    """
+
+    __slots__ = ("name", "label_names", "_children", "_lock")
 
     def __init__(self, name: str, labels: Sequence[str] = ()) -> None:
         self.name = name
         self.label_names: tuple[str, ...] = tuple(labels)
-        self._values: Dict[tuple[str, ...], float] = {}
+        self._children: Dict[tuple[tuple[str, type, object], ...], _ChildT] = {}
         self._lock = threading.Lock()
 
     def _normalize_labels(self, labels: Mapping[str, str]) -> tuple[str, ...]:
@@ -108,12 +208,33 @@ class Counter:
             )
         return tuple(str(labels[name]) for name in self.label_names)
 
-    def labels(self, **labels: str) -> CounterChild:
-        label_values = self._normalize_labels(labels)
-        with self._lock:
-            if label_values not in self._values:
-                self._values[label_values] = 0.0
-            return CounterChild(self, label_values)
+    def labels(self, **labels: str) -> _ChildT:
+        # Keyed on the value type too: 1, 1.0 and True are equal as dict keys
+        # but render as different label values.
+        key = tuple((name, type(value), value) for name, value in labels.items())
+        try:
+            child = self._children.get(key)
+        except TypeError:  # unhashable label value: resolve without caching
+            return self._child(self._normalize_labels(labels))
+        if child is None:
+            child = self._child(self._normalize_labels(labels))
+            self._children[key] = child
+        return child
+
+    def _child(self, label_values: tuple[str, ...]) -> _ChildT:
+        raise TypeError(f"{type(self).__name__} does not define children")
+
+
+class Counter(_Family[CounterChild]):
+    __slots__ = ("_values",)
+
+    def __init__(self, name: str, labels: Sequence[str] = ()) -> None:
+        super().__init__(name, labels)
+        self._values = _ShardedValues()
+
+    def _child(self, label_values: tuple[str, ...]) -> CounterChild:
+        self._values.declare(label_values)
+        return CounterChild(self, label_values)
 
     def inc(self, value: float = 1.0) -> None:
         self._inc((), float(value))
@@ -121,14 +242,11 @@ class Counter:
     def _inc(self, label_values: tuple[str, ...], value: float) -> None:
         if value == 0.0:
             return
-        with self._lock:
-            current = self._values.get(label_values, 0.0)
-            self._values[label_values] = current + value
+        self._values.add(label_values, value)
 
     def render(self) -> list[str]:
         lines = [f"# TYPE {self.name} counter"]
-        with self._lock:
-            items = sorted(self._values.items(), key=lambda item: item[0])
+        items = sorted(self._values.merged().items(), key=lambda item: item[0])
         for label_values, value in items:
             if label_values:
                 lines.append(_format_metric(self.name, self.label_names, label_values, value))
@@ -137,37 +255,27 @@ class Counter:
         return lines
 
 
-class Gauge:
-    __slots__ = ("name", "label_names", "_values", "_lock")
+class Gauge(_Family[GaugeChild]):
+    __slots__ = ("_values",)
 
     def __init__(self, name: str, labels: Sequence[str] = ()) -> None:
-        self.name = name
-        self.label_names: tuple[str, ...] = tuple(labels)
+        super().__init__(name, labels)
         self._values: Dict[tuple[str, ...], float] = {}
-        self._lock = threading.Lock()
-
-    def _normalize_labels(self, labels: Mapping[str, str]) -> tuple[str, ...]:
-        if len(labels) != len(self.label_names):
-            missing = [name for name in self.label_names if name not in labels]
-            unexpected = [name for name in labels if name not in self.label_names]
-            raise ValueError(
-                f"invalid labels for {self.name}: missing={missing} unexpected={unexpected}"
-            )
-        return tuple(str(labels[name]) for name in self.label_names)
 
-    def labels(self, **labels: str) -> GaugeChild:
-        label_values = self._normalize_labels(labels)
+    def _child(self, label_values: tuple[str, ...]) -> GaugeChild:
         with self._lock:
-            if label_values not in self._values:
-                self._values[label_values] = 0.0
-            return GaugeChild(self, label_values)
+            self._values.setdefault(label_values, 0.0)
+        _touch()
+        return GaugeChild(self, label_values)
 
     def set(self, value: float) -> None:
         self._set((), float(value))
 
     def _set(self, label_values: tuple[str, ...], value: float) -> None:
+        global _epoch
         with self._lock:
             self._values[label_values] = value
+        _epoch = next(_TICKS)
 
     def inc(self, value: float = 1.0) -> None:
         self._inc((), float(value))
@@ -176,11 +284,13 @@ class Gauge:
         self._inc((), -float(value))
 
     def _inc(self, label_values: tuple[str, ...], value: float) -> None:
+        global _epoch
         if value == 0.0:
             return
         with self._lock:
             current = self._values.get(label_values, 0.0)
             self._values[label_values] = current + value
+        _epoch = next(_TICKS)
 
     def render(self) -> list[str]:
         lines = [f"# TYPE {self.name} gauge"]
@@ -194,43 +304,34 @@ class Gauge:
         return lines
 
 
-class Histogram:
-    __slots__ = ("name", "label_names", "buckets", "_values", "_lock")
+class Histogram(_Family[HistogramChild]):
+    __slots__ = ("buckets", "_values")
 
     def __init__(self, name: str, buckets: Sequence[float], labels: Sequence[str] = ()) -> None:
-        self.name = name
-        self.label_names: tuple[str, ...] = tuple(labels)
+        super().__init__(name, labels)
         ordered = sorted(float(bucket) for bucket in buckets)
         self.buckets: tuple[float, ...] = tuple(ordered)
         self._values: Dict[tuple[str, ...], _HistogramValue] = {}
-        self._lock = threading.Lock()
-
-    def _normalize_labels(self, labels: Mapping[str, str]) -> tuple[str, ...]:
-        if len(labels) != len(self.label_names):
-            missing = [name for name in self.label_names if name not in labels]
-            unexpected = [name for name in labels if name not in self.label_names]
-            raise ValueError(
-                f"invalid labels for {self.name}: missing={missing} unexpected={unexpected}"
-            )
-        return tuple(str(labels[name]) for name in self.label_names)
 
-    def labels(self, **labels: str) -> HistogramChild:
-        label_values = self._normalize_labels(labels)
+    def _child(self, label_values: tuple[str, ...]) -> HistogramChild:
         with self._lock:
             if label_values not in self._values:
                 self._values[label_values] = _HistogramValue(len(self.buckets))
-            return HistogramChild(self, label_values)
+        _touch()
+        return HistogramChild(self, label_values)
 
     def observe(self, value: float) -> None:
         self._observe((), float(value))
 
     def _observe(self, label_values: tuple[str, ...], value: float) -> None:
+        global _epoch
         with self._lock:
             hist = self._values.get(label_values)
             if hist is None:
                 hist = _HistogramValue(len(self.buckets))
                 self._values[label_values] = hist
             hist.observe(value, self.buckets)
+        _epoch = next(_TICKS)
 
     def render(self) -> list[str]:
         lines = [f"# TYPE {self.name} histogram"]
@@ -241,14 +342,14 @@ class Histogram:
             snapshot, key=lambda item: item[0]
         ):
             base_labels = self.label_names if label_values else ()
-            for bucket, count in zip(buckets, counts):
+            for bucket, bucket_count in zip(buckets, counts):
                 extra = {"le": _format_value(bucket)}
                 lines.append(
                     _format_metric(
                         f"{self.name}_bucket",
                         base_labels,
                         label_values,
-                        count,
+                        bucket_count,
                         extra=extra,
                     )
                 )
@@ -281,22 +382,27 @@ class Histogram:
 
 
 class _HistogramValue:
+    """Per-bucket (non-cumulative) counts; the cumulative view is built on snapshot.
+
+    ``counts[i]`` holds observations in ``(buckets[i-1], buckets[i]]`` and the
+    last slot those above every bound, so ``observe`` is one bisect.
+    """
+
     __slots__ = ("counts", "count", "sum")
 
     def __init__(self, size: int) -> None:
-        self.counts = [0.0] * size
+        self.counts = [0.0] * (size + 1)
         self.count = 0.0
         self.sum = 0.0
 
     def observe(self, value: float, buckets: Sequence[float]) -> None:
         self.count += 1.0
         self.sum += value
-        for idx, upper in enumerate(buckets):
-            if value <= upper:
-                self.counts[idx] += 1.0
+        if value == value:  # NaN falls in no bucket, only +Inf
+            self.counts[bisect_left(buckets, value)] += 1.0
 
     def snapshot(self) -> tuple[list[float], float, float]:
-        return (self.counts.copy(), self.count, self.sum)
+        return (list(accumulate(self.counts[:-1])), self.count, self.sum)
 
 
 def _format_metric(
@@ -323,12 +429,14 @@ class Registry:
         self._metrics: MutableMapping[str, object] = {}
         self._order: list[str] = []
         self._lock = threading.Lock()
+        self._text: tuple[int, str] | None = None
 
     def _register(self, name: str, metric: object) -> object:
         with self._lock:
             if name not in self._metrics:
                 self._metrics[name] = metric
                 self._order.append(name)
+                _touch()
             return self._metrics[name]
 
     def counter(self, name: str, labels: Sequence[str] = ()) -> Counter:
@@ -373,6 +481,12 @@ class Registry:
         return self._register(name, histogram)  # type: ignore[return-value]
 
     def to_text(self) -> str:
+        """Render every metric; the text is reused until some metric changes."""
+
+        epoch = _epoch
+        cached = self._text
+        if cached is not None and cached[0] == epoch:
+            return cached[1]
         lines: list[str] = []
         for name in list(self._order):
             metric = self._metrics.get(name)
@@ -380,9 +494,9 @@ class Registry:
                 continue
             if hasattr(metric, "render"):
                 lines.extend(metric.render())  # type: ignore[arg-type]
-        if not lines:
-            return ""
-        return "\n".join(lines) + "\n"
+        text = "\n".join(lines) + "\n" if lines else ""
+        self._text = (epoch, text)
+        return text
 
 
 _REGISTRY: Registry | None = None
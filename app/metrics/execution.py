@@ -1,8 +1,8 @@
-"""Execution-related Prometheus metrics for stuck order resolution."""
+"""Execution-related Prometheus metrics for leg dispatch, post-trade refresh and stuck orders."""
 
 from __future__ import annotations
 
-from prometheus_client import Counter, Gauge
+from prometheus_client import Counter, Gauge, Histogram
 
 
 STUCK_ORDERS_TOTAL = Counter(
@@ -40,10 +40,56 @@ STUCK_RESOLVER_ACTIVE_INTENTS = Gauge(
     "Number of order intents currently monitored by the stuck resolver",
 )
 
+LEG_ACK_LATENCY_SECONDS = Histogram(
+    "execution_leg_ack_latency_seconds",
+    "Time from first send to venue acknowledgement for one plan leg",
+    labelnames=("venue", "mode"),
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+
+LEG_SEND_SKEW_SECONDS = Histogram(
+    "execution_leg_send_skew_seconds",
+    "Spread between the first and last leg send of a plan",
+    labelnames=("mode",),
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+
+LEG_ACK_SKEW_SECONDS = Histogram(
+    "execution_leg_ack_skew_seconds",
+    "Spread between the first and last leg acknowledgement of a plan",
+    labelnames=("mode",),
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+
+LEG_UNWIND_TOTAL = Counter(
+    "execution_leg_unwind_total",
+    "Sibling legs cancelled, unwound, abandoned or left unhedged after a parallel dispatch failure",
+    labelnames=("venue", "action"),
+)
+
+EXECUTION_PHASE_SECONDS = Histogram(
+    "execution_phase_seconds",
+    "End-to-end plan execution latency split into send, ack and post_trade phases",
+    labelnames=("phase",),
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+
+POST_TRADE_REFRESH_TOTAL = Counter(
+    "post_trade_refresh_total",
+    "Post-trade refresh requests and the background refreshes they were coalesced into",
+    labelnames=("event",),
+)
+
 
 __all__ = [
+    "EXECUTION_PHASE_SECONDS",
+    "LEG_ACK_LATENCY_SECONDS",
+    "LEG_ACK_SKEW_SECONDS",
+    "LEG_SEND_SKEW_SECONDS",
+    "LEG_UNWIND_TOTAL",
     "ORDER_RETRIES_TOTAL",
     "OPEN_ORDERS_GAUGE",
+    "POST_TRADE_REFRESH_TOTAL",
     "STUCK_RESOLVER_ACTIVE_INTENTS",
     "STUCK_RESOLVER_FAILURES_TOTAL",
     "STUCK_RESOLVER_RETRIES_TOTAL",
@@ -5,12 +5,18 @@ from __future__ import annotations
 import logging
 import threading
 
-from prometheus_client import Counter
+from prometheus_client import Counter, Gauge, Histogram
 
 __all__ = [
     "WS_CONNECT_TOTAL",
+    "WS_DIFF_BATCH_SIZE",
+    "WS_DIFF_BATCH_TIME_SAVED_SECONDS",
+    "WS_DIFF_COALESCED_TOTAL",
     "WS_DISCONNECT_TOTAL",
     "WS_GAP_DETECTED_TOTAL",
+    "WS_PENDING_DROPPED_TOTAL",
+    "WS_PENDING_HIGH_WATER",
+    "WS_RESYNC_DURATION_SECONDS",
     "WS_RESYNC_TOTAL",
     "reset_for_tests",
 ]
@@ -27,10 +33,18 @@ WS_CONNECT_TOTAL: Counter | None = None
 WS_DISCONNECT_TOTAL: Counter | None = None
 WS_GAP_DETECTED_TOTAL: Counter | None = None
 WS_RESYNC_TOTAL: Counter | None = None
+WS_DIFF_BATCH_SIZE: Histogram | None = None
+WS_DIFF_COALESCED_TOTAL: Counter | None = None
+WS_DIFF_BATCH_TIME_SAVED_SECONDS: Counter | None = None
+WS_RESYNC_DURATION_SECONDS: Histogram | None = None
+WS_PENDING_HIGH_WATER: Gauge | None = None
+WS_PENDING_DROPPED_TOTAL: Counter | None = None
 
 
 def _ensure_metrics() -> None:
     global _WS_METRICS_INITIALISED, WS_CONNECT_TOTAL, WS_DISCONNECT_TOTAL, WS_GAP_DETECTED_TOTAL, WS_RESYNC_TOTAL
+    global WS_DIFF_BATCH_SIZE, WS_DIFF_COALESCED_TOTAL, WS_DIFF_BATCH_TIME_SAVED_SECONDS
+    global WS_RESYNC_DURATION_SECONDS, WS_PENDING_HIGH_WATER, WS_PENDING_DROPPED_TOTAL
     if _WS_METRICS_INITIALISED:
         return
     with _LOCK:
@@ -56,6 +70,38 @@ def _ensure_metrics() -> None:
             "Total websocket resync operations triggered by venue and symbol.",
             ("venue", "symbol"),
         )
+        WS_DIFF_BATCH_SIZE = Histogram(
+            "ws_diff_batch_size",
+            "Number of websocket diffs applied per coalesced batch by venue.",
+            ("venue",),
+            buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256, 512),
+        )
+        WS_DIFF_COALESCED_TOTAL = Counter(
+            "ws_diff_coalesced_total",
+            "Total websocket diffs folded into an earlier diff of the same batch by venue.",
+            ("venue",),
+        )
+        WS_DIFF_BATCH_TIME_SAVED_SECONDS = Counter(
+            "ws_diff_batch_time_saved_seconds",
+            "Estimated apply time saved by coalescing diffs versus one-by-one application.",
+            ("venue",),
+        )
+        WS_RESYNC_DURATION_SECONDS = Histogram(
+            "ws_resync_duration_seconds",
+            "Wall time from resync start to snapshot applied by venue.",
+            ("venue",),
+            buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+        )
+        WS_PENDING_HIGH_WATER = Gauge(
+            "ws_pending_diffs_high_water",
+            "Largest number of diffs buffered for a symbol while awaiting a snapshot.",
+            ("venue", "symbol"),
+        )
+        WS_PENDING_DROPPED_TOTAL = Counter(
+            "ws_pending_diffs_dropped_total",
+            "Total buffered diffs dropped because the pending ring was full.",
+            ("venue", "symbol"),
+        )
         _WS_METRICS_INITIALISED = True
 
 
@@ -69,6 +115,12 @@ def reset_for_tests() -> None:  # pragma: no cover - best effort cleanup
         WS_DISCONNECT_TOTAL,
         WS_GAP_DETECTED_TOTAL,
         WS_RESYNC_TOTAL,
+        WS_DIFF_BATCH_SIZE,
+        WS_DIFF_COALESCED_TOTAL,
+        WS_DIFF_BATCH_TIME_SAVED_SECONDS,
+        WS_RESYNC_DURATION_SECONDS,
+        WS_PENDING_HIGH_WATER,
+        WS_PENDING_DROPPED_TOTAL,
     ):
         if metric is None:
             continue
@@ -0,0 +1,20 @@
+"""Prometheus counters for the top-of-book cache and its REST fallback."""
+
+from __future__ import annotations
+
+from prometheus_client import Counter
+
+__all__ = ["MARKETDATA_TOB_REQUESTS_TOTAL", "MARKETDATA_REST_FETCH_TOTAL"]
+
+
+MARKETDATA_TOB_REQUESTS_TOTAL = Counter(
+    "marketdata_top_of_book_requests_total",
+    "Top-of-book lookups by venue and outcome (hit, miss, coalesced, stale, negative).",
+    labelnames=("venue", "result"),
+)
+
+MARKETDATA_REST_FETCH_TOTAL = Counter(
+    "marketdata_rest_fetch_total",
+    "REST top-of-book fetches issued by the market data aggregator by venue and status.",
+    labelnames=("venue", "status"),
+)
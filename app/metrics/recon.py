@@ -9,6 +9,7 @@ from .core import (
     DEFAULT_METRICS_PATH,
     counter,
     gauge,
+    histogram,
     write_metrics,
 )
 
@@ -16,6 +17,10 @@ __all__ = [
     "RECON_DIFF_NOTIONAL_GAUGE",
     "RECON_STATUS_GAUGE",
     "RECON_AUTO_HOLD_COUNTER",
+    "RECON_CYCLE_TOTAL",
+    "RECON_DELTA_TOUCHED_KEYS",
+    "RECON_FETCH_SECONDS",
+    "RECON_FETCH_STALE_TOTAL",
     "RECON_ISSUES_TOTAL",
     "RECON_DRIFT_TOTAL",
     "RECON_LAST_RUN_TS",
@@ -37,6 +42,21 @@ RECON_DRIFT_TOTAL = counter(
 
 RECON_LAST_RUN_TS = gauge("propbot_recon_last_run_ts")
 
+RECON_CYCLE_TOTAL = counter("propbot_recon_cycle_total", labels=("mode",))
+
+RECON_DELTA_TOUCHED_KEYS = gauge("propbot_recon_delta_touched_keys")
+
+RECON_FETCH_SECONDS = histogram(
+    "propbot_recon_fetch_seconds",
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+    labels=("venue", "category"),
+)
+
+RECON_FETCH_STALE_TOTAL = counter(
+    "propbot_recon_fetch_stale_total",
+    labels=("venue", "category", "reason"),
+)
+
 RECON_LAST_STATUS = gauge(
     "propbot_recon_last_status",
     labels=("status",),
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from prometheus_client import Counter, Gauge
+from prometheus_client import Counter, Gauge, Histogram
 
 __all__ = [
     "TRADES_EXECUTED_COUNTER",
@@ -12,6 +12,9 @@ __all__ = [
     "DAILY_LOSS_BREACH_GAUGE",
     "RECON_EXCEPTIONS_COUNTER",
     "RECON_DIFFS_GAUGE",
+    "RUNTIME_STATE_UPDATES_TOTAL",
+    "RUNTIME_STATE_WRITES_TOTAL",
+    "RUNTIME_STATE_FLUSH_SECONDS",
     "record_trade_execution",
     "record_risk_breach",
     "set_auto_trade_state",
@@ -68,6 +71,23 @@ RECON_DIFFS_GAUGE = Gauge(
 )
 RECON_DIFFS_GAUGE.set(0.0)
 
+RUNTIME_STATE_UPDATES_TOTAL = Counter(
+    "propbot_runtime_state_updates_total",
+    "Runtime state sections queued for the write-behind flusher",
+)
+RUNTIME_STATE_WRITES_TOTAL = Counter(
+    "propbot_runtime_state_writes_total",
+    "Runtime state file writes by trigger",
+    ("trigger",),
+)
+for trigger in ("interval", "critical", "sync", "replace"):
+    RUNTIME_STATE_WRITES_TOTAL.labels(trigger=trigger).inc(0.0)
+RUNTIME_STATE_FLUSH_SECONDS = Histogram(
+    "propbot_runtime_state_flush_seconds",
+    "Time to merge and atomically rewrite the runtime state file",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0),
+)
+
 
 def record_trade_execution() -> None:
     """Increment the trade execution counter."""
@@ -0,0 +1,82 @@
+"""Prometheus metrics for the shared per-venue HTTP transport."""
+
+from __future__ import annotations
+
+from prometheus_client import Counter, Gauge, Histogram
+
+__all__ = [
+    "HTTP_POOL_IN_FLIGHT",
+    "HTTP_POOL_SATURATION",
+    "HTTP_POOL_WAIT_SECONDS",
+    "HTTP_POOL_WAITING",
+    "HTTP_REQUEST_LATENCY_SECONDS",
+    "RATE_LIMIT_QUEUE_DEPTH",
+    "RATE_LIMIT_SERVER_USED",
+    "RATE_LIMIT_SHED_TOTAL",
+    "RATE_LIMIT_TOKENS",
+    "RATE_LIMIT_WAIT_SECONDS",
+]
+
+
+HTTP_REQUEST_LATENCY_SECONDS = Histogram(
+    "http_transport_request_latency_seconds",
+    "Exchange REST round-trip latency by venue, method and status class.",
+    labelnames=("venue", "method", "status"),
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+
+HTTP_POOL_WAIT_SECONDS = Histogram(
+    "http_transport_pool_wait_seconds",
+    "Time a request waited for a free per-venue concurrency slot.",
+    labelnames=("venue",),
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0),
+)
+
+HTTP_POOL_IN_FLIGHT = Gauge(
+    "http_transport_in_flight",
+    "Exchange REST requests currently in flight by venue.",
+    labelnames=("venue",),
+)
+
+HTTP_POOL_WAITING = Gauge(
+    "http_transport_waiting",
+    "Exchange REST requests queued behind the per-venue concurrency limit.",
+    labelnames=("venue",),
+)
+
+HTTP_POOL_SATURATION = Gauge(
+    "http_transport_pool_saturation_ratio",
+    "In-flight requests divided by the per-venue concurrency limit.",
+    labelnames=("venue",),
+)
+
+RATE_LIMIT_QUEUE_DEPTH = Gauge(
+    "http_rate_limit_queue_depth",
+    "Requests waiting for venue rate-limit budget by priority lane.",
+    labelnames=("venue", "lane"),
+)
+
+RATE_LIMIT_WAIT_SECONDS = Histogram(
+    "http_rate_limit_wait_seconds",
+    "Time a request waited for venue rate-limit budget by priority lane.",
+    labelnames=("venue", "lane"),
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+
+RATE_LIMIT_SHED_TOTAL = Counter(
+    "http_rate_limit_shed_total",
+    "Requests dropped locally instead of spending venue rate-limit budget.",
+    labelnames=("venue", "lane", "reason"),
+)
+
+RATE_LIMIT_TOKENS = Gauge(
+    "http_rate_limit_tokens",
+    "Locally tracked rate-limit budget remaining per venue bucket.",
+    labelnames=("venue", "bucket"),
+)
+
+RATE_LIMIT_SERVER_USED = Gauge(
+    "http_rate_limit_server_used",
+    "Rate-limit usage last reported by the venue in response headers.",
+    labelnames=("venue", "bucket"),
+)
@@ -0,0 +1,33 @@
+"""Networking primitives shared by exchange clients."""
+
+from .ratelimit import (
+    Lane,
+    LanePolicy,
+    RateLimitScheduler,
+    RateLimitShed,
+    VenueRateLimiter,
+    VenueRateProfile,
+    request_lane,
+)
+from .transport import (
+    HttpTransport,
+    VenueClient,
+    VenuePoolConfig,
+    get_transport,
+    reset_transport_for_tests,
+)
+
+__all__ = [
+    "HttpTransport",
+    "Lane",
+    "LanePolicy",
+    "RateLimitScheduler",
+    "RateLimitShed",
+    "VenueClient",
+    "VenuePoolConfig",
+    "VenueRateLimiter",
+    "VenueRateProfile",
+    "get_transport",
+    "request_lane",
+    "reset_transport_for_tests",
+]
@@ -0,0 +1,596 @@
+"""Per-venue request-weight scheduler for exchange REST traffic.
+
+Each venue profile maps endpoints to a token bucket, a request weight and a
+priority lane. Requests wait on the shared transport loop until their bucket
+has room; waiting requests are served strictly by lane (orders before
+cancels before positions before market data before analytics), and the
+lower lanes may not dip into the headroom reserved for the higher ones.
+Work whose estimated wait exceeds its lane budget is shed before it reaches
+the venue. Server-reported usage headers (Binance ``X-MBX-USED-WEIGHT-*``)
+and 429/418 responses resynchronise the local buckets.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import heapq
+import itertools
+import logging
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Callable, Dict, Iterator, List, Mapping, Sequence, Tuple
+
+from app.metrics.transport import (
+    RATE_LIMIT_QUEUE_DEPTH,
+    RATE_LIMIT_SERVER_USED,
+    RATE_LIMIT_SHED_TOTAL,
+    RATE_LIMIT_TOKENS,
+    RATE_LIMIT_WAIT_SECONDS,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+
+class Lane(IntEnum):
+    """Priority lanes; lower values are served first."""
+
+    ORDERS = 0
+    CANCELS = 1
+    POSITIONS = 2
+    MARKET_DATA = 3
+    ANALYTICS = 4
+
+    @property
+    def label(self) -> str:
+        return self.name.lower()
+
+
+class RateLimitShed(RuntimeError):
+    """Raised when a request is dropped locally instead of spending venue budget."""
+
+    def __init__(self, venue: str, lane: Lane, reason: str, *, wait: float = 0.0) -> None:
+        super().__init__(f"{venue} {lane.label} request shed: {reason} (est wait {wait:.2f}s)")
+        self.venue = venue
+        self.lane = lane
+        self.reason = reason
+        self.wait = wait
+
+
+@dataclass(frozen=True, slots=True)
+class BucketSpec:
+    """``capacity`` weight units replenished evenly over ``interval`` seconds."""
+
+    capacity: float
+    interval: float
+
+    @property
+    def rate(self) -> float:
+        return self.capacity / self.interval
+
+
+@dataclass(frozen=True, slots=True)
+class EndpointRule:
+    """Weight and lane for requests whose path starts with ``path``.
+
+    ``unscoped_weight`` applies when the request carries no ``symbol``/``instId``
+    parameter, which is how venues price the "all symbols" variants.
+    """
+
+    path: str
+    weight: float = 1.0
+    lane: Lane | None = None
+    methods: frozenset[str] = frozenset()
+    bucket: str = "default"
+    unscoped_weight: float | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class LanePolicy:
+    """``max_wait`` of ``None`` never sheds; ``reserve`` is the share of the
+    bucket capacity this lane must leave untouched for higher lanes."""
+
+    max_wait: float | None = None
+    reserve: float = 0.0
+
+
+DEFAULT_LANE_POLICIES: Mapping[Lane, LanePolicy] = {
+    Lane.ORDERS: LanePolicy(),
+    Lane.CANCELS: LanePolicy(),
+    Lane.POSITIONS: LanePolicy(max_wait=5.0, reserve=0.05),
+    Lane.MARKET_DATA: LanePolicy(max_wait=1.0, reserve=0.10),
+    Lane.ANALYTICS: LanePolicy(max_wait=0.5, reserve=0.25),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Classification:
+    bucket: str
+    weight: float
+    lane: Lane
+
+
+@dataclass(frozen=True)
+class VenueRateProfile:
+    """Endpoint weights, buckets and usage headers for one venue family."""
+
+    name: str
+    buckets: Mapping[str, BucketSpec]
+    rules: Sequence[EndpointRule] = ()
+    usage_headers: Mapping[str, str] = field(default_factory=dict)
+    default_weight: float = 1.0
+
+    def classify(
+        self, method: str, path: str, params: Mapping[str, object] | None = None
+    ) -> Classification:
+        method = method.upper()
+        for rule in self.rules:
+            if rule.methods and method not in rule.methods:
+                continue
+            if not path.startswith(rule.path):
+                continue
+            weight = rule.weight
+            if rule.unscoped_weight is not None and not _has_symbol(params):
+                weight = rule.unscoped_weight
+            lane = rule.lane if rule.lane is not None else _default_lane(method)
+            bucket = rule.bucket if rule.bucket in self.buckets else "default"
+            return Classification(bucket, weight, lane)
+        return Classification("default", self.default_weight, _default_lane(method))
+
+
+def _has_symbol(params: Mapping[str, object] | None) -> bool:
+    if not params:
+        return False
+    return bool(params.get("symbol") or params.get("instId"))
+
+
+def _default_lane(method: str) -> Lane:
+    if method == "DELETE":
+        return Lane.CANCELS
+    if method in {"POST", "PUT"}:
+        return Lane.ORDERS
+    return Lane.MARKET_DATA
+
+
+def _rule(
+    path: str,
+    weight: float = 1.0,
+    lane: Lane | None = None,
+    *,
+    methods: str = "",
+    bucket: str = "default",
+    unscoped: float | None = None,
+) -> EndpointRule:
+    return EndpointRule(
+        path=path,
+        weight=weight,
+        lane=lane,
+        methods=frozenset(methods.split()) if methods else frozenset(),
+        bucket=bucket,
+        unscoped_weight=unscoped,
+    )
+
+
+# Binance USDⓈ-M futures: one IP-wide weight budget of 2400 per minute.
+BINANCE_FUTURES_PROFILE = VenueRateProfile(
+    name="binance",
+    buckets={"default": BucketSpec(capacity=2400.0, interval=60.0)},
+    usage_headers={"x-mbx-used-weight-1m": "default"},
+    rules=(
+        _rule("/fapi/v1/order", 1.0, Lane.ORDERS, methods="POST"),
+        _rule("/fapi/v1/order", 1.0, Lane.CANCELS, methods="DELETE"),
+        _rule("/fapi/v1/allOpenOrders", 1.0, Lane.CANCELS, methods="DELETE"),
+        _rule("/fapi/v1/order", 1.0, Lane.POSITIONS, methods="GET"),
+        _rule("/fapi/v1/leverage", 1.0, Lane.ORDERS),
+        _rule("/fapi/v1/marginType", 1.0, Lane.ORDERS),
+        _rule("/fapi/v1/positionSide", 1.0, Lane.ORDERS),
+        _rule("/fapi/v1/openOrders", 1.0, Lane.POSITIONS, unscoped=40.0),
+        _rule("/fapi/v2/positionRisk", 5.0, Lane.POSITIONS),
+        _rule("/fapi/v2/account", 5.0, Lane.POSITIONS),
+        _rule("/fapi/v2/balance", 5.0, Lane.POSITIONS),
+        _rule("/fapi/v1/userTrades", 5.0, Lane.POSITIONS),
+        _rule("/fapi/v1/premiumIndex", 1.0, Lane.MARKET_DATA, unscoped=10.0),
+        _rule("/fapi/v1/depth", 10.0, Lane.MARKET_DATA),
+        _rule("/fapi/v1/ticker/bookTicker", 2.0, Lane.MARKET_DATA, unscoped=5.0),
+        _rule("/fapi/v1/ticker/price", 1.0, Lane.MARKET_DATA, unscoped=2.0),
+        _rule("/fapi/v1/ticker/24hr", 1.0, Lane.ANALYTICS, unscoped=40.0),
+        _rule("/fapi/v1/klines", 5.0, Lane.ANALYTICS),
+        _rule("/fapi/v1/fundingRate", 1.0, Lane.ANALYTICS),
+        _rule("/fapi/v1/commissionRate", 20.0, Lane.ANALYTICS),
+        _rule("/fapi/v1/exchangeInfo", 1.0, Lane.ANALYTICS),
+        _rule("/fapi/v1/time", 1.0, Lane.MARKET_DATA),
+        _rule("/fapi/v1/ping", 1.0, Lane.MARKET_DATA),
+    ),
+)
+
+# OKX v5: independent per-endpoint limits, no usage headers.
+OKX_PROFILE = VenueRateProfile(
+    name="okx",
+    buckets={
+        "default": BucketSpec(capacity=20.0, interval=2.0),
+        "trade.order": BucketSpec(capacity=60.0, interval=2.0),
+        "trade.cancel": BucketSpec(capacity=60.0, interval=2.0),
+        "trade.pending": BucketSpec(capacity=60.0, interval=2.0),
+        "trade.fills": BucketSpec(capacity=10.0, interval=2.0),
+        "account.positions": BucketSpec(capacity=10.0, interval=2.0),
+        "account.balance": BucketSpec(capacity=10.0, interval=2.0),
+        "account.config": BucketSpec(capacity=5.0, interval=2.0),
+        "account.leverage": BucketSpec(capacity=20.0, interval=2.0),
+        "public.mark": BucketSpec(capacity=10.0, interval=2.0),
+        "market.ticker": BucketSpec(capacity=20.0, interval=2.0),
+        "market.books": BucketSpec(capacity=40.0, interval=2.0),
+    },
+    rules=(
+        _rule("/api/v5/trade/order", lane=Lane.ORDERS, bucket="trade.order", methods="POST"),
+        _rule("/api/v5/trade/cancel-order", lane=Lane.CANCELS, bucket="trade.cancel"),
+        _rule("/api/v5/trade/orders-pending", lane=Lane.POSITIONS, bucket="trade.pending"),
+        _rule("/api/v5/trade/fills", lane=Lane.POSITIONS, bucket="trade.fills"),
+        _rule("/api/v5/account/positions", lane=Lane.POSITIONS, bucket="account.positions"),
+        _rule("/api/v5/account/balance", lane=Lane.POSITIONS, bucket="account.balance"),
+        _rule("/api/v5/account/set-position-mode", lane=Lane.ORDERS, bucket="account.config"),
+        _rule("/api/v5/account/set-leverage", lane=Lane.ORDERS, bucket="account.leverage"),
+        _rule("/api/v5/public/mark-price", lane=Lane.MARKET_DATA, bucket="public.mark"),
+        _rule("/api/v5/market/ticker", lane=Lane.MARKET_DATA, bucket="market.ticker"),
+        _rule("/api/v5/market/books", lane=Lane.MARKET_DATA, bucket="market.books"),
+        _rule("/api/v5/public/", lane=Lane.ANALYTICS),
+    ),
+)
+
+DEFAULT_PROFILES: Mapping[str, VenueRateProfile] = {
+    "binance": BINANCE_FUTURES_PROFILE,
+    "okx": OKX_PROFILE,
+}
+
+
+def profile_key(venue: str) -> str:
+    """Venues sharing an account/IP budget share a limiter (``binance-um`` → ``binance``)."""
+
+    lowered = venue.lower()
+    for key in DEFAULT_PROFILES:
+        if lowered == key or lowered.startswith(f"{key}-") or lowered.startswith(f"{key}_"):
+            return key
+    return lowered
+
+
+_Waiter = Tuple[int, int, float, "asyncio.Future[None]"]
+
+
+class _Bucket:
+    __slots__ = (
+        "venue",
+        "name",
+        "spec",
+        "tokens",
+        "updated",
+        "blocked_until",
+        "waiters",
+        "wake",
+        "pump",
+    )
+
+    def __init__(self, venue: str, name: str, spec: BucketSpec, now: float) -> None:
+        self.venue = venue
+        self.name = name
+        self.spec = spec
+        self.tokens = spec.capacity
+        self.updated = now
+        self.blocked_until = 0.0
+        self.waiters: List[_Waiter] = []
+        self.wake: asyncio.Event | None = None
+        self.pump: asyncio.Task[None] | None = None
+
+    def refill(self, now: float) -> None:
+        elapsed = now - self.updated
+        if elapsed > 0:
+            self.tokens = min(self.spec.capacity, self.tokens + elapsed * self.spec.rate)
+            self.updated = now
+
+    def live_waiters(self) -> Iterator[_Waiter]:
+        return (waiter for waiter in self.waiters if not waiter[3].done())
+
+    def publish(self) -> None:
+        RATE_LIMIT_TOKENS.labels(venue=self.venue, bucket=self.name).set(self.tokens)
+
+
+class VenueRateLimiter:
+    """Token buckets and priority queues for one venue profile.
+
+    Must only be used from a single event loop (the transport loop), which is
+    why none of the bookkeeping takes a lock.
+    """
+
+    def __init__(
+        self,
+        profile: VenueRateProfile,
+        *,
+        lane_policies: Mapping[Lane, LanePolicy] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.profile = profile
+        self._policies = dict(DEFAULT_LANE_POLICIES)
+        self._policies.update(lane_policies or {})
+        self._clock = clock
+        self._seq = itertools.count()
+        now = clock()
+        self._buckets: Dict[str, _Bucket] = {
+            name: _Bucket(profile.name, name, spec, now) for name, spec in profile.buckets.items()
+        }
+        self._depth: Dict[Lane, int] = {lane: 0 for lane in Lane}
+
+    # ------------------------------------------------------------------
+    # Helpers
+
+    def _reserve(self, bucket: _Bucket, lane: Lane) -> float:
+        return self._policies[lane].reserve * bucket.spec.capacity
+
+    def _estimate_wait(self, bucket: _Bucket, lane: Lane, weight: float, now: float) -> float:
+        ahead = sum(w for lane_value, _, w, _ in bucket.live_waiters() if lane_value <= lane)
+        deficit = ahead + weight + self._reserve(bucket, lane) - bucket.tokens
+        blocked = max(bucket.blocked_until - now, 0.0)
+        return blocked + max(deficit, 0.0) / bucket.spec.rate
+
+    def _set_depth(self, lane: Lane, delta: int) -> None:
+        self._depth[lane] += delta
+        RATE_LIMIT_QUEUE_DEPTH.labels(venue=self.profile.name, lane=lane.label).set(
+            self._depth[lane]
+        )
+
+    def _shed(self, lane: Lane, reason: str, wait: float) -> RateLimitShed:
+        RATE_LIMIT_SHED_TOTAL.labels(venue=self.profile.name, lane=lane.label, reason=reason).inc()
+        return RateLimitShed(self.profile.name, lane, reason, wait=wait)
+
+    # ------------------------------------------------------------------
+    # Scheduling
+
+    async def acquire(
+        self,
+        method: str,
+        path: str,
+        params: Mapping[str, object] | None = None,
+        *,
+        lane: Lane | None = None,
+        weight: float | None = None,
+        floor: Lane | None = None,
+    ) -> Classification:
+        """Wait until the request fits its bucket; raise ``RateLimitShed`` if dropped.
+
+        ``lane`` and ``weight`` override the endpoint classification; ``floor``
+        only ever demotes (see ``request_lane``).
+        """
+
+        classification = self.profile.classify(method, path, params)
+        resolved = classification.lane if lane is None else lane
+        if floor is not None and floor > resolved:
+            resolved = floor
+        if resolved is not classification.lane or weight is not None:
+            classification = Classification(
+                classification.bucket,
+                classification.weight if weight is None else weight,
+                resolved,
+            )
+        bucket = self._buckets[classification.bucket]
+        lane_value = classification.lane
+        cost = min(classification.weight, bucket.spec.capacity)
+        policy = self._policies[lane_value]
+        started = self._clock()
+        bucket.refill(started)
+        if (
+            not any(True for _ in bucket.live_waiters())
+            and started >= bucket.blocked_until
+            and bucket.tokens - cost >= self._reserve(bucket, lane_value)
+        ):
+            bucket.tokens -= cost
+            bucket.publish()
+            RATE_LIMIT_WAIT_SECONDS.labels(venue=self.profile.name, lane=lane_value.label).observe(
+                0.0
+            )
+            return classification
+        if policy.max_wait is not None:
+            estimate = self._estimate_wait(bucket, lane_value, cost, started)
+            if estimate > policy.max_wait:
+                raise self._shed(lane_value, "budget", estimate)
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(bucket.waiters, (int(lane_value), next(self._seq), cost, future))
+        self._set_depth(lane_value, 1)
+        self._kick(bucket)
+        try:
+            await future
+        finally:
+            self._set_depth(lane_value, -1)
+            if not future.done():
+                future.cancel()
+        RATE_LIMIT_WAIT_SECONDS.labels(venue=self.profile.name, lane=lane_value.label).observe(
+            self._clock() - started
+        )
+        return classification
+
+    def _kick(self, bucket: _Bucket) -> None:
+        if bucket.wake is None:
+            bucket.wake = asyncio.Event()
+        bucket.wake.set()
+        if bucket.pump is None or bucket.pump.done():
+            bucket.pump = asyncio.get_running_loop().create_task(self._pump(bucket))
+
+    async def _pump(self, bucket: _Bucket) -> None:
+        assert bucket.wake is not None  # nosec B101  # set by _kick
+        while bucket.waiters:
+            lane_value, _, cost, future = bucket.waiters[0]
+            if future.done():
+                heapq.heappop(bucket.waiters)
+                continue
+            now = self._clock()
+            bucket.refill(now)
+            if now < bucket.blocked_until:
+                delay = bucket.blocked_until - now
+            else:
+                need = cost + self._reserve(bucket, Lane(lane_value))
+                if bucket.tokens >= need:
+                    heapq.heappop(bucket.waiters)
+                    bucket.tokens -= cost
+                    bucket.publish()
+                    future.set_result(None)
+                    continue
+                delay = (need - bucket.tokens) / bucket.spec.rate
+            bucket.wake.clear()
+            try:
+                # A higher-priority arrival or a server resync wakes us early.
+                await asyncio.wait_for(bucket.wake.wait(), timeout=max(delay, 0.001))
+            except asyncio.TimeoutError:
+                pass
+
+    # ------------------------------------------------------------------
+    # Server feedback
+
+    def observe(self, status_code: int, headers: Mapping[str, str], bucket_name: str) -> None:
+        """Resynchronise buckets from usage headers and back off on 429/418."""
+
+        now = self._clock()
+        for header, name in self.profile.usage_headers.items():
+            raw = headers.get(header)
+            bucket = self._buckets.get(name)
+            if raw is None or bucket is None:
+                continue
+            try:
+                used = float(raw)
+            except ValueError:
+                continue
+            bucket.refill(now)
+            # The server also counts traffic from other processes on this IP/key.
+            bucket.tokens = min(bucket.tokens, max(bucket.spec.capacity - used, 0.0))
+            bucket.publish()
+            RATE_LIMIT_SERVER_USED.labels(venue=self.profile.name, bucket=name).set(used)
+        if status_code in {418, 429}:
+            bucket = self._buckets.get(bucket_name) or self._buckets["default"]
+            retry_after = _retry_after(headers, default=1.0 if status_code == 429 else 60.0)
+            bucket.tokens = 0.0
+            bucket.updated = now
+            bucket.blocked_until = max(bucket.blocked_until, now + retry_after)
+            bucket.publish()
+            LOGGER.warning(
+                "rate_limit.backoff",
+                extra={
+                    "venue": self.profile.name,
+                    "bucket": bucket.name,
+                    "status": status_code,
+                    "retry_after": retry_after,
+                },
+            )
+        for bucket in self._buckets.values():
+            if bucket.wake is not None:
+                bucket.wake.set()
+
+    def stats(self) -> Dict[str, object]:
+        now = self._clock()
+        buckets: Dict[str, Dict[str, float]] = {}
+        for name, bucket in self._buckets.items():
+            # Read-only: may be called from outside the transport loop.
+            elapsed = max(now - bucket.updated, 0.0)
+            buckets[name] = {
+                "tokens": min(bucket.spec.capacity, bucket.tokens + elapsed * bucket.spec.rate),
+                "capacity": bucket.spec.capacity,
+                "blocked_for": max(bucket.blocked_until - now, 0.0),
+            }
+        return {
+            "buckets": buckets,
+            "queue_depth": {lane.label: depth for lane, depth in self._depth.items()},
+        }
+
+
+def _retry_after(headers: Mapping[str, str], *, default: float) -> float:
+    raw = headers.get("retry-after")
+    if raw is None:
+        return default
+    try:
+        return max(float(raw), 0.0)
+    except ValueError:
+        return default
+
+
+class RateLimitScheduler:
+    """Lazily created ``VenueRateLimiter`` per venue profile."""
+
+    def __init__(
+        self,
+        profiles: Mapping[str, VenueRateProfile] | None = None,
+        *,
+        lane_policies: Mapping[Lane, LanePolicy] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._profiles = dict(DEFAULT_PROFILES if profiles is None else profiles)
+        self._lane_policies = lane_policies
+        self._clock = clock
+        self._limiters: Dict[str, VenueRateLimiter] = {}
+
+    def limiter(self, venue: str) -> VenueRateLimiter | None:
+        key = profile_key(venue)
+        limiter = self._limiters.get(key)
+        if limiter is None:
+            profile = self._profiles.get(key)
+            if profile is None:
+                return None
+            limiter = VenueRateLimiter(
+                profile, lane_policies=self._lane_policies, clock=self._clock
+            )
+            self._limiters[key] = limiter
+        return limiter
+
+    def stats(self) -> Dict[str, Dict[str, object]]:
+        return {key: limiter.stats() for key, limiter in list(self._limiters.items())}
+
+
+def rate_limit_enabled() -> bool:
+    raw = os.environ.get("HTTP_RATE_LIMIT_ENABLED")
+    if raw is None:
+        return True
+    return raw.strip().lower() not in {"0", "false", "no", "off"}
+
+
+_LANE: contextvars.ContextVar[Lane | None] = contextvars.ContextVar("request_lane", default=None)
+
+
+@contextmanager
+def request_lane(lane: Lane) -> Iterator[None]:
+    """Demote every venue request made inside the block to at least ``lane``.
+
+    The block only ever lowers priority, never raises it: a request whose own
+    lane is more important than ``lane`` is served on ``lane`` instead, while
+    one already classified less important (a higher :class:`Lane` value)
+    keeps its own lane. The lane follows ``asyncio`` tasks and
+    ``asyncio.to_thread`` calls spawned from the block, so dashboards can
+    demote a whole refresh at once.
+    """
+
+    token = _LANE.set(lane)
+    try:
+        yield
+    finally:
+        _LANE.reset(token)
+
+
+def current_lane() -> Lane | None:
+    return _LANE.get()
+
+
+__all__ = [
+    "BINANCE_FUTURES_PROFILE",
+    "BucketSpec",
+    "Classification",
+    "DEFAULT_LANE_POLICIES",
+    "DEFAULT_PROFILES",
+    "EndpointRule",
+    "Lane",
+    "LanePolicy",
+    "OKX_PROFILE",
+    "RateLimitScheduler",
+    "RateLimitShed",
+    "VenueRateLimiter",
+    "VenueRateProfile",
+    "current_lane",
+    "profile_key",
+    "rate_limit_enabled",
+    "request_lane",
+]
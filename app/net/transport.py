@@ -0,0 +1,376 @@
+"""Shared pooled HTTP transport for exchange REST clients.
+
+Every venue gets one long-lived ``httpx.AsyncClient`` (keep-alive pool,
+HTTP/2 when the ``h2`` package is installed) and a concurrency limit. All
+clients live on a single background event loop so sync callers and async
+callers on any loop share the same sockets instead of each client keeping
+its own session. Venues with a rate-limit profile (see ``ratelimit``) are
+scheduled by weight and priority lane before they take a concurrency slot.
+Pools and their limits are keyed like the rate limiters (``profile_key``), so
+aliases of one exchange (``binance``, ``binance_um``, ``binance-um``) share them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Coroutine, Dict, Mapping, Tuple
+
+import httpx
+
+from app.metrics.transport import (
+    HTTP_POOL_IN_FLIGHT,
+    HTTP_POOL_SATURATION,
+    HTTP_POOL_WAIT_SECONDS,
+    HTTP_POOL_WAITING,
+    HTTP_REQUEST_LATENCY_SECONDS,
+)
+
+from .ratelimit import (
+    Lane,
+    RateLimitScheduler,
+    current_lane,
+    profile_key,
+    rate_limit_enabled,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def _env_number(name: str, default: float) -> float:
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        return default
+
+
+@dataclass(frozen=True, slots=True)
+class VenuePoolConfig:
+    """Connection pool and concurrency limits for one venue."""
+
+    max_connections: int = 20
+    max_keepalive: int = 10
+    keepalive_expiry: float = 30.0
+    max_concurrency: int = 10
+    timeout: float = 10.0
+    http2: bool = True
+
+    @classmethod
+    def from_env(cls) -> "VenuePoolConfig":
+        return cls(
+            max_connections=int(_env_number("HTTP_POOL_MAX_CONNECTIONS", 20)),
+            max_keepalive=int(_env_number("HTTP_POOL_MAX_KEEPALIVE", 10)),
+            keepalive_expiry=_env_number("HTTP_POOL_KEEPALIVE_EXPIRY_SEC", 30.0),
+            max_concurrency=int(_env_number("HTTP_POOL_MAX_CONCURRENCY", 10)),
+        )
+
+
+ClientFactory = Callable[[str, VenuePoolConfig], httpx.AsyncClient]
+
+# (explicit lane, explicit weight, context lane floor)
+_Schedule = Tuple[Lane | None, float | None, Lane | None]
+
+
+def _default_client_factory(venue: str, config: VenuePoolConfig) -> httpx.AsyncClient:
+    limits = httpx.Limits(
+        max_connections=max(config.max_connections, 1),
+        max_keepalive_connections=max(config.max_keepalive, 0),
+        keepalive_expiry=config.keepalive_expiry,
+    )
+    return httpx.AsyncClient(
+        limits=limits,
+        timeout=config.timeout,
+        http2=config.http2 and _HTTP2_AVAILABLE,
+    )
+
+
+class _VenuePool:
+    __slots__ = ("venue", "config", "client", "semaphore", "in_flight", "waiting")
+
+    def __init__(self, venue: str, config: VenuePoolConfig, client: httpx.AsyncClient) -> None:
+        self.venue = venue
+        self.config = config
+        self.client = client
+        self.semaphore = asyncio.Semaphore(max(config.max_concurrency, 1))
+        self.in_flight = 0
+        self.waiting = 0
+
+    def publish(self) -> None:
+        HTTP_POOL_IN_FLIGHT.labels(venue=self.venue).set(self.in_flight)
+        HTTP_POOL_WAITING.labels(venue=self.venue).set(self.waiting)
+        HTTP_POOL_SATURATION.labels(venue=self.venue).set(
+            self.in_flight / max(self.config.max_concurrency, 1)
+        )
+
+
+class HttpTransport:
+    """Per-venue pooled HTTP clients running on one background event loop."""
+
+    def __init__(
+        self,
+        *,
+        default_config: VenuePoolConfig | None = None,
+        venue_configs: Mapping[str, VenuePoolConfig] | None = None,
+        client_factory: ClientFactory | None = None,
+        rate_limits: RateLimitScheduler | None = None,
+    ) -> None:
+        self._default_config = default_config or VenuePoolConfig.from_env()
+        if rate_limits is None and rate_limit_enabled():
+            rate_limits = RateLimitScheduler()
+        self._rate_limits = rate_limits
+        self._venue_configs: Dict[str, VenuePoolConfig] = {
+            profile_key(venue): config for venue, config in (venue_configs or {}).items()
+        }
+        self._client_factory = client_factory or _default_client_factory
+        self._pools: Dict[str, _VenuePool] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Configuration
+
+    def configure_venue(
+        self, venue: str, config: VenuePoolConfig | None = None, **overrides: Any
+    ) -> None:
+        """Set pool limits for ``venue``; applies to pools created afterwards."""
+
+        key = profile_key(venue)
+        base = config or self._venue_configs.get(key) or self._default_config
+        self._venue_configs[key] = replace(base, **overrides) if overrides else base
+
+    def client(self, venue: str, *, base_url: str = "") -> "VenueClient":
+        return VenueClient(self, venue, base_url=base_url)
+
+    # ------------------------------------------------------------------
+    # Event loop plumbing
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        loop = self._loop
+        if loop is not None:
+            return loop
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def _run() -> None:
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(ready.set)
+                    loop.run_forever()
+
+                thread = threading.Thread(target=_run, name="http-transport", daemon=True)
+                thread.start()
+                ready.wait()
+                self._thread = thread
+                self._loop = loop
+            return self._loop
+
+    def _submit(self, coro: Coroutine[Any, Any, httpx.Response]) -> Future[httpx.Response]:
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+
+    def _pool(self, venue: str) -> _VenuePool:
+        key = profile_key(venue)
+        pool = self._pools.get(key)
+        if pool is None:
+            config = self._venue_configs.get(key, self._default_config)
+            pool = _VenuePool(key, config, self._client_factory(key, config))
+            self._pools[key] = pool
+        return pool
+
+    async def _send(
+        self,
+        venue: str,
+        method: str,
+        url: str,
+        kwargs: Dict[str, Any],
+        schedule: _Schedule = (None, None, None),
+    ) -> httpx.Response:
+        # Runs on the transport loop only, so pool and limiter bookkeeping need no lock.
+        limiter = self._rate_limits.limiter(venue) if self._rate_limits is not None else None
+        bucket = "default"
+        if limiter is not None:
+            lane, weight, floor = schedule
+            params = kwargs.get("params")
+            classification = await limiter.acquire(
+                method,
+                httpx.URL(url).path,
+                params if isinstance(params, Mapping) else None,
+                lane=lane,
+                weight=weight,
+                floor=floor,
+            )
+            bucket = classification.bucket
+        pool = self._pool(venue)
+        queued = time.perf_counter()
+        pool.waiting += 1
+        pool.publish()
+        try:
+            await pool.semaphore.acquire()
+        finally:
+            pool.waiting -= 1
+        HTTP_POOL_WAIT_SECONDS.labels(venue=pool.venue).observe(time.perf_counter() - queued)
+        pool.in_flight += 1
+        pool.publish()
+        started = time.perf_counter()
+        status = "error"
+        try:
+            response = await pool.client.request(method, url, **kwargs)
+            status = f"{response.status_code // 100}xx"
+            if limiter is not None:
+                limiter.observe(response.status_code, response.headers, bucket)
+            return response
+        finally:
+            HTTP_REQUEST_LATENCY_SECONDS.labels(
+                venue=pool.venue, method=method, status=status
+            ).observe(time.perf_counter() - started)
+            pool.in_flight -= 1
+            pool.semaphore.release()
+            pool.publish()
+
+    # ------------------------------------------------------------------
+    # Public API
+
+    def request(
+        self,
+        venue: str,
+        method: str,
+        url: str,
+        *,
+        lane: Lane | None = None,
+        weight: float | None = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Blocking request for sync clients; other keyword arguments go to ``httpx``.
+
+        ``lane``/``weight`` override the venue profile's endpoint classification.
+        """
+
+        schedule = (lane, weight, current_lane())
+        return self._submit(self._send(venue, method.upper(), url, kwargs, schedule)).result()
+
+    async def arequest(
+        self,
+        venue: str,
+        method: str,
+        url: str,
+        *,
+        lane: Lane | None = None,
+        weight: float | None = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Awaitable request usable from any event loop."""
+
+        schedule = (lane, weight, current_lane())
+        future = self._submit(self._send(venue, method.upper(), url, kwargs, schedule))
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        return {
+            venue: {
+                "in_flight": pool.in_flight,
+                "waiting": pool.waiting,
+                "max_concurrency": pool.config.max_concurrency,
+                "max_connections": pool.config.max_connections,
+            }
+            for venue, pool in list(self._pools.items())
+        }
+
+    def rate_limit_stats(self) -> Dict[str, Dict[str, object]]:
+        if self._rate_limits is None:
+            return {}
+        return self._rate_limits.stats()
+
+    def close(self) -> None:
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+        if loop is None:
+            return
+        pools = list(self._pools.values())
+        self._pools.clear()
+
+        async def _shutdown() -> None:
+            for pool in pools:
+                try:
+                    await pool.client.aclose()
+                except Exception as exc:  # pragma: no cover - best effort cleanup
+                    LOGGER.debug(
+                        "http_transport.close_failed", extra={"venue": pool.venue}, exc_info=exc
+                    )
+
+        asyncio.run_coroutine_threadsafe(_shutdown(), loop).result(timeout=5.0)
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout=5.0)
+        loop.close()
+
+
+class VenueClient:
+    """``HttpTransport`` bound to one venue and an optional base URL."""
+
+    __slots__ = ("_transport", "venue", "base_url")
+
+    def __init__(self, transport: HttpTransport, venue: str, *, base_url: str = "") -> None:
+        self._transport = transport
+        self.venue = venue
+        self.base_url = base_url.rstrip("/")
+
+    def _url(self, path: str) -> str:
+        if not self.base_url or path.startswith(("http://", "https://")):
+            return path
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    def request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        return self._transport.request(self.venue, method, self._url(path), **kwargs)
+
+    def get(self, path: str, **kwargs: Any) -> httpx.Response:
+        return self.request("GET", path, **kwargs)
+
+    async def arequest(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        return await self._transport.arequest(self.venue, method, self._url(path), **kwargs)
+
+
+_TRANSPORT: HttpTransport | None = None
+_TRANSPORT_LOCK = threading.Lock()
+
+
+def get_transport() -> HttpTransport:
+    global _TRANSPORT
+    if _TRANSPORT is None:
+        with _TRANSPORT_LOCK:
+            if _TRANSPORT is None:
+                _TRANSPORT = HttpTransport()
+    return _TRANSPORT
+
+
+def reset_transport_for_tests(transport: HttpTransport | None = None) -> None:
+    """Close the shared transport and optionally install a replacement."""
+
+    global _TRANSPORT
+    with _TRANSPORT_LOCK:
+        previous, _TRANSPORT = _TRANSPORT, transport
+    if previous is not None and previous is not transport:
+        previous.close()
+
+
+__all__ = [
+    "ClientFactory",
+    "HttpTransport",
+    "VenueClient",
+    "VenuePoolConfig",
+    "get_transport",
+    "reset_transport_for_tests",
+]
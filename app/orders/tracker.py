@@ -1,14 +1,25 @@
-"""Order lifecycle tracking with bounded memory usage."""
+"""Order lifecycle tracking with bounded memory usage.
+
+TTL and capacity eviction are driven by two lazy min-heaps ordered by last
+update: one over every tracked order and one over terminal orders only. Heap
+entries are never updated in place; an entry is live only while it matches
+the key recorded for its order, and an order whose timestamps were changed
+outside the tracker is re-queued when it reaches the top. Evicting ``k``
+orders therefore costs ``O(k log n)`` instead of a scan (and sort) of every
+tracked order.
+"""
 
 from __future__ import annotations
 
+import heapq
+import itertools
 import logging
 import os
 from collections import Counter as _Counter
 from dataclasses import dataclass
 from decimal import Decimal, InvalidOperation
 from time import time
-from typing import Dict, Iterable, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from prometheus_client import Counter, Gauge
 
@@ -214,6 +225,18 @@ class TrackedOrder:
     key: str = ""
 
 
+_AgeKey = Tuple[float, int]
+_HeapEntry = Tuple[float, int, int, str]
+
+
+def _last_update(tracked: TrackedOrder) -> float:
+    return tracked.updated_ts or float(tracked.updated_ns) / _NANOS_IN_SECOND
+
+
+def _age_key(tracked: TrackedOrder) -> _AgeKey:
+    return (_last_update(tracked), tracked.created_ns)
+
+
 @dataclass(slots=True, frozen=True)
 class TrackedOrderSnapshot:
     """Immutable view of a tracked order."""
@@ -241,6 +264,11 @@ class OrderTracker:
         max_items: int = TRACKER_MAX_ITEMS,
     ) -> None:
         self._orders: Dict[str, TrackedOrder] = {}
+        self._age_heap: List[_HeapEntry] = []
+        self._age_keys: Dict[str, _AgeKey] = {}
+        self._terminal_heap: List[_HeapEntry] = []
+        self._terminal_keys: Dict[str, _AgeKey] = {}
+        self._heap_seq = itertools.count()
         effective_max_active = TRACKER_MAX_ACTIVE if max_active is None else max(max_active, 0)
         self._max_active = effective_max_active or TRACKER_MAX_ACTIVE
         self._ttl_seconds = max(int(ttl_seconds), 0)
@@ -310,6 +338,7 @@ class OrderTracker:
             key=key,
         )
         self._orders[coid] = tracked
+        self._index(tracked)
         self._enforce_capacity()
         self.stats["added"] += 1
         _TRACKER_METRICS.observe_tracked(len(self._orders))
@@ -360,6 +389,7 @@ class OrderTracker:
         tracked.state = new_state
         tracked.updated_ns = now_ns
         tracked.updated_ts = float(now_ns) / _NANOS_IN_SECOND
+        self._index(tracked)
         return tracked.state
 
     def process_order_event(
@@ -391,7 +421,7 @@ class OrderTracker:
                 entry.key = str(ctx.get("key", entry.key))
             removed = self.finalize(coid, state)
             if not removed and entry is not None:
-                self._orders.pop(coid, None)
+                self._discard(coid)
                 _TRACKER_METRICS.observe_tracked(len(self._orders))
             self.stats["removed_terminal"] += 1
             return
@@ -412,6 +442,7 @@ class OrderTracker:
                 key=str(ctx.get("key", "")),
             )
             self._orders[coid] = entry
+            self._index(entry)
             self._enforce_capacity()
             _TRACKER_METRICS.observe_tracked(len(self._orders))
         entry.state = state
@@ -421,6 +452,8 @@ class OrderTracker:
         entry.symbol = str(ctx.get("symbol", entry.symbol))
         entry.side = str(ctx.get("side", entry.side))
         entry.key = str(ctx.get("key", entry.key))
+        if self._orders.get(coid) is entry:
+            self._index(entry)
         self.stats["updates"] += 1
 
     @staticmethod
@@ -443,6 +476,7 @@ class OrderTracker:
             tracked.updated_ns = updated_ns
         if state is OrderState.FILLED:
             tracked.filled = tracked.qty
+        self._index(tracked)
         if not self.is_terminal(previous_state):
             _TRACKER_METRICS.observe_finalized(state)
         return True
@@ -453,7 +487,7 @@ class OrderTracker:
         Returns ``True`` when the order was tracked and removed.
         """
 
-        tracked = self._orders.pop(coid, None)
+        tracked = self._discard(coid)
         if tracked is None:
             return False
         final_state = tracked.state if self.is_terminal(tracked.state) else state
@@ -476,10 +510,7 @@ class OrderTracker:
         if not self._orders:
             return 0
         removed = 0
-        terminal_ids = [
-            coid for coid, tracked in self._orders.items() if self.is_terminal(tracked.state)
-        ]
-        for coid in terminal_ids:
+        for coid in list(self._terminal_keys):
             tracked = self._orders.get(coid)
             if tracked is None:
                 continue
@@ -492,11 +523,11 @@ class OrderTracker:
             return 0
         ttl_ns = ttl_sec * _NANOS_IN_SECOND
         removed = 0
-        aged_ids = [
-            coid for coid, tracked in self._orders.items() if now_ns - tracked.updated_ns > ttl_ns
-        ]
-        for coid in aged_ids:
-            self._orders.pop(coid, None)
+        while True:
+            tracked = self._oldest(self._age_heap, self._age_keys)
+            if tracked is None or now_ns - tracked.updated_ns <= ttl_ns:
+                break
+            self._discard(tracked.coid)
             removed += 1
         if removed:
             _TRACKER_METRICS.observe_tracked(len(self._orders))
@@ -510,13 +541,11 @@ class OrderTracker:
         removed = 0
         reference = float(now)
         ttl = float(ttl_sec)
-        for coid, tracked in tuple(self._orders.items()):
-            if not self.is_terminal(tracked.state):
-                continue
-            last_update = tracked.updated_ts or float(tracked.updated_ns) / _NANOS_IN_SECOND
-            if reference - last_update <= ttl:
-                continue
-            self._orders.pop(coid, None)
+        while True:
+            tracked = self._oldest(self._terminal_heap, self._terminal_keys)
+            if tracked is None or reference - _last_update(tracked) <= ttl:
+                break
+            self._discard(tracked.coid)
             removed += 1
         if removed:
             _TRACKER_METRICS.observe_tracked(len(self._orders))
@@ -563,6 +592,69 @@ class OrderTracker:
             )
         return removed_ttl, removed_size
 
+    def _index(self, tracked: TrackedOrder) -> None:
+        """Queue ``tracked`` in the expiry heaps under its current age key."""
+
+        coid = tracked.coid
+        key = _age_key(tracked)
+        if self._age_keys.get(coid) != key:
+            self._age_keys[coid] = key
+            heapq.heappush(self._age_heap, (*key, next(self._heap_seq), coid))
+        if self.is_terminal(tracked.state):
+            if self._terminal_keys.get(coid) != key:
+                self._terminal_keys[coid] = key
+                heapq.heappush(self._terminal_heap, (*key, next(self._heap_seq), coid))
+        elif coid in self._terminal_keys:
+            del self._terminal_keys[coid]
+
+    def _discard(self, coid: str) -> TrackedOrder | None:
+        tracked = self._orders.pop(coid, None)
+        self._age_keys.pop(coid, None)
+        self._terminal_keys.pop(coid, None)
+        if len(self._age_heap) > 2 * len(self._age_keys) + 1024:
+            self._age_heap = self._rebuild_heap(self._age_keys)
+        if len(self._terminal_heap) > 2 * len(self._terminal_keys) + 1024:
+            self._terminal_heap = self._rebuild_heap(self._terminal_keys)
+        return tracked
+
+    def _clear(self) -> None:
+        self._orders.clear()
+        self._age_heap.clear()
+        self._age_keys.clear()
+        self._terminal_heap.clear()
+        self._terminal_keys.clear()
+
+    def _rebuild_heap(self, keys: Dict[str, _AgeKey]) -> List[_HeapEntry]:
+        heap = [(*key, next(self._heap_seq), coid) for coid, key in keys.items()]
+        heapq.heapify(heap)
+        return heap
+
+    def _oldest(self, heap: List[_HeapEntry], keys: Dict[str, _AgeKey]) -> TrackedOrder | None:
+        """Return the least recently updated order in ``heap`` without removing it.
+
+        Stale entries are dropped on the way; orders whose timestamps were
+        changed directly on the :class:`TrackedOrder` are re-queued.
+        """
+
+        while heap:
+            entry = heap[0]
+            coid = entry[3]
+            tracked = self._orders.get(coid)
+            if tracked is None or keys.get(coid) != entry[:2]:
+                heapq.heappop(heap)
+                continue
+            if keys is self._terminal_keys and not self.is_terminal(tracked.state):
+                heapq.heappop(heap)
+                del keys[coid]
+                continue
+            key = _age_key(tracked)
+            if key != entry[:2]:
+                keys[coid] = key
+                heapq.heapreplace(heap, (*key, next(self._heap_seq), coid))
+                continue
+            return tracked
+        return None
+
     def _record_order_cycle_metric(self, tracked: TrackedOrder, final_state: OrderState) -> None:
         duration_seconds = _compute_order_cycle_seconds(tracked)
         if duration_seconds is None:
@@ -599,11 +691,9 @@ class OrderTracker:
     def _enforce_capacity(self) -> None:
         if len(self._orders) <= self._max_active:
             return
-        terminal_orders: Iterable[TrackedOrder] = (
-            tracked for tracked in self._orders.values() if self.is_terminal(tracked.state)
-        )
-        for tracked in sorted(terminal_orders, key=lambda item: item.updated_ns):
-            if len(self._orders) <= self._max_active:
+        while len(self._orders) > self._max_active:
+            tracked = self._oldest(self._terminal_heap, self._terminal_keys)
+            if tracked is None:
                 break
             self.finalize(tracked.coid, tracked.state)
         if len(self._orders) > self._max_active:
@@ -660,15 +750,14 @@ class TrackingCleaner:
         reference = float(now_ts)
         ttl = float(ttl_seconds)
         removed: list[tuple[str, OrderState]] = []
-        orders = tracker._orders  # noqa: SLF001 - internal coordination helper
-        for coid, tracked in tuple(orders.items()):
-            last_update = tracked.updated_ts or float(tracked.updated_ns) / _NANOS_IN_SECOND
-            if reference - last_update <= ttl:
-                continue
-            removed.append((coid, tracked.state))
-            orders.pop(coid, None)
+        while True:
+            tracked = tracker._oldest(tracker._age_heap, tracker._age_keys)  # noqa: SLF001
+            if tracked is None or reference - _last_update(tracked) <= ttl:
+                break
+            removed.append((tracked.coid, tracked.state))
+            tracker._discard(tracked.coid)  # noqa: SLF001
         if removed:
-            _TRACKER_METRICS.observe_tracked(len(orders))
+            _TRACKER_METRICS.observe_tracked(len(tracker))
         return removed
 
     @staticmethod
@@ -678,28 +767,23 @@ class TrackingCleaner:
         max_items: int,
     ) -> list[tuple[str, OrderState]]:
         limit = max(int(max_items), 0)
-        orders = tracker._orders  # noqa: SLF001 - internal coordination helper
-        if not orders:
+        if not len(tracker):
             return []
+        orders = tracker._orders  # noqa: SLF001 - internal coordination helper
         if limit == 0:
             removed = [(coid, tracked.state) for coid, tracked in orders.items()]
-            orders.clear()
+            tracker._clear()  # noqa: SLF001
             _TRACKER_METRICS.observe_tracked(0)
             return removed
         if len(orders) <= limit:
             return []
-        sorted_orders = sorted(
-            orders.items(),
-            key=lambda item: (
-                item[1].updated_ts or float(item[1].updated_ns) / _NANOS_IN_SECOND,
-                item[1].created_ns,
-            ),
-        )
-        to_remove = len(orders) - limit
         removed: list[tuple[str, OrderState]] = []
-        for coid, tracked in sorted_orders[:to_remove]:
-            removed.append((coid, tracked.state))
-            orders.pop(coid, None)
+        while len(orders) > limit:
+            tracked = tracker._oldest(tracker._age_heap, tracker._age_keys)  # noqa: SLF001
+            if tracked is None:
+                break
+            removed.append((tracked.coid, tracked.state))
+            tracker._discard(tracked.coid)  # noqa: SLF001
         if removed:
             _TRACKER_METRICS.observe_tracked(len(orders))
         return removed
@@ -1,16 +1,45 @@
+"""Append-only JSONL journal of order intents for idempotent replay.
+
+Every record is fsynced before the call that wrote it returns. With
+``group_commit`` enabled, concurrent appends share fsyncs: the first caller
+to need a sync becomes the leader, optionally waits up to
+``commit_window_ms`` for other in-flight writers, and one flush+fsync covers
+every record written so far. Followers block until a sync covering their
+record has completed, so durability is unchanged.
+
+With ``checkpoint_every`` set, the in-memory indexes are periodically written
+to ``<path>.ckpt`` together with the journal offset they cover. Only the
+copy of the indexes happens under the journal lock; serialising and writing
+the checkpoint does not block other appends. Startup then loads the
+checkpoint and replays only the tail of the journal; a missing, stale or
+unreadable checkpoint falls back to a full replay.
+
+Once ``_by_intent`` grows past ``max_inmem`` the oldest half (by record
+timestamp) is evicted. A lazy min-heap of ``(ts, intent_key)`` keeps that
+proportional to the number of evicted intents, and an order-to-intent map
+replaces the scan over ``_by_intent`` when status records are appended.
+"""
+
 from __future__ import annotations
 
+import heapq
 import io
 import json
+import logging
 import os
 import pathlib
+import threading
 import time
 from dataclasses import asdict, dataclass
 from decimal import Decimal
-from typing import Dict, Iterable, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from app.metrics.core import counter as metrics_counter
 
+LOGGER = logging.getLogger(__name__)
+
+_CHECKPOINT_VERSION = 1
+
 
 @dataclass
 class OutboxRecord:
@@ -29,6 +58,8 @@ class OutboxRecord:
 
 
 _OUTBOX_WRITE_TOTAL = metrics_counter("propbot_outbox_write_total")
+_OUTBOX_FSYNC_TOTAL = metrics_counter("propbot_outbox_fsync_total")
+_OUTBOX_CHECKPOINT_TOTAL = metrics_counter("propbot_outbox_checkpoint_total")
 
 
 class OutboxJournal:
@@ -39,9 +70,13 @@ class OutboxJournal:
         flush_every: int = 1,
         dupe_window_sec: int = 10,
         max_inmem: int = 200_000,
+        group_commit: bool = False,
+        commit_window_ms: float = 0.0,
+        checkpoint_every: int = 0,
     ) -> None:
         self._path = pathlib.Path(path)
         self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._checkpoint_path = self._path.with_name(self._path.name + ".ckpt")
         self._rotate_bytes = max(0, int(rotate_mb)) * 1024 * 1024
         self._flush_every = max(1, int(flush_every))
         self._dupe_window = max(0, int(dupe_window_sec))
@@ -50,6 +85,27 @@ class OutboxJournal:
         self._wcount = 0
         self._by_intent: Dict[str, Tuple[float, str, str]] = {}
         self._by_order: Dict[str, str] = {}
+        # Eviction heap: may hold stale entries, valid iff the ts matches
+        # ``_by_intent``; compacted once it doubles the live entries.
+        self._intent_heap: List[Tuple[float, str]] = []
+        self._intent_by_order: Dict[str, str] = {}
+        self._group_commit = bool(group_commit)
+        self._commit_window = max(0.0, float(commit_window_ms)) / 1000.0
+        self._checkpoint_every = max(0, int(checkpoint_every))
+        self._since_checkpoint = 0
+        self._checkpoint_seq = 0
+        self._checkpoint_written = 0
+        # ``_lock`` guards the file handle and indexes; ``_sync_cond`` guards
+        # the group-commit sequence numbers below; ``_checkpoint_lock``
+        # serialises checkpoint writes, which run outside ``_lock``.
+        self._lock = threading.RLock()
+        self._checkpoint_lock = threading.Lock()
+        self._sync_cond = threading.Condition()
+        self._written_seq = 0
+        self._synced_seq = 0
+        self._syncing = False
+        self._inflight = 0
+        self.fsyncs = 0
         self._load_existing()
 
     def begin_pending(
@@ -136,23 +192,108 @@ class OutboxJournal:
         self._append(record)
 
     def _intent_for_order(self, order_id: str) -> str:
-        for key, value in self._by_intent.items():
-            _, _, known_order = value
-            if known_order == order_id:
-                return key
-        return ""
+        key = self._intent_by_order.get(order_id)
+        if key is None:
+            return ""
+        last = self._by_intent.get(key)
+        if last is None or last[2] != order_id:
+            return ""
+        return key
 
     def _append(self, record: OutboxRecord) -> None:
-        handle = self._open_fp()
         payload = json.dumps(asdict(record), ensure_ascii=False)
-        handle.write(payload + "\n")
-        self._wcount += 1
-        self._update_index(record)
-        _OUTBOX_WRITE_TOTAL.inc()
-        if self._wcount % self._flush_every == 0:
-            handle.flush()
-            os.fsync(handle.fileno())
-        self._maybe_rotate(handle)
+        if not self._group_commit:
+            with self._lock:
+                handle = self._open_fp()
+                handle.write(payload + "\n")
+                self._wcount += 1
+                self._update_index(record)
+                _OUTBOX_WRITE_TOTAL.inc()
+                if self._wcount % self._flush_every == 0:
+                    self._fsync(handle)
+                self._maybe_rotate(handle)
+                checkpoint = self._maybe_checkpoint()
+            self._write_checkpoint(checkpoint)
+            return
+        with self._sync_cond:
+            self._inflight += 1
+        try:
+            with self._lock:
+                handle = self._open_fp()
+                handle.write(payload + "\n")
+                self._wcount += 1
+                self._written_seq += 1
+                seq = self._written_seq
+                self._update_index(record)
+                _OUTBOX_WRITE_TOTAL.inc()
+            self._sync_to(seq)
+            with self._lock:
+                if self._fp is not None:
+                    self._maybe_rotate(self._fp)
+                checkpoint = self._maybe_checkpoint()
+            self._write_checkpoint(checkpoint)
+        finally:
+            with self._sync_cond:
+                self._inflight -= 1
+
+    def _sync_to(self, seq: int) -> None:
+        """Block until record ``seq`` is on disk, leading the fsync if nobody else is."""
+
+        with self._sync_cond:
+            while self._synced_seq < seq:
+                if not self._syncing:
+                    self._syncing = True
+                    wait_for_peers = self._inflight > 1 and self._commit_window > 0
+                    break
+                self._sync_cond.wait()
+            else:
+                return
+        # Only the flush happens under the write lock; the fsync runs on a
+        # duplicated descriptor so writers keep appending (and rotation may
+        # close the handle) meanwhile. On failure nothing advances: the error
+        # reaches the leader and a waiting follower takes over and retries.
+        target = self._synced_seq
+        try:
+            if wait_for_peers:
+                time.sleep(self._commit_window)
+            fd = -1
+            with self._lock:
+                written = self._written_seq
+                if self._fp is not None:
+                    self._fp.flush()
+                    fd = os.dup(self._fp.fileno())
+            if fd >= 0:
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+                self.fsyncs += 1
+                _OUTBOX_FSYNC_TOTAL.inc()
+            target = written
+        finally:
+            with self._sync_cond:
+                self._synced_seq = max(self._synced_seq, target)
+                self._syncing = False
+                self._sync_cond.notify_all()
+
+    def _fsync(self, handle: io.TextIOWrapper) -> None:
+        handle.flush()
+        os.fsync(handle.fileno())
+        self.fsyncs += 1
+        _OUTBOX_FSYNC_TOTAL.inc()
+
+    def close(self) -> None:
+        """Sync and close the journal, leaving a checkpoint of the current indexes."""
+
+        checkpoint = None
+        with self._lock:
+            if self._fp is not None:
+                self._fsync(self._fp)
+                if self._checkpoint_every:
+                    checkpoint = self._snapshot_checkpoint()
+                self._fp.close()
+                self._fp = None
+        self._write_checkpoint(checkpoint)
 
     def _open_fp(self) -> io.TextIOWrapper:
         if self._fp is None:
@@ -162,43 +303,172 @@ class OutboxJournal:
     def _maybe_rotate(self, handle: io.TextIOWrapper) -> None:
         try:
             if self._path.exists() and self._path.stat().st_size >= self._rotate_bytes:
-                handle.flush()
-                os.fsync(handle.fileno())
+                self._fsync(handle)
                 handle.close()
                 self._fp = None
                 rotated = self._path.with_suffix(self._path.suffix + f".{int(time.time())}")
                 os.replace(self._path, rotated)
+                # Checkpoint the fresh file on the caller's next _maybe_checkpoint.
+                self._since_checkpoint = self._checkpoint_every
         except OSError:
             return
 
+    # ------------------------------------------------------------------
+    # Checkpoints
+
+    def _maybe_checkpoint(self) -> Optional[Tuple[int, Dict[str, Any]]]:
+        """Snapshot the indexes when a checkpoint is due (caller holds ``_lock``)."""
+
+        if not self._checkpoint_every:
+            return None
+        self._since_checkpoint += 1
+        if self._since_checkpoint >= self._checkpoint_every:
+            return self._snapshot_checkpoint()
+        return None
+
+    def _rotated_paths(self) -> list[pathlib.Path]:
+        aux = {self._checkpoint_path.name, self._checkpoint_path.name + ".tmp"}
+        pattern = f"{self._path.name}.*"
+        return sorted(path for path in self._path.parent.glob(pattern) if path.name not in aux)
+
+    def _snapshot_checkpoint(self) -> Optional[Tuple[int, Dict[str, Any]]]:
+        """Copy the indexes and the journal offset they cover (caller holds ``_lock``)."""
+
+        self._since_checkpoint = 0
+        try:
+            if self._fp is not None:
+                self._fp.flush()
+            try:
+                stat = self._path.stat()
+                inode, offset = stat.st_ino, stat.st_size
+            except FileNotFoundError:
+                inode, offset = None, 0
+            rotated = [path.name for path in self._rotated_paths()]
+        except OSError as exc:
+            LOGGER.warning("outbox.checkpoint_failed path=%s error=%s", self._path, exc)
+            return None
+        self._checkpoint_seq += 1
+        state = {
+            "version": _CHECKPOINT_VERSION,
+            "inode": inode,
+            "offset": offset,
+            "rotated": rotated,
+            "by_intent": dict(self._by_intent),
+            "by_order": dict(self._by_order),
+        }
+        return self._checkpoint_seq, state
+
+    def _write_checkpoint(self, snapshot: Optional[Tuple[int, Dict[str, Any]]]) -> None:
+        """Serialise a snapshot to ``<path>.ckpt`` without holding ``_lock``.
+
+        Snapshots taken earlier than the last one written are dropped, so a
+        slow writer never replaces a newer checkpoint with an older one.
+        """
+
+        if snapshot is None:
+            return
+        seq, state = snapshot
+        with self._checkpoint_lock:
+            if seq <= self._checkpoint_written:
+                return
+            try:
+                tmp = self._checkpoint_path.with_name(self._checkpoint_path.name + ".tmp")
+                with open(tmp, "w", encoding="utf-8") as handle:
+                    json.dump(state, handle, separators=(",", ":"))
+                os.replace(tmp, self._checkpoint_path)
+            except OSError as exc:
+                LOGGER.warning("outbox.checkpoint_failed path=%s error=%s", self._path, exc)
+                return
+            self._checkpoint_written = seq
+            _OUTBOX_CHECKPOINT_TOTAL.inc()
+
+    def _load_checkpoint(self) -> Optional[int]:
+        """Restore indexes from the checkpoint; return the journal offset to replay from."""
+
+        try:
+            with open(self._checkpoint_path, "r", encoding="utf-8") as handle:
+                state = json.load(handle)
+            if state.get("version") != _CHECKPOINT_VERSION:
+                return None
+            rotated = [path.name for path in self._rotated_paths()]
+            if rotated != list(state.get("rotated") or []):
+                return None
+            offset = int(state.get("offset") or 0)
+            try:
+                stat = self._path.stat()
+            except FileNotFoundError:
+                stat = None
+            if stat is None:
+                if offset:
+                    return None
+            elif (state.get("inode") is not None and stat.st_ino != state["inode"]) or (
+                stat.st_size < offset
+            ):
+                return None
+            by_intent = {
+                str(key): (float(value[0]), str(value[1]), str(value[2]))
+                for key, value in (state.get("by_intent") or {}).items()
+            }
+            by_order = {
+                str(key): str(value) for key, value in (state.get("by_order") or {}).items()
+            }
+        except (OSError, ValueError, TypeError, IndexError, AttributeError):
+            return None
+        self._by_intent = by_intent
+        self._by_order = by_order
+        self._rebuild_intent_indexes()
+        return offset
+
+    def _rebuild_intent_indexes(self) -> None:
+        self._intent_heap = [(value[0], key) for key, value in self._by_intent.items()]
+        heapq.heapify(self._intent_heap)
+        self._intent_by_order = {
+            value[2]: key for key, value in self._by_intent.items() if value[2]
+        }
+
+    def _evict_oldest_intents(self, count: int) -> None:
+        heap = self._intent_heap
+        while count > 0 and heap:
+            ts, key = heapq.heappop(heap)
+            last = self._by_intent.get(key)
+            if last is None or last[0] != ts:
+                continue
+            del self._by_intent[key]
+            if self._intent_by_order.get(last[2]) == key:
+                del self._intent_by_order[last[2]]
+            count -= 1
+
     def _update_index(self, record: OutboxRecord) -> None:
         if len(self._by_intent) > self._max_inmem:
-            oldest = sorted(self._by_intent.items(), key=lambda item: item[1][0])[
-                : max(1, len(self._by_intent) // 2)
-            ]
-            for key, _ in oldest:
-                self._by_intent.pop(key, None)
+            self._evict_oldest_intents(max(1, len(self._by_intent) // 2))
         if record.intent_key:
-            last = self._by_intent.get(record.intent_key)
+            key = record.intent_key
+            last = self._by_intent.get(key)
             if last is None or record.status != "PENDING" or record.ts >= last[0]:
-                self._by_intent[record.intent_key] = (
-                    record.ts,
-                    record.status,
-                    record.order_id,
-                )
+                self._by_intent[key] = (record.ts, record.status, record.order_id)
+                if last is None or last[0] != record.ts:
+                    heapq.heappush(self._intent_heap, (record.ts, key))
+                if last is not None and last[2] != record.order_id:
+                    if self._intent_by_order.get(last[2]) == key:
+                        del self._intent_by_order[last[2]]
+                if record.order_id:
+                    self._intent_by_order[record.order_id] = key
+                if len(self._intent_heap) > 2 * len(self._by_intent) + 1024:
+                    self._rebuild_intent_indexes()
         if record.order_id:
             self._by_order[record.order_id] = record.status
 
     def _iter_file(self) -> Iterable[OutboxRecord]:
         yield from self._read_one(self._path)
-        pattern = f"{self._path.name}.*"
-        for candidate in sorted(self._path.parent.glob(pattern)):
+        for candidate in self._rotated_paths():
             yield from self._read_one(candidate)
 
-    def _read_one(self, path: pathlib.Path) -> Iterable[OutboxRecord]:
+    def _read_one(self, path: pathlib.Path, offset: int = 0) -> Iterable[OutboxRecord]:
         if not path.exists():
             return
         with open(path, "r", encoding="utf-8") as handle:
+            if offset:
+                handle.seek(offset)
             for line in handle:
                 try:
                     payload = json.loads(line)
@@ -207,5 +477,10 @@ class OutboxJournal:
                     continue
 
     def _load_existing(self) -> None:
+        offset = self._load_checkpoint() if self._checkpoint_every else None
+        if offset is not None:
+            for record in self._read_one(self._path, offset):
+                self._update_index(record)
+            return
         for record in self._iter_file():
             self._update_index(record)
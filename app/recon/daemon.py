@@ -13,7 +13,7 @@ from datetime import datetime, timedelta, timezone
 from decimal import Decimal, InvalidOperation
 from pathlib import Path
 from types import SimpleNamespace
-from typing import Iterable, Mapping, Sequence
+from typing import Awaitable, Callable, Iterable, Mapping, Sequence, TypeVar
 
 import httpx
 
@@ -25,7 +25,11 @@ from ..broker.router import ExecutionRouter
 from ..market.watchdog import watchdog
 from ..metrics.recon import (
     RECON_AUTO_HOLD_COUNTER,
+    RECON_CYCLE_TOTAL,
+    RECON_DELTA_TOUCHED_KEYS,
     RECON_DRIFT_TOTAL,
+    RECON_FETCH_SECONDS,
+    RECON_FETCH_STALE_TOTAL,
     RECON_ISSUES_TOTAL,
     RECON_LAST_RUN_TS,
     RECON_LAST_SEVERITY,
@@ -44,13 +48,18 @@ from .core import (
     detect_pnl_drifts,
     detect_position_drifts,
 )
-from .core import _ledger_rows_from_pnl, Reconciler as StalenessReconciler
+from .core import _ledger_rows_from_pnl, _normalise_venue, Reconciler as StalenessReconciler
+from .delta import ChangeSet, DeltaState, balance_key, position_key
 from .reconciler import Reconciler
 
 LOGGER = logging.getLogger(__name__)
 _DEFAULT_GC_TTL_SEC = 300
 
 INTEGRITY_REPORT_PATH = Path("data/reports/recon_integrity.json")
+# Venue label of the ledger-side fetches in fetch metrics and stale entries.
+_LOCAL_VENUE = "local"
+
+_T = TypeVar("_T")
 _MD_VENUES = ("binance", "okx", "bybit")
 
 
@@ -203,15 +212,54 @@ class DaemonConfig:
     fee_critical_usd: Decimal = Decimal("20")
     funding_warn_usd: Decimal = Decimal("5")
     funding_critical_usd: Decimal = Decimal("25")
+    mode: str = "full"
+    full_sweep_sec: float = 300.0
+    cycle_deadline_sec: float = 10.0
+
+
+class _Cycle:
+    """Deadline, stale fetches and shared execution router of one cycle."""
+
+    def __init__(self, deadline_sec: float) -> None:
+        self._loop = asyncio.get_running_loop()
+        self.deadline = self._loop.time() + max(deadline_sec, 0.0)
+        self.stale: set[tuple[str, str]] = set()
+        self._router: ExecutionRouter | None = None
+
+    @property
+    def router(self) -> ExecutionRouter:
+        if self._router is None:
+            self._router = ExecutionRouter()
+        return self._router
+
+    def remaining(self) -> float:
+        return max(self.deadline - self._loop.time(), 0.0)
+
+    def stale_venues(self, *categories: str) -> set[str]:
+        return {venue for venue, category in self.stale if category in categories}
 
 
 class ReconDaemon:
-    """Manage periodic reconciliation sweeps."""
+    """Manage periodic reconciliation sweeps.
+
+    In ``full`` mode every cycle refetches and compares everything. In
+    ``delta`` mode (see :mod:`app.recon.delta`) a full sweep runs every
+    ``full_sweep_sec`` and the cycles in between re-diff only the keys that
+    changed locally or received remote fills since the previous cycle; PnL
+    drifts are carried over from the last full sweep.
+
+    All ledger and venue fetches of a cycle run concurrently against one
+    ``cycle_deadline_sec`` deadline. A venue (or the ledger) that misses it is
+    reported stale for that category and left out of the comparison instead
+    of holding up the others or showing up as a drift.
+    """
 
     def __init__(self, config: DaemonConfig | None = None) -> None:
         self._config = config or _resolve_daemon_config()
         self._task: asyncio.Task[None] | None = None
         self._stop = asyncio.Event()
+        self._delta = DeltaState()
+        self._inflight: dict[tuple[str, str], asyncio.Future] = {}
 
     async def start(self) -> None:
         if not self._config.enabled:
@@ -236,10 +284,192 @@ class ReconDaemon:
 
     async def run_once(self) -> ReconResult:
         state = runtime.get_state()
-        recon_context = await self._build_context(state)
-        drifts = run_recon_cycle(recon_context)
+        cycle = self._new_cycle()
+        if self._config.mode == "delta":
+            drifts = await self._run_delta_cycle(state, cycle)
+        else:
+            recon_context = await self._build_context(state, cycle)
+            drifts = run_recon_cycle(recon_context)
+            RECON_CYCLE_TOTAL.labels(mode="full").inc()
         return _drifts_to_result(drifts)
 
+    def _new_cycle(self) -> _Cycle:
+        return _Cycle(self._config.cycle_deadline_sec)
+
+    async def _run_delta_cycle(self, state, cycle: _Cycle) -> list[ReconDrift]:
+        started = time.time()
+        if self._delta.full_sweep_due(started, self._config.full_sweep_sec):
+            recon_context = await self._build_context(state, cycle)
+            drifts = run_recon_cycle(recon_context)
+            self._delta.prime(
+                positions=recon_context.local_positions(),
+                balances=recon_context.local_balances(),
+                orders=recon_context.local_orders(),
+                venues=_venue_ids(state),
+                drifts=drifts,
+                started=started,
+            )
+            if cycle.stale:
+                # The stale keys were not compared; sweep again next cycle.
+                self._delta.last_full = None
+            RECON_CYCLE_TOTAL.labels(mode="full").inc()
+            return drifts
+
+        local_positions, local_balances, local_orders = await asyncio.gather(
+            self._fetch_local_positions(cycle=cycle),
+            self._fetch_local_balances(cycle=cycle),
+            self._fetch_local_orders(cycle=cycle),
+        )
+        if cycle.stale_venues("positions", "balances", "orders"):
+            # A missing ledger read would look like removed rows: keep the last result.
+            drifts = list(self._delta.drifts)
+            _publish_drifts(
+                SimpleNamespace(state=state),
+                self._recon_cfg(),
+                drifts,
+                counted=[],
+                stale=cycle.stale,
+            )
+            RECON_CYCLE_TOTAL.labels(mode="delta").inc()
+            return drifts
+        changes = self._delta.local_changes(local_positions, local_balances, local_orders)
+        for venue, touched in (await self._fetch_remote_fill_changes(state, cycle)).items():
+            if touched:
+                changes.pairs |= touched
+                # Fees and realised PnL move the venue's balances too.
+                changes.balance_venues.add(venue)
+        RECON_DELTA_TOUCHED_KEYS.set(len(changes.pairs) + len(changes.balance_venues))
+        fresh: list[ReconDrift] = []
+        if changes:
+            fresh = await self._diff_changes(
+                state, changes, local_positions, local_balances, local_orders, cycle
+            )
+        if cycle.stale:
+            # Changes seen this cycle on stale venues are only caught by a sweep.
+            self._delta.last_full = None
+        drifts = self._delta.merge(fresh, changes)
+        _publish_drifts(
+            SimpleNamespace(state=state),
+            self._recon_cfg(),
+            drifts,
+            counted=fresh,
+            stale=cycle.stale,
+        )
+        RECON_CYCLE_TOTAL.labels(mode="delta").inc()
+        return drifts
+
+    async def _diff_changes(
+        self,
+        state,
+        changes: ChangeSet,
+        local_positions: Sequence[Mapping[str, object]],
+        local_balances: Sequence[Mapping[str, object]],
+        local_orders: Sequence[Mapping[str, object]],
+        cycle: _Cycle,
+    ) -> list[ReconDrift]:
+        """Compare the keys in ``changes``; keys of stale venues are removed from it."""
+
+        venue_ids = _venue_ids(state)
+        pair_venues = {venue_ids[name] for name, _ in changes.pairs if name in venue_ids}
+        balance_venues = {venue_ids[name] for name in changes.balance_venues if name in venue_ids}
+        remote_positions, remote_balances, remote_orders = await asyncio.gather(
+            self._fetch_remote_positions(venues=pair_venues, cycle=cycle),
+            self._fetch_remote_balances(state, venues=balance_venues, cycle=cycle),
+            self._fetch_remote_orders(state, venues=pair_venues, cycle=cycle),
+        )
+        stale_pairs = cycle.stale_venues("positions", "orders")
+        changes.pairs = {key for key in changes.pairs if key[0] not in stale_pairs}
+        changes.balance_venues -= cycle.stale_venues("balances")
+
+        def _in_pairs(row: Mapping[str, object]) -> bool:
+            return position_key(row) in changes.pairs
+
+        def _in_balance_venues(row: Mapping[str, object]) -> bool:
+            key = balance_key(row)
+            return key is not None and key[0] in changes.balance_venues
+
+        remote_touched = {
+            key: value
+            for key, value in remote_positions.items()
+            if position_key({"venue": key[0], "symbol": key[1]}) in changes.pairs
+        }
+        recon_cfg = self._recon_cfg()
+        drifts: list[ReconDrift] = []
+        drifts.extend(
+            detect_balance_drifts(
+                [row for row in local_balances if _in_balance_venues(row)],
+                [row for row in remote_balances if _in_balance_venues(row)],
+                recon_cfg,
+            )
+        )
+        drifts.extend(
+            detect_position_drifts(
+                [row for row in local_positions if _in_pairs(row)], remote_touched, recon_cfg
+            )
+        )
+        drifts.extend(
+            detect_order_drifts(
+                [row for row in local_orders if _in_pairs(row)],
+                [row for row in remote_orders if _in_pairs(row)],
+                recon_cfg,
+            )
+        )
+        return drifts
+
+    async def _fetch_remote_fill_changes(
+        self, state, cycle: _Cycle
+    ) -> dict[str, set[tuple[str, str]]]:
+        """Fetch fills past each venue's watermark; map venue to the pairs they touch."""
+
+        venue_ids = _venue_ids(state)
+        if not venue_ids:
+            return {}
+        names: list[str] = []
+        tasks: list[asyncio.Task[list[Mapping[str, object]] | None]] = []
+        for name, venue_id in venue_ids.items():
+            venue = venue_id.replace("_", "-")
+            broker = cycle.router.broker_for_venue(venue)
+            if broker is None:
+                continue
+            watermark = self._delta.fills.get(name)
+            since_dt = None
+            if watermark is not None and watermark.ts is not None:
+                since_dt = datetime.fromtimestamp(watermark.ts, tz=timezone.utc)
+            names.append(name)
+            tasks.append(
+                asyncio.create_task(self._broker_fills(broker, venue, since_dt, cycle=cycle))
+            )
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        touched: dict[str, set[tuple[str, str]]] = {}
+        for name, result in zip(names, results):
+            # A failed fetch leaves the watermark where it was for the next cycle.
+            if result is None or isinstance(result, BaseException):
+                continue
+            touched[name] = self._delta.remote_fill_changes(name, result, _coerce_timestamp)
+        return touched
+
+    def _recon_cfg(self) -> SimpleNamespace:
+        return SimpleNamespace(
+            epsilon_position=self._config.epsilon_position,
+            epsilon_balance=self._config.epsilon_balance,
+            epsilon_notional=self._config.epsilon_notional,
+            auto_hold_on_critical=self._config.auto_hold_on_critical,
+            balance_warn_usd=self._config.balance_warn_usd,
+            balance_critical_usd=self._config.balance_critical_usd,
+            position_size_warn=self._config.position_size_warn,
+            position_size_critical=self._config.position_size_critical,
+            order_critical_missing=self._config.order_critical_missing,
+            pnl_warn_usd=self._config.pnl_warn_usd,
+            pnl_critical_usd=self._config.pnl_critical_usd,
+            pnl_relative_warn=self._config.pnl_relative_warn,
+            pnl_relative_critical=self._config.pnl_relative_critical,
+            fee_warn_usd=self._config.fee_warn_usd,
+            fee_critical_usd=self._config.fee_critical_usd,
+            funding_warn_usd=self._config.funding_warn_usd,
+            funding_critical_usd=self._config.funding_critical_usd,
+            enabled=self._config.enabled,
+        )
+
     async def _run_loop(self) -> None:
         LOGGER.info("recon.daemon_start", extra={"interval": self._config.interval_sec})
         while not self._stop.is_set():
@@ -261,42 +491,30 @@ class ReconDaemon:
                 continue
         LOGGER.info("recon.daemon_stop")
 
-    async def _build_context(self, state) -> SimpleNamespace:
-        local_positions, local_balances, local_orders, local_pnl = await asyncio.gather(
-            self._fetch_local_positions(),
-            self._fetch_local_balances(),
-            self._fetch_local_orders(),
-            self._fetch_local_pnl(),
-        )
-        remote_positions, remote_balances, remote_orders, remote_pnl = await asyncio.gather(
-            self._fetch_remote_positions(),
-            self._fetch_remote_balances(state),
-            self._fetch_remote_orders(state),
-            self._fetch_remote_pnl(state),
+    async def _build_context(self, state, cycle: _Cycle | None = None) -> SimpleNamespace:
+        cycle = cycle or self._new_cycle()
+        (
+            local_positions,
+            local_balances,
+            local_orders,
+            local_pnl,
+            remote_positions,
+            remote_balances,
+            remote_orders,
+            remote_pnl,
+        ) = await asyncio.gather(
+            self._fetch_local_positions(cycle=cycle),
+            self._fetch_local_balances(cycle=cycle),
+            self._fetch_local_orders(cycle=cycle),
+            self._fetch_local_pnl(cycle=cycle),
+            self._fetch_remote_positions(cycle=cycle),
+            self._fetch_remote_balances(state, cycle=cycle),
+            self._fetch_remote_orders(state, cycle=cycle),
+            self._fetch_remote_pnl(state, cycle=cycle),
         )
+        stale = frozenset(cycle.stale)
 
-        cfg = SimpleNamespace(
-            recon=SimpleNamespace(
-                epsilon_position=self._config.epsilon_position,
-                epsilon_balance=self._config.epsilon_balance,
-                epsilon_notional=self._config.epsilon_notional,
-                auto_hold_on_critical=self._config.auto_hold_on_critical,
-                balance_warn_usd=self._config.balance_warn_usd,
-                balance_critical_usd=self._config.balance_critical_usd,
-                position_size_warn=self._config.position_size_warn,
-                position_size_critical=self._config.position_size_critical,
-                order_critical_missing=self._config.order_critical_missing,
-                pnl_warn_usd=self._config.pnl_warn_usd,
-                pnl_critical_usd=self._config.pnl_critical_usd,
-                pnl_relative_warn=self._config.pnl_relative_warn,
-                pnl_relative_critical=self._config.pnl_relative_critical,
-                fee_warn_usd=self._config.fee_warn_usd,
-                fee_critical_usd=self._config.fee_critical_usd,
-                funding_warn_usd=self._config.funding_warn_usd,
-                funding_critical_usd=self._config.funding_critical_usd,
-                enabled=self._config.enabled,
-            )
-        )
+        cfg = SimpleNamespace(recon=self._recon_cfg())
 
         return SimpleNamespace(
             cfg=cfg,
@@ -309,11 +527,58 @@ class ReconDaemon:
             remote_orders=lambda: remote_orders,
             local_pnl=lambda: local_pnl,
             remote_pnl=lambda: remote_pnl,
+            stale=lambda: stale,
         )
 
-    async def _fetch_local_positions(self) -> Sequence[Mapping[str, object]]:
+    async def _venue_call(
+        self,
+        cycle: _Cycle,
+        venue: str,
+        category: str,
+        call: Callable[[], Awaitable[_T]],
+    ) -> _T | None:
+        """Await ``call()`` until the cycle deadline; ``None`` when the fetch went stale.
+
+        The call itself is shielded: a fetch that misses the deadline keeps
+        running and its venue is reported stale for ``category`` until it
+        returns, so an unresponsive venue pins at most one worker thread per
+        category instead of one more every cycle. A fetch that fails is
+        reported stale as well before its error propagates: callers fall back
+        to an empty result, which must not be diffed as if the venue had no
+        rows, and a stale venue forces the next delta cycle into a full sweep.
+        """
+
+        key = (venue, category)
+        loop = asyncio.get_running_loop()
+        pending = self._inflight.get(key)
+        if pending is not None and not pending.done() and pending.get_loop() is loop:
+            _mark_stale(cycle, venue, category, reason="in_flight")
+            return None
+        started = time.perf_counter()
+        future = asyncio.ensure_future(call())
+        future.add_done_callback(_consume_result)
+        self._inflight[key] = future
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout=cycle.remaining())
+        except asyncio.TimeoutError:
+            _mark_stale(cycle, venue, category, reason="deadline")
+            return None
+        except Exception:
+            _mark_stale(cycle, venue, category, reason="error")
+            raise
+        finally:
+            RECON_FETCH_SECONDS.labels(venue=venue, category=category).observe(
+                time.perf_counter() - started
+            )
+
+    async def _fetch_local_positions(
+        self, cycle: _Cycle | None = None
+    ) -> Sequence[Mapping[str, object]]:
+        cycle = cycle or self._new_cycle()
         try:
-            return await asyncio.to_thread(ledger.fetch_positions)
+            rows = await self._venue_call(
+                cycle, _LOCAL_VENUE, "positions", lambda: asyncio.to_thread(ledger.fetch_positions)
+            )
         except _LEDGER_ERRORS as exc:  # pragma: no cover - defensive
             _log_recon_failure(
                 "recon.local_positions_failed",
@@ -322,10 +587,16 @@ class ReconDaemon:
                 details={"source": "ledger.fetch_positions"},
             )
             return []
+        return rows if rows is not None else []
 
-    async def _fetch_local_balances(self) -> Sequence[Mapping[str, object]]:
+    async def _fetch_local_balances(
+        self, cycle: _Cycle | None = None
+    ) -> Sequence[Mapping[str, object]]:
+        cycle = cycle or self._new_cycle()
         try:
-            return await asyncio.to_thread(ledger.fetch_balances)
+            rows = await self._venue_call(
+                cycle, _LOCAL_VENUE, "balances", lambda: asyncio.to_thread(ledger.fetch_balances)
+            )
         except _LEDGER_ERRORS as exc:  # pragma: no cover - defensive
             _log_recon_failure(
                 "recon.local_balances_failed",
@@ -334,10 +605,16 @@ class ReconDaemon:
                 details={"source": "ledger.fetch_balances"},
             )
             return []
+        return rows if rows is not None else []
 
-    async def _fetch_local_orders(self) -> Sequence[Mapping[str, object]]:
+    async def _fetch_local_orders(
+        self, cycle: _Cycle | None = None
+    ) -> Sequence[Mapping[str, object]]:
+        cycle = cycle or self._new_cycle()
         try:
-            return await asyncio.to_thread(ledger.fetch_open_orders)
+            rows = await self._venue_call(
+                cycle, _LOCAL_VENUE, "orders", lambda: asyncio.to_thread(ledger.fetch_open_orders)
+            )
         except _LEDGER_ERRORS as exc:  # pragma: no cover - defensive
             _log_recon_failure(
                 "recon.local_orders_failed",
@@ -346,45 +623,88 @@ class ReconDaemon:
                 details={"source": "ledger.fetch_open_orders"},
             )
             return []
+        return rows if rows is not None else []
 
-    async def _fetch_local_pnl(self) -> Sequence[Mapping[str, object]]:
-        since_ts = await asyncio.to_thread(_determine_pnl_since_ts)
-        try:
-            return await asyncio.to_thread(_build_local_pnl_snapshot, since_ts)
-        except _PNL_ERRORS as exc:  # pragma: no cover - defensive
-            _log_recon_failure(
-                "recon.local_pnl_failed",
-                level=logging.ERROR,
-                exc=exc,
-                details={"source": "pnl_snapshot", "since": since_ts},
-            )
-            return []
+    async def _fetch_local_pnl(self, cycle: _Cycle | None = None) -> Sequence[Mapping[str, object]]:
+        cycle = cycle or self._new_cycle()
 
-    async def _fetch_remote_positions(self) -> Mapping[tuple[str, str], object]:
-        reconciler = Reconciler()
-        try:
-            return await asyncio.to_thread(reconciler.fetch_exchange_positions)
-        except _REMOTE_ERRORS as exc:  # pragma: no cover - defensive
-            _log_recon_failure(
-                "recon.remote_positions_failed",
-                level=logging.WARNING,
-                exc=exc,
-                details={"source": "exchange.positions"},
-            )
+        def _snapshot() -> list[Mapping[str, object]]:
+            since_ts = _determine_pnl_since_ts()
+            try:
+                return _build_local_pnl_snapshot(since_ts)
+            except _PNL_ERRORS as exc:  # pragma: no cover - defensive
+                _log_recon_failure(
+                    "recon.local_pnl_failed",
+                    level=logging.ERROR,
+                    exc=exc,
+                    details={"source": "pnl_snapshot", "since": since_ts},
+                )
+                return []
+
+        rows = await self._venue_call(
+            cycle, _LOCAL_VENUE, "pnl", lambda: asyncio.to_thread(_snapshot)
+        )
+        return rows if rows is not None else []
+
+    async def _fetch_remote_positions(
+        self, venues: set[str] | None = None, cycle: _Cycle | None = None
+    ) -> Mapping[tuple[str, str], object]:
+        """Fetch positions per runtime venue, or only the venue ids in ``venues``."""
+
+        if venues is not None and not venues:
             return {}
+        cycle = cycle or self._new_cycle()
+        venue_ids = [
+            venue_id
+            for venue_id in _venue_ids(runtime.get_state()).values()
+            if venues is None or venue_id in venues
+        ]
+        reconciler = Reconciler()
+
+        def _call(venue_id: str) -> Callable[[], Awaitable[Mapping[tuple[str, str], float]]]:
+            return lambda: asyncio.to_thread(reconciler.fetch_exchange_positions, venues={venue_id})
+
+        results = await asyncio.gather(
+            *(
+                self._venue_call(cycle, _normalise_venue(venue_id), "positions", _call(venue_id))
+                for venue_id in venue_ids
+            ),
+            return_exceptions=True,
+        )
+        positions: dict[tuple[str, str], object] = {}
+        for venue_id, result in zip(venue_ids, results):
+            if isinstance(result, _REMOTE_ERRORS):  # pragma: no cover - defensive
+                _log_recon_failure(
+                    "recon.remote_positions_failed",
+                    level=logging.WARNING,
+                    exc=result,
+                    details={"source": "exchange.positions", "venue": venue_id},
+                )
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            if result:
+                positions.update(result)
+        return positions
+
+    async def _fetch_remote_balances(
+        self, state, venues: set[str] | None = None, cycle: _Cycle | None = None
+    ) -> Sequence[Mapping[str, object]]:
+        """Fetch balances from every runtime venue, or only the venue ids in ``venues``."""
 
-    async def _fetch_remote_balances(self, state) -> Sequence[Mapping[str, object]]:
         runtime_deriv = getattr(state, "derivatives", None)
-        venues = getattr(runtime_deriv, "venues", {}) if runtime_deriv else {}
-        if not venues:
+        runtime_venues = getattr(runtime_deriv, "venues", {}) if runtime_deriv else {}
+        if not runtime_venues:
             return []
-        router = ExecutionRouter()
+        cycle = cycle or self._new_cycle()
         tasks = []
         venue_order: list[str] = []
-        for venue_id in venues.keys():
+        for venue_id in runtime_venues.keys():
+            if venues is not None and venue_id not in venues:
+                continue
             venue = venue_id.replace("_", "-")
-            broker = router.broker_for_venue(venue)
-            tasks.append(self._broker_balances(broker, venue))
+            broker = cycle.router.broker_for_venue(venue)
+            tasks.append(self._broker_balances(broker, venue, cycle))
             venue_order.append(venue)
         results = await asyncio.gather(*tasks, return_exceptions=True)
         balances: list[Mapping[str, object]] = []
@@ -409,25 +729,13 @@ class ReconDaemon:
             balances.extend(result)
         return balances
 
-    async def _broker_balances(self, broker, venue: str) -> list[Mapping[str, object]]:
+    async def _broker_balances(
+        self, broker, venue: str, cycle: _Cycle
+    ) -> list[Mapping[str, object]]:
         try:
-            response = await asyncio.wait_for(broker.balances(venue=venue), timeout=5.0)
-        except asyncio.TimeoutError:
-            LOGGER.warning(
-                "recon.remote_balances_timeout",
-                extra={
-                    "event": "recon.remote_balances_timeout",
-                    "component": "recon",
-                    "details": {"venue": venue, "category": "balances"},
-                },
-            )
-            alert_notify(
-                AlertLevel.WARN,
-                "recon.remote_balances_timeout",
-                source="recon",
-                details={"venue": venue, "category": "balances"},
+            response = await self._venue_call(
+                cycle, _normalise_venue(venue), "balances", lambda: broker.balances(venue=venue)
             )
-            return []
         except _REMOTE_ERRORS as exc:  # pragma: no cover - defensive
             _log_recon_failure(
                 "recon.remote_balances_failed",
@@ -441,19 +749,26 @@ class ReconDaemon:
             return []
         return [row for row in payload if isinstance(row, Mapping)]
 
-    async def _fetch_remote_orders(self, state) -> Sequence[Mapping[str, object]]:
+    async def _fetch_remote_orders(
+        self, state, venues: set[str] | None = None, cycle: _Cycle | None = None
+    ) -> Sequence[Mapping[str, object]]:
+        """Fetch open orders from every runtime venue, or only the venue ids in ``venues``."""
+
         runtime_deriv = getattr(state, "derivatives", None)
-        venues = getattr(runtime_deriv, "venues", {}) if runtime_deriv else {}
-        if not venues:
+        runtime_venues = getattr(runtime_deriv, "venues", {}) if runtime_deriv else {}
+        if not runtime_venues:
             return []
+        cycle = cycle or self._new_cycle()
         tasks: list[asyncio.Task[list[Mapping[str, object]]]] = []
         venue_order: list[str] = []
-        for venue_id, venue_state in venues.items():
+        for venue_id, venue_state in runtime_venues.items():
+            if venues is not None and venue_id not in venues:
+                continue
             client = getattr(venue_state, "client", None)
             if client is None:
                 continue
             venue = venue_id.replace("_", "-")
-            tasks.append(asyncio.create_task(self._client_orders(client, venue)))
+            tasks.append(asyncio.create_task(self._client_orders(client, venue, cycle)))
             venue_order.append(venue)
         results = await asyncio.gather(*tasks, return_exceptions=True)
         orders: list[Mapping[str, object]] = []
@@ -478,25 +793,14 @@ class ReconDaemon:
             orders.extend(result)
         return orders
 
-    async def _client_orders(self, client, venue: str) -> list[Mapping[str, object]]:
+    async def _client_orders(self, client, venue: str, cycle: _Cycle) -> list[Mapping[str, object]]:
         try:
-            payload = await asyncio.wait_for(asyncio.to_thread(client.open_orders), timeout=5.0)
-        except asyncio.TimeoutError:
-            LOGGER.warning(
-                "recon.remote_orders_timeout",
-                extra={
-                    "event": "recon.remote_orders_timeout",
-                    "component": "recon",
-                    "details": {"venue": venue, "category": "orders"},
-                },
-            )
-            alert_notify(
-                AlertLevel.WARN,
-                "recon.remote_orders_timeout",
-                source="recon",
-                details={"venue": venue, "category": "orders"},
+            payload = await self._venue_call(
+                cycle,
+                _normalise_venue(venue),
+                "orders",
+                lambda: asyncio.to_thread(client.open_orders),
             )
-            return []
         except _REMOTE_ERRORS as exc:  # pragma: no cover - defensive
             _log_recon_failure(
                 "recon.remote_orders_failed",
@@ -509,23 +813,27 @@ class ReconDaemon:
             return []
         return [dict(row) for row in payload if isinstance(row, Mapping)]
 
-    async def _fetch_remote_pnl(self, state) -> Sequence[Mapping[str, object]]:
+    async def _fetch_remote_pnl(
+        self, state, cycle: _Cycle | None = None
+    ) -> Sequence[Mapping[str, object]]:
         runtime_deriv = getattr(state, "derivatives", None)
         venues = getattr(runtime_deriv, "venues", {}) if runtime_deriv else {}
         if not venues:
             return []
-        router = ExecutionRouter()
+        cycle = cycle or self._new_cycle()
         since_ts = await asyncio.to_thread(_determine_pnl_since_ts)
         since_dt = datetime.fromtimestamp(since_ts, tz=timezone.utc) if since_ts else None
         tasks: list[asyncio.Task[list[Mapping[str, object]]]] = []
         venue_order: list[str] = []
         for venue_id in venues.keys():
             venue = venue_id.replace("_", "-")
-            broker = router.broker_for_venue(venue)
+            broker = cycle.router.broker_for_venue(venue)
             if broker is None:
                 continue
             venue_order.append(venue)
-            tasks.append(asyncio.create_task(self._broker_pnl(broker, venue, since_dt, since_ts)))
+            tasks.append(
+                asyncio.create_task(self._broker_pnl(broker, venue, since_dt, since_ts, cycle))
+            )
         results = await asyncio.gather(*tasks, return_exceptions=True)
         snapshots: list[Mapping[str, object]] = []
         for venue, result in zip(venue_order, results):
@@ -555,39 +863,11 @@ class ReconDaemon:
         venue: str,
         since_dt: datetime | None,
         since_ts: float | None,
+        cycle: _Cycle,
     ) -> list[Mapping[str, object]]:
-        try:
-            fills_payload = await asyncio.wait_for(broker.get_fills(since=since_dt), timeout=10.0)
-        except asyncio.TimeoutError:
-            LOGGER.warning(
-                "recon.remote_pnl_timeout",
-                extra={
-                    "event": "recon.remote_pnl_timeout",
-                    "component": "recon",
-                    "details": {"venue": venue, "category": "fills"},
-                },
-            )
-            alert_notify(
-                AlertLevel.WARN,
-                "recon.remote_pnl_timeout",
-                source="recon",
-                details={"venue": venue, "category": "fills"},
-            )
+        fills = await self._broker_fills(broker, venue, since_dt, cycle=cycle, category="pnl")
+        if fills is None:
             return []
-        except _REMOTE_ERRORS as exc:  # pragma: no cover - defensive
-            _log_recon_failure(
-                "recon.remote_pnl_fetch_failed",
-                level=logging.WARNING,
-                exc=exc,
-                details={"venue": venue, "category": "fills"},
-            )
-            return []
-        fills: list[Mapping[str, object]] = []
-        if isinstance(fills_payload, Iterable):
-            for item in fills_payload:
-                normalised = _normalise_remote_fill(venue, item)
-                if normalised is not None:
-                    fills.append(normalised)
         supports_fees = any("fee" in row and row["fee"] not in (None, "") for row in fills)
         source = _StaticPnLSource(fills, [], supports_fees=supports_fees, supports_funding=False)
         try:
@@ -607,6 +887,57 @@ class ReconDaemon:
             )
             return []
 
+    async def _broker_fills(
+        self,
+        broker,
+        venue: str,
+        since_dt: datetime | None,
+        *,
+        cycle: _Cycle | None = None,
+        category: str = "fills",
+    ) -> list[Mapping[str, object]] | None:
+        """Normalised venue fills since ``since_dt``; ``None`` when the fetch failed."""
+
+        cycle = cycle or self._new_cycle()
+        try:
+            fills_payload = await self._venue_call(
+                cycle, _normalise_venue(venue), category, lambda: broker.get_fills(since=since_dt)
+            )
+        except _REMOTE_ERRORS as exc:  # pragma: no cover - defensive
+            _log_recon_failure(
+                "recon.remote_pnl_fetch_failed",
+                level=logging.WARNING,
+                exc=exc,
+                details={"venue": venue, "category": category},
+            )
+            return None
+        if fills_payload is None:
+            return None
+        fills: list[Mapping[str, object]] = []
+        if isinstance(fills_payload, Iterable):
+            for item in fills_payload:
+                normalised = _normalise_remote_fill(venue, item)
+                if normalised is not None:
+                    fills.append(normalised)
+        return fills
+
+
+def _mark_stale(cycle: _Cycle, venue: str, category: str, *, reason: str) -> None:
+    cycle.stale.add((venue, category))
+    RECON_FETCH_STALE_TOTAL.labels(venue=venue, category=category, reason=reason).inc()
+    details = {"venue": venue, "category": category, "reason": reason}
+    LOGGER.warning(
+        "recon.fetch_stale",
+        extra={"event": "recon.fetch_stale", "component": "recon", "details": details},
+    )
+    alert_notify(AlertLevel.WARN, "recon.fetch_stale", source="recon", details=details)
+
+
+def _consume_result(future: asyncio.Future) -> None:
+    # A fetch abandoned at the deadline may still fail; retrieve its exception.
+    if not future.cancelled():
+        future.exception()
+
 
 def _ctx_fetch(ctx, name: str, default):
     if ctx is None:
@@ -874,6 +1205,7 @@ def _update_runtime_snapshot(
     ts: float,
     recon_cfg: object | None,
     hold_engaged: bool,
+    stale: Iterable[tuple[str, str]] = (),
 ) -> None:
     payload = [_drift_payload(drift) for drift in drifts]
     metadata = {
@@ -886,6 +1218,7 @@ def _update_runtime_snapshot(
         "drift_count": len(payload),
         "last_severity": worst,
         "enabled": bool(getattr(recon_cfg, "enabled", True)),
+        "stale": [{"venue": venue, "category": category} for venue, category in sorted(stale)],
     }
     runtime.update_reconciliation_status(
         issues=payload,
@@ -981,6 +1314,9 @@ def _resolve_daemon_config(cfg: object | None = None) -> DaemonConfig:
     fee_critical = _extract("fee_critical_usd", config.fee_critical_usd)
     funding_warn = _extract("funding_warn_usd", config.funding_warn_usd)
     funding_critical = _extract("funding_critical_usd", config.funding_critical_usd)
+    mode_raw = str(_cfg_value(recon_cfg, "mode") or config.mode).strip().lower()
+    full_sweep_raw = _cfg_value(recon_cfg, "full_sweep_sec")
+    deadline_raw = _cfg_value(recon_cfg, "cycle_deadline_sec")
 
     return DaemonConfig(
         enabled=bool(enabled_raw) if enabled_raw is not None else config.enabled,
@@ -1008,6 +1344,13 @@ def _resolve_daemon_config(cfg: object | None = None) -> DaemonConfig:
         fee_critical_usd=fee_critical,
         funding_warn_usd=funding_warn,
         funding_critical_usd=funding_critical,
+        mode=mode_raw if mode_raw in {"full", "delta"} else config.mode,
+        full_sweep_sec=(
+            float(full_sweep_raw) if full_sweep_raw not in (None, "") else config.full_sweep_sec
+        ),
+        cycle_deadline_sec=(
+            float(deadline_raw) if deadline_raw not in (None, "") else config.cycle_deadline_sec
+        ),
     )
 
 
@@ -1023,18 +1366,74 @@ def run_recon_cycle(ctx) -> list[ReconDrift]:
     remote_orders = _ctx_fetch(ctx, "remote_orders", lambda: [])
     local_pnl = _ctx_fetch(ctx, "local_pnl", lambda: [])
     remote_pnl = _ctx_fetch(ctx, "remote_pnl", lambda: [])
+    stale = _ctx_fetch(ctx, "stale", lambda: ())
 
     drifts: list[ReconDrift] = []
-    drifts.extend(detect_balance_drifts(local_balances, remote_balances, recon_cfg))
-    drifts.extend(detect_position_drifts(local_positions, remote_positions, recon_cfg))
-    drifts.extend(detect_order_drifts(local_orders, remote_orders, recon_cfg))
-    drifts.extend(detect_pnl_drifts(local_pnl, remote_pnl, recon_cfg))
+    drifts.extend(
+        detect_balance_drifts(
+            *_fresh_rows(stale, "balances", local_balances, remote_balances), recon_cfg
+        )
+    )
+    drifts.extend(
+        detect_position_drifts(
+            *_fresh_rows(stale, "positions", local_positions, remote_positions), recon_cfg
+        )
+    )
+    drifts.extend(
+        detect_order_drifts(*_fresh_rows(stale, "orders", local_orders, remote_orders), recon_cfg)
+    )
+    drifts.extend(detect_pnl_drifts(*_fresh_rows(stale, "pnl", local_pnl, remote_pnl), recon_cfg))
+
+    _publish_drifts(ctx, recon_cfg, drifts, counted=drifts, stale=stale)
+    return drifts
+
+
+def _fresh_rows(stale: Iterable[tuple[str, str]], category: str, local, remote) -> tuple:
+    """Drop the ``category`` rows of venues whose fetch went stale, on both sides.
+
+    A stale ledger read leaves nothing to compare for the category.
+    """
+
+    venues = {venue for venue, name in stale if name == category}
+    if not venues:
+        return local, remote
+    if _LOCAL_VENUE in venues:
+        return [], []
+    return _without_venues(local, venues), _without_venues(remote, venues)
+
+
+def _without_venues(rows, venues: set[str]):
+    if isinstance(rows, Mapping):
+        return {
+            key: value
+            for key, value in rows.items()
+            if not (isinstance(key, tuple) and _normalise_venue(key[0]) in venues)
+        }
+    return [
+        row
+        for row in rows or []
+        if not (
+            isinstance(row, Mapping)
+            and _normalise_venue(row.get("venue") or row.get("exchange")) in venues
+        )
+    ]
+
+
+def _publish_drifts(
+    ctx,
+    recon_cfg: object | None,
+    drifts: Sequence[ReconDrift],
+    *,
+    counted: Sequence[ReconDrift],
+    stale: Iterable[tuple[str, str]] = (),
+) -> None:
+    """Log and count ``counted``, then publish ``drifts`` as the current recon status."""
 
     worst = _worst_severity(drifts)
-    ts = drifts[0].ts if drifts else time.time()
+    ts = counted[0].ts if counted else time.time()
 
     hold_engaged = False
-    for drift in drifts:
+    for drift in counted:
         _log_drift(drift)
         RECON_DRIFT_TOTAL.labels(kind=drift.kind, severity=drift.severity).inc()
         RECON_ISSUES_TOTAL.labels(
@@ -1046,8 +1445,15 @@ def run_recon_cycle(ctx) -> list[ReconDrift]:
         hold_engaged = _engage_hold(ctx, drifts)
 
     _update_metrics(ts, worst)
-    _update_runtime_snapshot(drifts, worst, ts, recon_cfg, hold_engaged)
-    return drifts
+    _update_runtime_snapshot(drifts, worst, ts, recon_cfg, hold_engaged, stale)
+
+
+def _venue_ids(state) -> dict[str, str]:
+    """Map normalised venue names to the runtime's derivatives venue ids."""
+
+    runtime_deriv = getattr(state, "derivatives", None)
+    venues = getattr(runtime_deriv, "venues", {}) if runtime_deriv else {}
+    return {_normalise_venue(venue_id): venue_id for venue_id in venues or {}}
 
 
 async def run_recon_cycle_async(*, config: DaemonConfig | None = None) -> ReconResult:
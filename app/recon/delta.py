@@ -0,0 +1,233 @@
+"""Watermarks and change detection for delta reconciliation.
+
+A delta cycle re-diffs only what changed since the previous cycle:
+
+* local positions, balances and open orders are cheap ledger reads; each row
+  gets a signature that is compared with the previous cycle's, so added,
+  changed and removed rows mark their key as touched;
+* remote fills are fetched per venue from a watermark (the newest fill time
+  seen, plus the fills already seen at that instant so that the inclusive
+  ``since`` query does not report them twice) and mark their
+  ``(venue, symbol)`` as touched.
+
+Remote positions, balances and open orders are then requested only for the
+touched venues and only the touched keys are compared. Changes that show up
+in neither feed (an order cancelled on the venue, a transfer) are left to the
+periodic full sweep, which also re-primes every signature and watermark.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Mapping, Sequence, Set, Tuple
+
+from .core import ReconDrift, _normalise_symbol, _normalise_venue
+
+Key = Tuple[str, str]
+
+# Fills arriving up to this long before a full sweep started may not be
+# reflected in what it fetched, so the watermark it leaves starts earlier.
+_WATERMARK_SKEW_SEC = 1.0
+
+
+def _signature(row: Mapping[str, object], *, skip: Sequence[str] = ("ts",)) -> tuple:
+    return tuple(sorted((str(k), repr(v)) for k, v in row.items() if k not in skip))
+
+
+def position_key(row: Mapping[str, object]) -> Key | None:
+    venue = _normalise_venue(row.get("venue") or row.get("exchange"))
+    symbol = _normalise_symbol(row.get("symbol") or row.get("instrument"))
+    if not venue or not symbol:
+        return None
+    return venue, symbol
+
+
+def balance_key(row: Mapping[str, object]) -> Key | None:
+    venue = _normalise_venue(row.get("venue") or row.get("exchange"))
+    asset = _normalise_symbol(row.get("asset") or row.get("currency") or row.get("symbol"))
+    if not venue or not asset:
+        return None
+    return venue, asset
+
+
+def _order_id(row: Mapping[str, object]) -> str:
+    for name in ("id", "order_id", "client_order_id", "idemp_key", "orderId", "clientOrderId"):
+        value = row.get(name)
+        if value not in (None, ""):
+            return str(value)
+    return ""
+
+
+@dataclass
+class ChangeSet:
+    """Keys a delta cycle has to re-diff."""
+
+    pairs: Set[Key] = field(default_factory=set)
+    balance_venues: Set[str] = field(default_factory=set)
+
+    def __bool__(self) -> bool:
+        return bool(self.pairs or self.balance_venues)
+
+    @property
+    def venues(self) -> Set[str]:
+        return {venue for venue, _ in self.pairs} | self.balance_venues
+
+    def touch_pair(self, key: Key) -> None:
+        self.pairs.add(key)
+
+    def covers(self, drift: ReconDrift) -> bool:
+        """Whether ``drift`` belongs to a key this cycle re-evaluates."""
+
+        venue = _normalise_venue(drift.venue)
+        if drift.kind == "BALANCE":
+            return venue in self.balance_venues
+        if drift.kind in {"POSITION", "ORDER"}:
+            return (venue, _normalise_symbol(drift.symbol)) in self.pairs
+        return False
+
+
+@dataclass
+class FillWatermark:
+    ts: float | None = None
+    seen: Set[str] = field(default_factory=set)
+
+    def advance(self, fills: Sequence[Tuple[float, str, Mapping[str, object]]]) -> List[Mapping]:
+        """Return the fills past the watermark and move it forward.
+
+        ``fills`` are ``(ts, signature, fill)`` triples; fills at exactly the
+        watermark time are new unless their signature was already seen.
+        """
+
+        fresh = [
+            fill
+            for ts, signature, fill in fills
+            if self.ts is None or ts > self.ts or (ts == self.ts and signature not in self.seen)
+        ]
+        newest = max((ts for ts, _, _ in fills), default=self.ts)
+        if newest is None:
+            return fresh
+        if self.ts is not None and newest <= self.ts:
+            newest = self.ts
+            seen = self.seen
+        else:
+            seen = set()
+        seen |= {signature for ts, signature, _ in fills if ts == newest}
+        self.ts, self.seen = newest, seen
+        return fresh
+
+
+class DeltaState:
+    """Row signatures, watermarks and last published drifts kept between cycles."""
+
+    def __init__(self) -> None:
+        self.positions: Dict[Key, tuple] = {}
+        self.balances: Dict[Key, tuple] = {}
+        self.orders: Dict[Key, Tuple[Key, tuple]] = {}
+        self.fills: Dict[str, FillWatermark] = {}
+        self.drifts: List[ReconDrift] = []
+        self.last_full: float | None = None
+
+    def full_sweep_due(self, now: float, every_sec: float) -> bool:
+        if self.last_full is None:
+            return True
+        return every_sec > 0 and now - self.last_full >= every_sec
+
+    def prime(
+        self,
+        *,
+        positions: Sequence[Mapping[str, object]],
+        balances: Sequence[Mapping[str, object]],
+        orders: Sequence[Mapping[str, object]],
+        venues: Iterable[str],
+        drifts: Sequence[ReconDrift],
+        started: float,
+    ) -> None:
+        """Reset the state to what a full sweep started at ``started`` observed."""
+
+        self.positions = {}
+        self.balances = {}
+        self.orders = {}
+        self.local_changes(positions, balances, orders)
+        watermark = started - _WATERMARK_SKEW_SEC
+        self.fills = {venue: FillWatermark(ts=watermark) for venue in venues}
+        self.drifts = list(drifts)
+        self.last_full = started
+
+    def local_changes(
+        self,
+        positions: Sequence[Mapping[str, object]],
+        balances: Sequence[Mapping[str, object]],
+        orders: Sequence[Mapping[str, object]],
+    ) -> ChangeSet:
+        """Diff the local ledger rows against the previous cycle's signatures."""
+
+        changes = ChangeSet()
+        current_positions: Dict[Key, tuple] = {}
+        for row in positions:
+            key = position_key(row)
+            if key is not None:
+                current_positions[key] = _signature(row)
+        for key in set(current_positions) | set(self.positions):
+            if current_positions.get(key) != self.positions.get(key):
+                changes.touch_pair(key)
+        self.positions = current_positions
+
+        current_balances: Dict[Key, tuple] = {}
+        for row in balances:
+            key = balance_key(row)
+            if key is not None:
+                current_balances[key] = _signature(row)
+        for key in set(current_balances) | set(self.balances):
+            if current_balances.get(key) != self.balances.get(key):
+                changes.balance_venues.add(key[0])
+        self.balances = current_balances
+
+        current_orders: Dict[Key, Tuple[Key, tuple]] = {}
+        for row in orders:
+            pair = position_key(row)
+            order_id = _order_id(row)
+            if pair is None or not order_id:
+                continue
+            current_orders[(pair[0], order_id)] = (pair, _signature(row, skip=()))
+        for key in set(current_orders) | set(self.orders):
+            now_entry = current_orders.get(key)
+            before = self.orders.get(key)
+            if now_entry != before:
+                for entry in (now_entry, before):
+                    if entry is not None:
+                        changes.touch_pair(entry[0])
+        self.orders = current_orders
+        return changes
+
+    def remote_fill_changes(
+        self,
+        venue: str,
+        fills: Sequence[Mapping[str, object]],
+        coerce_ts: Callable[[object], float | None],
+    ) -> Set[Key]:
+        """Advance ``venue``'s watermark over ``fills``; return the pairs they touch."""
+
+        stamped: List[Tuple[float, str, Mapping[str, object]]] = []
+        for fill in fills:
+            ts = coerce_ts(fill.get("ts") or fill.get("timestamp") or fill.get("time"))
+            if ts is None:
+                ts = time.time()
+            stamped.append((ts, repr(_signature(fill, skip=())), fill))
+        watermark = self.fills.setdefault(venue, FillWatermark())
+        touched: Set[Key] = set()
+        for fill in watermark.advance(stamped):
+            key = position_key({"venue": venue, "symbol": fill.get("symbol")})
+            if key is not None:
+                touched.add(key)
+        return touched
+
+    def merge(self, fresh: Sequence[ReconDrift], changes: ChangeSet) -> List[ReconDrift]:
+        """Replace the drifts of re-diffed keys with ``fresh``; keep the rest."""
+
+        kept = [drift for drift in self.drifts if not changes.covers(drift)]
+        self.drifts = kept + list(fresh)
+        return list(self.drifts)
+
+
+__all__ = ["ChangeSet", "DeltaState", "FillWatermark", "balance_key", "position_key"]
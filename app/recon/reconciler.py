@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import Callable, Dict, Iterable, Mapping, MutableMapping, Tuple
+from typing import Callable, Collection, Dict, Iterable, Mapping, MutableMapping, Tuple
 
 from .. import ledger
 from ..services import runtime
@@ -104,14 +104,20 @@ class Reconciler:
             )
         self._adapters = adapters
 
-    def fetch_exchange_positions(self) -> Dict[_PositionKey, float]:
+    def fetch_exchange_positions(
+        self, venues: Collection[str] | None = None
+    ) -> Dict[_PositionKey, float]:
+        """Fetch positions from every runtime venue, or only the venue ids in ``venues``."""
+
         state = self._adapters.get_state()
         runtime_state = getattr(state, "derivatives", None)
-        venues = getattr(runtime_state, "venues", None)
-        if not venues:
+        runtime_venues = getattr(runtime_state, "venues", None)
+        if not runtime_venues:
             return {}
         positions: Dict[_PositionKey, float] = {}
-        for venue_id, venue_runtime in venues.items():
+        for venue_id, venue_runtime in runtime_venues.items():
+            if venues is not None and venue_id not in venues:
+                continue
             venue_name = _normalise_venue(venue_id)
             client = getattr(venue_runtime, "client", None)
             if client is None:
@@ -1,19 +1,38 @@
-"""Exposure cap helpers for pre-trade validation and telemetry."""
+"""Exposure cap helpers for pre-trade validation and telemetry.
+
+Pre-trade checks read exposures from :class:`ExposureIndex`, which the ledger
+keeps current after every position write, and cap limits from a table
+compiled once per config object. Neither touches the database.
+:func:`setup_exposure_index_verifier` checks the index against the ledger in
+the background every ``EXPOSURE_INDEX_VERIFY_SEC`` seconds.
+"""
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import asyncio
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterable, Mapping, MutableMapping, Tuple
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Tuple
 
-from prometheus_client import Gauge
+from prometheus_client import Counter, Gauge
 
 from .. import ledger
 
+LOGGER = logging.getLogger(__name__)
 
 __all__ = [
     "ExposureCapsSnapshot",
+    "ExposureIndex",
     "collect_snapshot",
+    "get_exposure_index",
+    "reset_exposure_index_for_tests",
+    "setup_exposure_index_verifier",
+    "verify_exposure_index",
     "resolve_caps",
     "check_open_allowed",
     "build_status_payload",
@@ -23,6 +42,7 @@ __all__ = [
     "EXPOSURE_CAP_GLOBAL",
     "EXPOSURE_CAP_SIDE",
     "EXPOSURE_CAP_VENUE",
+    "EXPOSURE_INDEX_MISMATCH_TOTAL",
 ]
 
 
@@ -46,6 +66,10 @@ EXPOSURE_CAP_VENUE = Gauge(
     "Configured per-venue absolute exposure cap per symbol.",
     ("symbol", "venue"),
 )
+EXPOSURE_INDEX_MISMATCH_TOTAL = Counter(
+    "propbot_exposure_index_mismatch_total",
+    "Position rows where the in-memory exposure index disagreed with the ledger.",
+)
 
 # Initialise metric series to known labels to avoid missing-time-series alerts.
 for _symbol in ("UNKNOWN",):
@@ -158,134 +182,511 @@ def _iter_mapping_items(mapping: Any) -> Iterable[Tuple[str, Any]]:
         yield key, value
 
 
-def collect_snapshot(
-    positions: Iterable[Mapping[str, Any]] | None = None,
-) -> ExposureCapsSnapshot:
-    """Collect the current exposure snapshot from the ledger."""
+def _position_entry(row: Any) -> Tuple[Tuple[str, str], Dict[str, Any]] | None:
+    """Parse a ledger position row into its ``(venue, symbol)`` key and entry."""
 
-    if positions is None:
-        try:
-            positions = ledger.fetch_positions()
-        except Exception:  # pragma: no cover - defensive fetch
-            positions = []
+    if not isinstance(row, Mapping):
+        return None
+    raw_symbol = str(row.get("symbol") or "").upper()
+    if not raw_symbol:
+        return None
+    raw_venue = str(row.get("venue") or "")
+    symbol_key = _normalise_symbol(raw_symbol)
+    venue_key = _normalise_venue(raw_venue)
+    base_qty = _coerce_float(row.get("base_qty"))
+    avg_price = abs(_coerce_float(row.get("avg_price")))
+    notional = abs(base_qty) * avg_price
+    if base_qty > 0:
+        side = "LONG"
+    elif base_qty < 0:
+        side = "SHORT"
+    else:
+        side = "FLAT"
+    entry = {
+        "symbol": raw_symbol or symbol_key,
+        "venue": raw_venue or venue_key,
+        "base_qty": base_qty,
+        "avg_price": avg_price,
+        "LONG": notional if side == "LONG" else 0.0,
+        "SHORT": notional if side == "SHORT" else 0.0,
+        "total_abs": notional,
+        "side": side,
+    }
+    return (venue_key, symbol_key), entry
+
+
+def _build_snapshot(positions: Iterable[Mapping[str, Any]]) -> ExposureCapsSnapshot:
     snapshot = ExposureCapsSnapshot()
     for row in positions:
-        if not isinstance(row, Mapping):
-            continue
-        raw_symbol = str(row.get("symbol") or "").upper()
-        if not raw_symbol:
+        parsed = _position_entry(row)
+        if parsed is None:
             continue
-        raw_venue = str(row.get("venue") or "")
-        symbol_key = _normalise_symbol(raw_symbol)
-        venue_key = _normalise_venue(raw_venue)
-        base_qty = _coerce_float(row.get("base_qty"))
-        avg_price = abs(_coerce_float(row.get("avg_price")))
-        notional = abs(base_qty) * avg_price
-        entry = snapshot.by_venue_symbol.setdefault(
-            (venue_key, symbol_key),
-            {
-                "symbol": raw_symbol or symbol_key,
-                "venue": raw_venue or venue_key,
-                "base_qty": 0.0,
-                "avg_price": 0.0,
-                "LONG": 0.0,
-                "SHORT": 0.0,
-                "total_abs": 0.0,
-                "side": "FLAT",
-            },
-        )
-        entry["base_qty"] = base_qty
-        entry["avg_price"] = avg_price
-        entry["total_abs"] = notional
-        if base_qty > 0:
-            entry["LONG"] = notional
-            entry["SHORT"] = 0.0
-            entry["side"] = "LONG"
-        elif base_qty < 0:
-            entry["LONG"] = 0.0
-            entry["SHORT"] = notional
-            entry["side"] = "SHORT"
-        else:
-            entry["LONG"] = 0.0
-            entry["SHORT"] = 0.0
-            entry["side"] = "FLAT"
+        key, entry = parsed
+        symbol_key = key[1]
+        snapshot.by_venue_symbol[key] = entry
+        notional = entry["total_abs"]
         snapshot.by_symbol[symbol_key] = snapshot.by_symbol.get(symbol_key, 0.0) + notional
-        side_key = entry["side"]
-        if side_key in {"LONG", "SHORT"}:
-            key = (symbol_key, side_key)
-            snapshot.by_symbol_side[key] = snapshot.by_symbol_side.get(key, 0.0) + notional
+        if entry["side"] != "FLAT":
+            side_key = (symbol_key, entry["side"])
+            snapshot.by_symbol_side[side_key] = (
+                snapshot.by_symbol_side.get(side_key, 0.0) + notional
+            )
+    return snapshot
+
+
+def collect_snapshot(
+    positions: Iterable[Mapping[str, Any]] | None = None,
+) -> ExposureCapsSnapshot:
+    """Return the current exposure snapshot.
+
+    Without ``positions`` this is the exposure index's view and costs no I/O
+    once the index is seeded; explicit ``positions`` rows are aggregated
+    directly.
+    """
+
+    if positions is None:
+        return _INDEX.snapshot()
+    snapshot = _build_snapshot(positions)
     _record_snapshot_metrics(snapshot)
     return snapshot
 
 
+def _record_entry_metrics(
+    venue_key: str, symbol_key: str, entry: Mapping[str, Any]
+) -> List[Tuple[str, str, str]]:
+    venue_label = str(entry.get("venue") or venue_key or "unknown")
+    labels: List[Tuple[str, str, str]] = []
+    for side in ("LONG", "SHORT"):
+        value = _coerce_float(entry.get(side))
+        label = (symbol_key or "UNKNOWN", side, venue_label)
+        labels.append(label)
+        EXPOSURE_CURRENT_ABS.labels(symbol=label[0], side=side, venue=venue_label).set(value)
+    return labels
+
+
 def _record_snapshot_metrics(snapshot: ExposureCapsSnapshot) -> None:
     global _PREVIOUS_EXPOSURE_LABELS
     current: set[Tuple[str, str, str]] = set()
     for (venue_key, symbol_key), entry in snapshot.by_venue_symbol.items():
-        venue_label = str(entry.get("venue") or venue_key or "unknown")
-        for side in ("LONG", "SHORT"):
-            value = _coerce_float(entry.get(side))
-            label = (symbol_key or "UNKNOWN", side, venue_label)
-            current.add(label)
-            EXPOSURE_CURRENT_ABS.labels(symbol=label[0], side=side, venue=venue_label).set(value)
+        current.update(_record_entry_metrics(venue_key, symbol_key, entry))
     for label in _PREVIOUS_EXPOSURE_LABELS - current:
         symbol, side, venue = label
         EXPOSURE_CURRENT_ABS.labels(symbol=symbol, side=side, venue=venue).set(0.0)
     _PREVIOUS_EXPOSURE_LABELS = current
 
 
-def resolve_caps(cfg: Any, symbol: Any, side: Any, venue: Any) -> Dict[str, float | None]:
-    """Resolve the applicable caps for the supplied scope."""
+_VERIFY_TOLERANCE = 1e-9
 
-    root = _extract_caps_root(cfg)
-    symbol_key = _normalise_symbol(symbol)
-    side_key = _normalise_side(side)
-    venue_key = _normalise_venue(venue)
-    if not root or not symbol_key:
-        return {
-            "global_max_abs": None,
-            "side_max_abs": None,
-            "venue_max_abs": None,
-        }
-    default_entry = _caps_entry(_model_to_mapping(root).get("default"))
-    global_cap = default_entry.get("max_abs_usdt")
-    side_cap = default_entry.get("per_side_max_abs_usdt", {}).get(side_key) if side_key else None
-    venue_cap: float | None = None
+_RowKey = Tuple[str, str]
+_IndexRow = Tuple[int, Tuple[str, str], Dict[str, Any]]
 
-    for candidate, payload in _iter_mapping_items(_model_to_mapping(root).get("per_symbol")):
-        if _normalise_symbol(candidate) != symbol_key:
-            continue
-        entry = _caps_entry(payload)
-        if entry.get("max_abs_usdt") is not None:
-            global_cap = entry.get("max_abs_usdt")
-        if side_key:
-            per_side = entry.get("per_side_max_abs_usdt", {})
-            if per_side.get(side_key) is not None:
-                side_cap = per_side.get(side_key)
-        break
-
-    if venue_key:
-        per_venue = _model_to_mapping(_model_to_mapping(root).get("per_venue"))
-        for venue_candidate, symbols in per_venue.items():
-            if _normalise_venue(venue_candidate) != venue_key:
+
+def _utcnow_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class ExposureIndex:
+    """Exposure aggregates kept current from ledger position updates.
+
+    The index is seeded from :func:`ledger.snapshot_positions` the first time
+    it is read for a ledger path and then follows every committed position
+    write through :func:`ledger.add_position_listener`, adjusting the
+    per-symbol and per-side totals by the difference between a row's old and
+    new notional. Each update carries the ledger's position sequence number;
+    one that is not newer than what the index already reflects for its row is
+    dropped, so updates delivered out of order by concurrent writers cannot
+    roll a row back.
+
+    :meth:`snapshot` hands out a copy that is rebuilt only after a change, and
+    an update republishes the exposure gauges of its own row only.
+    :meth:`verify` compares the index with the ledger, reports disagreeing
+    rows and resynchronises the totals.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._path: Path | None = None
+        self._ready = False
+        self._floor = 0
+        self._rows: Dict[_RowKey, _IndexRow] = {}
+        self._by_symbol: Dict[str, float] = {}
+        self._by_symbol_side: Dict[Tuple[str, str], float] = {}
+        self._by_venue_symbol: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._symbol_rows: Dict[str, int] = {}
+        self._side_rows: Dict[Tuple[str, str], int] = {}
+        self._cached: ExposureCapsSnapshot | None = None
+
+    # ------------------------------------------------------------------
+    # Reads
+
+    def snapshot(self) -> ExposureCapsSnapshot:
+        """Current exposures; seeds the index from the ledger on first use."""
+
+        path = Path(ledger.LEDGER_PATH)
+        with self._lock:
+            if self._ready and self._path == path:
+                return replace(self._view(), ts=_utcnow_iso())
+        try:
+            self._seed(path)
+        except Exception as exc:
+            LOGGER.debug("exposure_index.seed_failed", extra={"error": str(exc)})
+            return ExposureCapsSnapshot()
+        with self._lock:
+            return replace(self._view(), ts=_utcnow_iso())
+
+    def verify(self) -> List[Dict[str, Any]]:
+        """Compare the index with the ledger; return one entry per disagreeing row.
+
+        The totals are rebuilt from the ledger rows either way, which also
+        clears the rounding error that incremental updates accumulate.
+        """
+
+        path = Path(ledger.LEDGER_PATH)
+        with self._lock:
+            if self._path != path:
+                self._track(path)
+            compare = self._ready
+        seq, rows = ledger.snapshot_positions()
+        mismatches: List[Dict[str, Any]] = []
+        with self._lock:
+            if self._path != path:
+                return mismatches
+            if compare and self._ready:
+                mismatches = self._diff(seq, rows)
+            self._load(seq, rows)
+        if mismatches:
+            EXPOSURE_INDEX_MISMATCH_TOTAL.inc(len(mismatches))
+            LOGGER.warning(
+                "exposure_index.mismatch",
+                extra={"path": str(path), "count": len(mismatches), "rows": mismatches[:10]},
+            )
+        return mismatches
+
+    # ------------------------------------------------------------------
+    # Updates
+
+    def on_position(self, path: Path, seq: int, row: Mapping[str, Any] | None) -> None:
+        """Ledger listener: apply one committed position write (``None`` = table cleared)."""
+
+        with self._lock:
+            if path != self._path or seq <= self._floor:
+                return
+            if row is None:
+                self._clear()
+                self._floor = seq
+                _record_snapshot_metrics(self._view())
+                return
+            key = (str(row.get("venue") or ""), str(row.get("symbol") or ""))
+            current = self._rows.get(key)
+            if current is not None and seq <= current[0]:
+                return
+            parsed = _position_entry(row)
+            self._replace(key, seq, parsed)
+            if parsed is not None:
+                (venue_key, symbol_key), entry = parsed
+                _PREVIOUS_EXPOSURE_LABELS.update(
+                    _record_entry_metrics(venue_key, symbol_key, entry)
+                )
+
+    def reset(self) -> None:
+        with self._lock:
+            self._path = None
+            self._ready = False
+            self._floor = 0
+            self._clear()
+
+    # ------------------------------------------------------------------
+    # Internals (lock held unless noted)
+
+    def _seed(self, path: Path) -> None:
+        # Called without the lock: the ledger read must not block updates,
+        # which are applied on top of the seed when they are newer than it.
+        with self._lock:
+            if self._path != path:
+                self._track(path)
+        seq, rows = ledger.snapshot_positions()
+        with self._lock:
+            if self._path == path:
+                self._load(seq, rows)
+
+    def _track(self, path: Path) -> None:
+        self._path = path
+        self._ready = False
+        self._floor = 0
+        self._clear()
+
+    def _load(self, seq: int, rows: Iterable[Mapping[str, Any]]) -> None:
+        if seq < self._floor:
+            # The table was cleared after these rows were read.
+            self._ready = True
+            return
+        newer = {key: row for key, row in self._rows.items() if row[0] > seq}
+        self._clear()
+        for row in rows:
+            key = (str(row.get("venue") or ""), str(row.get("symbol") or ""))
+            if key not in newer:
+                self._replace(key, seq, _position_entry(row))
+        for key, (row_seq, norm_key, entry) in newer.items():
+            self._replace(key, row_seq, (norm_key, entry))
+        self._floor = seq
+        self._ready = True
+        _record_snapshot_metrics(self._view())
+
+    def _clear(self) -> None:
+        self._rows = {}
+        self._by_symbol = {}
+        self._by_symbol_side = {}
+        self._by_venue_symbol = {}
+        self._symbol_rows = {}
+        self._side_rows = {}
+        self._cached = None
+
+    def _replace(
+        self,
+        key: _RowKey,
+        seq: int,
+        parsed: Tuple[Tuple[str, str], Dict[str, Any]] | None,
+    ) -> None:
+        previous = self._rows.pop(key, None)
+        if previous is not None:
+            self._account(previous[1], previous[2], -1)
+        if parsed is not None:
+            norm_key, entry = parsed
+            self._rows[key] = (seq, norm_key, entry)
+            self._account(norm_key, entry, 1)
+        self._cached = None
+
+    def _account(self, norm_key: Tuple[str, str], entry: Dict[str, Any], sign: int) -> None:
+        symbol_key = norm_key[1]
+        notional = entry["total_abs"] * sign
+        if _bump(self._symbol_rows, symbol_key, sign):
+            self._by_symbol[symbol_key] = self._by_symbol.get(symbol_key, 0.0) + notional
+        else:
+            self._by_symbol.pop(symbol_key, None)
+        if entry["side"] != "FLAT":
+            side_key = (symbol_key, entry["side"])
+            if _bump(self._side_rows, side_key, sign):
+                self._by_symbol_side[side_key] = self._by_symbol_side.get(side_key, 0.0) + notional
+            else:
+                self._by_symbol_side.pop(side_key, None)
+        if sign > 0:
+            self._by_venue_symbol[norm_key] = entry
+        elif self._by_venue_symbol.get(norm_key) is entry:
+            del self._by_venue_symbol[norm_key]
+
+    def _view(self) -> ExposureCapsSnapshot:
+        if self._cached is None:
+            self._cached = ExposureCapsSnapshot(
+                by_symbol=dict(self._by_symbol),
+                by_symbol_side=dict(self._by_symbol_side),
+                by_venue_symbol=dict(self._by_venue_symbol),
+            )
+        return self._cached
+
+    def _diff(self, seq: int, rows: Iterable[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+        expected: Dict[_RowKey, Dict[str, Any]] = {}
+        for row in rows:
+            parsed = _position_entry(row)
+            if parsed is not None:
+                key = (str(row.get("venue") or ""), str(row.get("symbol") or ""))
+                expected[key] = parsed[1]
+        stored = {key: row[2] for key, row in self._rows.items() if row[0] <= seq}
+        newer = {key for key, row in self._rows.items() if row[0] > seq}
+        mismatches: List[Dict[str, Any]] = []
+        for key in sorted((set(expected) | set(stored)) - newer):
+            want = expected.get(key)
+            have = stored.get(key)
+            fields = [
+                name
+                for name in ("base_qty", "avg_price")
+                if abs(
+                    _coerce_float((want or {}).get(name)) - _coerce_float((have or {}).get(name))
+                )
+                > _VERIFY_TOLERANCE
+            ]
+            if want is None or have is None:
+                fields = ["row"]
+            if fields:
+                mismatches.append(
+                    {
+                        "venue": key[0],
+                        "symbol": key[1],
+                        "fields": fields,
+                        "expected": want,
+                        "stored": have,
+                    }
+                )
+        return mismatches
+
+
+def _bump(counts: Dict[Any, int], key: Any, sign: int) -> bool:
+    """Adjust ``key``'s row count; ``False`` once no rows are left for it."""
+
+    remaining = counts.get(key, 0) + sign
+    if remaining > 0:
+        counts[key] = remaining
+        return True
+    counts.pop(key, None)
+    return False
+
+
+_INDEX = ExposureIndex()
+
+
+def _on_position_update(path: Path, seq: int, row: Mapping[str, Any] | None) -> None:
+    _INDEX.on_position(path, seq, row)
+
+
+ledger.add_position_listener(_on_position_update)
+
+
+def get_exposure_index() -> ExposureIndex:
+    return _INDEX
+
+
+def reset_exposure_index_for_tests() -> None:
+    _INDEX.reset()
+
+
+def verify_exposure_index() -> List[Dict[str, Any]]:
+    """Check the exposure index against the ledger and resynchronise it."""
+
+    return _INDEX.verify()
+
+
+DEFAULT_VERIFY_INTERVAL_SEC = 60.0
+
+
+def _verify_interval() -> float:
+    raw = os.getenv("EXPOSURE_INDEX_VERIFY_SEC")
+    try:
+        value = float(raw) if raw is not None else DEFAULT_VERIFY_INTERVAL_SEC
+    except ValueError:
+        value = DEFAULT_VERIFY_INTERVAL_SEC
+    return max(value, 0.0)
+
+
+async def _run_verifier(interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(verify_exposure_index)
+        except asyncio.CancelledError:  # pragma: no cover - propagation
+            raise
+        except Exception as exc:  # pragma: no cover - defensive logging
+            LOGGER.warning("exposure_index.verify_failed", extra={"error": str(exc)})
+
+
+def setup_exposure_index_verifier(app: Any) -> None:
+    """Run :func:`verify_exposure_index` periodically for the app's lifetime."""
+
+    @app.on_event("startup")
+    async def _start_exposure_index_verifier() -> None:  # pragma: no cover - integration glue
+        interval = _verify_interval()
+        if interval <= 0:
+            LOGGER.info("exposure index verifier disabled via EXPOSURE_INDEX_VERIFY_SEC=0")
+            return
+        app.state.exposure_index_verifier = asyncio.create_task(
+            _run_verifier(interval), name="exposure-index-verifier"
+        )
+
+    @app.on_event("shutdown")
+    async def _stop_exposure_index_verifier() -> None:  # pragma: no cover - integration glue
+        task = getattr(app.state, "exposure_index_verifier", None)
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            LOGGER.debug("exposure index verifier cancelled during shutdown")
+
+
+_NO_CAPS: Tuple[float | None, float | None, float | None] = (None, None, None)
+
+
+class _CapsTable:
+    """Exposure caps of one config, flattened into dictionaries keyed by normalised names."""
+
+    def __init__(self, root: Any) -> None:
+        mapping = _model_to_mapping(root)
+        self.default = _caps_entry(mapping.get("default"))
+        self.per_symbol: Dict[str, Dict[str, Any]] = {}
+        for candidate, payload in _iter_mapping_items(mapping.get("per_symbol")):
+            self.per_symbol.setdefault(_normalise_symbol(candidate), _caps_entry(payload))
+        self.per_venue: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for venue_candidate, symbols in _model_to_mapping(mapping.get("per_venue")).items():
+            venue_key = _normalise_venue(venue_candidate)
+            if venue_key in self.per_venue:
                 continue
+            entries: Dict[str, Dict[str, Any]] = {}
             for symbol_candidate, entry_raw in _iter_mapping_items(symbols):
-                if _normalise_symbol(symbol_candidate) != symbol_key:
-                    continue
-                entry = _caps_entry(entry_raw)
+                entries.setdefault(_normalise_symbol(symbol_candidate), _caps_entry(entry_raw))
+            self.per_venue[venue_key] = entries
+        self._resolved: Dict[Tuple[str, str | None, str], Tuple[Any, Any, Any]] = {}
+
+    def resolve(
+        self, symbol_key: str, side_key: str | None, venue_key: str
+    ) -> Tuple[float | None, float | None, float | None]:
+        key = (symbol_key, side_key, venue_key)
+        cached = self._resolved.get(key)
+        if cached is not None:
+            return cached
+        global_cap = self.default.get("max_abs_usdt")
+        side_cap = self.default["per_side_max_abs_usdt"].get(side_key) if side_key else None
+        venue_cap: float | None = None
+        entry = self.per_symbol.get(symbol_key)
+        if entry is not None:
+            if entry.get("max_abs_usdt") is not None:
+                global_cap = entry.get("max_abs_usdt")
+            if side_key and entry["per_side_max_abs_usdt"].get(side_key) is not None:
+                side_cap = entry["per_side_max_abs_usdt"].get(side_key)
+        if venue_key:
+            entry = self.per_venue.get(venue_key, {}).get(symbol_key)
+            if entry is not None:
                 if entry.get("max_abs_usdt") is not None:
                     venue_cap = entry.get("max_abs_usdt")
-                if side_key:
-                    per_side = entry.get("per_side_max_abs_usdt", {})
-                    if per_side.get(side_key) is not None:
-                        side_cap = per_side.get(side_key)
-                break
-            break
+                if side_key and entry["per_side_max_abs_usdt"].get(side_key) is not None:
+                    side_cap = entry["per_side_max_abs_usdt"].get(side_key)
+        resolved = (global_cap, side_cap, venue_cap)
+        self._resolved[key] = resolved
+        return resolved
+
+
+# Config objects are replaced, never mutated, when the runtime reloads, so a
+# compiled table stays valid for as long as its config object is alive. The
+# cache holds the config itself to keep its ``id`` from being reused.
+_CAPS_TABLES: "OrderedDict[int, Tuple[Any, _CapsTable | None]]" = OrderedDict()
+_CAPS_TABLES_MAX = 8
+_CAPS_TABLES_LOCK = threading.Lock()
+
+
+def _caps_table(cfg: Any) -> _CapsTable | None:
+    cached = _CAPS_TABLES.get(id(cfg))
+    if cached is not None and cached[0] is cfg:
+        return cached[1]
+    root = _extract_caps_root(cfg)
+    table = _CapsTable(root) if root else None
+    with _CAPS_TABLES_LOCK:
+        _CAPS_TABLES[id(cfg)] = (cfg, table)
+        while len(_CAPS_TABLES) > _CAPS_TABLES_MAX:
+            _CAPS_TABLES.popitem(last=False)
+    return table
 
+
+def resolve_caps(cfg: Any, symbol: Any, side: Any, venue: Any) -> Dict[str, float | None]:
+    """Resolve the applicable caps for the supplied scope."""
+
+    symbol_key = _normalise_symbol(symbol)
+    table = _caps_table(cfg) if symbol_key else None
+    if table is None:
+        caps = _NO_CAPS
+    else:
+        caps = table.resolve(symbol_key, _normalise_side(side), _normalise_venue(venue))
     return {
-        "global_max_abs": global_cap,
-        "side_max_abs": side_cap,
-        "venue_max_abs": venue_cap,
+        "global_max_abs": caps[0],
+        "side_max_abs": caps[1],
+        "venue_max_abs": caps[2],
     }
 
 
@@ -7,7 +7,7 @@ import math
 import os
 import threading
 import time
-from collections import Counter, deque
+from collections import deque
 from dataclasses import dataclass, field
 from typing import Callable, Deque, Dict, Mapping
 
@@ -21,6 +21,7 @@ from ..metrics import (
     set_velocity,
 )
 from ..services import runtime
+from ..utils.rolling import RollingCounter
 from ..watchdog.core import (
     BrokerStateSnapshot,
     STATE_DEGRADED,
@@ -822,8 +823,8 @@ class SlidingRiskGovernor:
         self._clock = clock or time.time
         self._config = config or RiskGovernorConfig()
         self._lock = threading.RLock()
-        self._events: Deque[tuple[float, str, str]] = deque()
-        self._error_breakdown: Counter[str] = Counter()
+        self._outcomes = RollingCounter(self._config.window_sec)
+        self._error_breakdown = RollingCounter(self._config.window_sec)
         self._current_window_start: float | None = None
         self._current_window_throttled: bool = False
         self._window_history: Deque[_WindowHistoryEntry] = deque(
@@ -839,28 +840,21 @@ class SlidingRiskGovernor:
     def record_order_success(self, *, venue: str | None = None, category: str = _ORDER_OK) -> None:
         now = self._clock()
         with self._lock:
-            self._events.append((now, _ORDER_OK, _normalise_category(category)))
-            self._prune(now)
-            if len(self._events) > 16384:
-                self._events.popleft()
+            self._outcomes.add(now, _ORDER_OK)
 
     def record_order_error(self, *, venue: str | None = None, category: str = _ORDER_ERROR) -> None:
         now = self._clock()
         normalised = _normalise_category(category)
         with self._lock:
-            self._events.append((now, _ORDER_ERROR, normalised))
-            self._error_breakdown[normalised] += 1
-            self._prune(now)
-            if len(self._events) > 16384:
-                self._events.popleft()
+            self._outcomes.add(now, _ORDER_ERROR)
+            self._error_breakdown.add(now, normalised)
 
     # ------------------------------------------------------------------
     def compute(self, *, venue: str | None = None) -> RiskDecision:
         now = self._clock()
         snapshot = get_broker_state()
         with self._lock:
-            self._prune(now)
-            orders_total, orders_ok, orders_error = self._counts()
+            orders_total, orders_ok, orders_error = self._counts(now)
             success_rate = orders_ok / orders_total if orders_total else 1.0
             error_rate = orders_error / orders_total if orders_total else 0.0
             broker_state, broker_reason = _resolve_broker_state(snapshot, venue)
@@ -881,7 +875,7 @@ class SlidingRiskGovernor:
                 broker_reason=broker_reason,
             )
             self._update_metrics(decision)
-            self._store_snapshot(decision, snapshot)
+            self._store_snapshot(decision, snapshot, now)
             return decision
 
     def snapshot(self) -> Dict[str, object]:
@@ -889,29 +883,10 @@ class SlidingRiskGovernor:
             return dict(self._last_snapshot)
 
     # ------------------------------------------------------------------
-    def _prune(self, now: float) -> None:
-        window = self._config.window_sec
-        threshold = now - window
-        while self._events and self._events[0][0] < threshold:
-            ts, kind, category = self._events.popleft()
-            if kind == _ORDER_ERROR:
-                remaining = self._error_breakdown.get(category)
-                if remaining is None:
-                    LOGGER.debug(
-                        "missing error breakdown bucket", extra={"category": category, "ts": ts}
-                    )
-                else:
-                    updated = remaining - 1
-                    if updated > 0:
-                        self._error_breakdown[category] = updated
-                    else:
-                        self._error_breakdown.pop(category, None)
-
-    def _counts(self) -> tuple[int, int, int]:
-        total = len(self._events)
-        errors = sum(1 for _, kind, _ in self._events if kind == _ORDER_ERROR)
-        ok = total - errors
-        return total, ok, errors
+    def _counts(self, now: float) -> tuple[int, int, int]:
+        ok = self._outcomes.count(now, _ORDER_OK)
+        errors = self._outcomes.count(now, _ORDER_ERROR)
+        return ok + errors, ok, errors
 
     def _decide_reason(
         self,
@@ -965,7 +940,9 @@ class SlidingRiskGovernor:
                     self._last_auto_hold_window = latest_window
         return auto_hold_reason
 
-    def _store_snapshot(self, decision: RiskDecision, snapshot: BrokerStateSnapshot) -> None:
+    def _store_snapshot(
+        self, decision: RiskDecision, snapshot: BrokerStateSnapshot, now: float
+    ) -> None:
         reason = decision.reason or ""
         if reason.startswith("BROKER_DEGRADED:"):
             reason = "BROKER_DEGRADED"
@@ -986,7 +963,7 @@ class SlidingRiskGovernor:
             "hold_after_windows": self._config.hold_after_windows,
             "window_sec": self._config.window_sec,
             "watchdog": snapshot.as_dict(),
-            "error_breakdown": dict(self._error_breakdown),
+            "error_breakdown": self._error_breakdown.counts(now),
         }
         self._last_snapshot = payload
 
@@ -15,6 +15,7 @@ from typing import Any, Dict, Iterable, Mapping, Protocol, Sequence, TypedDict
 import httpx
 
 import app.config.feature_flags as ff
+from app.config.runtime_settings import get_runtime_settings
 from app.db import ledger as ledger_db
 from app.health.aggregator import DEFAULT_REQUIRED_SIGNALS, get_agg
 from app.health.watchdog import get_watchdog
@@ -264,7 +265,7 @@ def _parse_required_signals(raw: str | None, fallback: set[str]) -> set[str]:
 def feature_enabled() -> bool:
     """Return True when smart router scoring is enabled."""
 
-    return _feature_flag_enabled("FEATURE_SMART_ROUTER", False)
+    return get_runtime_settings().smart_router_enabled
 
 
 def _cooldown_default_ttl() -> int:
@@ -417,14 +418,7 @@ def _latency_target_ms(config) -> float:
 
 
 def _latency_weight_bps_per_ms() -> float:
-    raw = os.getenv("SMART_ROUTER_LATENCY_BPS_PER_MS")
-    if raw is None:
-        return 0.01
-    try:
-        weight = float(raw)
-    except (TypeError, ValueError):
-        return 0.01
-    return max(weight, 0.0)
+    return get_runtime_settings().smart_router_latency_bps_per_ms
 
 
 def _order_tracker_ttl() -> int:
@@ -543,6 +537,9 @@ class SmartRouter:
                 flush_every=flush_every,
                 dupe_window_sec=self._outbox_dupe_window_sec,
                 max_inmem=max_inmem,
+                group_commit=_env_flag("OUTBOX_GROUP_COMMIT", True),
+                commit_window_ms=max(0, _env_int("OUTBOX_COMMIT_WINDOW_MS", 0)),
+                checkpoint_every=max(0, _env_int("OUTBOX_CHECKPOINT_EVERY", 10_000)),
             )
         self._outbox_keys: Dict[str, str] = {}
         self._ledger_enabled = _feature_flag_enabled("FF_LEDGER", False)
@@ -598,7 +595,7 @@ class SmartRouter:
                 self._risk_governor = None
 
     def _sor_enabled(self, strategy: str) -> bool:
-        if not _feature_flag_enabled("FF_SOR_V1", False):
+        if not get_runtime_settings().sor_enabled:
             return False
         strategy_key = _normalise_strategy_id(strategy).lower()
         return strategy_key in {"xex_arb", "inter_venue_arb"}
@@ -14,6 +14,7 @@ from ..risk.core import risk_gate
 from ..universe.gate import check_pair_allowed, is_universe_enforced
 from ..services.runtime import (
     HoldActiveError,
+    get_last_opportunity_candidates,
     get_last_opportunity_state,
     get_safety_status,
     get_state,
@@ -345,7 +346,11 @@ async def execute(plan_body: ExecutePayload) -> dict:
 @router.get("/opportunity")
 async def last_opportunity() -> dict:
     opportunity, status_flag = get_last_opportunity_state()
-    return {"last_opportunity": opportunity, "status": status_flag}
+    return {
+        "last_opportunity": opportunity,
+        "status": status_flag,
+        "candidates": get_last_opportunity_candidates(),
+    }
 
 
 @router.post("/confirm")
@@ -27,6 +27,7 @@ from ..alerts.registry import build_alerts_payload
 from ..ledger import build_ledger_from_history
 from ..metrics import set_auto_trade_state
 from ..metrics.pnl import publish_daily_snapshots
+from ..net import Lane, request_lane
 from ..audit_log import list_recent_operator_actions, log_operator_action
 from ..dashboard_helpers import render_dashboard_response
 from ..version import APP_VERSION
@@ -798,11 +799,13 @@ def _event_page(*, offset: int = 0, limit: int = DEFAULT_EVENT_LIMIT, order: str
 @router.get("/state")
 async def runtime_state() -> dict:
     state = get_state()
-    snapshot, open_orders, positions = await asyncio.gather(
-        portfolio.snapshot(),
-        asyncio.to_thread(ledger.fetch_open_orders),
-        asyncio.to_thread(ledger.fetch_positions),
-    )
+    # Dashboard refreshes must never compete with order flow for venue budget.
+    with request_lane(Lane.ANALYTICS):
+        snapshot, open_orders, positions = await asyncio.gather(
+            portfolio.snapshot(),
+            asyncio.to_thread(ledger.fetch_open_orders),
+            asyncio.to_thread(ledger.fetch_positions),
+        )
     set_open_orders(open_orders)
     risk_state = risk.refresh_runtime_state(snapshot=snapshot, open_orders=open_orders)
     risk_payload = risk_state.as_dict()
@@ -1160,6 +1163,11 @@ def _clean_str(value: str | None) -> str | None:
     return stripped or None
 
 
+def _clean_codes(values: list[str] | None) -> list[str] | None:
+    codes = [code for code in (_clean_str(value) for value in values or []) if code]
+    return codes or None
+
+
 @router.get("/events")
 async def events(
     offset: int = Query(0, ge=0),
@@ -1171,6 +1179,8 @@ async def events(
     since: datetime | None = Query(None),
     until: datetime | None = Query(None),
     search: str | None = Query(None),
+    code: list[str] | None = Query(None),
+    cursor: str | None = Query(None),
 ) -> dict:
     try:
         page = ledger.fetch_events_page(
@@ -1183,6 +1193,8 @@ async def events(
             since=since,
             until=until,
             search=_clean_str(search),
+            codes=_clean_codes(code),
+            cursor=_clean_str(cursor),
         )
     except ValueError as exc:
         raise HTTPException(
@@ -1221,6 +1233,8 @@ async def events_export(
     since: datetime | None = Query(None),
     until: datetime | None = Query(None),
     search: str | None = Query(None),
+    code: list[str] | None = Query(None),
+    cursor: str | None = Query(None),
 ) -> Response:
     fmt = (format or "csv").strip().lower()
     if fmt not in {"csv", "json"}:
@@ -1238,6 +1252,9 @@ async def events_export(
             since=since,
             until=until,
             search=_clean_str(search),
+            codes=_clean_codes(code),
+            cursor=_clean_str(cursor),
+            with_total=False,
         )
     except ValueError as exc:
         raise HTTPException(
@@ -1269,7 +1286,8 @@ async def portfolio_export(format: str = Query("csv")) -> Response:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="format must be csv or json"
         )
-    snapshot = await portfolio.snapshot()
+    with request_lane(Lane.ANALYTICS):
+        snapshot = await portfolio.snapshot()
     positions_payload = [
         {
             "venue": position.venue,
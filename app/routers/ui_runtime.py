@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+from dataclasses import fields
 from datetime import datetime
-from typing import Literal
+from typing import Any, Literal
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from pydantic import BaseModel
 
+from app.audit_log import log_operator_action
+from app.config.runtime_settings import get_runtime_settings, reload_runtime_settings
 from app.runtime.live_guard import LiveTradingGuard
 from app.runtime.promotion import PromotionStage, get_promotion_status
 
@@ -13,7 +16,9 @@ try:  # pragma: no cover - optional settings module
     from app.settings import settings as app_settings
 except ImportError:  # pragma: no cover - optional settings module
     app_settings = None
+from app.security import require_token
 from app.services.runtime import get_profile
+from app.utils.operators import resolve_operator_identity
 
 router = APIRouter(prefix="/api/ui", tags=["ui", "runtime"])
 
@@ -88,3 +93,48 @@ async def get_live_promotion_status() -> UiPromotionStatus:
         allowed_next_stages=list(status.allowed_next_stages),
         reason=status.reason,
     )
+
+
+def _require_role(request: Request, roles: set[str]) -> tuple[str, str]:
+    token = require_token(request)
+    if token is None:
+        return ("system", "operator")
+    identity = resolve_operator_identity(token)
+    if not identity or identity[1] not in roles:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="forbidden")
+    return identity
+
+
+@router.get("/runtime/settings")
+def get_runtime_settings_snapshot(request: Request) -> dict[str, Any]:
+    """Return the compiled settings snapshot hot paths currently read."""
+
+    _require_role(request, {"viewer", "auditor", "operator"})
+    settings = get_runtime_settings()
+    return {"version": settings.version, "settings": settings.as_dict()}
+
+
+@router.post("/runtime/settings/reload")
+def reload_runtime_settings_snapshot(request: Request) -> dict[str, Any]:
+    """Re-read the environment into a new settings snapshot (operators only)."""
+
+    name, role = _require_role(request, {"operator"})
+    previous = get_runtime_settings()
+    current = reload_runtime_settings()
+    changed = [
+        item.name
+        for item in fields(current)
+        if item.name != "version" and getattr(previous, item.name) != getattr(current, item.name)
+    ]
+    log_operator_action(
+        name,
+        role,
+        "RUNTIME_SETTINGS_RELOAD",
+        details={"version": current.version, "changed": changed},
+    )
+    return {
+        "version": current.version,
+        "previous_version": previous.version,
+        "changed": changed,
+        "settings": current.as_dict(),
+    }
@@ -1,6 +1,4 @@
 from __future__ import annotations
-import asyncio
-import json
 
 from typing import Any, Mapping
 
@@ -11,6 +9,7 @@ from ..services import runtime
 from ..services import cache as status_cache
 from ..services.cache import get_or_set
 from ..services.status import get_status_components, get_status_overview, get_status_slo
+from ..services.status_stream import get_status_broadcaster
 from ..slo.guard import apply_critical_slo_auto_hold, build_default_context
 from ..telemetry.metrics import slo_snapshot
 from ..utils.ttl_cache import cache_response
@@ -187,9 +186,9 @@ async def slo(_request: Request) -> JSONResponse:
 @router.websocket("/stream/status")
 async def stream_status(ws: WebSocket) -> None:
     await ws.accept()
-    try:
-        while True:
-            await ws.send_text(json.dumps(get_status_overview()))
-            await asyncio.sleep(1.0)
-    except WebSocketDisconnect:
-        return
+    async with get_status_broadcaster().subscribe(deltas=False) as frames:
+        try:
+            while True:
+                await ws.send_text(await frames.get())
+        except WebSocketDisconnect:
+            return
@@ -1,8 +1,6 @@
 from __future__ import annotations
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from ..services.status import get_status_overview
-import asyncio
-import json
+from ..services.status_stream import get_status_broadcaster
 
 router = APIRouter()
 
@@ -10,9 +8,9 @@ router = APIRouter()
 @router.websocket("/stream")
 async def stream(ws: WebSocket):
     await ws.accept()
-    try:
-        while True:
-            await ws.send_text(json.dumps(get_status_overview()))
-            await asyncio.sleep(1.0)
-    except WebSocketDisconnect:
-        return
+    async with get_status_broadcaster().subscribe() as frames:
+        try:
+            while True:
+                await ws.send_text(await frames.get())
+        except WebSocketDisconnect:
+            return
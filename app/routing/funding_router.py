@@ -7,8 +7,7 @@ import time
 from dataclasses import dataclass
 from typing import Dict, List, Mapping, MutableMapping, Optional
 
-import os
-
+from ..config.runtime_settings import get_runtime_settings
 from ..tca.cost_model import effective_cost as tca_effective_cost, funding_bps_per_hour
 from ..utils.symbols import normalise_symbol, resolve_venue_symbol
 
@@ -18,15 +17,8 @@ LOGGER = logging.getLogger(__name__)
 FUNDING_INTERVAL_SECONDS = 8 * 3600.0
 
 
-def _feature_flag_enabled(name: str, default: bool = False) -> bool:
-    raw = os.environ.get(name)
-    if raw is None:
-        return default
-    return raw.strip().lower() in {"1", "true", "yes", "on"}
-
-
 def _tca_router_enabled() -> bool:
-    return _feature_flag_enabled("FEATURE_TCA_ROUTER", False)
+    return get_runtime_settings().tca_router_enabled
 
 
 @dataclass(frozen=True)
@@ -1,15 +1,39 @@
-"""Disk-backed runtime status snapshot helper."""
+"""Disk-backed runtime status snapshot helper.
+
+Runtime mutations hand their sections to :func:`submit_runtime_updates`, which
+only records them in memory: the write-behind flusher thread coalesces the
+updates per top-level section and rewrites the file once per
+``RUNTIME_STATE_FLUSH_MS`` window (immediately for ``critical`` updates such
+as a HOLD transition). Sections registered with
+:func:`register_flush_provider` are computed on the flusher thread at write
+time. Every write goes to a temporary file that is fsynced and renamed over
+the target, so readers never see a torn file.
+
+:func:`load_runtime_payload` overlays the pending sections on the file, so
+readers in this process always see their own updates. ``RUNTIME_STATE_FLUSH_MS=0``
+turns write-behind off and flushes on the caller's thread.
+"""
 
 from __future__ import annotations
 
+import atexit
 import json
 import logging
 import os
+import tempfile
+import threading
+import time
 from pathlib import Path
-from typing import Any, Mapping
+from typing import Any, Callable, Dict, List, Mapping
 
+from .metrics.runtime import (
+    RUNTIME_STATE_FLUSH_SECONDS,
+    RUNTIME_STATE_UPDATES_TOTAL,
+    RUNTIME_STATE_WRITES_TOTAL,
+)
 
 _DEFAULT_RUNTIME_PATH = Path("data/runtime_state.json")
+DEFAULT_FLUSH_INTERVAL_MS = 250.0
 
 
 LOGGER = logging.getLogger(__name__)
@@ -24,10 +48,16 @@ def get_runtime_state_path() -> Path:
     return _DEFAULT_RUNTIME_PATH
 
 
-def load_runtime_payload() -> dict[str, Any]:
-    """Load the persisted runtime payload from disk."""
+def _flush_interval() -> float:
+    raw = os.environ.get("RUNTIME_STATE_FLUSH_MS")
+    try:
+        value = float(raw) if raw is not None else DEFAULT_FLUSH_INTERVAL_MS
+    except ValueError:
+        value = DEFAULT_FLUSH_INTERVAL_MS
+    return max(value, 0.0) / 1000.0
 
-    path = get_runtime_state_path()
+
+def _read_payload(path: Path) -> dict[str, Any]:
     try:
         raw = path.read_text(encoding="utf-8")
     except OSError:
@@ -43,24 +73,195 @@ def load_runtime_payload() -> dict[str, Any]:
     return dict(payload)
 
 
-def write_runtime_payload(payload: Mapping[str, Any]) -> None:
-    """Persist the provided payload to disk with pretty formatting."""
-
-    path = get_runtime_state_path()
+def _write_payload(path: Path, payload: Mapping[str, Any]) -> None:
     try:
         path.parent.mkdir(parents=True, exist_ok=True)
     except OSError as exc:
         LOGGER.warning(
             "runtime_state_store parent creation failed path=%s error=%s", path.parent, exc
         )
-    serialisable = dict(payload)
     try:
-        with path.open("w", encoding="utf-8") as handle:
-            json.dump(serialisable, handle, indent=2, sort_keys=True)
-    except OSError as exc:
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=str(path.parent), prefix=f".{path.name}.", delete=False
+        ) as handle:
+            json.dump(dict(payload), handle, indent=2, sort_keys=True)
+            handle.flush()
+            os.fsync(handle.fileno())
+            tmp_name = handle.name
+        os.replace(tmp_name, path)
+    except (OSError, TypeError, ValueError) as exc:
         LOGGER.warning("runtime_state_store write failed path=%s error=%s", path, exc)
 
 
+class RuntimeStateWriter:
+    """Coalescing write-behind writer for the runtime state file(s)."""
+
+    def __init__(self, *, interval: float | None = None) -> None:
+        self._interval = interval
+        self._cond = threading.Condition()
+        # Held while a file is read, merged and replaced, so a flush and a
+        # full ``write_runtime_payload`` never interleave.
+        self._file_lock = threading.Lock()
+        self._pending: Dict[Path, Dict[str, Any]] = {}
+        self._urgent = False
+        self._providers: List[Callable[[], Mapping[str, Any]]] = []
+        self._thread: threading.Thread | None = None
+        self.updates = 0
+        self.writes = 0
+
+    @property
+    def interval(self) -> float:
+        return self._interval if self._interval is not None else _flush_interval()
+
+    def add_provider(self, provider: Callable[[], Mapping[str, Any]]) -> None:
+        if provider not in self._providers:
+            self._providers.append(provider)
+
+    def submit(self, updates: Mapping[str, Any], *, critical: bool = False) -> None:
+        """Queue ``updates`` (top-level sections) for the next flush."""
+
+        path = get_runtime_state_path()
+        with self._cond:
+            self._pending.setdefault(path, {}).update(updates)
+            self.updates += 1
+            if critical:
+                self._urgent = True
+            write_behind = self.interval > 0
+            if write_behind:
+                self._ensure_thread()
+                self._cond.notify()
+        RUNTIME_STATE_UPDATES_TOTAL.inc()
+        if not write_behind:
+            self.flush(trigger="sync")
+
+    def pending(self, path: Path) -> Dict[str, Any]:
+        with self._cond:
+            return dict(self._pending.get(path, {}))
+
+    def flush(self, *, trigger: str = "sync") -> int:
+        """Write every pending section now; return the number of files written."""
+
+        with self._cond:
+            idle = not self._pending
+        if idle:
+            # Wait out a flush the background thread may have in flight.
+            with self._file_lock:
+                return 0
+        provided = self._provided()
+        written = 0
+        with self._file_lock:
+            with self._cond:
+                pending, self._pending = self._pending, {}
+                self._urgent = False
+            for path, sections in pending.items():
+                started = time.perf_counter()
+                payload = _read_payload(path)
+                payload.update(sections)
+                payload.update(provided)
+                _write_payload(path, payload)
+                RUNTIME_STATE_FLUSH_SECONDS.observe(time.perf_counter() - started)
+                RUNTIME_STATE_WRITES_TOTAL.labels(trigger=trigger).inc()
+                written += 1
+        with self._cond:
+            self.writes += written
+        return written
+
+    def replace(self, payload: Mapping[str, Any]) -> None:
+        """Write ``payload`` (plus provider sections) as the whole file.
+
+        Pending sections for the path are dropped; callers pass a payload built
+        from :func:`load_runtime_payload`, which already includes them.
+        """
+
+        path = get_runtime_state_path()
+        provided = self._provided()
+        with self._file_lock:
+            with self._cond:
+                self._pending.pop(path, None)
+            _write_payload(path, {**payload, **provided})
+        RUNTIME_STATE_WRITES_TOTAL.labels(trigger="replace").inc()
+
+    def _provided(self) -> Dict[str, Any]:
+        # Providers take their own locks, so callers run them before the file lock.
+        provided: Dict[str, Any] = {}
+        for provider in list(self._providers):
+            try:
+                provided.update(provider())
+            except Exception as exc:  # pragma: no cover - defensive
+                LOGGER.warning("runtime_state_store provider failed error=%s", exc)
+        return provided
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="runtime-state-writer", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+                # Coalesce everything that arrives within one interval of the
+                # first pending update, unless a critical update cuts it short.
+                deadline = time.monotonic() + self.interval
+                while not self._urgent:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                trigger = "critical" if self._urgent else "interval"
+            try:
+                self.flush(trigger=trigger)
+            except Exception as exc:  # pragma: no cover - defensive
+                LOGGER.warning("runtime_state_store flush failed error=%s", exc)
+
+
+_WRITER = RuntimeStateWriter()
+
+
+def get_runtime_state_writer() -> RuntimeStateWriter:
+    return _WRITER
+
+
+def load_runtime_payload() -> dict[str, Any]:
+    """Load the persisted runtime payload, including sections not yet flushed."""
+
+    path = get_runtime_state_path()
+    payload = _read_payload(path)
+    payload.update(_WRITER.pending(path))
+    return payload
+
+
+def submit_runtime_updates(updates: Mapping[str, Any], *, critical: bool = False) -> None:
+    """Queue top-level sections for the write-behind flusher."""
+
+    _WRITER.submit(updates, critical=critical)
+
+
+def flush_runtime_payload() -> int:
+    """Flush pending sections on the caller's thread (shutdown and test hook)."""
+
+    return _WRITER.flush(trigger="sync")
+
+
+# The flusher is a daemon thread; whatever it has not written yet goes out here.
+atexit.register(flush_runtime_payload)
+
+
+def register_flush_provider(provider: Callable[[], Mapping[str, Any]]) -> None:
+    """Add sections computed at flush time, on the flusher thread."""
+
+    _WRITER.add_provider(provider)
+
+
+def write_runtime_payload(payload: Mapping[str, Any]) -> None:
+    """Persist the provided payload to disk with pretty formatting."""
+
+    _WRITER.replace(payload)
+
+
 def merge_runtime_payload(updates: Mapping[str, Any]) -> dict[str, Any]:
     """Update the existing payload with ``updates`` and persist it."""
 
@@ -3,12 +3,13 @@ from __future__ import annotations
 import asyncio
 import logging
 from dataclasses import asdict, dataclass, field
+from functools import partial
 from typing import Any, Dict, List, Literal, Tuple
 
-import os
 import time
 
 from ..broker.router import ExecutionRouter
+from ..config.runtime_settings import get_runtime_settings
 from ..core.config import ArbitragePairConfig
 from ..metrics import record_trade_execution, slo
 from ..routing import effective_fee_for_quote, extract_funding_inputs
@@ -25,6 +26,8 @@ from ..strategy_risk import get_strategy_risk_manager
 from ..utils.symbols import resolve_runtime_venue_id
 from . import risk
 from .derivatives import DerivativesRuntime
+from .post_trade import get_post_trade_refresher
+from .quotes import QuoteSet, gather_quotes, gather_quotes_async, max_skew_ms
 from .runtime import (
     HoldActiveError,
     bump_counter,
@@ -187,6 +190,8 @@ class Plan:
     spread_bps: float = 0.0
     venues: List[str] = field(default_factory=list)
     reason: str | None = None
+    quote_ts: Dict[str, float] = field(default_factory=dict)
+    quote_skew_ms: float = 0.0
 
     def as_dict(self) -> Dict[str, Any]:
         payload: Dict[str, Any] = {
@@ -201,6 +206,9 @@ class Plan:
             "spread_bps": self.spread_bps,
             "venues": list(self.venues),
         }
+        if self.quote_ts:
+            payload["quote_ts"] = dict(self.quote_ts)
+            payload["quote_skew_ms"] = self.quote_skew_ms
         if self.reason:
             payload["reason"] = self.reason
         return payload
@@ -249,13 +257,6 @@ def _slippage_multiplier(slippage_bps: int, *, side: Literal["buy", "sell"]) ->
     return max(0.0, 1 - adjustment)
 
 
-def _feature_enabled(name: str, default: bool = False) -> bool:
-    raw = os.environ.get(name)
-    if raw is None:
-        return default
-    return raw.strip().lower() in {"1", "true", "yes", "on"}
-
-
 def _compute_leg(
     *,
     buy_exchange: str,
@@ -282,7 +283,10 @@ def _compute_leg(
     return pnl, legs
 
 
-def build_plan(symbol: str, notional: float, slippage_bps: int) -> Plan:
+_PLAN_VENUES = ("binance-um", "okx-perp")
+
+
+def _new_plan(symbol: str, notional: float, slippage_bps: int) -> Plan:
     state = get_state()
     symbol_normalised = (symbol or "").upper()
     notional_value = float(notional)
@@ -306,20 +310,58 @@ def build_plan(symbol: str, notional: float, slippage_bps: int) -> Plan:
         return plan
     if notional_value <= 0:
         plan.reason = "notional must be positive"
+    return plan
+
+
+def build_plan(symbol: str, notional: float, slippage_bps: int) -> Plan:
+    plan = _new_plan(symbol, notional, slippage_bps)
+    if plan.reason:
         return plan
+    aggregator = get_market_data()
+    quotes = gather_quotes(
+        {venue: partial(aggregator.top_of_book, venue, plan.symbol) for venue in _PLAN_VENUES}
+    )
+    return _complete_plan(plan, quotes)
 
-    # Книги цен
+
+async def build_plan_async(symbol: str, notional: float, slippage_bps: int) -> Plan:
+    """Async :func:`build_plan`; both venues' books are fetched concurrently on the loop."""
+
+    plan = _new_plan(symbol, notional, slippage_bps)
+    if plan.reason:
+        return plan
     aggregator = get_market_data()
+    fetch = getattr(aggregator, "top_of_book_async", None) or aggregator.top_of_book
+    quotes = await gather_quotes_async(
+        {venue: partial(fetch, venue, plan.symbol) for venue in _PLAN_VENUES}
+    )
+    return _complete_plan(plan, quotes)
+
+
+def _complete_plan(plan: Plan, quotes: QuoteSet) -> Plan:
+    state = get_state()
+    symbol_normalised = plan.symbol
+    notional_value = plan.notional
+    slippage_bps = plan.used_slippage_bps
+    fees = plan.used_fees_bps
+
+    # Книги цен
     try:
-        binance_book = aggregator.top_of_book("binance-um", symbol_normalised)
-        okx_book = aggregator.top_of_book("okx-perp", symbol_normalised)
+        binance_book = quotes.quote("binance-um")
+        okx_book = quotes.quote("okx-perp")
     except Exception as exc:  # pragma: no cover
         logger.exception("failed to fetch books for %s", symbol_normalised)
         plan.reason = f"failed to fetch books: {exc}"
         return plan
+    plan.quote_ts = quotes.timestamps()
+    plan.quote_skew_ms = quotes.skew_ms()
+    if quotes.skew_exceeded():
+        plan.viable = False
+        plan.reason = f"quote skew {plan.quote_skew_ms:.0f}ms > max {max_skew_ms():.0f}ms"
+        return plan
 
     funding_overrides: Dict[str, Dict[str, float]] = {}
-    if _feature_enabled("FEATURE_FUNDING_ROUTER"):
+    if get_runtime_settings().funding_router_enabled:
         config_data = getattr(state.config, "data", None)
         include_next_window = True
         derivatives_cfg = getattr(config_data, "derivatives", None) if config_data else None
@@ -689,7 +731,14 @@ async def execute_plan_async(plan: Plan, *, allow_safe_mode: bool = False) -> Ex
 
 def execute_plan(plan: Plan) -> ExecutionReport:
     """Synchronous wrapper for CLI contexts."""
-    return asyncio.run(execute_plan_async(plan, allow_safe_mode=True))
+
+    async def _run() -> ExecutionReport:
+        report = await execute_plan_async(plan, allow_safe_mode=True)
+        # The event loop ends with this call; let the post-trade refresh land.
+        await get_post_trade_refresher().flush()
+        return report
+
+    return asyncio.run(_run())
 
 
 class ArbitrageEngine:
@@ -4,6 +4,7 @@ import asyncio
 from collections import Counter
 import inspect
 import logging
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Awaitable, Callable, Dict, Iterable, Mapping, Optional, Sequence
@@ -13,6 +14,7 @@ from ..broker.base import CancelAllResult
 from ..journal import is_enabled as journal_enabled
 from ..journal import order_journal
 from ..metrics import set_auto_trade_state
+from ..telemetry import observe_core_latency
 from ..broker.router import ExecutionRouter
 from . import arbitrage
 from .dryrun import compute_metrics, select_cycle_symbol
@@ -81,6 +83,18 @@ class LoopCycleResult:
 
 
 async def run_cycle(*, allow_safe_mode: bool = True) -> LoopCycleResult:
+    started = time.perf_counter()
+    try:
+        result = await _run_cycle(allow_safe_mode=allow_safe_mode)
+    except Exception:
+        observe_core_latency("loop", (time.perf_counter() - started) * 1000.0, error=True)
+        raise
+    failed = result.summary is not None and result.summary.status == "error"
+    observe_core_latency("loop", (time.perf_counter() - started) * 1000.0, error=failed)
+    return result
+
+
+async def _run_cycle(*, allow_safe_mode: bool) -> LoopCycleResult:
     state = get_state()
     loop_state = get_loop_state()
     symbol = select_cycle_symbol()
@@ -92,7 +106,7 @@ async def run_cycle(*, allow_safe_mode: bool = True) -> LoopCycleResult:
     loop_state.pair = state.control.loop_pair or symbol
     loop_state.venues = list(state.control.loop_venues)
     loop_state.notional_usdt = notional
-    plan = arbitrage.build_plan(symbol, notional, slippage)
+    plan = await arbitrage.build_plan_async(symbol, notional, slippage)
     plan_payload = plan.as_dict()
     set_last_plan(plan_payload)
     loop_state.last_plan = plan_payload
@@ -2,18 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
 import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Callable, Dict, MutableMapping, Tuple
 
 from app.health.watchdog import get_watchdog
+from app.metrics.marketdata import MARKETDATA_REST_FETCH_TOTAL, MARKETDATA_TOB_REQUESTS_TOTAL
 from app.metrics.observability import set_market_data_staleness
 from app.utils.chaos import should_drop_ws_update
 
 
 BookFetcher = Callable[[str], Dict[str, float]]
 
+LOGGER = logging.getLogger(__name__)
+
 
 @dataclass
 class _BookEntry:
@@ -24,17 +30,33 @@ class _BookEntry:
 
 
 class MarketDataAggregator:
-    """Simple best bid/ask cache fed by websocket snapshots with REST fallback."""
+    """Best bid/ask cache fed by websocket snapshots with REST fallback.
+
+    REST fallbacks are single-flight per ``(venue, symbol)``: while one fetch
+    is in flight every other caller, sync or async, waits on the same result.
+    Failures are remembered for ``negative_ttl`` seconds so a degraded venue
+    is not hammered, and with ``serve_stale_ms`` a quote up to that much past
+    ``stale_after`` is returned immediately while a background refresh runs.
+    """
 
     def __init__(
         self,
         *,
         rest_fetchers: MutableMapping[str, BookFetcher] | None = None,
         stale_after: float = 1.0,
+        serve_stale_ms: float = 0.0,
+        negative_ttl: float = 0.5,
+        clock: Callable[[], float] | None = None,
     ) -> None:
         self._rest_fetchers: MutableMapping[str, BookFetcher] = rest_fetchers or {}
         self._stale_after = float(stale_after)
+        self._serve_stale_s = max(float(serve_stale_ms), 0.0) / 1000.0
+        self._negative_ttl = max(float(negative_ttl), 0.0)
+        self._clock = clock or time.time
         self._books: Dict[Tuple[str, str], _BookEntry] = {}
+        self._inflight: Dict[Tuple[str, str], Future[_BookEntry]] = {}
+        self._failures: Dict[Tuple[str, str], Tuple[float, Exception]] = {}
+        self._executor: ThreadPoolExecutor | None = None
         self._lock = threading.Lock()
 
     def register_rest_fetcher(self, venue: str, fetcher: BookFetcher) -> None:
@@ -51,11 +73,12 @@ class MarketDataAggregator:
     ) -> None:
         if should_drop_ws_update():
             return
-        ts_value = float(ts) if ts is not None else time.time()
+        ts_value = float(ts) if ts is not None else self._clock()
         key = (venue.lower(), symbol.upper())
         entry = _BookEntry(bid=float(bid), ask=float(ask), ts=ts_value, source="ws")
         with self._lock:
             self._books[key] = entry
+            self._failures.pop(key, None)
         set_market_data_staleness(venue, symbol, 0.0)
         get_watchdog().mark_marketdata_tick(ts_value)
 
@@ -66,25 +89,161 @@ class MarketDataAggregator:
         payload = fetcher(symbol)
         bid = float(payload.get("bid", 0.0))
         ask = float(payload.get("ask", 0.0))
-        ts_value = float(payload.get("ts", time.time()))
+        ts_value = float(payload.get("ts", self._clock()))
         entry = _BookEntry(bid=bid, ask=ask, ts=ts_value, source="rest")
         with self._lock:
             self._books[(venue.lower(), symbol.upper())] = entry
-        age = max(time.time() - entry.ts, 0.0)
+        age = max(self._clock() - entry.ts, 0.0)
         set_market_data_staleness(venue, symbol, age)
         get_watchdog().mark_marketdata_tick(entry.ts)
         return entry
 
-    def top_of_book(self, venue: str, symbol: str) -> Dict[str, float]:
-        key = (venue.lower(), symbol.upper())
-        now = time.time()
+    # -- single-flight refresh -------------------------------------------------
+    def _get_executor(self) -> ThreadPoolExecutor:
         with self._lock:
-            entry = self._books.get(key)
-        if entry is None or (self._stale_after and now - entry.ts > self._stale_after):
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=4, thread_name_prefix="marketdata-rest"
+                )
+            return self._executor
+
+    def _begin_refresh(self, key: Tuple[str, str]) -> Tuple[Future[_BookEntry], bool]:
+        """Return the in-flight refresh for ``key`` and whether the caller leads it."""
+
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                return future, False
+            future = Future()
+            future.set_running_or_notify_cancel()
+            self._inflight[key] = future
+            return future, True
+
+    def _run_refresh(
+        self, key: Tuple[str, str], venue: str, symbol: str, future: Future[_BookEntry]
+    ) -> None:
+        try:
             entry = self._fetch_via_rest(venue, symbol)
+        except Exception as exc:
+            MARKETDATA_REST_FETCH_TOTAL.labels(venue=key[0], status="error").inc()
+            LOGGER.debug(
+                "marketdata.rest_fetch_failed",
+                extra={"venue": venue, "symbol": symbol},
+                exc_info=exc,
+            )
+            with self._lock:
+                self._inflight.pop(key, None)
+                if self._negative_ttl > 0:
+                    self._failures[key] = (self._clock(), exc)
+            future.set_exception(exc)
+            return
+        MARKETDATA_REST_FETCH_TOTAL.labels(venue=key[0], status="ok").inc()
+        with self._lock:
+            self._inflight.pop(key, None)
+            self._failures.pop(key, None)
+        future.set_result(entry)
+
+    def _classify(self, key: Tuple[str, str], now: float) -> Tuple[str, _BookEntry | None]:
+        """Decide how to answer a lookup: ``hit``, ``stale``, ``negative`` or ``refresh``."""
+
+        with self._lock:
+            entry = self._books.get(key)
+            failure = self._failures.get(key)
+        if entry is not None:
+            age = now - entry.ts
+            if not self._stale_after or age <= self._stale_after:
+                return "hit", entry
+            if self._serve_stale_s and age <= self._stale_after + self._serve_stale_s:
+                return "stale", entry
+        if failure is not None and now - failure[0] <= self._negative_ttl:
+            return "negative", None
+        return "refresh", None
+
+    def _negative_error(self, key: Tuple[str, str]) -> Tuple[Exception, Exception | None]:
+        """Return a fresh error for a negatively cached ``key`` and the cached cause.
+
+        The cached exception is shared by every caller inside the TTL, so it is
+        never raised itself: each caller gets its own instance (same type when
+        it can be rebuilt from ``args``) chained to the original failure.
+        """
+
+        with self._lock:
+            failure = self._failures.get(key)
+        message = f"market data unavailable for {key[0]}/{key[1]}"
+        if failure is None:  # pragma: no cover - cleared concurrently
+            return LookupError(message), None
+        cached = failure[1]
+        try:
+            fresh = type(cached)(*cached.args)
+        except (TypeError, ValueError):
+            # The constructor does not accept its own ``args``.
+            fresh = LookupError(f"{message}: {cached}")
+        return fresh, cached
+
+    def _negatively_cached(self, key: Tuple[str, str], now: float) -> bool:
+        with self._lock:
+            failure = self._failures.get(key)
+        return failure is not None and now - failure[0] <= self._negative_ttl
+
+    def _revalidate_in_background(
+        self, key: Tuple[str, str], venue: str, symbol: str, now: float
+    ) -> None:
+        # A venue that just failed is not retried until the negative TTL
+        # lapses; the stale entry keeps being served meanwhile.
+        if self._negatively_cached(key, now):
+            return
+        future, leader = self._begin_refresh(key)
+        if leader:
+            self._get_executor().submit(self._run_refresh, key, venue, symbol, future)
+
+    def _respond(self, venue: str, symbol: str, entry: _BookEntry, now: float) -> Dict[str, float]:
         age = max(now - entry.ts, 0.0)
         set_market_data_staleness(venue, symbol, age)
         return {"bid": entry.bid, "ask": entry.ask, "ts": entry.ts}
 
+    def _lookup(
+        self, key: Tuple[str, str], venue: str, symbol: str, now: float
+    ) -> Tuple[_BookEntry | None, Future[_BookEntry] | None, bool]:
+        outcome, entry = self._classify(key, now)
+        future: Future[_BookEntry] | None = None
+        leader = False
+        if outcome == "stale":
+            self._revalidate_in_background(key, venue, symbol, now)
+        elif outcome == "negative":
+            MARKETDATA_TOB_REQUESTS_TOTAL.labels(venue=key[0], result=outcome).inc()
+            error, cause = self._negative_error(key)
+            raise error from cause
+        elif outcome == "refresh":
+            future, leader = self._begin_refresh(key)
+            outcome = "miss" if leader else "coalesced"
+        MARKETDATA_TOB_REQUESTS_TOTAL.labels(venue=key[0], result=outcome).inc()
+        return entry, future, leader
+
+    def top_of_book(self, venue: str, symbol: str) -> Dict[str, float]:
+        key = (venue.lower(), symbol.upper())
+        now = self._clock()
+        entry, future, leader = self._lookup(key, venue, symbol, now)
+        if future is not None:
+            if leader:
+                self._run_refresh(key, venue, symbol, future)
+            entry = future.result()
+        assert entry is not None  # nosec B101  # hits and refreshes always yield an entry
+        return self._respond(venue, symbol, entry, now)
+
+    async def top_of_book_async(self, venue: str, symbol: str) -> Dict[str, float]:
+        """Async variant of :meth:`top_of_book` that never blocks the event loop."""
+
+        key = (venue.lower(), symbol.upper())
+        now = self._clock()
+        entry, future, leader = self._lookup(key, venue, symbol, now)
+        if future is not None:
+            if leader:
+                asyncio.get_running_loop().run_in_executor(
+                    self._get_executor(), self._run_refresh, key, venue, symbol, future
+                )
+            entry = await asyncio.shield(asyncio.wrap_future(future))
+        assert entry is not None  # nosec B101  # hits and refreshes always yield an entry
+        return self._respond(venue, symbol, entry, now)
+
 
 __all__ = ["MarketDataAggregator"]
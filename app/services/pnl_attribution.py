@@ -135,9 +135,12 @@ def _build_trade_events(positions: Iterable[Mapping[str, Any]]) -> list[dict[str
     return events
 
 
+_FUNDING_EVENT_CODES = ("funding", "funding_payment", "funding_settlement")
+
+
 def _load_funding_events(*, limit: int = 200, mode: str) -> list[dict[str, Any]]:
     try:
-        events = fetch_events(limit=limit, order="desc")
+        events = fetch_events(limit=limit, order="desc", codes=_FUNDING_EVENT_CODES)
     except (sqlite3.Error, ValueError) as exc:
         LOGGER.warning(
             "pnl_attribution.funding_events_fetch_failed",
@@ -155,7 +158,7 @@ def _load_funding_events(*, limit: int = 200, mode: str) -> list[dict[str, Any]]
     funding_rows: list[dict[str, Any]] = []
     for event in events:
         code = str(event.get("code") or event.get("type") or "").lower()
-        if code not in {"funding", "funding_payment", "funding_settlement"}:
+        if code not in _FUNDING_EVENT_CODES:
             continue
         payload = event.get("payload") if isinstance(event.get("payload"), Mapping) else {}
         if isinstance(payload, str):
@@ -53,9 +53,12 @@ def _exclude_simulated_entries() -> bool:
         return _env_flag("EXCLUDE_DRY_RUN_FROM_PNL", True)
 
 
+_FUNDING_EVENT_CODES = ("funding", "funding_payment", "funding_settlement")
+
+
 def _load_funding_events(*, limit: int = 200, mode: str) -> List[dict[str, Any]]:
     try:
-        events = ledger.fetch_events(limit=limit, order="desc")
+        events = ledger.fetch_events(limit=limit, order="desc", codes=_FUNDING_EVENT_CODES)
     except (sqlite3.Error, ValueError) as exc:
         LOGGER.warning(
             "portfolio.funding_events_fetch_failed",
@@ -73,7 +76,7 @@ def _load_funding_events(*, limit: int = 200, mode: str) -> List[dict[str, Any]]
     funding_rows: List[dict[str, Any]] = []
     for event in events:
         code = str(event.get("code") or event.get("type") or "").lower()
-        if code not in {"funding", "funding_payment", "funding_settlement"}:
+        if code not in _FUNDING_EVENT_CODES:
             continue
         payload_raw = event.get("payload")
         if isinstance(payload_raw, Mapping):
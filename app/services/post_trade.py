@@ -0,0 +1,124 @@
+"""Debounced post-trade portfolio and risk refresh.
+
+A full refresh (open orders from the ledger, :func:`portfolio.snapshot` with
+its venue REST calls, and :func:`risk.refresh_runtime_state`) is too slow to
+run on the execution path. The router instead calls :meth:`schedule` after
+every dispatch; the refresher waits ``POST_TRADE_DEBOUNCE_MS`` for the burst
+to settle and runs a single refresh for every request that arrived in the
+meantime. Requests landing while a refresh is running trigger one more pass
+once it finishes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Dict, List
+
+from .. import ledger
+from ..config.runtime_settings import get_runtime_settings
+from ..metrics.execution import EXECUTION_PHASE_SECONDS, POST_TRADE_REFRESH_TOTAL
+from . import portfolio, risk
+from .portfolio import PortfolioSnapshot
+from .runtime import set_open_orders
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _debounce_seconds() -> float:
+    return get_runtime_settings().post_trade_debounce_ms / 1000.0
+
+
+class PostTradeRefresher:
+    """Coalesce post-trade refresh requests into background refreshes."""
+
+    def __init__(self, *, debounce: float | None = None) -> None:
+        self._debounce = debounce
+        self._task: asyncio.Task | None = None
+        self._dirty = False
+        self._requested_at: float | None = None
+        self.last_snapshot: PortfolioSnapshot | None = None
+        self.last_open_orders: List[Dict[str, object]] = []
+        self.last_refreshed: float | None = None
+        self.requests = 0
+        self.runs = 0
+
+    @property
+    def pending(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def schedule(self) -> None:
+        """Request a refresh from inside the running event loop."""
+
+        loop = asyncio.get_running_loop()
+        self.requests += 1
+        POST_TRADE_REFRESH_TOTAL.labels(event="requested").inc()
+        self._dirty = True
+        if self._requested_at is None:
+            self._requested_at = time.perf_counter()
+        task = self._task
+        if task is None or task.done() or task.get_loop() is not loop:
+            self._task = loop.create_task(self._run())
+
+    async def refresh(self) -> PortfolioSnapshot:
+        """Run one full refresh now and remember its results."""
+
+        open_orders = await asyncio.to_thread(ledger.fetch_open_orders)
+        set_open_orders(open_orders)
+        snapshot = await portfolio.snapshot()
+        risk.refresh_runtime_state(snapshot=snapshot, open_orders=open_orders)
+        self.last_snapshot = snapshot
+        self.last_open_orders = open_orders
+        self.last_refreshed = time.perf_counter()
+        self.runs += 1
+        return snapshot
+
+    async def flush(self) -> None:
+        """Wait for the pending refresh, if any, in the current event loop."""
+
+        task = self._task
+        if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            await task
+
+    def snapshot_age(self) -> float | None:
+        if self.last_refreshed is None:
+            return None
+        return time.perf_counter() - self.last_refreshed
+
+    async def _run(self) -> None:
+        debounce = self._debounce if self._debounce is not None else _debounce_seconds()
+        while self._dirty:
+            if debounce:
+                await asyncio.sleep(debounce)
+            self._dirty = False
+            requested_at, self._requested_at = self._requested_at, None
+            POST_TRADE_REFRESH_TOTAL.labels(event="refreshed").inc()
+            try:
+                await self.refresh()
+            except Exception:
+                LOGGER.exception("post-trade refresh failed")
+            finally:
+                if requested_at is not None:
+                    EXECUTION_PHASE_SECONDS.labels(phase="post_trade").observe(
+                        time.perf_counter() - requested_at
+                    )
+
+
+_REFRESHER = PostTradeRefresher()
+
+
+def get_post_trade_refresher() -> PostTradeRefresher:
+    return _REFRESHER
+
+
+def reset_post_trade_refresher(refresher: PostTradeRefresher | None = None) -> None:
+    global _REFRESHER
+    _REFRESHER = refresher or PostTradeRefresher()
+
+
+__all__ = [
+    "PostTradeRefresher",
+    "get_post_trade_refresher",
+    "reset_post_trade_refresher",
+]
@@ -0,0 +1,224 @@
+"""Concurrent per-venue quote fetching for multi-leg plans."""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Union
+
+LOGGER = logging.getLogger(__name__)
+
+QuoteFetcher = Callable[[], Mapping[str, Any]]
+AsyncQuoteFetcher = Callable[[], Awaitable[Mapping[str, Any]]]
+Timeout = Union[float, Mapping[str, float], None]
+
+_DEFAULT_TIMEOUT_MS = 1500.0
+_DEFAULT_MAX_SKEW_MS = 1000.0
+
+_EXECUTOR: ThreadPoolExecutor | None = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def _env_ms(name: str, default: float) -> float:
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        return default
+
+
+def default_timeout_ms() -> float:
+    return max(_env_ms("QUOTE_FETCH_TIMEOUT_MS", _DEFAULT_TIMEOUT_MS), 0.0)
+
+
+def max_skew_ms() -> float:
+    """Largest tolerated gap between leg quote timestamps; ``0`` disables the check."""
+
+    return max(_env_ms("QUOTE_MAX_SKEW_MS", _DEFAULT_MAX_SKEW_MS), 0.0)
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        with _EXECUTOR_LOCK:
+            if _EXECUTOR is None:
+                _EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="quote-fetch")
+    return _EXECUTOR
+
+
+@dataclass(frozen=True, slots=True)
+class LegQuote:
+    """Outcome of fetching one venue's quote.
+
+    ``ts`` is the quote's own ``ts`` when the source provides one (cached
+    websocket books), otherwise the wall-clock time the response arrived.
+    """
+
+    venue: str
+    quote: Dict[str, Any] | None
+    ts: float
+    latency_ms: float
+    error: BaseException | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.quote is not None
+
+
+@dataclass(slots=True)
+class QuoteSet:
+    legs: Dict[str, LegQuote] = field(default_factory=dict)
+    elapsed_ms: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return all(leg.ok for leg in self.legs.values())
+
+    def failed(self) -> List[LegQuote]:
+        return [leg for leg in self.legs.values() if not leg.ok]
+
+    def quote(self, venue: str) -> Dict[str, Any]:
+        leg = self.legs[venue]
+        if leg.error is not None:
+            raise leg.error
+        assert leg.quote is not None  # nosec B101  # ok legs always carry a quote
+        return leg.quote
+
+    def raise_for_failures(self) -> None:
+        for leg in self.legs.values():
+            if leg.error is not None:
+                raise leg.error
+
+    def timestamps(self) -> Dict[str, float]:
+        return {venue: leg.ts for venue, leg in self.legs.items() if leg.ok}
+
+    def skew_ms(self) -> float:
+        stamps = list(self.timestamps().values())
+        if len(stamps) < 2:
+            return 0.0
+        return (max(stamps) - min(stamps)) * 1000.0
+
+    def skew_exceeded(self, limit_ms: float | None = None) -> bool:
+        limit = max_skew_ms() if limit_ms is None else float(limit_ms)
+        return limit > 0 and self.skew_ms() > limit
+
+
+def _timeout_for(venue: str, timeout: Timeout) -> float:
+    if timeout is None:
+        return default_timeout_ms() / 1000.0
+    if isinstance(timeout, Mapping):
+        value = timeout.get(venue)
+        if value is None:
+            return default_timeout_ms() / 1000.0
+        return max(float(value), 0.0)
+    return max(float(timeout), 0.0)
+
+
+def _leg(
+    venue: str, started: float, payload: Any = None, error: BaseException | None = None
+) -> LegQuote:
+    received = time.time()
+    latency_ms = (time.perf_counter() - started) * 1000.0
+    if error is not None:
+        return LegQuote(venue=venue, quote=None, ts=received, latency_ms=latency_ms, error=error)
+    quote = dict(payload or {})
+    ts_raw = quote.get("ts")
+    try:
+        ts = float(ts_raw) if ts_raw is not None else received
+    except (TypeError, ValueError):
+        ts = received
+    return LegQuote(venue=venue, quote=quote, ts=ts, latency_ms=latency_ms)
+
+
+def _timeout_error(venue: str, seconds: float) -> TimeoutError:
+    return TimeoutError(f"{venue} quote timed out after {seconds * 1000.0:.0f} ms")
+
+
+def _log_failures(quotes: QuoteSet) -> None:
+    for leg in quotes.failed():
+        LOGGER.warning(
+            "quotes.leg_failed",
+            extra={"venue": leg.venue, "latency_ms": leg.latency_ms, "error": str(leg.error)},
+        )
+
+
+def gather_quotes(fetchers: Mapping[str, QuoteFetcher], *, timeout: Timeout = None) -> QuoteSet:
+    """Fetch every venue's quote concurrently and wait at most each venue's timeout.
+
+    Timeouts count from the moment the gather starts, so the call returns
+    after the slowest leg or the largest timeout, whichever comes first.
+    A leg that times out keeps running on the worker pool; its result is
+    discarded.
+    """
+
+    started = time.perf_counter()
+    executor = _get_executor()
+    futures = {venue: executor.submit(fetcher) for venue, fetcher in fetchers.items()}
+    result = QuoteSet()
+    for venue, future in futures.items():
+        limit = _timeout_for(venue, timeout)
+        remaining = max(limit - (time.perf_counter() - started), 0.0)
+        try:
+            payload = future.result(timeout=remaining)
+        except FutureTimeoutError:
+            future.cancel()
+            result.legs[venue] = _leg(venue, started, error=_timeout_error(venue, limit))
+        except Exception as exc:
+            LOGGER.debug("quotes.fetch_error", extra={"venue": venue}, exc_info=exc)
+            result.legs[venue] = _leg(venue, started, error=exc)
+        else:
+            result.legs[venue] = _leg(venue, started, payload)
+    result.elapsed_ms = (time.perf_counter() - started) * 1000.0
+    _log_failures(result)
+    return result
+
+
+async def gather_quotes_async(
+    fetchers: Mapping[str, QuoteFetcher | AsyncQuoteFetcher], *, timeout: Timeout = None
+) -> QuoteSet:
+    """Async :func:`gather_quotes`; coroutine fetchers run on the loop, others on the pool."""
+
+    started = time.perf_counter()
+    loop = asyncio.get_running_loop()
+
+    async def _fetch(venue: str, fetcher: QuoteFetcher | AsyncQuoteFetcher) -> LegQuote:
+        limit = _timeout_for(venue, timeout)
+        if inspect.iscoroutinefunction(fetcher):
+            awaitable: Awaitable[Any] = fetcher()
+        else:
+            awaitable = loop.run_in_executor(_get_executor(), fetcher)
+        try:
+            payload = await asyncio.wait_for(awaitable, timeout=limit)
+        except asyncio.TimeoutError:
+            return _leg(venue, started, error=_timeout_error(venue, limit))
+        except Exception as exc:
+            LOGGER.debug("quotes.fetch_error", extra={"venue": venue}, exc_info=exc)
+            return _leg(venue, started, error=exc)
+        return _leg(venue, started, payload)
+
+    venues = list(fetchers)
+    legs = await asyncio.gather(*(_fetch(venue, fetchers[venue]) for venue in venues))
+    result = QuoteSet(legs=dict(zip(venues, legs)))
+    result.elapsed_ms = (time.perf_counter() - started) * 1000.0
+    _log_failures(result)
+    return result
+
+
+__all__ = [
+    "AsyncQuoteFetcher",
+    "LegQuote",
+    "QuoteFetcher",
+    "QuoteSet",
+    "default_timeout_ms",
+    "gather_quotes",
+    "gather_quotes_async",
+    "max_skew_ms",
+]
@@ -42,6 +42,13 @@ class ReconRunner:
             config.interval_sec = interval
         else:
             config.interval_sec = _env_float("RECON_INTERVAL_SEC", config.interval_sec)
+        mode_override = os.getenv("RECON_MODE")
+        if mode_override is not None and mode_override.strip().lower() in {"full", "delta"}:
+            config.mode = mode_override.strip().lower()
+        config.full_sweep_sec = _env_float("RECON_FULL_SWEEP_SEC", config.full_sweep_sec)
+        config.cycle_deadline_sec = _env_float(
+            "RECON_CYCLE_DEADLINE_SEC", config.cycle_deadline_sec
+        )
         enabled_override = _env_flag("RECON_ENABLED", config.enabled)
         config.enabled = enabled_override
         auto_hold_override = os.getenv("RECON_AUTO_HOLD_ON_CRITICAL")
@@ -200,6 +200,46 @@ def refresh_runtime_state(
     return state.risk
 
 
+_RESTING_STATUSES = frozenset(
+    {"new", "open", "pending", "submitted", "accepted", "partially_filled"}
+)
+
+
+def apply_execution(orders: Iterable[Mapping[str, object]]) -> RiskState:
+    """Fold freshly acknowledged orders into the current risk metrics.
+
+    Bridges the gap until the next full :func:`refresh_runtime_state`: each
+    order adds its gross notional to the symbol exposure (an upper bound, so
+    reducing fills never loosen a limit early) and resting orders count
+    towards the venue's open-order total. Breaches are re-evaluated against
+    the updated metrics.
+    """
+
+    state = get_state()
+    current = state.risk.current
+    for order in orders:
+        if order.get("simulated"):
+            continue
+        try:
+            notional = abs(float(order.get("qty") or 0.0) * float(order.get("price") or 0.0))
+        except (TypeError, ValueError):
+            notional = 0.0
+        symbol = _normalise_symbol(order.get("symbol"))
+        if symbol and notional:
+            current.position_usdt[symbol] = current.position_usdt.get(symbol, 0.0) + notional
+        status = str(order.get("status") or "").lower()
+        if status in _RESTING_STATUSES:
+            venue = _normalise_venue(order.get("venue"))
+            current.open_orders[venue] = current.open_orders.get(venue, 0) + 1
+    metrics = RiskMetrics(
+        positions_usdt=dict(current.position_usdt),
+        open_orders=dict(current.open_orders),
+        daily_realized_usdt=current.daily_loss_usdt,
+    )
+    state.risk.breaches = _active_breaches(state.risk, metrics)
+    return state.risk
+
+
 def _plan_order_counts(plan: "Plan") -> Counter[str]:
     counts: Counter[str] = Counter()
     for leg in plan.legs:
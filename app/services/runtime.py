@@ -49,8 +49,10 @@ from ..risk.risk_governor import configure_pretrade_risk_governor, configure_ris
 from ..persistence import state_store
 from ..runtime import leader_lock
 from ..runtime_state_store import (
+    flush_runtime_payload as _store_flush_runtime_payload,
     load_runtime_payload as _store_load_runtime_payload,
-    write_runtime_payload as _store_write_runtime_payload,
+    register_flush_provider as _store_register_flush_provider,
+    submit_runtime_updates as _store_submit_runtime_updates,
 )
 from . import approvals_store
 from .derivatives import DerivativesRuntime, bootstrap_derivatives
@@ -716,16 +718,18 @@ class RiskState:
         }
 
 
-@dataclass
 @dataclass
 class OpportunityState:
     opportunity: Dict[str, Any] | None = None
     status: str = "blocked_by_risk"
+    # Ranked list from the last universe scan, best first.
+    candidates: List[Dict[str, Any]] = field(default_factory=list)
 
     def as_dict(self) -> Dict[str, Any | None]:
         return {
             "opportunity": deepcopy(self.opportunity) if self.opportunity else None,
             "status": self.status,
+            "candidates": deepcopy(self.candidates),
         }
 
 
@@ -1169,7 +1173,11 @@ def _bootstrap_runtime() -> RuntimeState:
     guards = _init_guards(loaded)
     metrics = MetricsState()
     derivatives = bootstrap_derivatives(loaded, safe_mode=safe_mode)
-    market_data = MarketDataAggregator(stale_after=1.5)
+    market_data = MarketDataAggregator(
+        stale_after=1.5,
+        serve_stale_ms=_env_float("MARKETDATA_SERVE_STALE_MS", 0.0),
+        negative_ttl=_env_float("MARKETDATA_NEGATIVE_TTL_MS", 500.0) / 1000.0,
+    )
 
     watchdog_cfg = getattr(loaded.data, "watchdog", None)
     thresholds = _extract_watchdog_thresholds(watchdog_cfg)
@@ -2414,6 +2422,7 @@ def reset_for_tests() -> None:
     _LAST_SHUTDOWN_RESULT = None
     with _STATE_LOCK:
         _PROFILE = None
+    _PERSISTED_HOLD.clear()
     reset_safe_mode_for_tests()
     with _STATE_LOCK:
         _STATE = _bootstrap_runtime()
@@ -2492,6 +2501,8 @@ def reset_for_tests() -> None:
             exc_info=exc,
         )
 
+    _store_flush_runtime_payload()
+
 
 def control_as_dict() -> Dict[str, object]:
     with _STATE_LOCK:
@@ -2531,18 +2542,42 @@ def get_last_opportunity_state() -> tuple[Dict[str, Any] | None, str]:
     )
 
 
+def get_last_opportunity_candidates() -> List[Dict[str, Any]]:
+    """Return the ranked candidates published by the last universe scan."""
+
+    with _STATE_LOCK:
+        state = _STATE.last_opportunity
+        if not isinstance(state, OpportunityState):
+            return []
+        return deepcopy(state.candidates)
+
+
 def set_last_opportunity_state(
-    opportunity: Mapping[str, Any] | None, status: str
+    opportunity: Mapping[str, Any] | None,
+    status: str,
+    *,
+    candidates: Sequence[Mapping[str, Any]] | None = None,
 ) -> Dict[str, Any]:
+    """Publish the current opportunity; ``candidates=None`` keeps the ranked list."""
+
     snapshot: Dict[str, Any | None]
     with _STATE_LOCK:
+        previous = _STATE.last_opportunity
+        if candidates is not None:
+            ranked = [dict(entry) for entry in candidates]
+        elif isinstance(previous, OpportunityState):
+            ranked = previous.candidates
+        else:
+            ranked = []
         state_payload: Dict[str, Any | None] = {
             "opportunity": dict(opportunity) if opportunity is not None else None,
             "status": status,
+            "candidates": deepcopy(ranked),
         }
         _STATE.last_opportunity = OpportunityState(
             opportunity=dict(opportunity) if opportunity is not None else None,
             status=status,
+            candidates=ranked,
         )
         snapshot = state_payload
     _persist_runtime_payload({"last_opportunity": snapshot})
@@ -2951,14 +2986,33 @@ def _runtime_status_snapshot() -> Dict[str, Any]:
         return status
 
 
-def _persist_runtime_payload(updates: Mapping[str, Any]) -> None:
-    payload = _load_runtime_payload()
-    payload.update(updates)
-    payload.update(_runtime_status_snapshot())
+def _runtime_flush_sections() -> Dict[str, Any]:
+    """Sections recomputed on the runtime state flusher thread at write time."""
+
+    payload = _runtime_status_snapshot()
     leader_status = leader_lock.get_status()
     payload["leader_lock"] = leader_status
     payload["leader_fencing_id"] = leader_status.get("fencing_id")
-    _store_write_runtime_payload(payload)
+    return payload
+
+
+_store_register_flush_provider(_runtime_flush_sections)
+
+# Last persisted HOLD flag per section; a change is flushed without waiting
+# for the write-behind interval. Nothing is known to be on disk before the
+# first snapshot of a process, so that one always counts as a change.
+_PERSISTED_HOLD: Dict[str, object] = {}
+_NOT_PERSISTED = object()
+
+
+def _hold_transition(section: str, value: object) -> bool:
+    previous = _PERSISTED_HOLD.get(section, _NOT_PERSISTED)
+    _PERSISTED_HOLD[section] = value
+    return previous != value
+
+
+def _persist_runtime_payload(updates: Mapping[str, Any], *, critical: bool = False) -> None:
+    _store_submit_runtime_updates(updates, critical=critical)
 
 
 def _restore_on_start_enabled(cfg: LoadedConfig) -> bool:
@@ -3196,11 +3250,15 @@ def make_runtime_snapshot() -> Dict[str, Any]:
 
 
 def _persist_control_snapshot(snapshot: Mapping[str, object]) -> None:
-    _persist_runtime_payload({"control": dict(snapshot)})
+    critical = _hold_transition("control", snapshot.get("mode"))
+    _persist_runtime_payload({"control": dict(snapshot)}, critical=critical)
 
 
 def _persist_safety_snapshot(snapshot: Mapping[str, object]) -> None:
-    _persist_runtime_payload({"safety": dict(snapshot)})
+    critical = _hold_transition(
+        "safety", (snapshot.get("hold_active"), snapshot.get("hold_reason"))
+    )
+    _persist_runtime_payload({"safety": dict(snapshot)}, critical=critical)
 
 
 def _persist_autopilot_snapshot(snapshot: Mapping[str, object]) -> None:
@@ -3229,10 +3287,20 @@ def _load_persisted_state(state: RuntimeState) -> None:
     if isinstance(opportunity_payload, Mapping):
         opportunity = opportunity_payload.get("opportunity")
         status = str(opportunity_payload.get("status") or "blocked_by_risk")
+        raw_candidates = opportunity_payload.get("candidates")
+        candidates = [
+            dict(entry)
+            for entry in (raw_candidates if isinstance(raw_candidates, list) else [])
+            if isinstance(entry, Mapping)
+        ]
         if isinstance(opportunity, Mapping):
-            state.last_opportunity = OpportunityState(opportunity=dict(opportunity), status=status)
+            state.last_opportunity = OpportunityState(
+                opportunity=dict(opportunity), status=status, candidates=candidates
+            )
         elif opportunity is None:
-            state.last_opportunity = OpportunityState(opportunity=None, status=status)
+            state.last_opportunity = OpportunityState(
+                opportunity=None, status=status, candidates=candidates
+            )
     auto_payload = payload.get("auto_hedge")
     if isinstance(auto_payload, Mapping):
         auto_state = state.auto_hedge
@@ -3467,6 +3535,7 @@ _persist_runtime_payload(
         "autopilot": _STATE.autopilot.as_dict(),
     }
 )
+_store_flush_runtime_payload()
 
 schedule_recon_a_daemon()
 
@@ -3833,5 +3902,7 @@ async def on_shutdown(*, reason: str | None = None) -> Dict[str, object]:
                 exc_info=exc,
             )
 
+        await asyncio.to_thread(_store_flush_runtime_payload)
+
         _LAST_SHUTDOWN_RESULT = dict(summary)
         return summary
@@ -0,0 +1,249 @@
+"""Shared producer behind the status websocket streams.
+
+One task per event loop computes :func:`get_status_overview` once per tick
+and fans the result out to every subscriber, instead of each connection
+recomputing guards, SLOs, recon and PnL on its own. The task starts with the
+first subscriber and exits once the last one leaves.
+
+Delta subscribers (``/api/ui/stream``) receive a ``snapshot`` frame first and
+then one ``delta`` frame per tick with JSON-patch style operations
+(``add``/``remove``/``replace`` on RFC 6901 paths) against the previous tick;
+a delta with no operations doubles as a heartbeat. Full subscribers
+(``/api/ui/status/stream/status``) receive the plain overview every tick.
+
+Each subscriber owns a bounded queue that the producer only ever fills with
+``put_nowait``. When a slow client's queue is full its backlog is discarded
+and replaced by a single full frame (a fresh ``snapshot`` for delta
+subscribers), so the client resynchronises and the producer never waits.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, List, Mapping, Set
+
+from prometheus_client import Counter, Gauge, Histogram
+
+from .status import get_status_overview
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL_SEC = 1.0
+DEFAULT_QUEUE_MAX = 8
+
+STATUS_STREAM_SUBSCRIBERS = Gauge(
+    "status_stream_subscribers",
+    "Connected status websocket subscribers.",
+    ("mode",),
+)
+STATUS_STREAM_TICK_SECONDS = Histogram(
+    "status_stream_tick_seconds",
+    "Time to compute, diff and encode one status stream tick.",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+STATUS_STREAM_RESYNCS_TOTAL = Counter(
+    "status_stream_resyncs_total",
+    "Slow status subscribers whose backlog was replaced by a full frame.",
+    ("mode",),
+)
+
+for _mode in ("delta", "full"):
+    STATUS_STREAM_SUBSCRIBERS.labels(mode=_mode).set(0)
+    STATUS_STREAM_RESYNCS_TOTAL.labels(mode=_mode)
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        value = float(raw)
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+
+def _escape(key: object) -> str:
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def diff_status(
+    previous: Mapping[str, Any], current: Mapping[str, Any], path: str = ""
+) -> List[Dict[str, Any]]:
+    """Return the operations that turn ``previous`` into ``current``.
+
+    Dicts (the overview is plain JSON data) are diffed key by key; any other
+    changed value, lists included, is replaced whole.
+    """
+
+    ops: List[Dict[str, Any]] = []
+    for key in previous:
+        if key not in current:
+            ops.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+    for key, value in current.items():
+        child = f"{path}/{_escape(key)}"
+        if key not in previous:
+            ops.append({"op": "add", "path": child, "value": value})
+            continue
+        old = previous[key]
+        if type(old) is dict and type(value) is dict:
+            if old != value:
+                ops.extend(diff_status(old, value, child))
+        elif type(old) is not type(value) or old != value:
+            ops.append({"op": "replace", "path": child, "value": value})
+    return ops
+
+
+class _Subscriber:
+    __slots__ = ("queue", "deltas", "resync")
+
+    def __init__(self, *, deltas: bool, maxsize: int) -> None:
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=maxsize)
+        self.deltas = deltas
+        self.resync = True
+
+    @property
+    def mode(self) -> str:
+        return "delta" if self.deltas else "full"
+
+
+class StatusBroadcaster:
+    """Compute the status overview once per tick for all stream subscribers."""
+
+    def __init__(
+        self,
+        *,
+        source: Callable[[], Mapping[str, Any]] | None = None,
+        interval: float | None = None,
+        queue_max: int | None = None,
+    ) -> None:
+        self._source = source
+        self._interval = interval
+        self._queue_max = queue_max
+        self._subscribers: Set[_Subscriber] = set()
+        self._task: asyncio.Task[None] | None = None
+        self._current: Mapping[str, Any] | None = None
+        self._seq = 0
+        self._full_text = ""
+        self._snapshot_text = ""
+
+    @property
+    def interval(self) -> float:
+        if self._interval is not None:
+            return self._interval
+        return _env_float("STATUS_STREAM_INTERVAL_SEC", DEFAULT_INTERVAL_SEC)
+
+    @property
+    def queue_max(self) -> int:
+        if self._queue_max is not None:
+            return max(int(self._queue_max), 1)
+        return int(_env_float("STATUS_STREAM_QUEUE_MAX", DEFAULT_QUEUE_MAX))
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    @asynccontextmanager
+    async def subscribe(self, *, deltas: bool = True) -> AsyncIterator[asyncio.Queue[str]]:
+        """Register a subscriber and yield the queue of encoded frames for it."""
+
+        running = self._running()
+        if not running:
+            # A producer left behind by another (closed) event loop is dead.
+            for stale in self._subscribers:
+                STATUS_STREAM_SUBSCRIBERS.labels(mode=stale.mode).dec()
+            self._subscribers.clear()
+            self._current = None
+        subscriber = _Subscriber(deltas=deltas, maxsize=self.queue_max)
+        self._subscribers.add(subscriber)
+        STATUS_STREAM_SUBSCRIBERS.labels(mode=subscriber.mode).inc()
+        if not running:
+            self._task = asyncio.get_running_loop().create_task(
+                self._run(), name="status-stream-producer"
+            )
+        elif self._current is not None:
+            # Join mid-stream with the latest tick rather than waiting for the next.
+            self._offer(subscriber, self._snapshot_text if deltas else self._full_text)
+            subscriber.resync = False
+        try:
+            yield subscriber.queue
+        finally:
+            if subscriber in self._subscribers:
+                self._subscribers.discard(subscriber)
+                STATUS_STREAM_SUBSCRIBERS.labels(mode=subscriber.mode).dec()
+
+    def _running(self) -> bool:
+        task = self._task
+        return (
+            task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop()
+        )
+
+    async def _run(self) -> None:
+        try:
+            while self._subscribers:
+                started = time.perf_counter()
+                source = self._source or get_status_overview
+                try:
+                    overview = source()
+                except Exception as exc:  # pragma: no cover - defensive
+                    LOGGER.warning("status stream tick failed", exc_info=exc)
+                else:
+                    self._publish(overview)
+                    STATUS_STREAM_TICK_SECONDS.observe(time.perf_counter() - started)
+                await asyncio.sleep(self.interval)
+        finally:
+            if self._task is asyncio.current_task():
+                self._task = None
+                self._current = None
+
+    def _publish(self, overview: Mapping[str, Any]) -> None:
+        previous, self._current = self._current, overview
+        self._seq += 1
+        self._full_text = json.dumps(overview)
+        self._snapshot_text = (
+            f'{{"type": "snapshot", "seq": {self._seq}, "data": {self._full_text}}}'
+        )
+        delta_text = None
+        if previous is not None:
+            delta_text = json.dumps(
+                {"type": "delta", "seq": self._seq, "ops": diff_status(previous, overview)}
+            )
+        for subscriber in list(self._subscribers):
+            if not subscriber.deltas:
+                self._offer(subscriber, self._full_text)
+            elif subscriber.resync or delta_text is None:
+                subscriber.resync = False
+                self._offer(subscriber, self._snapshot_text)
+            else:
+                self._offer(subscriber, delta_text)
+
+    def _offer(self, subscriber: _Subscriber, frame: str) -> None:
+        queue = subscriber.queue
+        if not queue.full():
+            queue.put_nowait(frame)
+            return
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(self._snapshot_text if subscriber.deltas else self._full_text)
+        STATUS_STREAM_RESYNCS_TOTAL.labels(mode=subscriber.mode).inc()
+
+
+_BROADCASTER = StatusBroadcaster()
+
+
+def get_status_broadcaster() -> StatusBroadcaster:
+    return _BROADCASTER
+
+
+__all__ = [
+    "DEFAULT_INTERVAL_SEC",
+    "DEFAULT_QUEUE_MAX",
+    "StatusBroadcaster",
+    "diff_status",
+    "get_status_broadcaster",
+]
@@ -3,11 +3,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 from decimal import ROUND_DOWN, Decimal
 from typing import Dict, Optional, Tuple
-import json
 import math
-import os
 import time
 
+from ..config.runtime_settings import RuntimeSettings, get_runtime_settings
 from .plan import Leg, RoutePlan
 
 
@@ -20,28 +19,17 @@ class Quote:
     ts_ms: int
 
 
-def _env_json(name: str, default: Dict[str, float]) -> Dict[str, float]:
-    raw = os.environ.get(name, "")
-    if not raw:
-        return default
-    try:
-        return json.loads(raw) or default
-    except (json.JSONDecodeError, TypeError, ValueError):
-        return default
-
-
 class ScoreCalculator:
-    def __init__(self) -> None:
-        self.min_edge_bps = float(os.environ.get("SOR_MIN_EDGE_BPS", "1.5"))
-        self.min_size_usd = Decimal(os.environ.get("SOR_MIN_SIZE_USD", "50"))
-        self.max_slip_bps = float(os.environ.get("SOR_MAX_SLIPPAGE_BPS", "5"))
-        self.quote_ttl_ms = int(os.environ.get("SOR_QUOTE_TTL_MS", "200"))
-        self.fees_bps = _env_json("SOR_FEES_BPS", {"binance": 2.5, "okx": 2.5, "bybit": 3.0})
-        self.funding_1h_bps = _env_json(
-            "SOR_FUNDING_BPS_1H", {"binance": 0.0, "okx": 0.0, "bybit": 0.0}
-        )
-        self.venue_prefs = _env_json("SOR_VENUE_PREFS", {"binance": 1.0, "okx": 1.0, "bybit": 1.0})
-        self.edge_ref = os.environ.get("SOR_EDGE_REF", "mid").lower()
+    def __init__(self, settings: RuntimeSettings | None = None) -> None:
+        cfg = settings if settings is not None else get_runtime_settings()
+        self.min_edge_bps = cfg.sor_min_edge_bps
+        self.min_size_usd = cfg.sor_min_size_usd
+        self.max_slip_bps = cfg.sor_max_slippage_bps
+        self.quote_ttl_ms = cfg.sor_quote_ttl_ms
+        self.fees_bps = cfg.sor_fees_bps
+        self.funding_1h_bps = cfg.sor_funding_bps_1h
+        self.venue_prefs = cfg.sor_venue_prefs
+        self.edge_ref = cfg.sor_edge_ref
 
     def _ref_price(self, q_long: Quote, q_short: Quote) -> Decimal:
         if self.edge_ref == "ask":
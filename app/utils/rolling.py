@@ -0,0 +1,229 @@
+"""Sliding-window counters and quantiles with constant-time updates.
+
+Both structures split the window into a ring of equal time buckets. Adding a
+sample touches one bucket and the running aggregate. Moving into a new bucket
+drops the buckets that fell out of the window and subtracts them from the
+aggregate, so no per-sample history is kept and nothing is rescanned on query.
+The price is resolution: a sample leaves the window somewhere between
+``window_sec - window_sec / buckets`` and ``window_sec`` after it was added.
+
+* :class:`RollingCounter` counts events per key (``ok``/``error``, reject
+  codes, ...). Updates and ``count`` are O(1); ``counts`` is O(keys).
+* :class:`RollingQuantile` keeps a log-bucketed sketch of the samples (each
+  value is binned to within ``relative_accuracy`` of itself), so quantile
+  queries cost O(occupied bins) and answers are clamped to the exact window
+  minimum and maximum.
+
+Neither class locks; callers already serialise access under their own lock.
+"""
+
+from __future__ import annotations
+
+import math
+from abc import ABC, abstractmethod
+from typing import Dict, Generic, List, TypeVar
+
+DEFAULT_BUCKETS = 60
+
+_S = TypeVar("_S")
+
+
+class _TimeRing(ABC, Generic[_S]):
+    def __init__(self, window_sec: float, buckets: int) -> None:
+        window = float(window_sec)
+        if window <= 0:
+            raise ValueError("window_sec must be positive")
+        self.window_sec = window
+        self._size = max(int(buckets), 1)
+        self._width = window / self._size
+        self._slots: List[_S | None] = [None] * self._size
+        self._head: int | None = None
+
+    def _index(self, now: float) -> int:
+        return math.floor(now / self._width)
+
+    def _advance(self, index: int) -> None:
+        head = self._head
+        if head is None:
+            self._head = index
+            return
+        if index <= head:
+            return
+        for position in range(head + 1, head + 1 + min(index - head, self._size)):
+            slot = position % self._size
+            expired = self._slots[slot]
+            if expired is not None:
+                self._slots[slot] = None
+                self._expire(expired)
+        self._head = index
+
+    def _slot(self, now: float) -> _S | None:
+        """Advance to ``now`` and return its bucket, creating it if needed.
+
+        ``None`` means ``now`` lies before the window (a late sample).
+        """
+
+        index = self._index(now)
+        self._advance(index)
+        assert self._head is not None
+        if index <= self._head - self._size:
+            return None
+        slot = index % self._size
+        bucket = self._slots[slot]
+        if bucket is None:
+            bucket = self._slots[slot] = self._new_slot()
+        return bucket
+
+    def expire(self, now: float) -> None:
+        """Drop the buckets that are out of the window at ``now``."""
+
+        self._advance(self._index(now))
+
+    def _live_slots(self) -> List[_S]:
+        return [slot for slot in self._slots if slot is not None]
+
+    @abstractmethod
+    def _new_slot(self) -> _S:
+        """Return an empty bucket."""
+
+    @abstractmethod
+    def _expire(self, slot: _S) -> None:
+        """Subtract a bucket that left the window from the running aggregate."""
+
+
+class RollingCounter(_TimeRing[Dict[str, int]]):
+    """Per-key event counts over the last ``window_sec`` seconds."""
+
+    def __init__(self, window_sec: float, *, buckets: int = DEFAULT_BUCKETS) -> None:
+        super().__init__(window_sec, buckets)
+        self._totals: Dict[str, int] = {}
+
+    def add(self, now: float, key: str = "", count: int = 1) -> None:
+        bucket = self._slot(now)
+        if bucket is None or count <= 0:
+            return
+        bucket[key] = bucket.get(key, 0) + count
+        self._totals[key] = self._totals.get(key, 0) + count
+
+    def count(self, now: float, key: str = "") -> int:
+        self.expire(now)
+        return self._totals.get(key, 0)
+
+    def counts(self, now: float) -> Dict[str, int]:
+        self.expire(now)
+        return dict(self._totals)
+
+    def total(self, now: float) -> int:
+        self.expire(now)
+        return sum(self._totals.values())
+
+    def _new_slot(self) -> Dict[str, int]:
+        return {}
+
+    def _expire(self, slot: Dict[str, int]) -> None:
+        totals = self._totals
+        for key, count in slot.items():
+            remaining = totals.get(key, 0) - count
+            if remaining > 0:
+                totals[key] = remaining
+            else:
+                totals.pop(key, None)
+
+
+class _SketchSlot:
+    __slots__ = ("bins", "low", "high")
+
+    def __init__(self) -> None:
+        self.bins: Dict[int, int] = {}
+        self.low = math.inf
+        self.high = -math.inf
+
+
+class RollingQuantile(_TimeRing[_SketchSlot]):
+    """Approximate quantiles of the samples seen in the last ``window_sec`` seconds.
+
+    Positive values are binned geometrically so that each bin's representative
+    is within ``relative_accuracy`` of every value in it; values at or below
+    ``min_value`` share a single bin. Quantiles use the nearest-rank
+    definition (the smallest sample with at least ``q`` of the window at or
+    below it).
+    """
+
+    _FLOOR_BIN = -(1 << 62)
+
+    def __init__(
+        self,
+        window_sec: float,
+        *,
+        buckets: int = DEFAULT_BUCKETS,
+        relative_accuracy: float = 0.01,
+        min_value: float = 1e-6,
+    ) -> None:
+        super().__init__(window_sec, buckets)
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be in (0, 1)")
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._min_value = float(min_value)
+        self._bins: Dict[int, int] = {}
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, now: float, value: float) -> None:
+        bucket = self._slot(now)
+        if bucket is None:
+            return
+        value = float(value)
+        key = self._bin(value)
+        bucket.bins[key] = bucket.bins.get(key, 0) + 1
+        bucket.low = min(bucket.low, value)
+        bucket.high = max(bucket.high, value)
+        self._bins[key] = self._bins.get(key, 0) + 1
+        self._count += 1
+
+    def quantile(self, now: float, q: float) -> float:
+        """The ``q`` quantile (``0 <= q <= 1``) of the window; ``0.0`` when empty."""
+
+        self.expire(now)
+        if not self._count:
+            return 0.0
+        slots = self._live_slots()
+        low = min(slot.low for slot in slots)
+        high = max(slot.high for slot in slots)
+        rank = max(math.ceil(min(max(q, 0.0), 1.0) * self._count), 1)
+        seen = 0
+        estimate = high
+        for key in sorted(self._bins):
+            seen += self._bins[key]
+            if seen >= rank:
+                estimate = self._value(key)
+                break
+        return min(max(estimate, low), high)
+
+    def _bin(self, value: float) -> int:
+        if value <= self._min_value:
+            return self._FLOOR_BIN
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def _value(self, key: int) -> float:
+        if key == self._FLOOR_BIN:
+            return self._min_value
+        return 2.0 * self._gamma**key / (self._gamma + 1.0)
+
+    def _new_slot(self) -> _SketchSlot:
+        return _SketchSlot()
+
+    def _expire(self, slot: _SketchSlot) -> None:
+        bins = self._bins
+        for key, count in slot.bins.items():
+            remaining = bins.get(key, 0) - count
+            if remaining > 0:
+                bins[key] = remaining
+            else:
+                bins.pop(key, None)
+            self._count -= count
+
+
+__all__ = ["DEFAULT_BUCKETS", "RollingCounter", "RollingQuantile"]
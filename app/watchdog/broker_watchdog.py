@@ -7,9 +7,9 @@ import logging
 import math
 import threading
 import time
-from collections import Counter, deque
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Callable, Deque, Dict, Iterable, Mapping
+from typing import Callable, Deque, Dict, Mapping
 
 from ..metrics import set_watchdog_state_metric as metrics_set_state_metric
 from ..metrics.broker_watchdog import (
@@ -18,6 +18,7 @@ from ..metrics.broker_watchdog import (
     set_state as metrics_set_state,
     update_metrics as metrics_update_metrics,
 )
+from ..utils.rolling import RollingCounter, RollingQuantile
 
 
 LOGGER = logging.getLogger(__name__)
@@ -41,16 +42,22 @@ _ORDER_WINDOW_S = 300.0
 _HISTORY_WINDOW_MULTIPLIER = 3
 
 
+_REST_TOTAL = "total"
+_REST_5XX = "5xx"
+_REST_TIMEOUT = "timeout"
+_ORDER_TOTAL = "total"
+_ORDER_REJECT = "reject"
+
+
 @dataclass
 class _VenueState:
-    ws_lag_samples: Deque[tuple[float, float]] = field(default_factory=deque)
-    ws_disconnects: Deque[float] = field(default_factory=deque)
-    rest_total: Deque[float] = field(default_factory=deque)
-    rest_5xx: Deque[float] = field(default_factory=deque)
-    rest_timeouts: Deque[float] = field(default_factory=deque)
-    order_total: Deque[float] = field(default_factory=deque)
-    order_rejects: Deque[tuple[float, str]] = field(default_factory=deque)
-    order_reject_codes: Counter[str] = field(default_factory=Counter)
+    ws_lag: RollingQuantile = field(default_factory=lambda: RollingQuantile(_LAG_WINDOW_S))
+    ws_disconnects: RollingCounter = field(default_factory=lambda: RollingCounter(_RATE_WINDOW_S))
+    rest: RollingCounter = field(default_factory=lambda: RollingCounter(_REST_WINDOW_S))
+    orders: RollingCounter = field(default_factory=lambda: RollingCounter(_ORDER_WINDOW_S))
+    order_reject_codes: RollingCounter = field(
+        default_factory=lambda: RollingCounter(_ORDER_WINDOW_S)
+    )
     state: str = STATE_OK
     last_reason: str = ""
     burn_rate: float = 0.0
@@ -97,14 +104,14 @@ class BrokerWatchdog:
         now = self._clock()
         with self._lock:
             state = self._ensure_state(venue)
-            state.ws_lag_samples.append((now, float(lag_ms)))
+            state.ws_lag.add(now, float(lag_ms))
             self._evaluate(venue, state, now)
 
     def record_ws_disconnect(self, venue: str) -> None:
         now = self._clock()
         with self._lock:
             state = self._ensure_state(venue)
-            state.ws_disconnects.append(now)
+            state.ws_disconnects.add(now)
             metrics_increment_disconnect(self._canonical(venue))
             self._evaluate(venue, state, now, reason_hint="ws_disconnect_spike")
 
@@ -112,7 +119,7 @@ class BrokerWatchdog:
         now = self._clock()
         with self._lock:
             state = self._ensure_state(venue)
-            state.rest_total.append(now)
+            state.rest.add(now, _REST_TOTAL)
             self._evaluate(venue, state, now)
 
     def record_rest_error(self, venue: str, kind: str | None = None) -> None:
@@ -120,11 +127,11 @@ class BrokerWatchdog:
         normalised = (kind or "").strip().lower()
         with self._lock:
             state = self._ensure_state(venue)
-            state.rest_total.append(now)
+            state.rest.add(now, _REST_TOTAL)
             if normalised in {"timeout", "timeouts", "timed_out"}:
-                state.rest_timeouts.append(now)
+                state.rest.add(now, _REST_TIMEOUT)
             else:
-                state.rest_5xx.append(now)
+                state.rest.add(now, _REST_5XX)
             reason = "rest_timeout_spike" if normalised.startswith("timeout") else "rest_5xx_spike"
             self._evaluate(venue, state, now, reason_hint=reason)
 
@@ -132,7 +139,7 @@ class BrokerWatchdog:
         now = self._clock()
         with self._lock:
             state = self._ensure_state(venue)
-            state.order_total.append(now)
+            state.orders.add(now, _ORDER_TOTAL)
             self._evaluate(venue, state, now)
 
     def record_order_reject(self, venue: str, code: str | None = None) -> None:
@@ -140,9 +147,9 @@ class BrokerWatchdog:
         reject_code = (code or "UNKNOWN").strip().upper() or "UNKNOWN"
         with self._lock:
             state = self._ensure_state(venue)
-            state.order_total.append(now)
-            state.order_rejects.append((now, reject_code))
-            state.order_reject_codes[reject_code] += 1
+            state.orders.add(now, _ORDER_TOTAL)
+            state.orders.add(now, _ORDER_REJECT)
+            state.order_reject_codes.add(now, reject_code)
             self._evaluate(venue, state, now, reason_hint=f"order_reject:{reject_code}")
 
     # ------------------------------------------------------------------
@@ -166,7 +173,7 @@ class BrokerWatchdog:
                     "rest_5xx_rate": metrics["rest_5xx_rate"],
                     "rest_timeouts_rate": metrics["rest_timeouts_rate"],
                     "order_reject_rate": metrics["order_reject_rate"],
-                    "order_reject_breakdown": dict(state.order_reject_codes),
+                    "order_reject_breakdown": state.order_reject_codes.counts(now),
                     "burn_rate": state.burn_rate,
                     "last_reason": state.last_reason,
                     "updated_ts": state.last_transition_ts or now,
@@ -259,32 +266,15 @@ class BrokerWatchdog:
         metrics_set_state_metric(label, state.state)
 
     def _collect_metrics(self, state: _VenueState, now: float) -> Dict[str, float]:
-        self._prune_deque(state.ws_lag_samples, now, _LAG_WINDOW_S)
-        self._prune_deque(state.ws_disconnects, now, _RATE_WINDOW_S)
-        self._prune_deque(state.rest_total, now, _REST_WINDOW_S)
-        self._prune_deque(state.rest_5xx, now, _REST_WINDOW_S)
-        self._prune_deque(state.rest_timeouts, now, _REST_WINDOW_S)
-        self._prune_deque(state.order_total, now, _ORDER_WINDOW_S)
-
-        def _remove_reject(item: tuple[float, str]) -> None:
-            _, code = item
-            current = state.order_reject_codes.get(code, 0)
-            if current <= 1:
-                state.order_reject_codes.pop(code, None)
-            else:
-                state.order_reject_codes[code] = current - 1
-
-        self._prune_deque(state.order_rejects, now, _ORDER_WINDOW_S, on_remove=_remove_reject)
-        lag_values = [sample for _, sample in state.ws_lag_samples]
-        ws_lag = self._percentile(lag_values, 95)
-        disconnect_rate = self._rate_per_minute(len(state.ws_disconnects), _RATE_WINDOW_S)
-        rest_total = len(state.rest_total) or 0
-        rest_5xx = len(state.rest_5xx) or 0
-        rest_timeouts = len(state.rest_timeouts) or 0
+        ws_lag = state.ws_lag.quantile(now, 0.95)
+        disconnect_rate = self._rate_per_minute(state.ws_disconnects.total(now), _RATE_WINDOW_S)
+        rest_total = state.rest.count(now, _REST_TOTAL)
+        rest_5xx = state.rest.count(now, _REST_5XX)
+        rest_timeouts = state.rest.count(now, _REST_TIMEOUT)
         rest_5xx_rate = (rest_5xx / rest_total) if rest_total else 0.0
         rest_timeout_rate = (rest_timeouts / rest_total) if rest_total else 0.0
-        order_total = len(state.order_total) or 0
-        order_rejects = len(state.order_rejects) or 0
+        order_total = state.orders.count(now, _ORDER_TOTAL)
+        order_rejects = state.orders.count(now, _ORDER_REJECT)
         order_reject_rate = (order_rejects / order_total) if order_total else 0.0
         return {
             "ws_lag_ms_p95": ws_lag,
@@ -294,45 +284,6 @@ class BrokerWatchdog:
             "order_reject_rate": order_reject_rate,
         }
 
-    def _prune_deque(
-        self,
-        dq: Deque,
-        now: float,
-        window: float,
-        *,
-        on_remove: Callable[[object], None] | None = None,
-    ) -> None:
-        cutoff = now - window
-        while dq:
-            head = dq[0]
-            ts = head[0] if isinstance(head, tuple) else head
-            if ts >= cutoff:
-                break
-            item = dq.popleft()
-            if on_remove is not None:
-                try:
-                    on_remove(item)
-                except Exception as exc:  # pragma: no cover - defensive  # noqa: BLE001
-                    LOGGER.debug(
-                        "broker watchdog prune callback failed",
-                        extra={"window": window},
-                        exc_info=exc,
-                    )
-
-    def _percentile(self, values: Iterable[float], percentile: float) -> float:
-        cleaned = [float(v) for v in values if v is not None]
-        if not cleaned:
-            return 0.0
-        ordered = sorted(cleaned)
-        k = (len(ordered) - 1) * (percentile / 100.0)
-        f = math.floor(k)
-        c = math.ceil(k)
-        if f == c:
-            return ordered[int(k)]
-        d0 = ordered[int(f)] * (c - k)
-        d1 = ordered[int(c)] * (k - f)
-        return d0 + d1
-
     def _rate_per_minute(self, count: int, window: float) -> float:
         if window <= 0:
             return float(count)
@@ -0,0 +1 @@
+"""Microbenchmarks for PropBot hot paths (run with ``python -m benchmarks.<name>``)."""
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+"""Shared timing and reporting helpers for the microbenchmarks."""
+
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterable, Sequence
+
+
+@dataclass(slots=True)
+class BenchResult:
+    name: str
+    ops: int
+    seconds: float
+
+    @property
+    def ns_per_op(self) -> float:
+        if self.ops <= 0:
+            return 0.0
+        return self.seconds * 1e9 / self.ops
+
+    @property
+    def ops_per_s(self) -> float:
+        if self.seconds <= 0:
+            return float("inf")
+        return self.ops / self.seconds
+
+
+def measure(name: str, fn: Callable[[], int], *, repeat: int = 5) -> BenchResult:
+    """Run ``fn`` ``repeat`` times and keep the fastest run.
+
+    ``fn`` returns the number of operations it performed so results can be
+    reported per operation.
+    """
+
+    best: BenchResult | None = None
+    for _ in range(max(int(repeat), 1)):
+        started = time.perf_counter()
+        ops = int(fn())
+        elapsed = time.perf_counter() - started
+        if best is None or elapsed < best.seconds:
+            best = BenchResult(name=name, ops=ops, seconds=elapsed)
+    assert best is not None
+    return best
+
+
+def report(title: str, results: Sequence[BenchResult], *, baseline: str | None = None) -> None:
+    """Print a fixed-width table; ``baseline`` names the row speedups are relative to.
+
+    Speedups compare time per operation, so rows may run different op counts.
+    """
+
+    reference = next((item for item in results if item.name == baseline), None)
+    print(f"== {title} ==")
+    width = max((len(item.name) for item in results), default=4)
+    for item in results:
+        line = (
+            f"{item.name:<{width}}  {item.ops:>10d} ops  {item.seconds * 1000:>10.2f} ms  "
+            f"{item.ns_per_op:>12.1f} ns/op  {item.ops_per_s:>14.0f} ops/s"
+        )
+        if reference is not None and item is not reference and item.ns_per_op > 0:
+            line += f"  x{reference.ns_per_op / item.ns_per_op:.2f}"
+        print(line)
+
+
+def percentile(samples: Iterable[float], pct: float) -> float:
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    rank = min(max(int(round(pct / 100.0 * (len(ordered) - 1))), 0), len(ordered) - 1)
+    return ordered[rank]
+
+
+__all__ = ["BenchResult", "measure", "percentile", "report"]
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+"""Pre-trade exposure-cap checks: ledger read per check versus the exposure index.
+
+Usage::
+
+    python -m benchmarks.exposure_caps_bench
+    python -m benchmarks.exposure_caps_bench --positions 2000 --symbols 500
+
+``ledger`` is the previous path: every check reads all positions from the
+ledger, aggregates them, and resolves caps from a freshly walked config.
+``index`` is the current path: the exposure index snapshot plus the cap table
+compiled once for the config object. Every ``--fill-every``-th check follows
+a fill, so the index's incremental updates are part of its timing; the
+scratch ledger runs with ``synchronous=OFF`` so fsyncs do not swamp the
+difference.
+"""
+
+import argparse
+import os
+import tempfile
+from pathlib import Path
+from typing import Sequence
+
+from app import ledger
+from app.config.schema import AppConfig, ExposureCapsConfig, ExposureCapsEntry
+from app.risk import exposure_caps
+
+from ._harness import BenchResult, measure, report
+
+
+def _config(symbols: int) -> AppConfig:
+    return AppConfig(
+        profile="bench",
+        exposure_caps=ExposureCapsConfig(
+            default=ExposureCapsEntry(max_abs_usdt=1e9),
+            per_symbol={
+                f"SYM{idx}USDT": ExposureCapsEntry(max_abs_usdt=1e9) for idx in range(symbols)
+            },
+            per_venue={
+                venue: {
+                    f"SYM{idx}USDT": ExposureCapsEntry(max_abs_usdt=1e9) for idx in range(symbols)
+                }
+                for venue in ("binance-um", "okx-perp")
+            },
+        ),
+    )
+
+
+def _seed(positions: int) -> int:
+    order_id = ledger.record_order(
+        venue="binance-um",
+        symbol="SYM0USDT",
+        side="buy",
+        qty=1.0,
+        price=100.0,
+        status="submitted",
+        client_ts="2024-01-01T00:00:00+00:00",
+        exchange_ts=None,
+        idemp_key="bench-order",
+    )
+    for idx in range(positions):
+        ledger.record_fill(
+            order_id=order_id,
+            venue=("binance-um", "okx-perp")[idx % 2],
+            symbol=f"SYM{idx // 2}USDT",
+            side="buy",
+            qty=1.0,
+            price=100.0,
+            fee=0.0,
+            ts="2024-01-01T00:00:00+00:00",
+        )
+    return order_id
+
+
+def _checks(
+    cfg: AppConfig, order_id: int, count: int, fill_every: int, *, from_ledger: bool
+) -> int:
+    for idx in range(count):
+        symbol = f"SYM{idx % 50}USDT"
+        if idx % fill_every == 0:
+            ledger.record_fill(
+                order_id=order_id,
+                venue="binance-um",
+                symbol=symbol,
+                side="buy",
+                qty=0.001,
+                price=100.0,
+                fee=0.0,
+                ts="2024-01-01T00:00:00+00:00",
+            )
+        if from_ledger:
+            exposure_caps._CAPS_TABLES.clear()
+            snapshot = exposure_caps.collect_snapshot(ledger.fetch_positions())
+        else:
+            snapshot = exposure_caps.collect_snapshot()
+        ctx = {"config": cfg, "snapshot": snapshot}
+        exposure_caps.check_open_allowed(ctx, symbol, "LONG", "binance-um", 500.0)
+    return count
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Exposure caps pre-trade check benchmark")
+    parser.add_argument("--positions", type=int, default=1_000)
+    parser.add_argument("--symbols", type=int, default=500)
+    parser.add_argument("--checks", type=int, default=500)
+    parser.add_argument("--fill-every", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault("LEDGER_SQLITE_SYNCHRONOUS", "OFF")
+    fill_every = max(args.fill_every, 1)
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger.LEDGER_PATH = Path(tmp) / "ledger.db"
+        ledger.init_db()
+        order_id = _seed(args.positions)
+        cfg = _config(args.symbols)
+        exposure_caps.collect_snapshot()
+        results: list[BenchResult] = []
+        for name, from_ledger in (("ledger", True), ("index", False)):
+            results.append(
+                measure(
+                    name,
+                    lambda: _checks(
+                        cfg, order_id, args.checks, fill_every, from_ledger=from_ledger
+                    ),
+                    repeat=args.repeat,
+                )
+            )
+        ledger.close_connections()
+    report(
+        f"Fill + exposure-cap check ({args.positions} positions, {args.symbols} capped symbols)",
+        results,
+        baseline="ledger",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+"""Event log page latency: Python-side filtering versus SQL filtering with keyset pages.
+
+Usage::
+
+    python -m benchmarks.ledger_events_bench
+    python -m benchmarks.ledger_events_bench --events 500000
+
+``python-filter`` reproduces the old ``fetch_events_page``: every row is read
+back, its payload decoded and matched in Python, then the page is sliced.
+``sql`` is the current implementation (indexed columns, FTS5 search, cursor).
+"""
+
+import argparse
+import json
+import random
+import sqlite3
+import tempfile
+from pathlib import Path
+from typing import Sequence
+
+from app import ledger
+from app.ledger import events as ledger_events
+
+from ._harness import BenchResult, measure, report
+
+_VENUES = ("binance-um", "okx-perp", "bybit-perp")
+_SYMBOLS = ("BTCUSDT", "ETHUSDT", "SOLUSDT", "XRPUSDT")
+
+
+def _seed(count: int) -> None:
+    rng = random.Random(3)
+    rows = []
+    for idx in range(count):
+        payload = {
+            "venue": rng.choice(_VENUES),
+            "symbol": rng.choice(_SYMBOLS),
+            "message": f"order {idx} {'rejected' if rng.random() < 0.01 else 'accepted'}",
+        }
+        rows.append(
+            (
+                f"2024-01-01T{idx // 3600 % 24:02d}:{idx // 60 % 60:02d}:{idx % 60:02d}Z",
+                "INFO",
+                "order_status",
+                json.dumps(payload),
+                *ledger_events.extract(payload),
+            )
+        )
+
+    def _tx(conn: sqlite3.Connection) -> None:
+        conn.executemany(
+            """
+            INSERT INTO events (ts, level, code, payload, venue, symbol, message)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+
+    ledger._write(_tx)
+
+
+def _python_filter(*, venue: str, search: str, limit: int) -> int:
+    rows = ledger._connect().execute(
+        "SELECT id, ts, level, code, payload FROM events ORDER BY ts DESC, id DESC"
+    )
+    matched = []
+    for row in rows:
+        payload = json.loads(row["payload"])
+        if ledger_events.event_lookup(payload, ("venue", "exchange")) != venue:
+            continue
+        if search not in ledger_events.event_message(payload).lower():
+            continue
+        matched.append(payload)
+    del matched[limit:]
+    return 1
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Event log page, Python filter vs SQL")
+    parser.add_argument("--events", type=int, default=200_000)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    original_path = ledger.LEDGER_PATH
+    results: list[BenchResult] = []
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            ledger.close_connections()
+            ledger.LEDGER_PATH = Path(tmp) / "ledger.db"
+            ledger.init_db()
+            _seed(args.events)
+            results.append(
+                measure(
+                    "python-filter",
+                    lambda: _python_filter(venue="okx-perp", search="rejected", limit=args.limit),
+                    repeat=args.repeat,
+                )
+            )
+
+            def sql_page() -> int:
+                ledger.fetch_events_page(limit=args.limit, venue="okx-perp", search="rejected")
+                return 1
+
+            results.append(measure("sql", sql_page, repeat=args.repeat))
+            ledger.close_connections()
+    finally:
+        ledger.LEDGER_PATH = original_path
+    report(
+        f"event log page, one page per op ({args.events} events)", results, baseline="python-filter"
+    )
+
+
+if __name__ == "__main__":
+    main()
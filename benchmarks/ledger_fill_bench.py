@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+"""Fills per second through ``ledger.record_fill`` before and after connection pooling.
+
+Usage::
+
+    python -m benchmarks.ledger_fill_bench
+    python -m benchmarks.ledger_fill_bench --fills 2000 --threads 8
+
+``per-call`` reproduces the old behaviour: a fresh ``sqlite3.connect`` with the
+default rollback journal for every write. ``pooled`` is the WAL writer
+connection with group commit. Each mode runs single-threaded and with
+``--threads`` concurrent writers, every run against a fresh database file.
+"""
+
+import argparse
+import sqlite3
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator, Sequence
+
+from app import ledger
+
+from ._harness import BenchResult, measure, report
+
+
+def _per_call_write(fn: Callable[[sqlite3.Connection], object]) -> object:
+    with ledger._LEDGER_LOCK:
+        conn = sqlite3.connect(ledger.LEDGER_PATH)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:
+                return fn(conn)
+        finally:
+            conn.close()
+
+
+@contextmanager
+def _fresh_ledger(root: Path, name: str, *, per_call: bool) -> Iterator[int]:
+    ledger.close_connections()
+    ledger.LEDGER_PATH = root / f"{name}.db"
+    original = ledger._write
+    if per_call:
+        ledger._write = _per_call_write  # type: ignore[assignment]
+    try:
+        ledger.init_db()
+        yield ledger.record_order(
+            venue="binance-um",
+            symbol="BTCUSDT",
+            side="buy",
+            qty=1.0,
+            price=100.0,
+            status="submitted",
+            client_ts="2024-01-01T00:00:00+00:00",
+            exchange_ts=None,
+            idemp_key=name,
+        )
+    finally:
+        ledger._write = original  # type: ignore[assignment]
+        ledger.close_connections()
+
+
+def _fill(order_id: int, idx: int) -> None:
+    ledger.record_fill(
+        order_id=order_id,
+        venue="binance-um",
+        symbol="BTCUSDT",
+        side="buy" if idx % 2 else "sell",
+        qty=0.001,
+        price=100.0 + idx % 7,
+        fee=0.0001,
+        ts="2024-01-01T00:00:00+00:00",
+    )
+
+
+def run(root: Path, name: str, *, fills: int, threads: int, per_call: bool) -> int:
+    with _fresh_ledger(root, name, per_call=per_call) as order_id:
+        per_thread = max(fills // threads, 1)
+
+        def worker() -> None:
+            for idx in range(per_thread):
+                _fill(order_id, idx)
+
+        workers = [threading.Thread(target=worker) for _ in range(threads)]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        return per_thread * threads
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Ledger fill throughput, per-call vs pooled")
+    parser.add_argument("--fills", type=int, default=1000)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    original_path = ledger.LEDGER_PATH
+    results: list[BenchResult] = []
+    counter = iter(range(1_000_000))
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            for label, per_call in (("per-call", True), ("pooled", False)):
+                for threads in (1, max(args.threads, 1)):
+                    results.append(
+                        measure(
+                            f"{label} x{threads}",
+                            lambda: run(
+                                root,
+                                f"run{next(counter)}",
+                                fills=args.fills,
+                                threads=threads,
+                                per_call=per_call,
+                            ),
+                            repeat=args.repeat,
+                        )
+                    )
+    finally:
+        ledger.LEDGER_PATH = original_path
+    report(f"ledger.record_fill ({args.fills} fills)", results, baseline="per-call x1")
+
+
+if __name__ == "__main__":
+    main()
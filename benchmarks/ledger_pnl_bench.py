@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+"""``ledger.compute_pnl`` latency: full fill replay versus incremental ``pnl_state``.
+
+Usage::
+
+    python -m benchmarks.ledger_pnl_bench
+    python -m benchmarks.ledger_pnl_bench --fills 200000 --positions 40
+
+``replay`` reproduces the old behaviour (every fill read back and replayed in
+id order on each call). ``incremental`` is the current ``compute_pnl``, which
+sums one ``pnl_state`` row per (venue, symbol).
+"""
+
+import argparse
+import random
+import sqlite3
+import tempfile
+from pathlib import Path
+from typing import Sequence
+
+from app import ledger
+from app.ledger import pnl_state
+
+from ._harness import BenchResult, measure, report
+
+
+def _seed(fills: int, positions: int) -> None:
+    rng = random.Random(42)
+    keys = [(f"venue{idx % 4}", f"SYM{idx}USDT") for idx in range(max(positions, 1))]
+    rows = []
+    for idx in range(fills):
+        venue, symbol = keys[idx % len(keys)]
+        rows.append(
+            (
+                1,
+                venue,
+                symbol,
+                "buy" if rng.random() < 0.5 else "sell",
+                round(rng.uniform(0.01, 1.0), 3),
+                round(rng.uniform(90.0, 110.0), 2),
+                0.01,
+                "2024-01-01T00:00:00+00:00",
+            )
+        )
+
+    def _tx(conn: sqlite3.Connection) -> None:
+        conn.executemany(
+            """
+            INSERT INTO fills (order_id, venue, symbol, side, qty, price, fee, ts)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+        pnl_state.rebuild(conn)
+
+    ledger._write(_tx)
+
+
+def _replay_pnl() -> float:
+    states = pnl_state.replay_fills(ledger._connect())
+    return sum(state.realized for state in states.values())
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="compute_pnl, full replay vs incremental")
+    parser.add_argument("--fills", type=int, default=50_000)
+    parser.add_argument("--positions", type=int, default=20)
+    parser.add_argument("--calls", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    original_path = ledger.LEDGER_PATH
+    results: list[BenchResult] = []
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            ledger.close_connections()
+            ledger.LEDGER_PATH = Path(tmp) / "ledger.db"
+            ledger.init_db()
+            _seed(args.fills, args.positions)
+
+            def replay() -> int:
+                for _ in range(args.calls):
+                    _replay_pnl()
+                return args.calls
+
+            def incremental() -> int:
+                for _ in range(args.calls):
+                    ledger.compute_pnl()
+                return args.calls
+
+            results.append(measure("replay", replay, repeat=args.repeat))
+            results.append(measure("incremental", incremental, repeat=args.repeat))
+            ledger.close_connections()
+    finally:
+        ledger.LEDGER_PATH = original_path
+    report(f"ledger.compute_pnl ({args.fills} fills)", results, baseline="replay")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+"""JSON-array rewrite per call versus the append-only ``LogStore``.
+
+Usage::
+
+    python -m benchmarks.log_store_bench
+    python -m benchmarks.log_store_bench --records 100000 --ops 5000
+
+``rewrite`` is the previous store pattern: load the whole JSON array for
+every call, and for an append also dump it back with ``indent=2``. It costs
+O(history) per call, so it runs only ``--rewrite-ops`` operations. ``log`` is
+``log_store.LogStore`` holding the same ``--records`` records (preloaded as
+its base): an append writes one log line and ``recent(20)`` decodes 20 rows.
+``cold-load`` times opening the store from disk, i.e. crash recovery.
+"""
+
+import argparse
+import json
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+
+from log_store import LogStore
+
+from ._harness import BenchResult, measure, report
+
+_RECENT = 20
+
+
+def _record(idx: int) -> Dict[str, Any]:
+    return {
+        "ts": f"2024-01-01T00:00:{idx % 60:02d}+00:00",
+        "symbol": f"SYM{idx % 500}USDT",
+        "venue": ("binance-um", "okx-perp")[idx % 2],
+        "slippage_bps": (idx % 17) / 4.0,
+        "success": idx % 9 != 0,
+    }
+
+
+def _rewrite_append(path: Path, count: int) -> int:
+    for idx in range(count):
+        entries: List[Dict[str, Any]] = json.loads(path.read_text())
+        entries.append(_record(idx))
+        path.write_text(json.dumps(entries, indent=2, sort_keys=True))
+    return count
+
+
+def _rewrite_recent(path: Path, count: int) -> int:
+    for _ in range(count):
+        json.loads(path.read_text())[-_RECENT:]
+    return count
+
+
+def _log_append(store: LogStore, count: int) -> int:
+    for idx in range(count):
+        store.append(_record(idx))
+    return count
+
+
+def _log_recent(store: LogStore, count: int) -> int:
+    for _ in range(count):
+        store.recent(_RECENT)
+    return count
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Append-only log store benchmark")
+    parser.add_argument("--records", type=int, default=1_000_000)
+    parser.add_argument("--ops", type=int, default=10_000)
+    parser.add_argument("--rewrite-ops", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    records = [_record(idx) for idx in range(args.records)]
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy = Path(tmp) / "legacy.json"
+        legacy.write_text(json.dumps(records, indent=2, sort_keys=True))
+        store = LogStore(Path(tmp) / "store.json", compact_min=10 * args.records + 1)
+        store.reset(records)
+        del records
+
+        appends: List[BenchResult] = [
+            measure("rewrite", lambda: _rewrite_append(legacy, args.rewrite_ops), repeat=1),
+            measure("log", lambda: _log_append(store, args.ops), repeat=args.repeat),
+        ]
+        reads: List[BenchResult] = [
+            measure("rewrite", lambda: _rewrite_recent(legacy, args.rewrite_ops), repeat=1),
+            measure("log", lambda: _log_recent(store, args.ops), repeat=args.repeat),
+        ]
+        store.close()
+        cold = [measure("cold-load", lambda: len(LogStore(store.path)), repeat=1)]
+
+    report(f"Append one record ({args.records} records stored)", appends, baseline="rewrite")
+    report(f"Read newest {_RECENT} ({args.records} records stored)", reads, baseline="rewrite")
+    report(f"Open store from base + log ({args.records} records)", cold)
+
+
+if __name__ == "__main__":
+    main()
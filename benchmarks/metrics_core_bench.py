@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+"""ns/op of ``app.metrics.core`` hot paths, single-threaded and under thread load.
+
+Usage::
+
+    python -m benchmarks.metrics_core_bench
+    python -m benchmarks.metrics_core_bench --ops 100000 --threads 8
+
+Each op is the call pattern used at the instrumentation sites:
+``metric.labels(...).inc()``, ``.set()`` or ``.observe()``. ``locked`` is the
+previous core (kept below as ``_Locked*``): every ``labels()`` call takes the
+metric lock and allocates a child, every update takes the lock again and a
+histogram observation walks all buckets. ``core`` is the current module with
+memoized children, per-thread counter shards and bisect buckets. With
+``--threads N`` the same number of ops is split across N threads. ``to_text``
+renders a registry of 200 series between updates versus repeatedly.
+"""
+
+import argparse
+import threading
+from typing import Callable, Dict, List, Sequence
+
+from app.metrics import core
+
+from ._harness import BenchResult, measure, report
+
+_BUCKETS = [5.0, 10.0, 20.0, 50.0, 100.0, 200.0, 500.0, 1000.0, 2000.0]
+
+
+class _LockedChild:
+    def __init__(self, parent: "_LockedMetric", key: tuple[str, ...]) -> None:
+        self._parent = parent
+        self._key = key
+
+    def inc(self, value: float = 1.0) -> None:
+        self._parent._inc(self._key, float(value))
+
+    def set(self, value: float) -> None:
+        self._parent._set(self._key, float(value))
+
+    def observe(self, value: float) -> None:
+        self._parent._observe(self._key, float(value))
+
+
+class _LockedMetric:
+    def __init__(self, label_names: Sequence[str]) -> None:
+        self.label_names = tuple(label_names)
+        self._values: Dict[tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, **labels: str) -> _LockedChild:
+        key = tuple(str(labels[name]) for name in self.label_names)
+        with self._lock:
+            if key not in self._values:
+                self._values[key] = 0.0
+            return _LockedChild(self, key)
+
+    def _inc(self, key: tuple[str, ...], value: float) -> None:
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + value  # type: ignore[operator]
+
+    def _set(self, key: tuple[str, ...], value: float) -> None:
+        with self._lock:
+            self._values[key] = value
+
+    def _observe(self, key: tuple[str, ...], value: float) -> None:
+        with self._lock:
+            counts = self._values.get(key)
+            if not isinstance(counts, list):
+                counts = [0.0] * len(_BUCKETS)
+                self._values[key] = counts
+            for idx, upper in enumerate(_BUCKETS):
+                if value <= upper:
+                    counts[idx] += 1.0
+
+
+def _run_threads(threads: int, ops: int, body: Callable[[int], None]) -> int:
+    per_thread = ops // threads
+    if threads == 1:
+        body(per_thread)
+        return per_thread
+    workers = [threading.Thread(target=body, args=(per_thread,)) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return per_thread * threads
+
+
+def _bodies(counter, gauge, histogram) -> Dict[str, Callable[[int], None]]:
+    def inc(count: int) -> None:
+        for _ in range(count):
+            counter.labels(venue="binance-um", result="ok").inc()
+
+    def set_(count: int) -> None:
+        for idx in range(count):
+            gauge.labels(venue="binance-um").set(idx)
+
+    def observe(count: int) -> None:
+        for idx in range(count):
+            histogram.labels(route="primary").observe(float(idx % 2500))
+
+    return {"inc": inc, "set": set_, "observe": observe}
+
+
+def _render_registry(series: int) -> core.Registry:
+    registry = core.Registry()
+    counter = registry.counter("bench_render_total", labels=("venue", "symbol"))
+    histogram = registry.histogram("bench_render_ms", _BUCKETS, labels=("venue",))
+    for idx in range(series):
+        counter.labels(venue=f"v{idx % 4}", symbol=f"S{idx}").inc(idx)
+    for idx in range(4):
+        histogram.labels(venue=f"v{idx}").observe(float(idx))
+    return registry
+
+
+def _render_uncached(registry: core.Registry, count: int) -> int:
+    for _ in range(count):
+        registry._text = None
+        registry.to_text()
+    return count
+
+
+def _render_cached(registry: core.Registry, count: int) -> int:
+    for _ in range(count):
+        registry.to_text()
+    return count
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Metrics core microbenchmark")
+    parser.add_argument("--ops", type=int, default=200_000)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    registry = core.Registry()
+    current = _bodies(
+        registry.counter("bench_orders_total", labels=("venue", "result")),
+        registry.gauge("bench_position", labels=("venue",)),
+        registry.histogram("bench_latency_ms", _BUCKETS, labels=("route",)),
+    )
+    locked = _bodies(
+        _LockedMetric(("venue", "result")),
+        _LockedMetric(("venue",)),
+        _LockedMetric(("route",)),
+    )
+    for threads in sorted({1, max(args.threads, 1)}):
+        for op in ("inc", "set", "observe"):
+            results: List[BenchResult] = [
+                measure(
+                    "locked",
+                    lambda: _run_threads(threads, args.ops, locked[op]),
+                    repeat=args.repeat,
+                ),
+                measure(
+                    "core",
+                    lambda: _run_threads(threads, args.ops, current[op]),
+                    repeat=args.repeat,
+                ),
+            ]
+            report(
+                f"labels().{op}() x{args.ops} on {threads} thread(s)", results, baseline="locked"
+            )
+
+    render = _render_registry(200)
+    renders = max(args.ops // 1000, 1)
+    report(
+        f"Registry.to_text, 200 series, x{renders}",
+        [
+            measure("render", lambda: _render_uncached(render, renders), repeat=args.repeat),
+            measure("cached", lambda: _render_cached(render, renders), repeat=args.repeat),
+        ],
+        baseline="render",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+"""Replay L2 diff streams through the dict-backed and ladder book sides.
+
+Usage::
+
+    python -m benchmarks.orderbook_bench                      # synthetic stream
+    python -m benchmarks.orderbook_bench --input diffs.jsonl  # recorded stream
+
+Recorded streams are JSONL files with one ``DiffEvent`` per line (the shape
+kept in ``BookRecord.diff_history``). The first line may instead carry a
+snapshot with ``bids``/``asks`` only; it seeds the book before the replay.
+"""
+
+import argparse
+import json
+import random
+from pathlib import Path
+from typing import Callable, List, Sequence, Tuple
+
+from app.market.orderbook.book_store import BookSide, DiffEvent, LadderBookSide
+
+from ._harness import measure, report
+
+Level = Tuple[float, float]
+Snapshot = Tuple[List[Level], List[Level]]
+
+
+def synthetic_stream(
+    *, levels: int, events: int, updates: int, tick: float = 0.1, seed: int = 7
+) -> Tuple[Snapshot, List[DiffEvent]]:
+    rng = random.Random(seed)
+    mid = 30_000.0
+    bids = [(round(mid - tick * (i + 1), 1), rng.uniform(0.1, 5.0)) for i in range(levels)]
+    asks = [(round(mid + tick * (i + 1), 1), rng.uniform(0.1, 5.0)) for i in range(levels)]
+    stream: List[DiffEvent] = []
+    for seq in range(1, events + 1):
+        mid += rng.choice((-tick, 0.0, tick))
+        bid_updates: List[Level] = []
+        ask_updates: List[Level] = []
+        for _ in range(updates):
+            offset = int(rng.expovariate(0.15)) + 1
+            size = 0.0 if rng.random() < 0.3 else rng.uniform(0.1, 5.0)
+            if rng.random() < 0.5:
+                bid_updates.append((round(mid - tick * offset, 1), size))
+            else:
+                ask_updates.append((round(mid + tick * offset, 1), size))
+        stream.append(
+            {
+                "symbol": "BTCUSDT",
+                "bids": bid_updates,
+                "asks": ask_updates,
+                "seq_from": seq,
+                "seq_to": seq,
+                "ts_ms": seq,
+            }
+        )
+    return (bids, asks), stream
+
+
+def load_stream(path: Path) -> Tuple[Snapshot, List[DiffEvent]]:
+    snapshot: Snapshot = ([], [])
+    stream: List[DiffEvent] = []
+    with path.open("r", encoding="utf-8") as handle:
+        for index, line in enumerate(handle):
+            line = line.strip()
+            if not line:
+                continue
+            payload = json.loads(line)
+            bids = [(float(p), float(q)) for p, q in payload.get("bids", [])]
+            asks = [(float(p), float(q)) for p, q in payload.get("asks", [])]
+            if index == 0 and "seq_from" not in payload:
+                snapshot = (bids, asks)
+                continue
+            payload["bids"] = bids
+            payload["asks"] = asks
+            stream.append(payload)
+    return snapshot, stream
+
+
+def replay(
+    factory: Callable[[bool], BookSide | LadderBookSide],
+    snapshot: Snapshot,
+    stream: Sequence[DiffEvent],
+    *,
+    depth: int,
+    depth_every: int,
+) -> int:
+    bids = factory(True)
+    asks = factory(False)
+    bids.apply(snapshot[0])
+    asks.apply(snapshot[1])
+    ops = 0
+    for index, event in enumerate(stream):
+        bids.apply(event["bids"])
+        asks.apply(event["asks"])
+        bids.top()
+        asks.top()
+        ops += 1
+        if depth_every and index % depth_every == 0:
+            bids.as_list(depth)
+            asks.as_list(depth)
+    return ops
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Replay L2 diffs through both book side engines")
+    parser.add_argument("--input", type=Path, help="JSONL file with recorded DiffEvents")
+    parser.add_argument("--levels", type=int, default=1000, help="synthetic levels per side")
+    parser.add_argument("--events", type=int, default=50_000, help="synthetic diff count")
+    parser.add_argument("--updates", type=int, default=8, help="level updates per diff")
+    parser.add_argument("--depth", type=int, default=20, help="as_list depth to read")
+    parser.add_argument("--depth-every", type=int, default=10, help="read depth every N diffs")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    if args.input:
+        snapshot, stream = load_stream(args.input)
+    else:
+        snapshot, stream = synthetic_stream(
+            levels=args.levels, events=args.events, updates=args.updates
+        )
+
+    engines = {
+        "dict": lambda descending: BookSide(descending=descending),
+        "ladder": lambda descending: LadderBookSide(descending=descending),
+    }
+    results = []
+    for name, factory in engines.items():
+        results.append(
+            measure(
+                name,
+                lambda factory=factory: replay(
+                    factory, snapshot, stream, depth=args.depth, depth_every=args.depth_every
+                ),
+                repeat=args.repeat,
+            )
+        )
+    report(
+        f"orderbook replay ({len(stream)} diffs, depth {args.depth} every {args.depth_every})",
+        results,
+        baseline="dict",
+    )
+
+
+if __name__ == "__main__":
+    main()
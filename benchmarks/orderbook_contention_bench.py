@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+"""N writer / M reader contention benchmark for ``OrderBookStore``.
+
+Writers stream diffs into their own books while readers poll top-of-book
+across every book. The per-book store is compared against a wrapper that
+routes every call through one global lock, which is how the store behaved
+before books carried their own locks.
+
+Usage::
+
+    python -m benchmarks.orderbook_contention_bench --writers 4 --readers 8
+"""
+
+import argparse
+import random
+import threading
+import time
+from typing import Callable, Dict, List, Mapping, Sequence, Tuple
+
+from app.market.orderbook.book_store import DiffEvent, OrderBookStore
+
+from ._harness import percentile
+
+VENUES = ("binance", "okx", "bybit")
+
+
+class GlobalLockStore(OrderBookStore):
+    """Baseline: serialise writers and readers on a single store-wide lock."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._global = threading.RLock()
+
+    def apply_diff(self, venue: str, event: DiffEvent) -> None:
+        with self._global:
+            super().apply_diff(venue, event)
+
+    def get_top_of_book(self, venue: str, symbol: str) -> Mapping[str, float | int | None]:
+        with self._global:
+            return super().get_top_of_book(venue, symbol)
+
+
+def _books(symbols: int) -> List[Tuple[str, str]]:
+    return [(venue, f"SYM{i:03d}USDT") for venue in VENUES for i in range(symbols)]
+
+
+def _run(
+    store: OrderBookStore,
+    books: Sequence[Tuple[str, str]],
+    *,
+    writers: int,
+    readers: int,
+    duration: float,
+) -> Dict[str, float]:
+    for venue, symbol in books:
+        store.apply_snapshot(
+            venue=venue,
+            symbol=symbol,
+            bids=[(100.0 - i * 0.1, 1.0) for i in range(50)],
+            asks=[(100.1 + i * 0.1, 1.0) for i in range(50)],
+            last_seq=0,
+        )
+    stop = threading.Event()
+    writes = [0] * writers
+    reads = [0] * readers
+    latencies: List[List[float]] = [[] for _ in range(readers)]
+
+    def writer(index: int) -> None:
+        owned = books[index::writers]
+        seqs = {book: 0 for book in owned}
+        rng = random.Random(index)
+        while not stop.is_set():
+            for venue, symbol in owned:
+                seq = seqs[(venue, symbol)] + 1
+                seqs[(venue, symbol)] = seq
+                px = 100.0 + rng.randint(-20, 20) * 0.1
+                store.apply_diff(
+                    venue,
+                    {
+                        "symbol": symbol,
+                        "bids": [(round(px - 0.1, 1), rng.random())],
+                        "asks": [(round(px + 0.1, 1), rng.random())],
+                        "seq_from": seq,
+                        "seq_to": seq,
+                        "ts_ms": seq,
+                    },
+                )
+                writes[index] += 1
+
+    def reader(index: int) -> None:
+        rng = random.Random(1000 + index)
+        clock: Callable[[], float] = time.perf_counter
+        sink = latencies[index]
+        while not stop.is_set():
+            venue, symbol = books[rng.randrange(len(books))]
+            started = clock()
+            store.get_top_of_book(venue, symbol)
+            sink.append(clock() - started)
+            reads[index] += 1
+
+    threads = [threading.Thread(target=writer, args=(i,)) for i in range(writers)]
+    threads += [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    merged = [sample for chunk in latencies for sample in chunk]
+    return {
+        "writes_per_s": sum(writes) / duration,
+        "reads_per_s": sum(reads) / duration,
+        "read_p50_us": percentile(merged, 50) * 1e6,
+        "read_p99_us": percentile(merged, 99) * 1e6,
+    }
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="OrderBookStore writer/reader contention")
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--symbols", type=int, default=20, help="symbols per venue")
+    parser.add_argument("--duration", type=float, default=2.0, help="seconds per run")
+    args = parser.parse_args(argv)
+
+    books = _books(args.symbols)
+    print(
+        f"== orderbook contention ({args.writers} writers, {args.readers} readers, "
+        f"{len(books)} books, {args.duration:.1f}s) =="
+    )
+    for name, store in (("global-lock", GlobalLockStore()), ("per-book", OrderBookStore())):
+        stats = _run(
+            store, books, writers=args.writers, readers=args.readers, duration=args.duration
+        )
+        print(
+            f"{name:<12} writes/s={stats['writes_per_s']:>10.0f}  reads/s={stats['reads_per_s']:>10.0f}  "
+            f"read p50={stats['read_p50_us']:.2f}us  p99={stats['read_p99_us']:.2f}us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+"""OutboxJournal append throughput and cold-start time.
+
+Usage::
+
+    python -m benchmarks.outbox_journal_bench
+    python -m benchmarks.outbox_journal_bench --appends 4000 --threads 16 --journal-mb 1024
+
+``append``: ``per-record`` fsyncs after every record (the old default),
+``group`` shares fsyncs between concurrent writers (``--window-ms`` adds the
+leader's commit window); both are durable on return.
+``cold-start``: building the indexes by replaying a ``--journal-mb`` journal
+in full versus loading the checkpoint and replaying only the tail.
+"""
+
+import argparse
+import json
+import tempfile
+import threading
+import time
+from decimal import Decimal
+from pathlib import Path
+from typing import Sequence
+
+from app.outbox.journal import OutboxJournal
+
+from ._harness import BenchResult, measure, report
+
+_NO_ROTATE_MB = 1 << 20
+
+
+def _pending(journal: OutboxJournal, idx: int) -> None:
+    journal.begin_pending(
+        intent_key=f"intent-{idx}",
+        order_id=f"order-{idx}",
+        strategy="bench",
+        symbol="BTCUSDT",
+        venue="binance-um",
+        side="buy",
+        qty=Decimal("0.001"),
+        px=Decimal("100.5"),
+    )
+
+
+def _append_run(root: Path, *, appends: int, threads: int, group: bool, window_ms: float) -> int:
+    path = root / f"append-{time.perf_counter_ns()}.jsonl"
+    journal = OutboxJournal(
+        str(path), rotate_mb=_NO_ROTATE_MB, group_commit=group, commit_window_ms=window_ms
+    )
+    per_thread = max(appends // threads, 1)
+
+    def worker(base: int) -> None:
+        for idx in range(base, base + per_thread):
+            _pending(journal, idx)
+
+    workers = [threading.Thread(target=worker, args=(n * per_thread,)) for n in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    journal.close()
+    return per_thread * threads
+
+
+def _write_journal(path: Path, megabytes: int) -> int:
+    target = megabytes * 1024 * 1024
+    written = 0
+    count = 0
+    with open(path, "w", encoding="utf-8") as handle:
+        while written < target:
+            status = ("PENDING", "ACKED", "FINAL")[count % 3]
+            line = json.dumps(
+                {
+                    "ts": 1_700_000_000.0 + count,
+                    "status": status,
+                    "intent_key": f"intent-{count // 3}",
+                    "order_id": f"order-{count // 3}",
+                    "strategy": "bench",
+                    "symbol": "BTCUSDT",
+                    "venue": "binance-um",
+                    "side": "buy",
+                    "qty": "0.001",
+                    "px": "100.5",
+                    "reason": "",
+                    "exch_order_id": "",
+                }
+            )
+            handle.write(line + "\n")
+            written += len(line) + 1
+            count += 1
+    return count
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="OutboxJournal append and cold-start benchmark")
+    parser.add_argument("--appends", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--window-ms", type=float, default=0.0)
+    parser.add_argument("--journal-mb", type=int, default=1024)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        appends: list[BenchResult] = []
+        for label, group in (("per-record", False), ("group", True)):
+            for threads in (1, max(args.threads, 1)):
+                appends.append(
+                    measure(
+                        f"{label} x{threads}",
+                        lambda: _append_run(
+                            root,
+                            appends=args.appends,
+                            threads=threads,
+                            group=group,
+                            window_ms=args.window_ms,
+                        ),
+                        repeat=args.repeat,
+                    )
+                )
+        report(f"OutboxJournal append ({args.appends} records)", appends, baseline="per-record x1")
+
+        path = root / "outbox.jsonl"
+        records = _write_journal(path, args.journal_mb)
+        # Leave a checkpoint at the current end of the journal, then a short tail.
+        OutboxJournal(str(path), rotate_mb=_NO_ROTATE_MB, checkpoint_every=1).close()
+        tail = OutboxJournal(str(path), rotate_mb=_NO_ROTATE_MB, checkpoint_every=1 << 30)
+        for idx in range(1000):
+            _pending(tail, records + idx)
+        tail.close()
+        (root / "outbox.jsonl.ckpt.tmp").unlink(missing_ok=True)
+
+        cold = [
+            measure(
+                "full-replay",
+                lambda: OutboxJournal(str(path), rotate_mb=_NO_ROTATE_MB) and records,
+                repeat=1,
+            ),
+            measure(
+                "checkpoint",
+                lambda: OutboxJournal(str(path), rotate_mb=_NO_ROTATE_MB, checkpoint_every=1 << 30)
+                and records,
+                repeat=args.repeat,
+            ),
+        ]
+        report(
+            f"OutboxJournal cold start ({args.journal_mb} MB, {records} records)",
+            cold,
+            baseline="full-replay",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+"""Pre-trade risk decisions: rescanned event windows versus rolling buckets.
+
+Usage::
+
+    python -m benchmarks.risk_window_bench
+    python -m benchmarks.risk_window_bench --events 16384 --lag-samples 20000
+
+``scan`` reproduces the previous windows on the same clock and data: the
+risk governor keeps every order outcome in a deque and counts the errors on
+each ``compute()``, and the broker watchdog keeps every lag sample and sorts a
+copy for the p95 on each evaluation. ``rolling`` is the current implementation
+on ``app.utils.rolling`` counters and quantile sketch.
+"""
+
+import argparse
+import math
+from collections import deque
+from typing import Dict, Sequence
+
+from app.services import runtime  # noqa: F401 - imports the risk governor without a cycle
+from app.risk.risk_governor import SlidingRiskGovernor
+from app.watchdog.broker_watchdog import BrokerWatchdog, _LAG_WINDOW_S
+
+from ._harness import BenchResult, measure, report
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _ScanGovernor(SlidingRiskGovernor):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._events: deque = deque()
+
+    def record_order_success(self, *, venue=None, category="ok") -> None:
+        self._events.append((self._clock(), "ok"))
+
+    def record_order_error(self, *, venue=None, category="error") -> None:
+        self._events.append((self._clock(), "error"))
+
+    def _counts(self, now: float) -> tuple[int, int, int]:
+        threshold = now - self._config.window_sec
+        while self._events and self._events[0][0] < threshold:
+            self._events.popleft()
+        total = len(self._events)
+        errors = sum(1 for _, kind in self._events if kind == "error")
+        return total, total - errors, errors
+
+
+class _ScanWatchdog(BrokerWatchdog):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._lags: deque = deque()
+
+    def record_ws_lag(self, venue: str, lag_ms: float) -> None:
+        self._lags.append((self._clock(), float(lag_ms)))
+        super().record_ws_lag(venue, lag_ms)
+
+    def _collect_metrics(self, state, now: float) -> Dict[str, float]:
+        metrics = super()._collect_metrics(state, now)
+        while self._lags and self._lags[0][0] < now - _LAG_WINDOW_S:
+            self._lags.popleft()
+        ordered = sorted(value for _, value in self._lags)
+        if ordered:
+            k = (len(ordered) - 1) * 0.95
+            f, c = math.floor(k), math.ceil(k)
+            metrics["ws_lag_ms_p95"] = (
+                ordered[f] * (c - k) + ordered[c] * (k - f) if f != c else ordered[f]
+            )
+        return metrics
+
+
+def _governor(scan: bool, events: int) -> tuple[SlidingRiskGovernor, _Clock]:
+    clock = _Clock()
+    governor = (_ScanGovernor if scan else SlidingRiskGovernor)(clock=clock)
+    step = 3000.0 / events
+    for idx in range(events):
+        clock.now += step
+        if idx % 100:
+            governor.record_order_success()
+        else:
+            governor.record_order_error(category="rejected")
+    return governor, clock
+
+
+def _decisions(governor: SlidingRiskGovernor, clock: _Clock, count: int) -> int:
+    for _ in range(count):
+        clock.now += 0.001
+        governor.record_order_success()
+        governor.compute(venue="binance")
+    return count
+
+
+def _watchdog(scan: bool, samples: int) -> tuple[BrokerWatchdog, _Clock]:
+    clock = _Clock()
+    watchdog = (_ScanWatchdog if scan else BrokerWatchdog)(clock=clock, auto_hold_on_down=False)
+    step = 100.0 / samples
+    for idx in range(samples):
+        clock.now += step
+        watchdog.record_ws_lag("binance", 50.0 + (idx * 37) % 300)
+    return watchdog, clock
+
+
+def _lag_updates(watchdog: BrokerWatchdog, clock: _Clock, count: int) -> int:
+    for idx in range(count):
+        clock.now += 0.001
+        watchdog.record_ws_lag("binance", 50.0 + (idx * 37) % 300)
+    return count
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Rolling risk window benchmark")
+    parser.add_argument("--events", type=int, default=16_384)
+    parser.add_argument("--lag-samples", type=int, default=20_000)
+    parser.add_argument("--decisions", type=int, default=2_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    decisions: list[BenchResult] = []
+    lag: list[BenchResult] = []
+    for name, scan in (("scan", True), ("rolling", False)):
+        governor, clock = _governor(scan, args.events)
+        decisions.append(
+            measure(
+                name,
+                lambda: _decisions(governor, clock, args.decisions),
+                repeat=args.repeat,
+            )
+        )
+        watchdog, lag_clock = _watchdog(scan, args.lag_samples)
+        lag.append(
+            measure(
+                name,
+                lambda: _lag_updates(watchdog, lag_clock, args.decisions),
+                repeat=args.repeat,
+            )
+        )
+    report(
+        f"Risk governor record + compute ({args.events} outcomes in window)",
+        decisions,
+        baseline="scan",
+    )
+    report(
+        f"Watchdog lag sample + evaluation ({args.lag_samples} samples in window)",
+        lag,
+        baseline="scan",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+"""SOR scoring and flag checks: per-call environment parsing versus the settings snapshot.
+
+Usage::
+
+    python -m benchmarks.runtime_settings_bench
+    python -m benchmarks.runtime_settings_bench --ops 20000 --venues 5
+
+``env`` is the previous behaviour: ``select_best_pair`` built a
+``ScoreCalculator`` that read four scalars and parsed three JSON maps from
+``os.environ`` on every call (kept below as ``_EnvScoreCalculator``), and the
+``FF_*`` helpers read and normalised the environment on every check.
+``snapshot`` reads the same values from ``get_runtime_settings()``. Both score
+every venue pair of ``--venues`` fresh quotes with the SOR env vars set.
+"""
+
+import argparse
+import json
+import os
+import time
+from decimal import Decimal
+from typing import Dict, List, Sequence
+
+from app.config import feature_flags as ff
+from app.config.profile import normalise_profile_category
+from app.config.runtime_settings import reload_runtime_settings
+from app.sor import select
+from app.sor.select import Quote, ScoreCalculator
+
+from ._harness import BenchResult, measure, report
+
+_ENV = {
+    "SOR_MIN_EDGE_BPS": "1.0",
+    "SOR_MIN_SIZE_USD": "10",
+    "SOR_MAX_SLIPPAGE_BPS": "5",
+    "SOR_QUOTE_TTL_MS": "60000",
+    "SOR_FEES_BPS": json.dumps({"binance": 2.0, "okx": 2.0, "bybit": 2.5, "bitget": 3.0}),
+    "SOR_FUNDING_BPS_1H": json.dumps({"binance": 0.1, "okx": -0.1, "bybit": 0.0}),
+    "SOR_VENUE_PREFS": json.dumps({"binance": 1.0, "okx": 0.9, "bybit": 1.0}),
+    "FF_PRETRADE_STRICT": "1",
+    "DEFAULT_PROFILE": "paper",
+}
+_FLAG_TRUE = {"1", "true", "on", "yes", "y", "True", "TRUE", "ON"}
+
+
+def _env_json(name: str, default: Dict[str, float]) -> Dict[str, float]:
+    raw = os.environ.get(name, "")
+    if not raw:
+        return default
+    try:
+        return json.loads(raw) or default
+    except (json.JSONDecodeError, TypeError, ValueError):
+        return default
+
+
+class _EnvScoreCalculator(ScoreCalculator):
+    def __init__(self) -> None:
+        self.min_edge_bps = float(os.environ.get("SOR_MIN_EDGE_BPS", "1.5"))
+        self.min_size_usd = Decimal(os.environ.get("SOR_MIN_SIZE_USD", "50"))
+        self.max_slip_bps = float(os.environ.get("SOR_MAX_SLIPPAGE_BPS", "5"))
+        self.quote_ttl_ms = int(os.environ.get("SOR_QUOTE_TTL_MS", "200"))
+        self.fees_bps = _env_json("SOR_FEES_BPS", {"binance": 2.5, "okx": 2.5, "bybit": 3.0})
+        self.funding_1h_bps = _env_json(
+            "SOR_FUNDING_BPS_1H", {"binance": 0.0, "okx": 0.0, "bybit": 0.0}
+        )
+        self.venue_prefs = _env_json("SOR_VENUE_PREFS", {"binance": 1.0, "okx": 1.0, "bybit": 1.0})
+        self.edge_ref = os.environ.get("SOR_EDGE_REF", "mid").lower()
+
+
+def _env_profile_flag(name: str) -> bool:
+    raw = os.getenv(name)
+    if raw is not None:
+        return raw in _FLAG_TRUE
+    profile = os.getenv("DEFAULT_PROFILE")
+    if not profile:
+        return False
+    return normalise_profile_category(profile) in {"paper", "testnet"}
+
+
+def _quotes(venues: int) -> Dict[str, Quote]:
+    names = ["binance", "okx", "bybit", "bitget", "gate", "kucoin", "mexc", "htx"][:venues]
+    now_ms = int(time.time() * 1000)
+    quotes: Dict[str, Quote] = {}
+    for idx, venue in enumerate(names):
+        mid = Decimal(30_000 + idx * 7)
+        quotes[venue] = Quote(venue, "BTCUSDT", mid - 1, mid + 1, now_ms)
+    return quotes
+
+
+def _select(quotes: Dict[str, Quote], count: int) -> int:
+    notional = Decimal("1000")
+    for _ in range(count):
+        select.select_best_pair(quotes, "BTCUSDT", notional)
+    return count
+
+
+def _env_flags(count: int) -> int:
+    for _ in range(count):
+        _env_profile_flag("FF_PRETRADE_STRICT")
+        _env_profile_flag("FF_MD_WATCHDOG")
+    return count
+
+
+def _snapshot_flags(count: int) -> int:
+    for _ in range(count):
+        ff.pretrade_strict_on()
+        ff.md_watchdog_on()
+    return count
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Runtime settings snapshot benchmark")
+    parser.add_argument("--ops", type=int, default=20_000)
+    parser.add_argument("--venues", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    os.environ.update(_ENV)
+    reload_runtime_settings()
+    quotes = _quotes(max(2, min(args.venues, 8)))
+
+    compiled = select.ScoreCalculator
+    select.ScoreCalculator = _EnvScoreCalculator  # type: ignore[misc]
+    scoring: List[BenchResult] = [
+        measure("env", lambda: _select(quotes, args.ops), repeat=args.repeat)
+    ]
+    select.ScoreCalculator = compiled  # type: ignore[misc]
+    scoring.append(measure("snapshot", lambda: _select(quotes, args.ops), repeat=args.repeat))
+
+    flags = [
+        measure("env", lambda: _env_flags(args.ops), repeat=args.repeat),
+        measure("snapshot", lambda: _snapshot_flags(args.ops), repeat=args.repeat),
+    ]
+    report(f"SOR select_best_pair, {len(quotes)} venues", scoring, baseline="env")
+    report("FF_PRETRADE_STRICT + FF_MD_WATCHDOG checks", flags, baseline="env")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+"""Status websocket ticks: an overview per client versus the shared broadcaster.
+
+Usage::
+
+    python -m benchmarks.status_stream_bench
+    python -m benchmarks.status_stream_bench --clients 25 --ticks 20
+
+``per-client`` is the previous stream handler: every connected client calls
+``get_status_overview()`` and ``json.dumps`` the whole payload on each tick.
+``shared`` is one ``StatusBroadcaster`` tick: the overview is computed, diffed
+and encoded once and the frames are queued for every subscriber. Both count
+one operation per client per tick; websocket I/O is left out of both.
+"""
+
+import argparse
+import asyncio
+import json
+import tempfile
+from contextlib import AsyncExitStack
+from pathlib import Path
+from typing import Sequence
+
+from app import ledger
+from app.services import runtime  # noqa: F401 - initialises runtime state for the overview
+from app.services.status import get_status_overview
+from app.services.status_stream import StatusBroadcaster
+
+from ._harness import BenchResult, measure, report
+
+
+def _per_client(clients: int, ticks: int) -> int:
+    for _ in range(ticks):
+        for _ in range(clients):
+            json.dumps(get_status_overview())
+    return clients * ticks
+
+
+def _shared(clients: int, ticks: int) -> int:
+    async def scenario() -> None:
+        # A long interval keeps the producer idle; ticks are driven below.
+        broadcaster = StatusBroadcaster(interval=3600, queue_max=ticks + 1)
+        async with AsyncExitStack() as stack:
+            queues = [
+                await stack.enter_async_context(broadcaster.subscribe()) for _ in range(clients)
+            ]
+            for _ in range(ticks):
+                broadcaster._publish(get_status_overview())
+            for queue in queues:
+                while not queue.empty():
+                    queue.get_nowait()
+
+    asyncio.run(scenario())
+    return clients * ticks
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Status stream fan-out benchmark")
+    parser.add_argument("--clients", type=int, default=10)
+    parser.add_argument("--ticks", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger.LEDGER_PATH = Path(tmp) / "ledger.db"
+        ledger.init_db()
+        get_status_overview()
+        results: list[BenchResult] = [
+            measure(
+                "per-client", lambda: _per_client(args.clients, args.ticks), repeat=args.repeat
+            ),
+            measure("shared", lambda: _shared(args.clients, args.ticks), repeat=args.repeat),
+        ]
+        ledger.close_connections()
+    report(
+        f"Status stream ticks ({args.clients} clients x {args.ticks} ticks)",
+        results,
+        baseline="per-client",
+    )
+
+
+if __name__ == "__main__":
+    main()
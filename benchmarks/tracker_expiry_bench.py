@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+"""Order tracker and outbox eviction: full scans versus expiry heaps.
+
+Usage::
+
+    python -m benchmarks.tracker_expiry_bench
+    python -m benchmarks.tracker_expiry_bench --orders 500000
+
+``scan`` reproduces the old code paths on the same data: TTL cleanup and
+capacity eviction walk (and sort) every tracked order, and status records
+look up their intent by scanning ``OutboxJournal._by_intent``. ``heap`` is
+the current implementation driven by the expiry heaps and the order-to-intent
+map.
+"""
+
+import argparse
+import tempfile
+from decimal import Decimal
+from pathlib import Path
+from typing import Sequence
+
+from app.orders.state import OrderState
+from app.orders.tracker import OrderTracker, TrackedOrder, TrackingCleaner
+from app.outbox.journal import OutboxJournal, OutboxRecord
+
+from ._harness import BenchResult, measure, report
+
+_NS = 1_000_000_000
+_STEP_NS = 10_000_000
+
+
+def _tracker(orders: int, *, max_active: int) -> OrderTracker:
+    tracker = OrderTracker(max_active=max_active, ttl_seconds=0, max_items=0)
+    for idx in range(orders):
+        now_ns = idx * _STEP_NS
+        tracker.register_order(
+            f"o-{idx}",
+            venue="binance",
+            symbol="BTCUSDT",
+            side="buy",
+            qty=Decimal("1"),
+            now_ns=now_ns,
+        )
+        if idx % 2:
+            tracker.mark_terminal(f"o-{idx}", OrderState.FILLED, now_ns / _NS)
+    return tracker
+
+
+def _scan_ttl(tracker: OrderTracker, now_ts: float, ttl: float) -> int:
+    orders = tracker._orders
+    expired = [
+        coid
+        for coid, tracked in orders.items()
+        if now_ts - (tracked.updated_ts or tracked.updated_ns / _NS) > ttl
+    ]
+    for coid in expired:
+        tracker._discard(coid)
+    return len(expired)
+
+
+def _scan_capacity(tracker: OrderTracker, limit: int) -> int:
+    removed = 0
+    terminal = (item for item in tracker._orders.values() if tracker.is_terminal(item.state))
+    for tracked in sorted(terminal, key=lambda item: item.updated_ns):
+        if len(tracker) <= limit:
+            break
+        tracker._discard(tracked.coid)
+        removed += 1
+    return removed
+
+
+def _ttl_ticks(tracker: OrderTracker, *, orders: int, ticks: int, scan: bool) -> int:
+    ttl = orders * _STEP_NS / _NS
+    for tick in range(ticks):
+        now_ts = ttl + (tick + 1)
+        if scan:
+            _scan_ttl(tracker, now_ts, ttl)
+        else:
+            TrackingCleaner.cleanup_by_ttl(tracker, now_ts=now_ts, ttl_seconds=int(ttl))
+    return ticks
+
+
+def _capacity_inserts(tracker: OrderTracker, *, orders: int, inserts: int, scan: bool) -> int:
+    limit = orders - 1
+    for idx in range(inserts):
+        now_ns = (orders + idx) * _STEP_NS
+        coid = f"n-{idx}"
+        if scan:
+            tracker._orders[coid] = TrackedOrder(
+                coid=coid,
+                venue="binance",
+                symbol="BTCUSDT",
+                side="buy",
+                qty=Decimal("1"),
+                created_ns=now_ns,
+                updated_ns=now_ns,
+                updated_ts=now_ns / _NS,
+            )
+            _scan_capacity(tracker, limit)
+        else:
+            tracker.register_order(
+                coid, venue="binance", symbol="BTCUSDT", side="buy", qty=Decimal("1"), now_ns=now_ns
+            )
+    return inserts
+
+
+def _journal(root: Path, orders: int) -> OutboxJournal:
+    journal = OutboxJournal(str(root / f"outbox-{orders}.jsonl"), max_inmem=orders * 2)
+    for idx in range(orders):
+        journal._update_index(
+            OutboxRecord(
+                ts=float(idx),
+                status="PENDING",
+                intent_key=f"intent-{idx}",
+                order_id=f"order-{idx}",
+                strategy="bench",
+                symbol="BTCUSDT",
+                venue="binance-um",
+                side="buy",
+                qty="1",
+                px="100",
+            )
+        )
+    return journal
+
+
+def _scan_intent(journal: OutboxJournal, order_id: str) -> str:
+    for key, value in journal._by_intent.items():
+        if value[2] == order_id:
+            return key
+    return ""
+
+
+def _intent_lookups(journal: OutboxJournal, *, orders: int, lookups: int, scan: bool) -> int:
+    step = max(orders // lookups, 1)
+    for idx in range(0, step * lookups, step):
+        order_id = f"order-{orders - 1 - idx}"
+        if scan:
+            _scan_intent(journal, order_id)
+        else:
+            journal._intent_for_order(order_id)
+    return lookups
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Tracker and outbox eviction benchmark")
+    parser.add_argument("--orders", type=int, default=200_000)
+    parser.add_argument("--ticks", type=int, default=20)
+    parser.add_argument("--inserts", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    ttl_ticks: list[BenchResult] = []
+    capacity: list[BenchResult] = []
+    for scan in (True, False):
+        name = "scan" if scan else "heap"
+        tracker = _tracker(args.orders, max_active=args.orders * 2)
+        ttl_ticks.append(
+            measure(
+                name,
+                lambda: _ttl_ticks(tracker, orders=args.orders, ticks=args.ticks, scan=scan),
+                repeat=1,
+            )
+        )
+        tracker = _tracker(args.orders, max_active=args.orders)
+        capacity.append(
+            measure(
+                name,
+                lambda: _capacity_inserts(
+                    tracker, orders=args.orders, inserts=args.inserts, scan=scan
+                ),
+                repeat=1,
+            )
+        )
+    report(
+        f"TTL cleanup ticks, 100 expiries each ({args.orders} tracked)", ttl_ticks, baseline="scan"
+    )
+    report(f"Insert at capacity ({args.orders} tracked)", capacity, baseline="scan")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        journal = _journal(Path(tmp), args.orders)
+        lookups = [
+            measure(
+                name,
+                lambda: _intent_lookups(journal, orders=args.orders, lookups=200, scan=scan),
+                repeat=3,
+            )
+            for name, scan in (("scan", True), ("map", False))
+        ]
+        report(
+            f"Outbox status append intent lookup ({args.orders} intents)", lookups, baseline="scan"
+        )
+
+
+if __name__ == "__main__":
+    main()
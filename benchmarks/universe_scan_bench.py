@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+"""Time one universe scan tick: load the quote matrix and rank cross-venue edges.
+
+Usage::
+
+    python -m benchmarks.universe_scan_bench
+    python -m benchmarks.universe_scan_bench --symbols 500 --venues 4
+
+The ``pairwise`` row is the naive approach of fetching ``get_top_of_book``
+dicts for every venue pair of every symbol; ``matrix`` is the column-oriented
+``load_quote_matrix`` + ``rank_edges`` path used by ``SCAN_MODE=universe``.
+"""
+
+import argparse
+import random
+from typing import List, Sequence
+
+from app.market.orderbook.book_store import OrderBookStore
+from services.universe_scanner import ScanVenue, book_symbol, load_quote_matrix, rank_edges
+
+from ._harness import measure, report
+
+VENUE_NAMES = ("binance", "okx", "bybit", "gate", "bitget")
+
+
+def seed_store(
+    symbols: Sequence[str], venues: Sequence[ScanVenue], *, seed: int = 11
+) -> OrderBookStore:
+    rng = random.Random(seed)
+    store = OrderBookStore()
+    for symbol in symbols:
+        mid = rng.uniform(0.05, 50_000.0)
+        for venue in venues:
+            skew = mid * rng.uniform(-0.002, 0.002)
+            half = mid * rng.uniform(0.00005, 0.0005)
+            store.apply_snapshot(
+                venue=venue.name,
+                symbol=book_symbol(venue.name, symbol),
+                bids=[(mid + skew - half, 1.0)],
+                asks=[(mid + skew + half, 1.0)],
+                last_seq=1,
+            )
+    return store
+
+
+def pairwise_tick(
+    store: OrderBookStore, symbols: Sequence[str], venues: Sequence[ScanVenue]
+) -> int:
+    found: List[tuple[float, str]] = []
+    for symbol in symbols:
+        for long_venue in venues:
+            long_book = store.get_top_of_book(long_venue.name, book_symbol(long_venue.name, symbol))
+            for short_venue in venues:
+                if short_venue is long_venue:
+                    continue
+                short_book = store.get_top_of_book(
+                    short_venue.name, book_symbol(short_venue.name, symbol)
+                )
+                ask = long_book.get("ask")
+                bid = short_book.get("bid")
+                if not ask or not bid:
+                    continue
+                edge = (
+                    (bid - ask) / ask * 10_000
+                    - long_venue.taker_fee_bps
+                    - short_venue.taker_fee_bps
+                )
+                found.append((edge, symbol))
+    found.sort(reverse=True)
+    return 1
+
+
+def matrix_tick(
+    store: OrderBookStore, symbols: Sequence[str], venues: Sequence[ScanVenue], top_n: int
+) -> int:
+    matrix = load_quote_matrix(store, symbols, venues)
+    rank_edges(matrix, min_edge_bps=float("-inf"), top_n=top_n)
+    return 1
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Time one universe scan tick over in-memory books")
+    parser.add_argument("--symbols", type=int, default=250, help="symbols in the universe")
+    parser.add_argument("--venues", type=int, default=3, help=f"venues (max {len(VENUE_NAMES)})")
+    parser.add_argument("--top-n", type=int, default=20)
+    parser.add_argument("--target-ms", type=float, default=5.0, help="per-tick latency budget")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    venues = [
+        ScanVenue(name, 2.0) for name in VENUE_NAMES[: max(2, min(args.venues, len(VENUE_NAMES)))]
+    ]
+    symbols = [f"SYM{index:04d}USDT" for index in range(args.symbols)]
+    store = seed_store(symbols, venues)
+
+    results = [
+        measure("pairwise", lambda: pairwise_tick(store, symbols, venues), repeat=args.repeat),
+        measure(
+            "matrix", lambda: matrix_tick(store, symbols, venues, args.top_n), repeat=args.repeat
+        ),
+    ]
+    report(
+        f"universe scan tick ({len(symbols)} symbols x {len(venues)} venues)",
+        results,
+        baseline="pairwise",
+    )
+    tick_ms = results[-1].seconds * 1000
+    verdict = "within" if tick_ms <= args.target_ms else "OVER"
+    print(f"matrix tick {tick_ms:.2f} ms ({verdict} {args.target_ms:.1f} ms target)")
+
+
+if __name__ == "__main__":
+    main()
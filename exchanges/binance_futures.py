@@ -9,8 +9,10 @@ import time
 from decimal import Decimal, ROUND_DOWN
 from typing import Any, Dict
 
+import httpx
 import requests
 
+from app.net import get_transport
 from app.utils.chaos import apply_order_delay, maybe_raise_rest_timeout
 
 from app.secrets_store import get_secrets_store
@@ -54,7 +56,9 @@ class BinanceFuturesClient(FuturesExchangeClient):
         self.api_key = api_key or store_key or env_key
         self.api_secret = api_secret or store_secret or env_secret
         self.api_url = api_url or os.getenv("BINANCE_FUTURES_API_URL", "https://fapi.binance.com")
-        self._session = session or requests.Session()
+        # ``session`` is kept for callers that inject their own; otherwise requests go
+        # through the shared pooled transport.
+        self._session = session
 
     # ------------------------------------------------------------------
     # Helpers
@@ -82,6 +86,15 @@ class BinanceFuturesClient(FuturesExchangeClient):
         payload["signature"] = signature
         return payload
 
+    def _send(self, method: str, url: str, **kwargs: Any) -> requests.Response | httpx.Response:
+        if self._session is not None:
+            return self._session.request(method, url, **kwargs)
+        for key in ("params", "data"):
+            # requests drops ``None`` values when encoding; httpx would send them empty.
+            if isinstance(kwargs.get(key), dict):
+                kwargs[key] = {k: v for k, v in kwargs[key].items() if v is not None}
+        return get_transport().request("binance", method, url, **kwargs)
+
     def _request(
         self,
         method: str,
@@ -103,7 +116,7 @@ class BinanceFuturesClient(FuturesExchangeClient):
         try:
             maybe_raise_rest_timeout(context="binance_futures.request")
             if method.upper() in {"POST", "PUT"}:
-                response = self._session.request(
+                response = self._send(
                     method.upper(),
                     url,
                     data=request_params,
@@ -111,7 +124,7 @@ class BinanceFuturesClient(FuturesExchangeClient):
                     timeout=_DEFAULT_TIMEOUT,
                 )
             else:
-                response = self._session.request(
+                response = self._send(
                     method.upper(),
                     url,
                     params=request_params,
@@ -119,7 +132,7 @@ class BinanceFuturesClient(FuturesExchangeClient):
                     timeout=_DEFAULT_TIMEOUT,
                 )
             response.raise_for_status()
-        except requests.RequestException as exc:  # pragma: no cover - defensive
+        except (requests.RequestException, httpx.HTTPError) as exc:  # pragma: no cover - defensive
             raise RuntimeError(f"Binance request failed: {exc}") from exc
 
         payload = response.json()
@@ -11,8 +11,10 @@ from datetime import datetime, timezone
 from decimal import Decimal, ROUND_DOWN
 from typing import Any, Dict
 
+import httpx
 import requests
 
+from app.net import get_transport
 from app.utils.chaos import apply_order_delay, maybe_raise_rest_timeout
 
 from app.secrets_store import get_secrets_store
@@ -67,7 +69,9 @@ class OKXFuturesClient(FuturesExchangeClient):
         self.api_secret = api_secret or store_secret or env_secret
         self.passphrase = passphrase or store_passphrase or env_passphrase
         self.api_url = api_url or os.getenv("OKX_FUTURES_API_URL", "https://www.okx.com")
-        self._session = session or requests.Session()
+        # ``session`` is kept for callers that inject their own; otherwise requests go
+        # through the shared pooled transport.
+        self._session = session
 
     # ------------------------------------------------------------------
     # Helpers
@@ -101,6 +105,15 @@ class OKXFuturesClient(FuturesExchangeClient):
         )
         return headers
 
+    def _send(self, method: str, url: str, **kwargs: Any) -> requests.Response | httpx.Response:
+        if self._session is not None:
+            return self._session.request(method, url, **kwargs)
+        if isinstance(kwargs.get("data"), str):
+            kwargs["content"] = kwargs.pop("data")
+        elif kwargs.get("data") is None:
+            kwargs.pop("data", None)
+        return get_transport().request("okx", method, url, **kwargs)
+
     def _request(
         self,
         method: str,
@@ -121,7 +134,7 @@ class OKXFuturesClient(FuturesExchangeClient):
         headers = self._headers(method, path + query, body_payload, signed)
         try:
             maybe_raise_rest_timeout(context="okx_futures.request")
-            response = self._session.request(
+            response = self._send(
                 method.upper(),
                 url,
                 headers=headers,
@@ -129,7 +142,7 @@ class OKXFuturesClient(FuturesExchangeClient):
                 timeout=_DEFAULT_TIMEOUT,
             )
             response.raise_for_status()
-        except requests.RequestException as exc:  # pragma: no cover - defensive
+        except (requests.RequestException, httpx.HTTPError) as exc:  # pragma: no cover - defensive
             raise RuntimeError(f"OKX request failed: {exc}") from exc
         payload = response.json()
         if isinstance(payload, dict) and payload.get("code") not in (None, "0", 0):
@@ -0,0 +1,562 @@
+"""Append-only log-structured storage behind the JSON-array stores.
+
+``positions_store``, ``pnl_history_store`` and ``services.execution_stats_store``
+used to load their whole JSON array, change one entry and rewrite the file,
+so every write and every read cost O(history). A :class:`LogStore` keeps that
+file (``<path>``, still a plain JSON array) as its compacted *base* and
+appends each change as one JSON line to ``<path>.log``:
+
+* ``{"op": "add", "keep": N, "rec": {...}}`` appends a record and keeps only
+  the newest ``N`` records (``keep`` is omitted for unbounded stores);
+* ``{"op": "set", "i": I, "rec": {...}}`` replaces the live record at index ``I``.
+
+Live records are held in memory as encoded JSON rows: a write costs one log
+line, and a read decodes only the rows it returns (``recent(n)`` touches
+``n`` rows). Once the log holds more operations than there are live records
+(and at least ``compact_min``) the rows are written out as the new base and
+the log starts over, which keeps compaction amortised O(1) per write.
+
+Crash safety: the first log line records the SHA-256 of the base it extends.
+Compaction replaces the base atomically (temp file, fsync, rename) before it
+replaces the log, so a crash in between leaves a log whose header no longer
+matches; it is ignored because its operations are already in the new base. A
+torn last line (a crash mid-append) is skipped on load.
+
+Every read and write first compares ``os.stat`` of both files with the state
+last loaded, so appends from another process are tailed and a replaced or
+deleted file triggers a full reload, without rereading unchanged files.
+Writers in every process serialise on an exclusive ``flock`` of
+``<path>.lock``, so a torn or unreadable last line seen under that lock was
+left by a crashed writer and is cut off before the next append. A corrupt line
+with more data behind it is never cut off: appends fail with ``OSError`` until
+the log is repaired, so the records behind it are kept.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import functools
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Tuple
+
+LOGGER = logging.getLogger(__name__)
+
+LOG_FORMAT_VERSION = 1
+DEFAULT_COMPACT_MIN = 1024
+_SHRINK_MIN = 1024
+_MAX_OPEN_STORES = 32
+
+_StatKey = Tuple[int, int, int]
+
+
+def _stat(path: Path) -> _StatKey | None:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
+def _normalise(row: Any) -> Dict[str, Any] | None:
+    if not isinstance(row, Mapping):
+        return None
+    return {str(key): value for key, value in row.items()}
+
+
+def _encode(record: Mapping[str, Any]) -> str:
+    return json.dumps(record, sort_keys=True)
+
+
+def _decode(rows: List[str]) -> List[Dict[str, Any]]:
+    # One parse for the whole slice is much cheaper than ``json.loads`` per row.
+    return json.loads("[" + ",".join(rows) + "]")
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        "wb", dir=str(path.parent), prefix=f".{path.name}.", delete=False
+    ) as handle:
+        handle.write(data)
+        handle.flush()
+        os.fsync(handle.fileno())
+        tmp_name = handle.name
+    try:
+        os.replace(tmp_name, path)
+    except OSError:
+        os.unlink(tmp_name)
+        raise
+
+
+class LogStore:
+    """Ordered records persisted as a JSON-array base plus an operation log.
+
+    ``index_key`` enables :meth:`locate` (first live record whose
+    ``str(record[index_key])`` matches). Records are returned as fresh dicts,
+    so callers may mutate them freely.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        name: str = "log_store",
+        index_key: str | None = None,
+        compact_min: int = DEFAULT_COMPACT_MIN,
+        fsync: bool = False,
+    ) -> None:
+        self.path = Path(path)
+        self.log_path = self.path.with_name(self.path.name + ".log")
+        self.lock_path = self.path.with_name(self.path.name + ".lock")
+        self._name = name
+        self._index_key = index_key
+        self._compact_min = max(int(compact_min), 1)
+        self._fsync = bool(fsync)
+        self._lock = threading.RLock()
+        # ``_rows[_head:]`` are live; ``_first`` is the ordinal of ``_rows[0]``
+        # and ``_index`` maps keys to ordinals, so trimming never shifts it.
+        self._rows: List[str] = []
+        self._head = 0
+        self._first = 0
+        self._index: Dict[str, int] = {}
+        self._loaded = False
+        self._base_hash = ""
+        self._base_stat: _StatKey | None = None
+        self._log_ok = False
+        self._log_ino: int | None = None
+        self._log_offset = 0
+        self._log_ops = 0
+        self._fd: int | None = None
+        self._lock_fd: int | None = None
+        self.compactions = 0
+
+    # ------------------------------------------------------------------
+    # Reads
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._refresh()
+            return len(self._rows) - self._head
+
+    def records(self) -> List[Dict[str, Any]]:
+        """Every live record, oldest first."""
+
+        with self._lock:
+            self._refresh()
+            rows = self._rows[self._head :]
+        return _decode(rows)
+
+    def recent(self, limit: int) -> List[Dict[str, Any]]:
+        """The newest ``limit`` records, oldest first."""
+
+        if limit <= 0:
+            return []
+        with self._lock:
+            self._refresh()
+            start = max(len(self._rows) - limit, self._head)
+            rows = self._rows[start:]
+        return _decode(rows)
+
+    def get(self, index: int) -> Dict[str, Any]:
+        with self._lock:
+            self._refresh()
+            return json.loads(self._rows[self._physical(index)])
+
+    def locate(self, key: object) -> int | None:
+        """Index of the first live record whose ``index_key`` equals ``key``."""
+
+        if self._index_key is None:
+            raise TypeError(f"{self._name} has no index_key")
+        with self._lock:
+            self._refresh()
+            ordinal = self._index.get(str(key))
+            if ordinal is None:
+                return None
+            physical = ordinal - self._first
+            if physical < self._head:
+                return None
+            return physical - self._head
+
+    # ------------------------------------------------------------------
+    # Writes
+
+    def append(self, record: Mapping[str, Any], *, keep: int | None = None) -> None:
+        self.extend([record], keep=keep)
+
+    def extend(self, records: Iterable[Mapping[str, Any]], *, keep: int | None = None) -> None:
+        """Append ``records`` and keep only the newest ``keep`` (if positive)."""
+
+        keep_value = int(keep) if keep is not None and keep > 0 else None
+        keep_field = f'"keep": {keep_value}, ' if keep_value is not None else ""
+        entries: List[Tuple[str, Callable[[], None]]] = []
+        for record in records:
+            normalised = _normalise(record)
+            if normalised is None:
+                continue
+            row = _encode(normalised)
+            entries.append(
+                (
+                    f'{{"op": "add", {keep_field}"rec": {row}}}\n',
+                    functools.partial(self._add, row, normalised, keep_value),
+                )
+            )
+        if entries:
+            with self._lock, self._locked():
+                self._refresh()
+                self._commit(entries)
+
+    def set(self, index: int, record: Mapping[str, Any]) -> None:
+        """Replace the live record at ``index``."""
+
+        normalised = _normalise(record)
+        if normalised is None:
+            raise TypeError("record must be a mapping")
+        row = _encode(normalised)
+        with self._lock, self._locked():
+            self._refresh()
+            self._physical(index)
+            line = f'{{"op": "set", "i": {int(index)}, "rec": {row}}}\n'
+            self._commit([(line, lambda: self._set(int(index), row, normalised))])
+
+    def reset(self, records: Iterable[Mapping[str, Any]] = ()) -> None:
+        """Replace the whole store with ``records`` (written as a fresh base)."""
+
+        with self._lock, self._locked():
+            self._refresh()
+            self._clear()
+            for record in records:
+                normalised = _normalise(record)
+                if normalised is not None:
+                    self._add(_encode(normalised), normalised, None)
+            self._compact()
+
+    def compact(self) -> None:
+        """Write the live records as the new base and restart the log."""
+
+        with self._lock, self._locked():
+            self._refresh()
+            self._compact()
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_fd()
+            if self._lock_fd is not None:
+                os.close(self._lock_fd)
+                self._lock_fd = None
+
+    def _compact(self) -> None:
+        self._shrink(force=True)
+        if self._rows:
+            data = ("[\n" + ",\n".join(self._rows) + "\n]\n").encode("utf-8")
+        else:
+            data = b"[]\n"
+        self._close_fd()
+        try:
+            _atomic_write(self.path, data)
+            # From here the old log is stale whatever happens next.
+            self._log_ok = False
+            self._base_hash = hashlib.sha256(data).hexdigest()
+            self._base_stat = _stat(self.path)
+            self._start_log()
+        except OSError:
+            # Memory may be ahead of disk; the next access reloads.
+            self._loaded = False
+            raise
+        self.compactions += 1
+
+    # ------------------------------------------------------------------
+    # In-memory state
+
+    def _physical(self, index: int) -> int:
+        live = len(self._rows) - self._head
+        if not 0 <= index < live:
+            raise IndexError(f"{self._name} index {index} out of range")
+        return self._head + index
+
+    def _clear(self) -> None:
+        self._rows = []
+        self._head = 0
+        self._first = 0
+        self._index = {}
+
+    def _add(self, row: str, record: Mapping[str, Any], keep: int | None) -> None:
+        ordinal = self._first + len(self._rows)
+        self._rows.append(row)
+        if self._index_key is not None:
+            self._index.setdefault(str(record.get(self._index_key)), ordinal)
+        if keep is not None:
+            excess = len(self._rows) - self._head - keep
+            if excess > 0:
+                self._head += excess
+                self._shrink()
+
+    def _set(self, index: int, row: str, record: Mapping[str, Any]) -> None:
+        physical = self._physical(index)
+        previous = self._rows[physical]
+        self._rows[physical] = row
+        if self._index_key is None:
+            return
+        ordinal = self._first + physical
+        key = str(record.get(self._index_key))
+        if self._index.get(key) == ordinal:
+            return
+        old_key = str(json.loads(previous).get(self._index_key))
+        if self._index.get(old_key) == ordinal:
+            self._reindex()
+        else:
+            current = self._index.get(key)
+            if current is None or current > ordinal:
+                self._index[key] = ordinal
+
+    def _shrink(self, *, force: bool = False) -> None:
+        head = self._head
+        if not head or not (force or (head >= _SHRINK_MIN and head * 2 >= len(self._rows))):
+            return
+        del self._rows[:head]
+        self._first += head
+        self._head = 0
+        if self._index_key is not None:
+            first = self._first
+            self._index = {key: value for key, value in self._index.items() if value >= first}
+
+    def _reindex(self) -> None:
+        self._index = {}
+        if self._index_key is None:
+            return
+        key = self._index_key
+        records = _decode(self._rows[self._head :])
+        base = self._first + self._head
+        for offset, record in enumerate(records):
+            self._index.setdefault(str(record.get(key)), base + offset)
+
+    def _apply(self, op: Mapping[str, Any]) -> None:
+        record = _normalise(op.get("rec"))
+        if record is None:
+            raise ValueError("log operation without a record")
+        kind = op.get("op")
+        if kind == "add":
+            keep = op.get("keep")
+            self._add(_encode(record), record, int(keep) if keep else None)
+        elif kind == "set":
+            self._set(int(op["i"]), _encode(record), record)
+        else:
+            raise ValueError(f"unknown log operation {kind!r}")
+        self._log_ops += 1
+
+    # ------------------------------------------------------------------
+    # Files
+
+    def _refresh(self) -> None:
+        if not self._loaded or _stat(self.path) != self._base_stat:
+            self._load()
+            return
+        log_stat = _stat(self.log_path)
+        log_ino = log_stat[0] if log_stat is not None else None
+        if log_ino != self._log_ino:
+            self._load()
+            return
+        if log_stat is None:
+            return
+        size = log_stat[1]
+        if size < self._log_offset:
+            self._load()
+        elif size > self._log_offset and self._log_ok:
+            self._tail()
+
+    def _load(self) -> None:
+        self._close_fd()
+        self._base_stat = _stat(self.path)
+        try:
+            raw = self.path.read_bytes()
+        except FileNotFoundError:
+            raw = b""
+        self._base_hash = hashlib.sha256(raw).hexdigest()
+        self._clear()
+        self._log_ok = False
+        self._log_ino = None
+        self._log_offset = 0
+        self._log_ops = 0
+        self._loaded = True
+        try:
+            handle = self.log_path.open("rb")
+        except FileNotFoundError:
+            self._load_base(raw, trusted=False)
+            return
+        with handle:
+            st = os.fstat(handle.fileno())
+            self._log_ino = st.st_ino
+            self._log_offset = st.st_size
+            header_line = handle.readline()
+            try:
+                header = json.loads(header_line) if header_line.endswith(b"\n") else None
+            except ValueError:
+                header = None
+            matches = (
+                isinstance(header, Mapping)
+                and header.get("log_store") == LOG_FORMAT_VERSION
+                and header.get("base") == self._base_hash
+            )
+            self._load_base(raw, trusted=matches)
+            if matches:
+                self._log_ok = True
+                self._log_offset = len(header_line)
+                self._tail(handle)
+            elif st.st_size:
+                LOGGER.info(f"{self._name}.stale_log_ignored", extra={"path": str(self.log_path)})
+
+    def _load_base(self, raw: bytes, *, trusted: bool) -> None:
+        if trusted and raw.startswith(b"[\n") and raw.endswith(b"\n]\n"):
+            # Written by ``compact`` (the log header carries its hash): one
+            # encoded row per line, so the rows are reused without re-encoding.
+            lines = raw[2:-3].decode("utf-8").split("\n")
+            self._rows = [line[:-1] for line in lines[:-1]] + lines[-1:]
+            self._reindex()
+            return
+        payload: Any = []
+        if raw.strip():
+            try:
+                payload = json.loads(raw)
+            except ValueError as exc:
+                LOGGER.error(
+                    f"{self._name}.invalid_json", extra={"path": str(self.path)}, exc_info=exc
+                )
+        for row in payload if isinstance(payload, list) else []:
+            record = _normalise(row)
+            if record is not None:
+                self._add(_encode(record), record, None)
+
+    def _tail(self, handle: Any = None) -> None:
+        if handle is None:
+            with self.log_path.open("rb") as fresh:
+                self._tail(fresh)
+            return
+        handle.seek(self._log_offset)
+        for line in handle:
+            if not line.endswith(b"\n"):
+                break  # torn append; cut off before the next write
+            try:
+                self._apply(json.loads(line))
+            except (ValueError, KeyError, TypeError, IndexError) as exc:
+                LOGGER.error(
+                    f"{self._name}.log_corrupt",
+                    extra={"path": str(self.log_path), "offset": self._log_offset},
+                    exc_info=exc,
+                )
+                break
+            self._log_offset += len(line)
+
+    def _start_log(self) -> None:
+        self._close_fd()
+        header = json.dumps({"base": self._base_hash, "log_store": LOG_FORMAT_VERSION}) + "\n"
+        data = header.encode("utf-8")
+        _atomic_write(self.log_path, data)
+        log_stat = _stat(self.log_path)
+        self._log_ino = log_stat[0] if log_stat is not None else None
+        self._log_offset = len(data)
+        self._log_ok = True
+        self._log_ops = 0
+
+    def _writer(self) -> int:
+        if self._fd is not None:
+            return self._fd
+        if not self._log_ok:
+            self._start_log()
+        self._fd = os.open(self.log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        return self._fd
+
+    def _cut_tail(self) -> None:
+        # Only called under ``_locked``: nothing past ``_log_offset`` can be an
+        # append still in flight.
+        log_stat = _stat(self.log_path)
+        if log_stat is None or log_stat[1] <= self._log_offset:
+            return
+        with self.log_path.open("rb") as handle:
+            handle.seek(self._log_offset)
+            rest = handle.read()
+        end = rest.find(b"\n")
+        if 0 <= end < len(rest) - 1:
+            raise OSError(
+                f"{self.log_path}: corrupt record at offset {self._log_offset} "
+                "with data behind it; refusing to append"
+            )
+        os.truncate(self.log_path, self._log_offset)
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold the exclusive ``flock`` that serialises writers across processes."""
+
+        if self._lock_fd is None:
+            self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+            self._lock_fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        fcntl.flock(self._lock_fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+
+    def _close_fd(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def _commit(self, entries: List[Tuple[str, Callable[[], None]]]) -> None:
+        data = "".join(line for line, _ in entries).encode("utf-8")
+        fd = self._writer()
+        self._cut_tail()
+        written = os.write(fd, data)
+        if written != len(data):
+            raise OSError(f"short write to {self.log_path}")
+        if self._fsync:
+            os.fsync(fd)
+        end = os.lseek(fd, 0, os.SEEK_CUR)
+        if end == self._log_offset + len(data):
+            self._log_offset = end
+            for _, apply in entries:
+                apply()
+                self._log_ops += 1
+        else:
+            # Another process appended too; replay the log in file order.
+            self._tail()
+        if self._log_ops >= max(self._compact_min, len(self._rows) - self._head):
+            try:
+                self._compact()
+            except OSError as exc:
+                LOGGER.error(
+                    f"{self._name}.compaction_failed", extra={"path": str(self.path)}, exc_info=exc
+                )
+
+
+_STORES: "OrderedDict[str, LogStore]" = OrderedDict()
+_STORES_LOCK = threading.Lock()
+
+
+def open_store(path: str | Path, **options: Any) -> LogStore:
+    """Return the process-wide :class:`LogStore` for ``path``.
+
+    ``options`` apply when the store is first opened. The least recently used
+    stores beyond a small bound are closed; reopening one reloads it from disk.
+    """
+
+    key = os.path.abspath(path)
+    with _STORES_LOCK:
+        store = _STORES.get(key)
+        if store is None:
+            store = LogStore(path, **options)
+            _STORES[key] = store
+            while len(_STORES) > _MAX_OPEN_STORES:
+                _, evicted = _STORES.popitem(last=False)
+                evicted.close()
+        else:
+            _STORES.move_to_end(key)
+    return store
+
+
+__all__ = ["DEFAULT_COMPACT_MIN", "LogStore", "open_store"]
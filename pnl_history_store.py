@@ -1,13 +1,18 @@
-"""Persistence layer for rolling PnL and exposure snapshots."""
+"""Persistence layer for rolling PnL and exposure snapshots.
+
+Snapshots live in a :class:`log_store.LogStore` at ``PNL_HISTORY_PATH``, so
+appends and ``list_recent`` do not reread or rewrite the whole history.
+"""
 
 from __future__ import annotations
 
-import json
 import logging
 import os
 import threading
 from pathlib import Path
-from typing import Any, Iterable, List, Mapping
+from typing import Any, Callable, List, Mapping
+
+from log_store import LogStore, open_store
 
 
 _STORE_ENV = "PNL_HISTORY_PATH"
@@ -31,61 +36,8 @@ def get_store_path() -> Path:
     return _store_path()
 
 
-def _ensure_parent(path: Path) -> None:
-    try:
-        path.parent.mkdir(parents=True, exist_ok=True)
-    except OSError as exc:
-        LOGGER.error(
-            "pnl_history.parent_mkdir_failed",
-            extra={"path": str(path.parent)},
-            exc_info=exc,
-        )
-
-
-def _load_entries(path: Path) -> List[dict[str, Any]]:
-    if not path.exists():
-        return []
-    try:
-        raw = path.read_text(encoding="utf-8")
-    except OSError as exc:
-        LOGGER.warning(
-            "pnl_history.read_failed",
-            extra={"path": str(path)},
-            exc_info=exc,
-        )
-        return []
-    if not raw.strip():
-        return []
-    try:
-        payload = json.loads(raw)
-    except json.JSONDecodeError as exc:
-        LOGGER.error(
-            "pnl_history.invalid_json",
-            extra={"path": str(path)},
-            exc_info=exc,
-        )
-        return []
-    if not isinstance(payload, list):
-        return []
-    entries: List[dict[str, Any]] = []
-    for row in payload:
-        if isinstance(row, Mapping):
-            entries.append({str(key): value for key, value in row.items()})
-    return entries
-
-
-def _write_entries(path: Path, entries: Iterable[Mapping[str, Any]]) -> None:
-    snapshot = [dict(row) for row in entries]
-    _ensure_parent(path)
-    try:
-        with path.open("w", encoding="utf-8") as handle:
-            json.dump(snapshot, handle, indent=2, sort_keys=True)
-    except OSError as exc:
-        LOGGER.error(
-            "pnl_history.write_failed",
-            extra={"path": str(path)},
-            exc_info=exc,
-        )
+def _store(path: Path) -> LogStore:
+    return open_store(path, name="pnl_history")
 
 
 def append_snapshot(
@@ -96,39 +48,61 @@ def append_snapshot(
     payload = dict(snapshot)
     path = _store_path()
     with _LOCK:
-        entries = _load_entries(path)
-        entries.append(payload)
-        if max_entries is not None and max_entries > 0:
-            entries = entries[-max_entries:]
-        _write_entries(path, entries)
+        try:
+            _store(path).append(payload, keep=max_entries)
+        except OSError as exc:
+            LOGGER.error(
+                "pnl_history.write_failed",
+                extra={"path": str(path)},
+                exc_info=exc,
+            )
     return payload
 
 
 def list_snapshots() -> List[dict[str, Any]]:
     """Return all persisted snapshots ordered from oldest to newest."""
 
-    path = _store_path()
-    with _LOCK:
-        entries = _load_entries(path)
-    return [dict(entry) for entry in entries]
+    return _read(lambda store: store.records())
 
 
 def list_recent(limit: int | None = None) -> List[dict[str, Any]]:
     """Return the ``limit`` most recent snapshots (newest first)."""
 
-    entries = list_snapshots()
     if limit is not None and limit > 0:
-        entries = entries[-limit:]
+        entries = _read(lambda store: store.recent(limit))
+    else:
+        entries = list_snapshots()
     entries.reverse()
     return entries
 
 
+def _read(query: Callable[[LogStore], List[dict[str, Any]]]) -> List[dict[str, Any]]:
+    path = _store_path()
+    with _LOCK:
+        try:
+            return query(_store(path))
+        except OSError as exc:
+            LOGGER.warning(
+                "pnl_history.read_failed",
+                extra={"path": str(path)},
+                exc_info=exc,
+            )
+            return []
+
+
 def reset_store() -> None:
     """Clear the history store (used in tests)."""
 
     path = _store_path()
     with _LOCK:
-        _write_entries(path, [])
+        try:
+            _store(path).reset()
+        except OSError as exc:
+            LOGGER.error(
+                "pnl_history.write_failed",
+                extra={"path": str(path)},
+                exc_info=exc,
+            )
 
 
 __all__ = [
@@ -1,8 +1,11 @@
-"""Durable storage for cross-exchange hedge positions."""
+"""Durable storage for cross-exchange hedge positions.
+
+Records live in a :class:`log_store.LogStore` indexed by position ``id``: an
+append or update writes one log line instead of rewriting every position.
+"""
 
 from __future__ import annotations
 
-import json
 import logging
 import os
 import threading
@@ -11,6 +14,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Mapping, MutableMapping
 
+from log_store import LogStore, open_store
+
 
 _STORE_ENV = "POSITIONS_STORE_PATH"
 _DEFAULT_PATH = Path("data/hedge_positions.json")
@@ -37,61 +42,16 @@ def get_store_path() -> Path:
     return _store_path()
 
 
-def _ensure_parent(path: Path) -> None:
-    try:
-        path.parent.mkdir(parents=True, exist_ok=True)
-    except OSError as exc:
-        LOGGER.error(
-            "positions_store.parent_mkdir_failed",
-            extra={"path": str(path.parent)},
-            exc_info=exc,
-        )
+def _store(path: Path) -> LogStore:
+    return open_store(path, name="positions_store", index_key="id")
 
 
-def _load_entries(path: Path) -> List[Dict[str, Any]]:
-    if not path.exists():
-        return []
-    try:
-        raw = path.read_text(encoding="utf-8")
-    except OSError as exc:
-        LOGGER.warning(
-            "positions_store.read_failed",
-            extra={"path": str(path)},
-            exc_info=exc,
-        )
-        return []
-    if not raw.strip():
-        return []
-    try:
-        payload = json.loads(raw)
-    except json.JSONDecodeError as exc:
-        LOGGER.error(
-            "positions_store.invalid_json",
-            extra={"path": str(path)},
-            exc_info=exc,
-        )
-        return []
-    if not isinstance(payload, list):
-        return []
-    entries: List[Dict[str, Any]] = []
-    for row in payload:
-        if isinstance(row, Mapping):
-            entries.append({str(key): value for key, value in row.items()})
-    return entries
-
-
-def _write_entries(path: Path, entries: Iterable[Mapping[str, Any]]) -> None:
-    snapshot = [dict(row) for row in entries]
-    _ensure_parent(path)
-    try:
-        with path.open("w", encoding="utf-8") as handle:
-            json.dump(snapshot, handle, indent=2, sort_keys=True)
-    except OSError as exc:
-        LOGGER.error(
-            "positions_store.write_failed",
-            extra={"path": str(path)},
-            exc_info=exc,
-        )
+def _log_write_failure(path: Path, exc: OSError) -> None:
+    LOGGER.error(
+        "positions_store.write_failed",
+        extra={"path": str(path)},
+        exc_info=exc,
+    )
 
 
 def list_records() -> List[Dict[str, Any]]:
@@ -99,8 +59,15 @@ def list_records() -> List[Dict[str, Any]]:
 
     path = _store_path()
     with _LOCK:
-        entries = _load_entries(path)
-    return [dict(entry) for entry in entries]
+        try:
+            return _store(path).records()
+        except OSError as exc:
+            LOGGER.warning(
+                "positions_store.read_failed",
+                extra={"path": str(path)},
+                exc_info=exc,
+            )
+            return []
 
 
 def _normalise_leg(
@@ -299,9 +266,10 @@ def append_record(payload: Mapping[str, Any]) -> Dict[str, Any]:
     path = _store_path()
     record = _prepare_record(payload)
     with _LOCK:
-        entries = _load_entries(path)
-        entries.append(record)
-        _write_entries(path, entries)
+        try:
+            _store(path).append(record)
+        except OSError as exc:
+            _log_write_failure(path, exc)
     return dict(record)
 
 
@@ -317,10 +285,11 @@ def update_record(
     updates_dict = {str(key): value for key, value in updates.items()}
     legs_payload = legs_override if legs_override is not None else updates_dict.pop("legs", None)
     with _LOCK:
-        entries = _load_entries(path)
-        target = _locate_entry(entries, position_id)
-        if target is None:
+        store = _store(path)
+        index = store.locate(position_id)
+        if index is None:
             raise KeyError(f"position {position_id} not found")
+        target = store.get(index)
         for key, value in updates_dict.items():
             if key == "rebalancer" and isinstance(value, Mapping):
                 existing = target.get("rebalancer")
@@ -404,17 +373,15 @@ def update_record(
                     elif raw_payload is not None:
                         new_leg["raw"] = raw_payload
                     legs_list[idx] = new_leg
-        _write_entries(path, entries)
+        _save(store, index, target)
         return {str(key): value for key, value in target.items()}
 
 
-def _locate_entry(
-    entries: List[MutableMapping[str, Any]], position_id: str
-) -> MutableMapping[str, Any] | None:
-    for entry in entries:
-        if str(entry.get("id")) == str(position_id):
-            return entry
-    return None
+def _save(store: LogStore, index: int, record: Mapping[str, Any]) -> None:
+    try:
+        store.set(index, record)
+    except OSError as exc:
+        _log_write_failure(store.path, exc)
 
 
 def mark_closed(
@@ -427,10 +394,11 @@ def mark_closed(
 
     path = _store_path()
     with _LOCK:
-        entries = _load_entries(path)
-        target = _locate_entry(entries, position_id)
-        if target is None:
+        store = _store(path)
+        index = store.locate(position_id)
+        if index is None:
             raise KeyError(f"position {position_id} not found")
+        target = store.get(index)
         if str(target.get("status")) == "closed":
             return dict(target)
         long_leg, short_leg = target.get("legs", [None, None])[:2]
@@ -470,7 +438,7 @@ def mark_closed(
                     "closed_ts": target["closed_ts"],
                 }
             )
-        _write_entries(path, entries)
+        _save(store, index, target)
         return dict(target)
 
 
@@ -479,7 +447,10 @@ def reset_store() -> None:
 
     path = _store_path()
     with _LOCK:
-        _write_entries(path, [])
+        try:
+            _store(path).reset()
+        except OSError as exc:
+            _log_write_failure(path, exc)
 
 
 __all__ = [
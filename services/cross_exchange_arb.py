@@ -5,9 +5,11 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import partial
 from typing import Any, Dict, Mapping, Tuple
 
 from app.services.hedge_log import append_entry
+from app.services.quotes import gather_quotes, max_skew_ms
 from app.services.runtime import (
     HoldActiveError,
     engage_safety_hold,
@@ -323,8 +325,15 @@ def check_spread(symbol: str) -> dict:
     """Inspect quotes from both exchanges and compute the actionable spread."""
 
     symbol_upper = str(symbol).upper()
-    binance_mark = _clients.binance.get_mark_price(symbol_upper)
-    okx_mark = _clients.okx.get_mark_price(symbol_upper)
+    quotes = gather_quotes(
+        {
+            "binance": partial(_clients.binance.get_mark_price, symbol_upper),
+            "okx": partial(_clients.okx.get_mark_price, symbol_upper),
+        }
+    )
+    quotes.raise_for_failures()
+    binance_mark = quotes.quote("binance")
+    okx_mark = quotes.quote("okx")
 
     binance_price = float(binance_mark.get("mark_price") or 0.0)
     okx_price = float(okx_mark.get("mark_price") or 0.0)
@@ -351,6 +360,8 @@ def check_spread(symbol: str) -> dict:
         "okx_mark_price": okx_price,
         "spread": spread,
         "spread_bps": float(spread_bps),
+        "quote_ts": quotes.timestamps(),
+        "quote_skew_ms": quotes.skew_ms(),
     }
 
 
@@ -550,6 +561,18 @@ def execute_hedged_trade(
                 "details": spread_info,
             }
 
+        skew_limit = max_skew_ms()
+        if skew_limit > 0 and _coerce_float(spread_info.get("quote_skew_ms")) > skew_limit:
+            _record_failure("quote_skew_exceeded")
+            return {
+                "symbol": spread_info["symbol"],
+                "min_spread": float(min_spread),
+                "spread": spread_value,
+                "success": False,
+                "reason": "quote_skew_exceeded",
+                "details": spread_info,
+            }
+
         notional = float(notion_usdt)
         leverage_value = float(leverage)
         cheap_price = _coerce_float(spread_info.get("cheap_mark"))
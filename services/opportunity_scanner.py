@@ -8,14 +8,17 @@ import os
 import time
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Dict
+from typing import Any, Callable, Dict, List, Mapping, Sequence, Tuple
 
 from fastapi import FastAPI
 
+from app.services.market_ws import get_orderbook_store
 from app.services.runtime import get_state, set_last_opportunity_state
 from app.telemetry import observe_core_latency, set_scanner_ok
+from app.universe_manager import UniverseManager
 from services.cross_exchange_arb import check_spread
 from services.risk_manager import can_open_new_position
+from services.universe_scanner import ScanVenue, load_quote_matrix, rank_edges
 
 STRATEGY_NAME = "cross_exchange_arb"
 
@@ -42,11 +45,43 @@ def _env_leverage() -> float:
         return 1.0
 
 
+def _env_mode() -> str:
+    raw = (os.getenv("SCAN_MODE") or "single").strip().lower()
+    return raw if raw in {"single", "universe"} else "single"
+
+
+def _env_universe_venues() -> List[str]:
+    raw = os.getenv("SCAN_UNIVERSE_VENUES") or "binance,okx,bybit"
+    return [token.strip().lower() for token in raw.split(",") if token.strip()]
+
+
+def _env_top_n() -> int:
+    raw = os.getenv("SCAN_TOP_N")
+    if raw is None:
+        return 20
+    try:
+        return max(int(raw), 1)
+    except ValueError:
+        return 20
+
+
+FundingProvider = Callable[[], Mapping[Tuple[str, str], float]]
+
+
 class OpportunityScanner:
-    def __init__(self, interval: float | None = None) -> None:
+    def __init__(
+        self,
+        interval: float | None = None,
+        *,
+        mode: str | None = None,
+        funding_provider: FundingProvider | None = None,
+    ) -> None:
         self.interval = interval or _env_interval()
+        self.mode = (mode or _env_mode()).lower()
+        self._funding_provider = funding_provider
         self._task: asyncio.Task[None] | None = None
         self._stop = asyncio.Event()
+        self.last_candidates: List[Dict[str, Any]] = []
 
     async def start(self) -> None:
         if self._task and not self._task.done():
@@ -75,6 +110,8 @@ class OpportunityScanner:
                 continue
 
     async def scan_once(self) -> Dict[str, Any]:
+        if self.mode == "universe":
+            return await self.scan_universe_once()
         start = time.perf_counter()
         failure = False
         try:
@@ -124,6 +161,93 @@ class OpportunityScanner:
             observe_core_latency("scan", duration_ms, error=failure)
             set_scanner_ok(not failure)
 
+    def _universe_symbols(self, state: Any) -> List[str]:
+        symbols = sorted(UniverseManager().allowed_pairs())
+        if symbols:
+            return symbols
+        loop_pair = getattr(state.control, "loop_pair", None) or getattr(
+            state.loop_config, "pair", None
+        )
+        return [(loop_pair or "BTCUSDT").upper()]
+
+    @staticmethod
+    def _universe_venues(control: Any) -> List[ScanVenue]:
+        venues: List[ScanVenue] = []
+        for name in _env_universe_venues():
+            fee = getattr(control, f"taker_fee_bps_{name}", 2)
+            try:
+                fee_bps = float(fee)
+            except (TypeError, ValueError):
+                fee_bps = 2.0
+            venues.append(ScanVenue(name=name, taker_fee_bps=fee_bps))
+        return venues
+
+    def rank_universe(
+        self, symbols: Sequence[str], venues: Sequence[ScanVenue]
+    ) -> List[Dict[str, Any]]:
+        """Rank every symbol across every venue pair from the in-memory books."""
+
+        funding = self._funding_provider() if self._funding_provider else None
+        matrix = load_quote_matrix(get_orderbook_store(), symbols, venues, funding_rates=funding)
+        return rank_edges(
+            matrix,
+            funding_horizon=1.0 if funding else 0.0,
+            min_edge_bps=float("-inf"),
+            top_n=_env_top_n(),
+        )
+
+    async def scan_universe_once(self) -> Dict[str, Any]:
+        """Scan all allowed pairs across all venue pairs and publish a ranked list."""
+
+        start = time.perf_counter()
+        failure = False
+        try:
+            state = get_state()
+            control = state.control
+            ranked = self.rank_universe(
+                self._universe_symbols(state), self._universe_venues(control)
+            )
+            ts = datetime.now(timezone.utc).isoformat()
+            candidates: List[Dict[str, Any]] = []
+            for entry in ranked:
+                candidate: Dict[str, Any] = dict(entry)
+                candidate.update(
+                    {
+                        "id": uuid.uuid4().hex,
+                        "ts": ts,
+                        "notional_suggestion": float(control.order_notional_usdt),
+                        "leverage_suggestion": _env_leverage(),
+                        "min_spread": float(entry["spread"]),
+                    }
+                )
+                candidates.append(candidate)
+            self.last_candidates = candidates
+            best = candidates[0] if candidates else None
+            status = "allowed"
+            if best is None or float(best["edge_bps"]) <= 0:
+                status = "blocked_by_risk"
+            else:
+                allowed, reason = can_open_new_position(
+                    float(best["notional_suggestion"]),
+                    float(best["leverage_suggestion"]),
+                    strategy=STRATEGY_NAME,
+                    requested_positions=1,
+                )
+                if not allowed:
+                    best["blocked_reason"] = reason
+                    status = "blocked_by_risk"
+            published = best if best is not None and float(best["edge_bps"]) > 0 else None
+            set_last_opportunity_state(published, status, candidates=candidates)
+            return {"candidate": best, "candidates": candidates, "status": status}
+        except Exception as exc:
+            failure = True
+            logger.exception("universe scan failed", extra={"error": str(exc)})
+            raise
+        finally:
+            duration_ms = (time.perf_counter() - start) * 1000.0
+            observe_core_latency("scan", duration_ms, error=failure)
+            set_scanner_ok(not failure)
+
 
 _scanner = OpportunityScanner()
 
@@ -0,0 +1,152 @@
+"""Column-oriented cross-venue edge scan over the whole trading universe."""
+
+from __future__ import annotations
+
+import heapq
+import math
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Sequence, Tuple
+
+from app.market.orderbook.book_store import OrderBookStore
+
+
+@dataclass(frozen=True, slots=True)
+class ScanVenue:
+    """Venue taking part in a universe scan."""
+
+    name: str
+    taker_fee_bps: float
+    book_venue: str | None = None
+
+    @property
+    def store_key(self) -> str:
+        return self.book_venue or self.name
+
+
+@dataclass(slots=True)
+class QuoteMatrix:
+    """Best bid/ask/funding laid out as one column per venue, one row per symbol."""
+
+    symbols: List[str]
+    venues: List[ScanVenue]
+    bids: List[List[float]]
+    asks: List[List[float]]
+    funding: List[List[float]]
+
+
+def book_symbol(venue: str, symbol: str) -> str:
+    """Map a canonical ``BTCUSDT`` symbol to the order book key used by ``venue``."""
+
+    upper = symbol.upper()
+    if venue.lower().startswith("okx") and upper.endswith("USDT") and "-" not in upper:
+        return f"{upper[:-4]}-USDT-SWAP"
+    return upper
+
+
+def load_quote_matrix(
+    store: OrderBookStore,
+    symbols: Sequence[str],
+    venues: Sequence[ScanVenue],
+    *,
+    funding_rates: Mapping[Tuple[str, str], float] | None = None,
+) -> QuoteMatrix:
+    """Read top-of-book for every (venue, symbol) from the in-memory book store.
+
+    Missing quotes are stored as ``0.0`` so the edge pass can skip them with a
+    single comparison instead of ``None`` checks.
+    """
+
+    rates = funding_rates or {}
+    bids: List[List[float]] = []
+    asks: List[List[float]] = []
+    funding: List[List[float]] = []
+    for venue in venues:
+        key = venue.store_key
+        venue_bids: List[float] = []
+        venue_asks: List[float] = []
+        venue_funding: List[float] = []
+        for symbol in symbols:
+            top = store.get_top_snapshot(key, book_symbol(key, symbol))
+            venue_bids.append(top.bid or 0.0)
+            venue_asks.append(top.ask or 0.0)
+            venue_funding.append(float(rates.get((venue.name, symbol), 0.0)))
+        bids.append(venue_bids)
+        asks.append(venue_asks)
+        funding.append(venue_funding)
+    return QuoteMatrix(
+        symbols=list(symbols), venues=list(venues), bids=bids, asks=asks, funding=funding
+    )
+
+
+def rank_edges(
+    matrix: QuoteMatrix,
+    *,
+    funding_horizon: float = 0.0,
+    min_edge_bps: float = 0.0,
+    top_n: int = 20,
+) -> List[Dict[str, object]]:
+    """Rank long/short venue combinations by fee- and funding-adjusted edge.
+
+    For every ordered venue pair the edge of buying at the long venue's ask and
+    selling at the short venue's bid is computed for all symbols in one pass
+    over the two columns. Funding is credited to the short leg and charged to
+    the long leg over ``funding_horizon`` funding intervals. Pairs without a
+    quote on either side (zero-filled ask or bid) never rank, whatever
+    ``min_edge_bps`` is.
+    """
+
+    symbols = matrix.symbols
+    funding_scale = 10_000.0 * funding_horizon
+    scored: List[Tuple[float, int, int, int]] = []
+    venue_count = len(matrix.venues)
+    for long_idx in range(venue_count):
+        long_asks = matrix.asks[long_idx]
+        long_funding = matrix.funding[long_idx]
+        long_fee = matrix.venues[long_idx].taker_fee_bps
+        for short_idx in range(venue_count):
+            if short_idx == long_idx:
+                continue
+            short_bids = matrix.bids[short_idx]
+            short_funding = matrix.funding[short_idx]
+            fees = long_fee + matrix.venues[short_idx].taker_fee_bps
+            edges = [
+                (
+                    (bid - ask) / ask * 10_000.0 - fees + (f_short - f_long) * funding_scale
+                    if ask > 0.0 and bid > 0.0
+                    else float("-inf")
+                )
+                for ask, bid, f_long, f_short in zip(
+                    long_asks, short_bids, long_funding, short_funding
+                )
+            ]
+            scored.extend(
+                (edge, row, long_idx, short_idx)
+                for row, edge in enumerate(edges)
+                if math.isfinite(edge) and edge >= min_edge_bps
+            )
+    best = heapq.nlargest(max(int(top_n), 0), scored)
+    ranked: List[Dict[str, object]] = []
+    for edge, row, long_idx, short_idx in best:
+        long_venue = matrix.venues[long_idx]
+        short_venue = matrix.venues[short_idx]
+        ask = matrix.asks[long_idx][row]
+        bid = matrix.bids[short_idx][row]
+        ranked.append(
+            {
+                "symbol": symbols[row],
+                "long_venue": long_venue.name,
+                "short_venue": short_venue.name,
+                "long_ask": ask,
+                "short_bid": bid,
+                "spread": bid - ask,
+                "spread_bps": (bid - ask) / ask * 10_000.0 if ask > 0.0 else 0.0,
+                "fees_bps": long_venue.taker_fee_bps + short_venue.taker_fee_bps,
+                "funding_bps": (matrix.funding[short_idx][row] - matrix.funding[long_idx][row])
+                * funding_scale,
+                "edge_bps": edge,
+            }
+        )
+    return ranked
+
+
+__all__ = ["QuoteMatrix", "ScanVenue", "book_symbol", "load_quote_matrix", "rank_edges"]
@@ -50,7 +50,7 @@ class _FrozenClock:
 
 
 @pytest.fixture()
-def isolate_env(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+def isolate_env(monkeypatch: pytest.MonkeyPatch, tmp_path: Path, settings_env) -> Path:
     """Isolate environment variables and block outbound network calls."""
 
     for key in list(os.environ.keys()):
@@ -58,7 +58,7 @@ def isolate_env(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
 
     metrics_path = tmp_path / "metrics.prom"
     monkeypatch.setenv("METRICS_PATH", str(metrics_path))
-    monkeypatch.setenv("FF_MD_WATCHDOG", "0")
+    settings_env.setenv("FF_MD_WATCHDOG", "0")
     monkeypatch.setenv("FF_ORDER_TIMEOUTS", "0")
 
     monkeypatch.setattr(httpx, "Client", _NoNetworkClient)
@@ -110,8 +110,9 @@ def test_stale_p95_gate_blocks(
     make_intent,
     frozen_time,
     monkeypatch: pytest.MonkeyPatch,
+    settings_env,
 ) -> None:
-    monkeypatch.setenv("FF_MD_WATCHDOG", "1")
+    settings_env.setenv("FF_MD_WATCHDOG", "1")
     monkeypatch.setenv("STALE_P95_LIMIT_MS", "100")
 
     venue = "binance"
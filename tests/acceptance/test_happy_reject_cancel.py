@@ -21,9 +21,10 @@ def test_happy_fill_matches_golden(
     run_router_flow,
     make_intent,
     monkeypatch: pytest.MonkeyPatch,
+    settings_env,
 ) -> None:
-    monkeypatch.setenv("FF_PRETRADE_STRICT", "1")
-    monkeypatch.setenv("FF_RISK_LIMITS", "0")
+    settings_env.setenv("FF_PRETRADE_STRICT", "1")
+    settings_env.setenv("FF_RISK_LIMITS", "0")
     monkeypatch.setenv("SAFE_MODE", "0")
 
     intent = make_intent(qty=Decimal("2"), price=Decimal("25000"))
@@ -47,9 +48,10 @@ def test_reject_matches_golden(
     run_router_flow,
     make_intent,
     monkeypatch: pytest.MonkeyPatch,
+    settings_env,
 ) -> None:
-    monkeypatch.setenv("FF_PRETRADE_STRICT", "1")
-    monkeypatch.setenv("FF_RISK_LIMITS", "0")
+    settings_env.setenv("FF_PRETRADE_STRICT", "1")
+    settings_env.setenv("FF_RISK_LIMITS", "0")
 
     intent = make_intent(side="sell", qty=Decimal("1"))
     result: RouterFlowResult = run_router_flow(intent, events=["REJECTED"])
@@ -65,9 +67,10 @@ def test_cancel_matches_golden(
     run_router_flow,
     make_intent,
     monkeypatch: pytest.MonkeyPatch,
+    settings_env,
 ) -> None:
-    monkeypatch.setenv("FF_PRETRADE_STRICT", "1")
-    monkeypatch.setenv("FF_RISK_LIMITS", "0")
+    settings_env.setenv("FF_PRETRADE_STRICT", "1")
+    settings_env.setenv("FF_RISK_LIMITS", "0")
 
     intent = make_intent(side="buy", qty=Decimal("1.5"))
     result: RouterFlowResult = run_router_flow(intent, events=["ACK", "CANCELED"])
@@ -20,6 +20,34 @@ os.environ.setdefault("DAILY_REPORTS_PATH", "/tmp/propbot-tests-daily.json")
 os.environ.setdefault("CAPITAL_STATE_PATH", "/tmp/propbot-tests-capital.json")
 
 
+class _SettingsEnv:
+    """``setenv``/``delenv`` for settings-backed variables, followed by a reload."""
+
+    def __init__(self, patch: pytest.MonkeyPatch) -> None:
+        self._patch = patch
+
+    def setenv(self, name: str, value: str) -> None:
+        self._patch.setenv(name, value)
+        reload_runtime_settings()
+
+    def delenv(self, name: str, raising: bool = True) -> None:
+        self._patch.delenv(name, raising=raising)
+        reload_runtime_settings()
+
+
+@pytest.fixture
+def settings_env():
+    """Edit variables compiled into ``RuntimeSettings`` and reload the snapshot.
+
+    Settings only change on startup or an explicit reload, so a plain
+    ``monkeypatch.setenv`` of such a variable is not seen by the code under test.
+    """
+
+    with pytest.MonkeyPatch.context() as patch:
+        yield _SettingsEnv(patch)
+    reload_runtime_settings()
+
+
 @pytest.fixture(autouse=True)
 def enable_feature_flags(monkeypatch):
     """Ensure critical feature flags are enabled during tests."""
@@ -32,6 +60,8 @@ def enable_feature_flags(monkeypatch):
     previous: dict[str, str | None] = {key: os.environ.get(key) for key in flags}
     for key, value in flags.items():
         monkeypatch.setenv(key, value)
+    # Each test starts from a snapshot of its own environment.
+    reload_runtime_settings()
     try:
         yield
     finally:
@@ -43,6 +73,7 @@ def enable_feature_flags(monkeypatch):
 
 
 from app import ledger
+from app.config.runtime_settings import reload_runtime_settings
 from app.main import app
 from app.runtime import leader_lock
 from app.services import runtime, approvals_store
@@ -52,6 +83,8 @@ from positions import reset_positions
 from pnl_history_store import reset_store as reset_pnl_history_store
 from app.capital_manager import CapitalManager, reset_capital_manager
 from app.strategy.pnl_tracker import reset_strategy_pnl_tracker_for_tests
+from app.services.post_trade import reset_post_trade_refresher
+from app.risk.exposure_caps import reset_exposure_index_for_tests
 
 
 @pytest.fixture
@@ -163,6 +196,20 @@ def reset_strategy_pnl_tracker():
     reset_strategy_pnl_tracker_for_tests()
 
 
+@pytest.fixture(autouse=True)
+def reset_post_trade():
+    reset_post_trade_refresher()
+    yield
+    reset_post_trade_refresher()
+
+
+@pytest.fixture(autouse=True)
+def reset_exposure_index():
+    reset_exposure_index_for_tests()
+    yield
+    reset_exposure_index_for_tests()
+
+
 @pytest.fixture(autouse=True)
 def reset_leader_lock(monkeypatch, tmp_path: Path):
     path = tmp_path / "leader.lock"
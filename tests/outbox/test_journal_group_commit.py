@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import json
+import threading
+from decimal import Decimal
+
+import pytest
+
+from app.outbox.journal import OutboxJournal
+
+
+def _pending(journal: OutboxJournal, idx: int) -> None:
+    journal.begin_pending(
+        intent_key=f"intent-{idx}",
+        order_id=f"order-{idx}",
+        strategy="alpha",
+        symbol="BTCUSDT",
+        venue="binance",
+        side="buy",
+        qty=Decimal("0.1"),
+        px=Decimal("100"),
+    )
+
+
+def test_concurrent_appends_share_fsyncs(tmp_path) -> None:
+    path = tmp_path / "outbox.jsonl"
+    journal = OutboxJournal(str(path), group_commit=True, commit_window_ms=2)
+    barrier = threading.Barrier(8)
+
+    def worker(base: int) -> None:
+        barrier.wait()
+        for idx in range(base, base + 25):
+            _pending(journal, idx)
+
+    threads = [threading.Thread(target=worker, args=(n * 100,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert journal.fsyncs < 200
+    reloaded = OutboxJournal(str(path))
+    assert all(reloaded.status_by_order(f"order-{n * 100 + 24}") == "PENDING" for n in range(8))
+    assert sum(1 for _ in path.open(encoding="utf-8")) == 200
+
+
+def test_startup_replays_only_the_tail_after_checkpoint(tmp_path, monkeypatch) -> None:
+    path = tmp_path / "outbox.jsonl"
+    journal = OutboxJournal(str(path), group_commit=True, checkpoint_every=10)
+    for idx in range(25):
+        _pending(journal, idx)
+    journal.mark_acked("order-3", "exch-3")
+    journal.mark_final("order-24", reason="filled")
+
+    monkeypatch.setattr(
+        OutboxJournal, "_iter_file", lambda self: pytest.fail("full replay on startup")
+    )
+    replayed: list[str] = []
+    original = OutboxJournal._read_one
+
+    def tracking_read(self, target, offset=0):
+        for record in original(self, target, offset):
+            replayed.append(record.order_id)
+            yield record
+
+    monkeypatch.setattr(OutboxJournal, "_read_one", tracking_read)
+    reloaded = OutboxJournal(str(path), checkpoint_every=10)
+
+    # 27 appends with a checkpoint every 10: only the last 7 are replayed.
+    assert replayed == [f"order-{idx}" for idx in range(20, 25)] + ["order-3", "order-24"]
+    assert reloaded.status_by_order("order-3") == "ACKED"
+    assert reloaded.status_by_order("order-24") == "FINAL"
+    assert reloaded.last_by_intent("intent-7")[1:] == ("PENDING", "order-7")
+
+
+def test_stale_checkpoint_falls_back_to_full_replay(tmp_path) -> None:
+    path = tmp_path / "outbox.jsonl"
+    journal = OutboxJournal(str(path), checkpoint_every=5)
+    for idx in range(12):
+        _pending(journal, idx)
+    journal.close()
+
+    lines = path.read_text(encoding="utf-8").splitlines(keepends=True)
+    path.write_text("".join(lines[:3]), encoding="utf-8")
+
+    reloaded = OutboxJournal(str(path), checkpoint_every=5)
+    assert reloaded.status_by_order("order-2") == "PENDING"
+    assert reloaded.status_by_order("order-11") is None
+
+
+def test_checkpoint_is_serialised_outside_the_journal_lock(tmp_path, monkeypatch) -> None:
+    path = tmp_path / "outbox.jsonl"
+    journal = OutboxJournal(str(path), group_commit=True, checkpoint_every=5)
+    appended_during_dump: list[bool] = []
+    original_dump = json.dump
+
+    def dump(state, handle, **kwargs) -> None:
+        # Another writer must be able to append while the checkpoint is written.
+        other = threading.Thread(target=_pending, args=(journal, 1000))
+        other.start()
+        other.join(timeout=5.0)
+        appended_during_dump.append(not other.is_alive())
+        original_dump(state, handle, **kwargs)
+
+    monkeypatch.setattr("app.outbox.journal.json.dump", dump)
+    for idx in range(5):
+        _pending(journal, idx)
+    monkeypatch.undo()
+
+    assert appended_during_dump == [True]
+    assert journal.status_by_order("order-1000") == "PENDING"
+    reloaded = OutboxJournal(str(path), checkpoint_every=5)
+    assert reloaded.status_by_order("order-1000") == "PENDING"
+    assert reloaded.status_by_order("order-4") == "PENDING"
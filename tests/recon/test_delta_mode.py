@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from app.recon import daemon as recon_daemon
+from app.recon.daemon import DaemonConfig, ReconDaemon
+
+
+class _Venues:
+    def __init__(self) -> None:
+        self.local_positions = [
+            {"venue": "binance-um", "symbol": "BTCUSDT", "base_qty": 1.0, "avg_price": 100.0},
+            {"venue": "okx-perp", "symbol": "ETHUSDT", "base_qty": 2.0, "avg_price": 10.0},
+        ]
+        self.remote_positions = {("binance-um", "BTCUSDT"): 1.0, ("okx-perp", "ETHUSDT"): 2.0}
+        self.fills: dict[str, list[dict[str, object]]] = {"binance-um": [], "okx-perp": []}
+        self.remote_calls: list[object] = []
+
+    def install(self, daemon: ReconDaemon) -> None:
+        async def local_positions(cycle=None):
+            return [dict(row) for row in self.local_positions]
+
+        async def empty(*_args, **_kwargs):
+            return []
+
+        async def remote_positions(venues=None, cycle=None):
+            self.remote_calls.append(None if venues is None else sorted(venues))
+            return dict(self.remote_positions)
+
+        async def broker_fills(_broker, venue, _since, **_kwargs):
+            return list(self.fills[venue])
+
+        daemon._fetch_local_positions = local_positions
+        daemon._fetch_local_balances = empty
+        daemon._fetch_local_orders = empty
+        daemon._fetch_local_pnl = empty
+        daemon._fetch_remote_positions = remote_positions
+        daemon._fetch_remote_balances = empty
+        daemon._fetch_remote_orders = empty
+        daemon._fetch_remote_pnl = empty
+        daemon._broker_fills = broker_fills
+
+
+@pytest.mark.asyncio
+async def test_delta_cycles_rediff_only_keys_with_new_fills(monkeypatch) -> None:
+    state = SimpleNamespace(
+        derivatives=SimpleNamespace(venues={"binance_um": object(), "okx_perp": object()}),
+        safety=SimpleNamespace(hold_active=False),
+    )
+    monkeypatch.setattr(recon_daemon.runtime, "get_state", lambda: state)
+    monkeypatch.setattr(recon_daemon.runtime, "update_reconciliation_status", lambda **_: None)
+    monkeypatch.setattr(
+        recon_daemon,
+        "ExecutionRouter",
+        lambda: SimpleNamespace(broker_for_venue=lambda venue: object()),
+    )
+    daemon = ReconDaemon(
+        DaemonConfig(mode="delta", full_sweep_sec=300.0, auto_hold_on_critical=False)
+    )
+    venues = _Venues()
+    venues.install(daemon)
+
+    first = await daemon.run_once()
+    assert first.issues == [] and venues.remote_calls == [None]
+
+    # Nothing changed locally and no new fills: no remote position fetch at all.
+    assert (await daemon.run_once()).issues == []
+    assert venues.remote_calls == [None]
+
+    fill_ts = (datetime.now(timezone.utc) + timedelta(seconds=5)).isoformat()
+    venues.fills["okx-perp"] = [
+        {"symbol": "ETHUSDT", "side": "buy", "qty": 1.0, "price": 10.0, "ts": fill_ts}
+    ]
+    venues.remote_positions[("okx-perp", "ETHUSDT")] = 3.0
+    venues.remote_positions[("binance-um", "BTCUSDT")] = 4.0  # no trace: left to the sweep
+
+    third = await daemon.run_once()
+    assert venues.remote_calls[-1] == ["okx_perp"]
+    assert [(issue.venue, issue.symbol) for issue in third.issues] == [("okx-perp", "ETHUSDT")]
+
+    # The same fill reported again by the inclusive ``since`` is not new; the drift is kept.
+    fourth = await daemon.run_once()
+    assert len(venues.remote_calls) == 2
+    assert [(issue.venue, issue.symbol) for issue in fourth.issues] == [("okx-perp", "ETHUSDT")]
+
+    venues.fills["okx-perp"] = []
+    daemon._delta.last_full -= 301.0
+    sweep = await daemon.run_once()
+    assert venues.remote_calls[-1] is None
+    assert sorted((issue.venue, issue.symbol) for issue in sweep.issues) == [
+        ("binance-um", "BTCUSDT"),
+        ("okx-perp", "ETHUSDT"),
+    ]
+
+    # A local ledger change touches its key: the binance drift clears without a sweep.
+    venues.local_positions[0]["base_qty"] = 4.0
+    resolved = await daemon.run_once()
+    assert venues.remote_calls[-1] == ["binance_um"]
+    assert [(issue.venue, issue.symbol) for issue in resolved.issues] == [("okx-perp", "ETHUSDT")]
+
+
+@pytest.mark.asyncio
+async def test_failed_remote_fetch_is_not_diffed_and_forces_a_sweep(monkeypatch) -> None:
+    state = SimpleNamespace(
+        derivatives=SimpleNamespace(venues={"binance_um": object(), "okx_perp": object()}),
+        safety=SimpleNamespace(hold_active=False),
+    )
+    monkeypatch.setattr(recon_daemon.runtime, "get_state", lambda: state)
+    monkeypatch.setattr(recon_daemon.runtime, "update_reconciliation_status", lambda **_: None)
+    monkeypatch.setattr(
+        recon_daemon,
+        "ExecutionRouter",
+        lambda: SimpleNamespace(broker_for_venue=lambda venue: object()),
+    )
+    fake = _Venues()
+    failing: set[str] = set()
+
+    class _Reconciler:
+        def fetch_exchange_positions(self, venues=None):
+            (venue_id,) = venues
+            if venue_id in failing:
+                raise RuntimeError("venue down")
+            return {
+                key: qty
+                for key, qty in fake.remote_positions.items()
+                if key[0] == venue_id.replace("_", "-")
+            }
+
+    monkeypatch.setattr(recon_daemon, "Reconciler", _Reconciler)
+    daemon = ReconDaemon(
+        DaemonConfig(mode="delta", full_sweep_sec=300.0, auto_hold_on_critical=False)
+    )
+    fake.install(daemon)
+    daemon._fetch_remote_positions = ReconDaemon._fetch_remote_positions.__get__(daemon)
+
+    assert (await daemon.run_once()).issues == []
+
+    # The ledger moves and the venue fetch fails: no drift against an empty remote.
+    fake.local_positions[1]["base_qty"] = 3.0
+    fake.remote_positions[("okx-perp", "ETHUSDT")] = 3.0
+    failing.add("okx_perp")
+    assert (await daemon.run_once()).issues == []
+    assert daemon._delta.last_full is None
+
+    # The next cycle sweeps everything once the venue answers again.
+    failing.clear()
+    fake.remote_positions[("okx-perp", "ETHUSDT")] = 2.5
+    swept = await daemon.run_once()
+    assert [(issue.venue, issue.symbol) for issue in swept.issues] == [("okx-perp", "ETHUSDT")]
+    assert daemon._delta.last_full is not None
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.recon import daemon as recon_daemon
+from app.recon.daemon import DaemonConfig, ReconDaemon
+
+
+class _Client:
+    def __init__(self, orders, release: threading.Event | None = None) -> None:
+        self._orders = orders
+        self._release = release
+        self.calls = 0
+
+    def open_orders(self):
+        self.calls += 1
+        if self._release is not None:
+            self._release.wait(5.0)
+        return list(self._orders)
+
+    def positions(self):
+        return []
+
+
+@pytest.mark.asyncio
+async def test_slow_venue_is_reported_stale_without_blocking_the_cycle(monkeypatch) -> None:
+    release = threading.Event()
+    fast = _Client([{"venue": "binance-um", "symbol": "BTCUSDT", "id": "1", "status": "open"}])
+    slow = _Client([], release=release)
+    state = SimpleNamespace(
+        derivatives=SimpleNamespace(
+            venues={
+                "binance_um": SimpleNamespace(client=fast),
+                "okx_perp": SimpleNamespace(client=slow),
+            }
+        ),
+        safety=SimpleNamespace(hold_active=False),
+    )
+    statuses: list[dict[str, object]] = []
+    local_orders = [
+        {"venue": "binance-um", "symbol": "BTCUSDT", "id": "1", "status": "open"},
+        {"venue": "okx-perp", "symbol": "ETHUSDT", "id": "2", "status": "open"},
+    ]
+    monkeypatch.setattr(recon_daemon.runtime, "get_state", lambda: state)
+    monkeypatch.setattr(
+        recon_daemon.runtime, "update_reconciliation_status", lambda **kw: statuses.append(kw)
+    )
+    monkeypatch.setattr(recon_daemon.ledger, "fetch_positions", lambda: [])
+    monkeypatch.setattr(recon_daemon.ledger, "fetch_balances", lambda: [])
+    monkeypatch.setattr(recon_daemon.ledger, "fetch_open_orders", lambda: list(local_orders))
+    monkeypatch.setattr(
+        recon_daemon, "ExecutionRouter", lambda: SimpleNamespace(broker_for_venue=lambda _: None)
+    )
+    monkeypatch.setattr(recon_daemon, "alert_notify", lambda *args, **kwargs: None)
+
+    async def empty(*_args, **_kwargs):
+        return []
+
+    daemon = ReconDaemon(DaemonConfig(cycle_deadline_sec=0.2, auto_hold_on_critical=False))
+    daemon._fetch_local_pnl = empty
+    daemon._fetch_remote_pnl = empty
+
+    try:
+        started = time.perf_counter()
+        first = await daemon.run_once()
+        assert time.perf_counter() - started < 2.0
+        # The okx order is not reported missing: its venue is stale, not empty.
+        assert first.issues == []
+        stale = [{"venue": "okx-perp", "category": "orders"}]
+        assert statuses[-1]["metadata"]["stale"] == stale
+
+        # The abandoned request is still running: no second thread is spent on it.
+        second = await daemon.run_once()
+        assert second.issues == []
+        assert statuses[-1]["metadata"]["stale"] == stale
+        assert (fast.calls, slow.calls) == (2, 1)
+    finally:
+        release.set()
@@ -13,16 +13,16 @@ import app.router.smart_router as smart_router_module
 
 
 @pytest.fixture
-def router(monkeypatch: pytest.MonkeyPatch) -> SmartRouter:
+def router(monkeypatch: pytest.MonkeyPatch, settings_env) -> SmartRouter:
     monkeypatch.setenv("TEST_ONLY_ROUTER_META", "*")
-    monkeypatch.setenv("FF_SOR_V1", "1")
-    monkeypatch.setenv("SOR_MIN_EDGE_BPS", "1.0")
-    monkeypatch.setenv("SOR_MIN_SIZE_USD", "10")
-    monkeypatch.setenv("SOR_MAX_SLIPPAGE_BPS", "5")
-    monkeypatch.setenv("SOR_QUOTE_TTL_MS", "1000")
-    monkeypatch.setenv("SOR_FEES_BPS", '{"binance":2.0,"okx":2.0,"bybit":2.0}')
-    monkeypatch.setenv("SOR_FUNDING_BPS_1H", '{"binance":0,"okx":0,"bybit":0}')
-    monkeypatch.setenv("SOR_VENUE_PREFS", '{"binance":1,"okx":1,"bybit":1}')
+    settings_env.setenv("FF_SOR_V1", "1")
+    settings_env.setenv("SOR_MIN_EDGE_BPS", "1.0")
+    settings_env.setenv("SOR_MIN_SIZE_USD", "10")
+    settings_env.setenv("SOR_MAX_SLIPPAGE_BPS", "5")
+    settings_env.setenv("SOR_QUOTE_TTL_MS", "1000")
+    settings_env.setenv("SOR_FEES_BPS", '{"binance":2.0,"okx":2.0,"bybit":2.0}')
+    settings_env.setenv("SOR_FUNDING_BPS_1H", '{"binance":0,"okx":0,"bybit":0}')
+    settings_env.setenv("SOR_VENUE_PREFS", '{"binance":1,"okx":1,"bybit":1}')
 
     monkeypatch.setattr("app.router.smart_router.get_liquidity_status", lambda: {})
     monkeypatch.setattr("app.router.smart_router.get_profile", lambda: SimpleNamespace(name="test"))
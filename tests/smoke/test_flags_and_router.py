@@ -50,16 +50,16 @@ def _make_router(monkeypatch: pytest.MonkeyPatch, idempo: IdempoStore) -> SmartR
     return SmartRouter(state=state, market_data=market_data, idempo_store=idempo)
 
 
-def _set_default_env(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setenv("DEFAULT_PROFILE", "paper")
-    monkeypatch.delenv("FF_PRETRADE_STRICT", raising=False)
-    monkeypatch.delenv("FF_RISK_LIMITS", raising=False)
+def _set_default_env(monkeypatch: pytest.MonkeyPatch, settings_env) -> None:
+    settings_env.setenv("DEFAULT_PROFILE", "paper")
+    settings_env.delenv("FF_PRETRADE_STRICT", raising=False)
+    settings_env.delenv("FF_RISK_LIMITS", raising=False)
     monkeypatch.setenv("RISK_CAP_SYMBOL", "")
     monkeypatch.setenv("RISK_CAP_STRATEGY", "")
 
 
-def test_pretrade_strict_rejects_invalid_qty(monkeypatch: pytest.MonkeyPatch) -> None:
-    _set_default_env(monkeypatch)
+def test_pretrade_strict_rejects_invalid_qty(monkeypatch: pytest.MonkeyPatch, settings_env) -> None:
+    _set_default_env(monkeypatch, settings_env)
     monkeypatch.setenv("RISK_CAP_VENUE", "binance:100000")
     tracker = TrackingIdempoStore()
     router = _make_router(monkeypatch, tracker)
@@ -84,9 +84,9 @@ def test_pretrade_strict_rejects_invalid_qty(monkeypatch: pytest.MonkeyPatch) ->
 
 
 def test_risk_limits_block_high_notional(
-    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture, settings_env
 ) -> None:
-    _set_default_env(monkeypatch)
+    _set_default_env(monkeypatch, settings_env)
     monkeypatch.setenv("RISK_CAP_VENUE", "binance:1000")
     tracker = TrackingIdempoStore()
     router = _make_router(monkeypatch, tracker)
@@ -115,8 +115,8 @@ def test_risk_limits_block_high_notional(
     )
 
 
-def test_order_passes_within_limits(monkeypatch: pytest.MonkeyPatch) -> None:
-    _set_default_env(monkeypatch)
+def test_order_passes_within_limits(monkeypatch: pytest.MonkeyPatch, settings_env) -> None:
+    _set_default_env(monkeypatch, settings_env)
     monkeypatch.setenv("RISK_CAP_VENUE", "binance:1000")
     tracker = TrackingIdempoStore()
     router = _make_router(monkeypatch, tracker)
@@ -43,13 +43,13 @@ def _reset_aggregator() -> None:
 
 
 @pytest.fixture
-def router(monkeypatch: pytest.MonkeyPatch) -> SmartRouter:
+def router(monkeypatch: pytest.MonkeyPatch, settings_env) -> SmartRouter:
     monkeypatch.setenv("FF_READINESS_AGG_GUARD", "1")
     monkeypatch.setenv("READINESS_REQUIRED", "market,recon")
     monkeypatch.setenv("READINESS_TTL_SEC", "30")
-    monkeypatch.setenv("FF_RISK_LIMITS", "0")
-    monkeypatch.setenv("FF_PRETRADE_STRICT", "0")
-    monkeypatch.setenv("FF_MD_WATCHDOG", "0")
+    settings_env.setenv("FF_RISK_LIMITS", "0")
+    settings_env.setenv("FF_PRETRADE_STRICT", "0")
+    settings_env.setenv("FF_MD_WATCHDOG", "0")
     monkeypatch.setenv("FF_ROUTER_COOLDOWN", "0")
     monkeypatch.setenv("FF_IDEMPOTENCY_OUTBOX", "0")
     monkeypatch.setenv("FF_ORDER_TIMEOUTS", "0")
@@ -10,13 +10,13 @@ from app.router import smart_router
 from app.services.safe_mode import SafeMode
 
 
-def _enable_test_metadata(monkeypatch: pytest.MonkeyPatch) -> None:
+def _enable_test_metadata(monkeypatch: pytest.MonkeyPatch, settings_env) -> None:
     monkeypatch.setenv("TEST_ONLY_ROUTER_META", "*")
     monkeypatch.setenv("TEST_ONLY_ROUTER_TICK_SIZE", "0.1")
     monkeypatch.setenv("TEST_ONLY_ROUTER_STEP_SIZE", "0.001")
     monkeypatch.setenv("TEST_ONLY_ROUTER_MIN_QTY", "0.0001")
     monkeypatch.delenv("TEST_ONLY_ROUTER_MIN_NOTIONAL", raising=False)
-    monkeypatch.setenv("FF_MD_WATCHDOG", "0")
+    settings_env.setenv("FF_MD_WATCHDOG", "0")
 
 
 @pytest.fixture()
@@ -79,11 +79,13 @@ def _register(router: smart_router.SmartRouter, **overrides: object) -> dict[str
     return router.register_order(**intent)
 
 
-def test_safe_mode_blocks_submission(monkeypatch: pytest.MonkeyPatch, router_factory) -> None:
-    _enable_test_metadata(monkeypatch)
+def test_safe_mode_blocks_submission(
+    monkeypatch: pytest.MonkeyPatch, router_factory, settings_env
+) -> None:
+    _enable_test_metadata(monkeypatch, settings_env)
     monkeypatch.setenv("SAFE_MODE", "1")
-    monkeypatch.setenv("FF_RISK_LIMITS", "0")
-    monkeypatch.setenv("FF_PRETRADE_STRICT", "0")
+    settings_env.setenv("FF_RISK_LIMITS", "0")
+    settings_env.setenv("FF_PRETRADE_STRICT", "0")
     SafeMode.set(True)
     router = router_factory()
 
@@ -95,10 +97,12 @@ def test_safe_mode_blocks_submission(monkeypatch: pytest.MonkeyPatch, router_fac
     assert response.get("strategy_id") == "smoke"
 
 
-def test_pretrade_strict_rejects_zero_qty(monkeypatch: pytest.MonkeyPatch, router_factory) -> None:
-    _enable_test_metadata(monkeypatch)
-    monkeypatch.setenv("FF_PRETRADE_STRICT", "1")
-    monkeypatch.setenv("FF_RISK_LIMITS", "0")
+def test_pretrade_strict_rejects_zero_qty(
+    monkeypatch: pytest.MonkeyPatch, router_factory, settings_env
+) -> None:
+    _enable_test_metadata(monkeypatch, settings_env)
+    settings_env.setenv("FF_PRETRADE_STRICT", "1")
+    settings_env.setenv("FF_RISK_LIMITS", "0")
     SafeMode.set(False)
     router = router_factory()
 
@@ -108,9 +112,11 @@ def test_pretrade_strict_rejects_zero_qty(monkeypatch: pytest.MonkeyPatch, route
     assert response.get("reason") == "qty_invalid"
 
 
-def test_risk_limits_block_when_enabled(monkeypatch: pytest.MonkeyPatch, router_factory) -> None:
-    _enable_test_metadata(monkeypatch)
-    monkeypatch.setenv("FF_RISK_LIMITS", "1")
+def test_risk_limits_block_when_enabled(
+    monkeypatch: pytest.MonkeyPatch, router_factory, settings_env
+) -> None:
+    _enable_test_metadata(monkeypatch, settings_env)
+    settings_env.setenv("FF_RISK_LIMITS", "1")
     monkeypatch.setenv("RISK_CAP_SYMBOL", "binance:BTCUSDT:0")
     SafeMode.set(False)
     router = router_factory()
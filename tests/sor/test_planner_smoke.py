@@ -9,11 +9,11 @@ from app.sor.select import Quote, select_best_pair
 
 
 @pytest.fixture(autouse=True)
-def _sor_env(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setenv("SOR_MIN_EDGE_BPS", "1.0")
-    monkeypatch.setenv("SOR_MIN_SIZE_USD", "10")
-    monkeypatch.setenv("SOR_MAX_SLIPPAGE_BPS", "5")
-    monkeypatch.setenv("SOR_QUOTE_TTL_MS", "1000")
+def _sor_env(monkeypatch: pytest.MonkeyPatch, settings_env) -> None:
+    settings_env.setenv("SOR_MIN_EDGE_BPS", "1.0")
+    settings_env.setenv("SOR_MIN_SIZE_USD", "10")
+    settings_env.setenv("SOR_MAX_SLIPPAGE_BPS", "5")
+    settings_env.setenv("SOR_QUOTE_TTL_MS", "1000")
 
 
 def test_route_plan_smoke() -> None:
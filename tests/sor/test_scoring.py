@@ -9,12 +9,12 @@ from app.sor.select import Quote, select_best_pair
 
 
 @pytest.fixture(autouse=True)
-def _sor_env(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setenv("SOR_MIN_EDGE_BPS", "1.0")
-    monkeypatch.setenv("SOR_FEES_BPS", '{"binance":2.0,"okx":2.0,"bybit":2.0}')
-    monkeypatch.setenv("SOR_MIN_SIZE_USD", "50")
-    monkeypatch.setenv("SOR_MAX_SLIPPAGE_BPS", "5")
-    monkeypatch.setenv("SOR_QUOTE_TTL_MS", "500")
+def _sor_env(monkeypatch: pytest.MonkeyPatch, settings_env) -> None:
+    settings_env.setenv("SOR_MIN_EDGE_BPS", "1.0")
+    settings_env.setenv("SOR_FEES_BPS", '{"binance":2.0,"okx":2.0,"bybit":2.0}')
+    settings_env.setenv("SOR_MIN_SIZE_USD", "50")
+    settings_env.setenv("SOR_MAX_SLIPPAGE_BPS", "5")
+    settings_env.setenv("SOR_QUOTE_TTL_MS", "500")
 
 
 def test_best_pair_positive_edge() -> None:
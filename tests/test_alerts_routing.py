@@ -19,8 +19,8 @@ def _clear_alerts_env(monkeypatch, tmp_path) -> None:
     Path(log_path).parent.mkdir(parents=True, exist_ok=True)
 
 
-def test_paper_profile_routes_only_critical(monkeypatch) -> None:
-    monkeypatch.setenv("DEFAULT_PROFILE", "paper")
+def test_paper_profile_routes_only_critical(monkeypatch, settings_env) -> None:
+    settings_env.setenv("DEFAULT_PROFILE", "paper")
     mock_send = Mock(return_value=200)
     monkeypatch.setattr("app.alerts.manager.wire_telegram.send_message", mock_send)
 
@@ -31,8 +31,8 @@ def test_paper_profile_routes_only_critical(monkeypatch) -> None:
     assert mock_send.call_count == 1
 
 
-def test_testnet_routes_warn_and_above(monkeypatch) -> None:
-    monkeypatch.setenv("DEFAULT_PROFILE", "testnet")
+def test_testnet_routes_warn_and_above(monkeypatch, settings_env) -> None:
+    settings_env.setenv("DEFAULT_PROFILE", "testnet")
     mock_send = Mock(return_value=200)
     monkeypatch.setattr("app.alerts.manager.wire_telegram.send_message", mock_send)
 
@@ -46,8 +46,8 @@ def test_testnet_routes_warn_and_above(monkeypatch) -> None:
     assert mock_send.call_count == 3
 
 
-def test_live_profile_matches_testnet(monkeypatch) -> None:
-    monkeypatch.setenv("DEFAULT_PROFILE", "live")
+def test_live_profile_matches_testnet(monkeypatch, settings_env) -> None:
+    settings_env.setenv("DEFAULT_PROFILE", "live")
     mock_send = Mock(return_value=200)
     monkeypatch.setattr("app.alerts.manager.wire_telegram.send_message", mock_send)
 
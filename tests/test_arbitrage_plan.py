@@ -36,7 +36,7 @@ def test_build_plan_blocks_low_spread():
     assert plan.reason is not None
 
 
-def test_build_plan_includes_funding_when_enabled(monkeypatch):
+def test_build_plan_includes_funding_when_enabled(monkeypatch, settings_env):
     reset_for_tests()
     state = get_state()
     state.control.taker_fee_bps_binance = 0
@@ -47,7 +47,7 @@ def test_build_plan_includes_funding_when_enabled(monkeypatch):
     aggregator.update_from_ws(venue="okx-perp", symbol="BTCUSDT", bid=20_040.0, ask=20_041.0)
     baseline = arbitrage.build_plan("BTCUSDT", 1_000.0, 0)
 
-    monkeypatch.setenv("FEATURE_FUNDING_ROUTER", "1")
+    settings_env.setenv("FEATURE_FUNDING_ROUTER", "1")
     now = time.time()
     derivatives = state.derivatives
     for venue_id, runtime in derivatives.venues.items():
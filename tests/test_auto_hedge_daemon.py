@@ -7,6 +7,7 @@ from typing import Dict
 import pytest
 
 from app.auto_hedge_daemon import AutoHedgeDaemon
+from app.runtime_state_store import flush_runtime_payload
 from app.services import risk_guard, runtime
 from app.services.hedge_log import read_entries, reset_log
 from app.services.status import get_status_overview
@@ -282,6 +283,7 @@ def test_auto_hedge_last_success_persisted(monkeypatch, tmp_path):
 
     ts = "2024-01-01T00:00:00+00:00"
     runtime.update_auto_hedge_state(last_success_ts=ts, last_execution_result="ok")
+    flush_runtime_payload()
 
     payload = json.loads(runtime_path.read_text())
     assert payload["auto_hedge"]["last_success_ts"] == ts
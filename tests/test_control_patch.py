@@ -4,6 +4,7 @@ import json
 
 import pytest
 
+from app.runtime_state_store import flush_runtime_payload
 from app.services import runtime
 
 
@@ -53,6 +54,7 @@ def test_control_patch_persists_and_loads(monkeypatch, tmp_path):
     }
 
     runtime.apply_control_patch(payload)
+    flush_runtime_payload()
 
     runtime_file = tmp_path / "runtime_state.json"
     assert runtime_file.exists()
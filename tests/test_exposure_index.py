@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from app import ledger
+from app.config.schema import AppConfig, ExposureCapsConfig, ExposureCapsEntry
+from app.risk import exposure_caps
+from app.risk.exposure_caps import collect_snapshot, get_exposure_index, resolve_caps
+
+
+@pytest.fixture
+def ledger_db(tmp_path, monkeypatch):
+    monkeypatch.setattr(ledger, "LEDGER_PATH", tmp_path / "ledger.db")
+    ledger.init_db()
+    yield ledger
+    ledger.close_connections()
+
+
+def _fill(order_id: int, side: str, qty: float, price: float, symbol: str = "BTCUSDT") -> None:
+    ledger.record_fill(
+        order_id=order_id,
+        venue="binance-um",
+        symbol=symbol,
+        side=side,
+        qty=qty,
+        price=price,
+        fee=0.0,
+        ts="2024-01-01T00:00:00+00:00",
+    )
+
+
+def _order() -> int:
+    return ledger.record_order(
+        venue="binance-um",
+        symbol="BTCUSDT",
+        side="buy",
+        qty=1.0,
+        price=100.0,
+        status="submitted",
+        client_ts="2024-01-01T00:00:00+00:00",
+        exchange_ts=None,
+        idemp_key="index-order",
+    )
+
+
+def test_index_follows_fills_without_reading_the_ledger(ledger_db, monkeypatch) -> None:
+    order_id = _order()
+    _fill(order_id, "buy", 1.0, 100.0)
+    assert collect_snapshot().by_symbol == {"BTCUSDT": pytest.approx(100.0)}
+
+    reads: list[int] = []
+    real_snapshot = ledger.snapshot_positions
+    monkeypatch.setattr(ledger, "snapshot_positions", lambda: reads.append(1) or real_snapshot())
+    _fill(order_id, "sell", 3.0, 120.0)
+    _fill(order_id, "buy", 2.0, 50.0, symbol="ETHUSDT")
+    snapshot = collect_snapshot()
+    assert reads == []
+    assert snapshot.by_symbol == {
+        "BTCUSDT": pytest.approx(240.0),
+        "ETHUSDT": pytest.approx(100.0),
+    }
+    assert snapshot.by_symbol_side == {
+        ("BTCUSDT", "SHORT"): pytest.approx(240.0),
+        ("ETHUSDT", "LONG"): pytest.approx(100.0),
+    }
+    assert snapshot.by_venue_symbol[("binanceum", "BTCUSDT")]["base_qty"] == pytest.approx(-2.0)
+    assert snapshot.by_symbol == collect_snapshot(ledger.fetch_positions()).by_symbol
+
+    ledger.reset()
+    assert collect_snapshot().by_symbol == {}
+    assert reads == []
+
+
+def test_concurrent_fills_leave_the_index_consistent(ledger_db) -> None:
+    order_id = _order()
+    collect_snapshot()
+
+    def worker(side: str) -> None:
+        for idx in range(40):
+            _fill(order_id, side, 0.01 * (idx % 3 + 1), 100.0 + idx)
+
+    threads = [threading.Thread(target=worker, args=(side,)) for side in ("buy", "sell") * 3]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    expected = collect_snapshot(ledger.fetch_positions())
+    assert collect_snapshot().by_venue_symbol == expected.by_venue_symbol
+    assert get_exposure_index().verify() == []
+
+
+def test_verify_reports_and_repairs_drift(ledger_db) -> None:
+    order_id = _order()
+    _fill(order_id, "buy", 1.0, 100.0)
+    collect_snapshot()
+
+    # A write the index never heard about, e.g. from another process.
+    conn = ledger._connect()
+    conn.execute("UPDATE positions SET base_qty = 4.0")
+    conn.commit()
+    mismatches = exposure_caps.verify_exposure_index()
+    assert [(row["symbol"], row["fields"]) for row in mismatches] == [("BTCUSDT", ["base_qty"])]
+    assert collect_snapshot().by_symbol == {"BTCUSDT": pytest.approx(400.0)}
+    assert exposure_caps.verify_exposure_index() == []
+
+
+def test_caps_are_compiled_once_per_config_object(monkeypatch) -> None:
+    config = AppConfig(
+        profile="unit-test",
+        exposure_caps=ExposureCapsConfig(
+            default=ExposureCapsEntry(max_abs_usdt=1000),
+            per_symbol={"ETH-USDT": ExposureCapsEntry(max_abs_usdt=2000)},
+        ),
+    )
+    compiled: list[object] = []
+    real_table = exposure_caps._CapsTable
+
+    def counting_table(root):
+        compiled.append(root)
+        return real_table(root)
+
+    monkeypatch.setattr(exposure_caps, "_CapsTable", counting_table)
+    for _ in range(3):
+        assert resolve_caps(config, "ETHUSDT", "LONG", "okx")["global_max_abs"] == 2000
+        assert resolve_caps(config, "BTCUSDT", "SHORT", None)["global_max_abs"] == 1000
+    assert len(compiled) == 1
+
+    reloaded = config.model_copy(
+        update={"exposure_caps": ExposureCapsConfig(default=ExposureCapsEntry(max_abs_usdt=5))}
+    )
+    assert resolve_caps(reloaded, "ETHUSDT", "LONG", "okx")["global_max_abs"] == 5
+    assert len(compiled) == 2
@@ -44,8 +44,8 @@ def test_choose_best_pair_prefers_lower_total_cost():
     assert best.short_venue == "binance"
 
 
-def test_choose_best_pair_uses_tca_router(monkeypatch):
-    monkeypatch.setenv("FEATURE_TCA_ROUTER", "1")
+def test_choose_best_pair_uses_tca_router(monkeypatch, settings_env):
+    settings_env.setenv("FEATURE_TCA_ROUTER", "1")
     now = time.time()
     horizon = now + 3600
     quotes = {
@@ -72,4 +72,4 @@ def test_choose_best_pair_uses_tca_router(monkeypatch):
     assert best is not None
     assert best.long_venue == "other"
     assert best.short_venue == "maker"
-    monkeypatch.delenv("FEATURE_TCA_ROUTER", raising=False)
+    settings_env.delenv("FEATURE_TCA_ROUTER", raising=False)
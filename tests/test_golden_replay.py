@@ -16,9 +16,9 @@ SCENARIO_DIR = Path(__file__).with_name("golden_scenarios")
 
 
 @pytest.mark.asyncio
-async def test_golden_replay_detects_mismatch(tmp_path, monkeypatch):
-    monkeypatch.setenv("GOLDEN_REPLAY_ENABLED", "1")
-    monkeypatch.setenv("GOLDEN_RECORD_ENABLED", "0")
+async def test_golden_replay_detects_mismatch(tmp_path, monkeypatch, settings_env):
+    settings_env.setenv("GOLDEN_REPLAY_ENABLED", "1")
+    settings_env.setenv("GOLDEN_RECORD_ENABLED", "0")
 
     timestamp = datetime.now(timezone.utc).isoformat()
 
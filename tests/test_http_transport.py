@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from app.metrics.transport import HTTP_REQUEST_LATENCY_SECONDS
+from app.net import HttpTransport, VenuePoolConfig, get_transport, reset_transport_for_tests
+from exchanges.binance_futures import BinanceFuturesClient
+from exchanges.okx_futures import OKXFuturesClient
+
+
+class _Recorder:
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.requests: list[httpx.Request] = []
+        self.active = 0
+        self.peak = 0
+        self.clients: list[str] = []
+        self._lock = threading.Lock()
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            self.requests.append(request)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            with self._lock:
+                self.active -= 1
+        if request.url.host == "okx.test":
+            return httpx.Response(200, json={"code": "0", "data": [{"markPx": "101.5"}]})
+        return httpx.Response(200, json={"markPrice": "100.5", "path": request.url.path})
+
+    def factory(self, venue: str, config: VenuePoolConfig) -> httpx.AsyncClient:
+        self.clients.append(venue)
+        return httpx.AsyncClient(
+            transport=httpx.MockTransport(self.handler), timeout=config.timeout
+        )
+
+
+@pytest.fixture
+def recorder():
+    recorder = _Recorder(delay=0.05)
+    transport = HttpTransport(
+        default_config=VenuePoolConfig(max_concurrency=2), client_factory=recorder.factory
+    )
+    reset_transport_for_tests(transport)
+    yield recorder
+    reset_transport_for_tests()
+
+
+def _latency_sum(venue: str) -> float:
+    return HTTP_REQUEST_LATENCY_SECONDS.labels(venue=venue, method="GET", status="2xx")._sum.get()
+
+
+def test_exchange_clients_share_one_pool_per_venue(recorder: _Recorder) -> None:
+    binance = BinanceFuturesClient(api_key="k", api_secret="s", api_url="https://binance.test")
+    other = BinanceFuturesClient(api_key="k", api_secret="s", api_url="https://binance.test")
+    okx = OKXFuturesClient(api_key="k", api_secret="s", passphrase="p", api_url="https://okx.test")
+
+    assert binance.get_mark_price("btcusdt")["mark_price"] == 100.5
+    assert other.get_mark_price("ETHUSDT")["mark_price"] == 100.5
+    assert okx.get_mark_price("BTCUSDT")["mark_price"] == 101.5
+
+    assert sorted(recorder.clients) == ["binance", "okx"]
+    first = recorder.requests[0]
+    assert first.url.params["symbol"] == "BTCUSDT"
+    assert first.headers["X-MBX-APIKEY"] == "k"
+    assert _latency_sum("binance") > 0
+
+
+def test_per_venue_concurrency_limit_is_enforced(recorder: _Recorder) -> None:
+    transport = get_transport()
+    threads = [
+        threading.Thread(
+            target=transport.request, args=("binance", "GET", "https://binance.test/x")
+        )
+        for _ in range(6)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(recorder.requests) == 6
+    assert recorder.peak == 2
+    assert transport.stats()["binance"]["in_flight"] == 0
+
+
+def test_venue_aliases_share_one_pool_and_limit(recorder: _Recorder) -> None:
+    transport = get_transport()
+    transport.configure_venue("binance-um", max_concurrency=3)
+    aliases = ("binance", "binance_um", "binance-um", "BINANCE")
+    threads = [
+        threading.Thread(target=transport.request, args=(alias, "GET", "https://binance.test/x"))
+        for alias in aliases * 3
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(recorder.requests) == 12
+    assert recorder.clients == ["binance"]
+    assert recorder.peak == 3
+    assert list(transport.stats()) == ["binance"]
+    assert transport.stats()["binance"]["max_concurrency"] == 3
+
+
+def test_async_callers_on_other_loops_share_the_transport(recorder: _Recorder) -> None:
+    client = get_transport().client("binance-um", base_url="https://binance.test/")
+
+    async def run() -> list[httpx.Response]:
+        return await asyncio.gather(*(client.arequest("GET", "/fapi/v1/time") for _ in range(4)))
+
+    responses = asyncio.run(run())
+    assert [response.json()["path"] for response in responses] == ["/fapi/v1/time"] * 4
+    assert recorder.clients == ["binance"]
+    assert recorder.peak == 2
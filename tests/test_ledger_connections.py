@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from app import ledger
+
+
+@pytest.fixture
+def ledger_db(tmp_path, monkeypatch):
+    monkeypatch.setattr(ledger, "LEDGER_PATH", tmp_path / "ledger.db")
+    ledger.init_db()
+    yield ledger
+    ledger.close_connections()
+
+
+def _order(idemp_key: str = "conn-order") -> int:
+    return ledger.record_order(
+        venue="binance-um",
+        symbol="BTCUSDT",
+        side="buy",
+        qty=1.0,
+        price=100.0,
+        status="submitted",
+        client_ts="2024-01-01T00:00:00+00:00",
+        exchange_ts=None,
+        idemp_key=idemp_key,
+    )
+
+
+def test_reads_reuse_one_wal_connection_per_thread(ledger_db) -> None:
+    first = ledger._connect()
+    assert ledger._connect() is first
+    assert first.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    seen = []
+    thread = threading.Thread(target=lambda: seen.append(ledger._connect()))
+    thread.start()
+    thread.join()
+    assert seen[0] is not first
+
+
+def test_concurrent_fills_are_group_committed(ledger_db) -> None:
+    order_id = _order()
+    commits_before = ledger._CONNECTIONS.commits
+    writes_before = ledger._CONNECTIONS.writes
+
+    def worker() -> None:
+        for idx in range(25):
+            ledger.record_fill(
+                order_id=order_id,
+                venue="binance-um",
+                symbol="BTCUSDT",
+                side="buy",
+                qty=0.01,
+                price=100.0 + idx,
+                fee=0.0,
+                ts=f"2024-01-01T00:00:{idx:02d}+00:00",
+            )
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(ledger.fetch_fills_since()) == 200
+    assert ledger._CONNECTIONS.writes - writes_before == 200
+    assert ledger._CONNECTIONS.commits - commits_before <= 200
+    position = ledger.fetch_positions()[0]
+    assert position["base_qty"] == pytest.approx(2.0)
+
+
+def test_failed_write_rolls_back_only_itself(ledger_db) -> None:
+    order_id = _order()
+
+    def broken(conn) -> None:
+        conn.execute("UPDATE orders SET status = 'corrupt' WHERE id = ?", (order_id,))
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        ledger._write(broken)
+    ledger.update_order_status(order_id, "filled")
+
+    assert ledger.get_order(order_id)["status"] == "filled"
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+
+import pytest
+
+from app import ledger
+from app.ledger import events
+
+
+@pytest.fixture
+def ledger_db(tmp_path, monkeypatch):
+    monkeypatch.setattr(ledger, "LEDGER_PATH", tmp_path / "ledger.db")
+    ledger.init_db()
+    yield ledger
+    ledger.close_connections()
+
+
+def test_cursor_pages_walk_every_matching_event_once(ledger_db) -> None:
+    for idx in range(25):
+        venue = "binance-um" if idx % 2 else "okx-perp"
+        ledger.record_event(
+            level="INFO", code=f"evt_{idx % 3}", payload={"venue": venue, "idx": idx}
+        )
+
+    seen: list[int] = []
+    cursor = None
+    while True:
+        page = ledger.fetch_events_page(limit=4, venue="BINANCE-UM", cursor=cursor)
+        seen.extend(item["payload"]["idx"] for item in page["items"])
+        assert page["total"] == (12 if cursor is None else None)
+        cursor = page["next_cursor"]
+        if cursor is None:
+            assert page["has_more"] is False
+            break
+    assert seen == sorted((idx for idx in range(25) if idx % 2), reverse=True)
+
+    first = ledger.fetch_events_page(limit=4, venue="BINANCE-UM", with_total=False)
+    assert first["total"] is None
+    counted = ledger.fetch_events_page(
+        limit=4, venue="BINANCE-UM", cursor=first["next_cursor"], with_total=True
+    )
+    assert counted["total"] == 12
+
+    codes = ledger.fetch_events(limit=100, order="asc", codes=["EVT_1"])
+    assert [item["payload"]["idx"] for item in codes] == list(range(1, 25, 3))
+
+    with pytest.raises(ValueError, match="cursor"):
+        ledger.fetch_events_page(cursor="not-a-cursor")
+
+
+def test_search_matches_substrings_case_insensitively(ledger_db) -> None:
+    ledger.record_event(level="ERROR", code="gamma", payload={"message": "Gamma failure"})
+    ledger.record_event(level="INFO", code="alpha", payload={"detail": "alpha 100% ready"})
+    ledger.record_event(level="INFO", code="beta", payload={"reason": "risk:limit"})
+
+    assert [e["code"] for e in ledger.fetch_events(search="MMA FAIL")] == ["gamma"]
+    assert [e["code"] for e in ledger.fetch_events(search="0%")] == ["alpha"]
+    assert [e["code"] for e in ledger.fetch_events(search="risk:lim")] == ["beta"]
+
+
+def test_legacy_events_are_migrated_on_init(tmp_path, monkeypatch) -> None:
+    path = tmp_path / "legacy.db"
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE events (id INTEGER PRIMARY KEY AUTOINCREMENT, ts TEXT NOT NULL,"
+        " level TEXT NOT NULL, code TEXT NOT NULL, payload TEXT NOT NULL)"
+    )
+    conn.executemany(
+        "INSERT INTO events (ts, level, code, payload) VALUES (?, ?, ?, ?)",
+        [
+            (f"2024-01-01T00:00:{idx:02d}Z", "INFO", "legacy", json.dumps(payload))
+            for idx, payload in enumerate(
+                [{"exchange": "okx-perp", "pair": "ETHUSDT", "message": "legacy fill"}, {}]
+            )
+        ],
+    )
+    conn.commit()
+    conn.close()
+    monkeypatch.setattr(ledger, "LEDGER_PATH", path)
+    try:
+        ledger.init_db()
+        items = ledger.fetch_events(order="asc", venue="okx-perp", search="legacy")
+        assert [(e["venue"], e["symbol"], e["message"]) for e in items] == [
+            ("okx-perp", "ETHUSDT", "legacy fill")
+        ]
+        assert ledger.fetch_events_page()["total"] == 2
+    finally:
+        ledger.close_connections()
+
+
+def test_backfill_walks_legacy_rows_by_id(tmp_path) -> None:
+    conn = sqlite3.connect(tmp_path / "legacy.db")
+    conn.row_factory = sqlite3.Row
+    conn.execute(
+        "CREATE TABLE events (id INTEGER PRIMARY KEY AUTOINCREMENT, ts TEXT NOT NULL,"
+        " level TEXT NOT NULL, code TEXT NOT NULL, payload TEXT NOT NULL)"
+    )
+    conn.executemany(
+        "INSERT INTO events (ts, level, code, payload) VALUES (?, ?, ?, ?)",
+        [
+            ("2024-01-01T00:00:00Z", "INFO", "legacy", json.dumps({"message": f"m{idx}"}))
+            for idx in range(5)
+        ],
+    )
+    events.ensure_schema(conn)
+
+    visited = []
+    last_id = 0
+    while last_id is not None:
+        visited.append(last_id)
+        last_id = events.backfill(conn, after=last_id, batch=2)
+
+    assert visited == [0, 2, 4, 5]
+    assert conn.execute("SELECT COUNT(*) FROM events WHERE message IS NULL").fetchone()[0] == 0
+    conn.close()
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from app import ledger
+from app.cli.main import main as cli_main
+
+
+@pytest.fixture
+def ledger_db(tmp_path, monkeypatch):
+    monkeypatch.setattr(ledger, "LEDGER_PATH", tmp_path / "ledger.db")
+    ledger.init_db()
+    yield ledger
+    ledger.close_connections()
+
+
+def _replay_realized() -> float:
+    state: dict[tuple[str, str], dict[str, float]] = {}
+    realized = 0.0
+    for fill in sorted(ledger.fetch_fills_since(), key=lambda row: row["id"]):
+        entry = state.setdefault((fill["venue"], fill["symbol"]), {"qty": 0.0, "avg": 0.0})
+        qty, price, fee = float(fill["qty"]), float(fill["price"]), float(fill["fee"])
+        if fill["side"] == "buy":
+            cost = entry["avg"] * entry["qty"] + price * qty + fee
+            entry["qty"] += qty
+            entry["avg"] = cost / entry["qty"]
+        elif entry["qty"] <= 0:
+            realized += price * qty - fee
+        else:
+            traded = min(qty, entry["qty"])
+            realized += (price - entry["avg"]) * traded - fee
+            entry["qty"] = max(0.0, entry["qty"] - traded)
+            if entry["qty"] == 0:
+                entry["avg"] = 0.0
+    return realized
+
+
+def _record_random_fills(count: int, seed: int = 7) -> None:
+    rng = random.Random(seed)
+    order_id = ledger.record_order(
+        venue="binance-um",
+        symbol="BTCUSDT",
+        side="buy",
+        qty=1.0,
+        price=100.0,
+        status="filled",
+        client_ts="2024-01-01T00:00:00+00:00",
+        exchange_ts=None,
+        idemp_key="pnl-state",
+    )
+    for idx in range(count):
+        ledger.record_fill(
+            order_id=order_id,
+            venue=rng.choice(["binance-um", "okx-perp"]),
+            symbol=rng.choice(["BTCUSDT", "ETHUSDT"]),
+            side=rng.choice(["buy", "sell"]),
+            qty=round(rng.uniform(0.01, 2.0), 3),
+            price=round(rng.uniform(90.0, 110.0), 2),
+            fee=0.01,
+            ts=f"2024-01-01T00:{idx // 60:02d}:{idx % 60:02d}+00:00",
+        )
+
+
+def test_incremental_pnl_matches_full_replay(ledger_db) -> None:
+    _record_random_fills(200)
+
+    assert ledger.compute_pnl()["realized"] == pytest.approx(_replay_realized())
+    assert ledger.verify_pnl_state() == []
+
+
+def test_rebuild_repairs_drifted_state(ledger_db) -> None:
+    _record_random_fills(50)
+    ledger._write(lambda conn: conn.execute("UPDATE pnl_state SET realized = realized + 5"))
+
+    assert cli_main(["pnl-rebuild", "--check"]) == 1
+    assert cli_main(["pnl-rebuild"]) == 0
+    assert cli_main(["pnl-rebuild", "--check"]) == 0
+    assert ledger.compute_pnl()["realized"] == pytest.approx(_replay_realized())
+
+
+def test_existing_database_is_seeded_on_init(ledger_db) -> None:
+    _record_random_fills(30)
+    ledger._write(lambda conn: conn.execute("DROP TABLE pnl_state"))
+    ledger.close_connections()
+
+    ledger.init_db()
+
+    assert ledger.verify_pnl_state() == []
+    assert ledger.compute_pnl()["realized"] == pytest.approx(_replay_realized())
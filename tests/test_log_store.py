@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from log_store import LogStore
+
+
+def test_appends_trim_and_reload_from_disk(tmp_path) -> None:
+    path = tmp_path / "stats.json"
+    store = LogStore(path, compact_min=1_000)
+    for idx in range(10):
+        store.append({"seq": idx}, keep=4)
+
+    assert store.recent(2) == [{"seq": 8}, {"seq": 9}]
+    assert store.records() == [{"seq": idx} for idx in range(6, 10)]
+    assert not path.exists()
+    assert len(store.log_path.read_text().splitlines()) == 11  # header + one line per append
+
+    reopened = LogStore(path)
+    assert reopened.records() == store.records()
+    assert reopened.recent(100) == store.records()
+
+
+def test_compaction_rewrites_base_and_restarts_log(tmp_path) -> None:
+    path = tmp_path / "history.json"
+    store = LogStore(path, compact_min=8)
+    for idx in range(20):
+        store.append({"seq": idx}, keep=5)
+
+    assert store.compactions == 2
+    base = json.loads(path.read_text())
+    assert base == [{"seq": idx} for idx in range(11, 16)]
+    assert len(store.log_path.read_text().splitlines()) == 1 + 4
+    assert LogStore(path).records() == [{"seq": idx} for idx in range(15, 20)]
+
+
+def test_torn_append_is_dropped_and_cut_before_next_write(tmp_path) -> None:
+    path = tmp_path / "positions.json"
+    store = LogStore(path)
+    store.append({"id": "a"})
+    store.append({"id": "b"})
+    with store.log_path.open("ab") as handle:
+        handle.write(b'{"op": "add", "rec": {"id": "tor')
+
+    recovered = LogStore(path)
+    assert recovered.records() == [{"id": "a"}, {"id": "b"}]
+    recovered.append({"id": "c"})
+    assert LogStore(path).records() == [{"id": "a"}, {"id": "b"}, {"id": "c"}]
+
+
+def test_log_left_behind_by_interrupted_compaction_is_ignored(tmp_path) -> None:
+    path = tmp_path / "positions.json"
+    store = LogStore(path)
+    for idx in range(3):
+        store.append({"id": str(idx)})
+    stale_log = store.log_path.read_bytes()
+
+    store.compact()
+    # Crash after the base was replaced but before the log was: the old log
+    # is still on disk, and its records are already in the base.
+    store.log_path.write_bytes(stale_log)
+
+    assert LogStore(path).records() == [{"id": "0"}, {"id": "1"}, {"id": "2"}]
+
+
+def test_set_and_locate_by_index_key(tmp_path) -> None:
+    path = tmp_path / "positions.json"
+    store = LogStore(path, index_key="id")
+    store.reset([{"id": "a", "status": "open"}, {"id": "b", "status": "open"}])
+    index = store.locate("b")
+    assert index == 1
+
+    record = store.get(index)
+    record["status"] = "closed"
+    store.set(index, record)
+
+    reopened = LogStore(path, index_key="id")
+    assert reopened.get(reopened.locate("b")) == {"id": "b", "status": "closed"}
+    assert reopened.locate("missing") is None
+
+
+def test_corrupt_line_with_records_behind_it_is_never_cut_off(tmp_path) -> None:
+    path = tmp_path / "positions.json"
+    store = LogStore(path)
+    store.append({"id": "a"})
+    with store.log_path.open("ab") as handle:
+        handle.write(b'{"op": "add", "rec": garbage}\n{"op": "add", "rec": {"id": "b"}}\n')
+    before = store.log_path.read_bytes()
+
+    recovered = LogStore(path)
+    assert recovered.records() == [{"id": "a"}]
+    with pytest.raises(OSError, match="refusing to append"):
+        recovered.append({"id": "c"})
+    assert store.log_path.read_bytes() == before
+
+
+def test_torn_line_from_a_crashed_writer_is_cut_while_the_log_is_open(tmp_path) -> None:
+    path = tmp_path / "positions.json"
+    store = LogStore(path)
+    store.append({"id": "a"})
+    with store.log_path.open("ab") as handle:
+        handle.write(b'{"op": "add", "rec": {"id": "tor')
+    store.append({"id": "b"})
+    assert LogStore(path).records() == [{"id": "a"}, {"id": "b"}]
+
+
+def test_compaction_keeps_appends_from_other_writers(tmp_path) -> None:
+    path = tmp_path / "positions.json"
+    first = LogStore(path)
+    second = LogStore(path)
+    first.append({"id": "a"})
+    second.append({"id": "b"})
+    first.compact()
+    second.append({"id": "c"})
+    assert LogStore(path).records() == [{"id": "a"}, {"id": "b"}, {"id": "c"}]
+
+
+def test_other_writers_and_deleted_files_are_picked_up(tmp_path) -> None:
+    path = tmp_path / "positions.json"
+    reader = LogStore(path)
+    writer = LogStore(path)
+    writer.reset([{"id": "a"}])
+    assert reader.records() == [{"id": "a"}]
+
+    writer.append({"id": "b"})
+    assert reader.recent(1) == [{"id": "b"}]
+    writer.compact()
+    for idx in range(5):
+        writer.append({"id": f"c{idx}"})
+    assert len(reader) == 7
+
+    path.unlink()
+    assert reader.records() == []
+
+
+def test_legacy_json_array_is_the_initial_base(tmp_path) -> None:
+    path = tmp_path / "legacy.json"
+    path.write_text(json.dumps([{"id": "x", "v": 1}, "junk", {"id": "y"}], indent=2))
+
+    store = LogStore(path)
+    store.append({"id": "z"})
+    assert LogStore(path).records() == [{"id": "x", "v": 1}, {"id": "y"}, {"id": "z"}]
@@ -15,11 +15,11 @@ def reset_watchdog() -> None:
 
 
 @pytest.fixture
-def router(monkeypatch: pytest.MonkeyPatch) -> SmartRouter:
-    monkeypatch.setenv("DEFAULT_PROFILE", "paper")
-    monkeypatch.setenv("FF_RISK_LIMITS", "0")
-    monkeypatch.setenv("FF_PRETRADE_STRICT", "0")
-    monkeypatch.delenv("FF_MD_WATCHDOG", raising=False)
+def router(monkeypatch: pytest.MonkeyPatch, settings_env) -> SmartRouter:
+    settings_env.setenv("DEFAULT_PROFILE", "paper")
+    settings_env.setenv("FF_RISK_LIMITS", "0")
+    settings_env.setenv("FF_PRETRADE_STRICT", "0")
+    settings_env.delenv("FF_MD_WATCHDOG", raising=False)
     monkeypatch.setattr("app.router.smart_router.get_liquidity_status", lambda: {})
     state = SimpleNamespace(config=None)
     market = SimpleNamespace()
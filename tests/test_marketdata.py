@@ -1,3 +1,8 @@
+import asyncio
+import threading
+import time
+
+from app.metrics.marketdata import MARKETDATA_TOB_REQUESTS_TOTAL
 from app.services.marketdata import MarketDataAggregator
 
 
@@ -19,3 +24,156 @@ def test_marketdata_rest_fallback_and_cache():
     cached = aggregator.top_of_book("binance-um", "BTCUSDT")
     assert cached["bid"] == 99.5
     assert calls["count"] == 1, "should not call REST when cache fresh"
+
+
+def _requests(venue: str, result: str) -> float:
+    return MARKETDATA_TOB_REQUESTS_TOTAL.labels(venue=venue, result=result)._value.get()
+
+
+def test_marketdata_concurrent_misses_share_one_rest_fetch():
+    release = threading.Event()
+    calls = []
+
+    def fetch(symbol: str):
+        calls.append(symbol)
+        release.wait(5.0)
+        return {"bid": 10.0, "ask": 11.0, "ts": time.time()}
+
+    aggregator = MarketDataAggregator(rest_fetchers={"venue-sf": fetch}, stale_after=10.0)
+    coalesced_before = _requests("venue-sf", "coalesced")
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(aggregator.top_of_book("venue-sf", "ETHUSDT"))
+        )
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    deadline = time.time() + 5.0
+    while _requests("venue-sf", "coalesced") - coalesced_before < 4 and time.time() < deadline:
+        time.sleep(0.005)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert calls == ["ETHUSDT"]
+    assert [book["bid"] for book in results] == [10.0] * 5
+    assert _requests("venue-sf", "coalesced") - coalesced_before == 4
+
+
+def test_marketdata_async_coalesces_and_negative_caches_failures():
+    now = {"t": 1000.0}
+    calls = {"count": 0}
+
+    def failing(symbol: str):
+        calls["count"] += 1
+        raise RuntimeError("venue degraded")
+
+    aggregator = MarketDataAggregator(
+        rest_fetchers={"venue-neg": failing},
+        stale_after=1.0,
+        negative_ttl=2.0,
+        clock=lambda: now["t"],
+    )
+
+    async def scenario():
+        results = await asyncio.gather(
+            *(aggregator.top_of_book_async("venue-neg", "BTCUSDT") for _ in range(3)),
+            return_exceptions=True,
+        )
+        assert all(isinstance(item, RuntimeError) for item in results)
+        assert calls["count"] == 1
+        try:
+            await aggregator.top_of_book_async("venue-neg", "BTCUSDT")
+        except RuntimeError:
+            pass
+        else:  # pragma: no cover - defensive
+            raise AssertionError("negative cache should re-raise")
+        assert calls["count"] == 1
+        now["t"] += 3.0
+        try:
+            await aggregator.top_of_book_async("venue-neg", "BTCUSDT")
+        except RuntimeError:
+            pass
+        assert calls["count"] == 2
+
+    asyncio.run(scenario())
+    assert _requests("venue-neg", "negative") >= 1
+
+
+def test_marketdata_serves_stale_while_refreshing():
+    now = {"t": 100.0}
+    refreshed = threading.Event()
+
+    def fetch(symbol: str):
+        refreshed.set()
+        return {"bid": 2.0, "ask": 3.0, "ts": now["t"]}
+
+    aggregator = MarketDataAggregator(
+        rest_fetchers={"venue-swr": fetch},
+        stale_after=1.0,
+        serve_stale_ms=500,
+        clock=lambda: now["t"],
+    )
+    aggregator.update_from_ws(venue="venue-swr", symbol="BTCUSDT", bid=1.0, ask=1.5, ts=100.0)
+    now["t"] = 101.2
+    book = aggregator.top_of_book("venue-swr", "BTCUSDT")
+    assert book["bid"] == 1.0
+    assert refreshed.wait(5.0)
+    deadline = time.time() + 5.0
+    while aggregator.top_of_book("venue-swr", "BTCUSDT")["bid"] != 2.0:
+        assert time.time() < deadline
+        time.sleep(0.005)
+
+
+def test_marketdata_negative_cache_raises_fresh_chained_errors():
+    original = RuntimeError("venue degraded")
+
+    def failing(symbol: str):
+        raise original
+
+    aggregator = MarketDataAggregator(
+        rest_fetchers={"venue-chain": failing}, stale_after=1.0, negative_ttl=60.0
+    )
+    raised = []
+    for _ in range(2):
+        try:
+            aggregator.top_of_book("venue-chain", "BTCUSDT")
+        except RuntimeError as exc:
+            raised.append(exc)
+    first, second = raised
+    assert first is original
+    assert second is not original
+    assert second.__cause__ is original
+    assert second.args == original.args
+
+
+def test_marketdata_stale_entry_is_not_revalidated_while_negatively_cached():
+    now = {"t": 100.0}
+    calls = []
+    failed = threading.Event()
+
+    def failing(symbol: str):
+        calls.append(symbol)
+        failed.set()
+        raise RuntimeError("venue degraded")
+
+    aggregator = MarketDataAggregator(
+        rest_fetchers={"venue-swr-neg": failing},
+        stale_after=1.0,
+        serve_stale_ms=5000,
+        negative_ttl=2.0,
+        clock=lambda: now["t"],
+    )
+    aggregator.update_from_ws(venue="venue-swr-neg", symbol="BTCUSDT", bid=1.0, ask=1.5, ts=100.0)
+    now["t"] = 101.2
+    assert aggregator.top_of_book("venue-swr-neg", "BTCUSDT")["bid"] == 1.0
+    assert failed.wait(5.0)
+    deadline = time.time() + 5.0
+    while not aggregator._failures and time.time() < deadline:
+        time.sleep(0.005)
+
+    now["t"] = 102.0
+    assert aggregator.top_of_book("venue-swr-neg", "BTCUSDT")["bid"] == 1.0
+    aggregator._get_executor().shutdown(wait=True)
+    assert calls == ["BTCUSDT"]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 from pathlib import Path
 
 import app.metrics.core as core
@@ -50,3 +51,68 @@ def test_write_metrics(tmp_path: Path, monkeypatch) -> None:
 
     payload = target.read_text(encoding="utf-8")
     assert payload.strip() != ""
+
+
+def test_counter_shards_merge_across_threads() -> None:
+    registry = core.Registry()
+    counter = registry.counter("demo_threads_total", labels=("venue",))
+    assert counter.labels(venue="okx") is counter.labels(venue="okx")
+
+    def worker() -> None:
+        for _ in range(1_000):
+            counter.labels(venue="okx").inc()
+            counter.inc(0.5)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert counter._values.get(("okx",)) == 8_000
+    assert counter._values.get(()) == 4_000
+    payload = registry.to_text()
+    assert 'demo_threads_total{venue="okx"} 8000' in payload
+
+    counter._values.clear()
+    assert counter._values.get(("okx",), 0.0) == 0.0
+
+
+def test_to_text_cache_follows_mutations() -> None:
+    registry = core.Registry()
+    gauge = registry.gauge("demo_cached_gauge")
+    gauge.set(1.0)
+    first = registry.to_text()
+    assert registry.to_text() is first
+
+    gauge.set(2.0)
+    assert "demo_cached_gauge 2" in registry.to_text()
+    registry.counter("demo_cached_total").labels()
+    assert "demo_cached_total 0" in registry.to_text()
+
+
+def test_histogram_bucket_bounds_are_inclusive() -> None:
+    registry = core.Registry()
+    histogram = registry.histogram("demo_bounds_ms", buckets=[10.0, 1.0, 5.0])
+    for value in (1.0, 5.0, 5.5, 10.0, 99.0, float("nan")):
+        histogram.observe(value)
+
+    payload = registry.to_text()
+    assert 'demo_bounds_ms_bucket{le="1"} 1' in payload
+    assert 'demo_bounds_ms_bucket{le="5"} 2' in payload
+    assert 'demo_bounds_ms_bucket{le="10"} 4' in payload
+    assert 'demo_bounds_ms_bucket{le="+Inf"} 6' in payload
+
+
+def test_equal_label_values_of_different_types_are_separate_series() -> None:
+    registry = core.Registry()
+    counter = registry.counter("demo_typed_total", labels=("v",))
+    counter.labels(v=1).inc()
+    counter.labels(v=1.0).inc(2)
+    counter.labels(v=True).inc(3)
+    counter.labels(v=1).inc()
+
+    payload = registry.to_text()
+    assert 'demo_typed_total{v="1"} 2' in payload
+    assert 'demo_typed_total{v="1.0"} 2' in payload
+    assert 'demo_typed_total{v="True"} 3' in payload
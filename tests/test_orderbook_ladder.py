@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import random
+
+from app.market.orderbook.book_store import BookSide, LadderBookSide, OrderBookStore
+
+
+def _random_updates(rng: random.Random, count: int) -> list[tuple[float, float]]:
+    updates = []
+    for _ in range(count):
+        price = round(100.0 + rng.randint(-50, 50) * 0.5, 1)
+        size = 0.0 if rng.random() < 0.35 else round(rng.uniform(0.1, 3.0), 3)
+        updates.append((price, size))
+    return updates
+
+
+def test_ladder_matches_dict_side_contract() -> None:
+    rng = random.Random(11)
+    for descending in (True, False):
+        legacy = BookSide(descending=descending)
+        ladder = LadderBookSide(descending=descending)
+        for _ in range(500):
+            updates = _random_updates(rng, 6)
+            legacy.apply(updates)
+            ladder.apply(updates)
+            assert ladder.top() == legacy.top()
+            assert ladder.as_list(5) == legacy.as_list(5)
+        assert ladder.as_list() == legacy.as_list()
+        assert ladder.as_list(0) == []
+        assert ladder.as_list(10_000) == legacy.as_list(10_000)
+
+
+def test_ladder_empty_and_delete_of_missing_level() -> None:
+    side = LadderBookSide(descending=True)
+    assert side.top() == (None, None)
+    side.apply([(101.0, 0.0)])
+    assert side.as_list() == []
+    side.apply([(101.0, 1.0), (102.0, 2.0), (101.0, 1.5)])
+    assert side.top() == (102.0, 2.0)
+    assert side.as_list() == [(102.0, 2.0), (101.0, 1.5)]
+
+
+def test_store_uses_ladder_by_default_and_accepts_factory() -> None:
+    store = OrderBookStore()
+    store.apply_snapshot(
+        venue="binance", symbol="BTCUSDT", bids=[(100.0, 1.0)], asks=[(101.0, 1.0)], last_seq=1
+    )
+    record = store.get_or_create("binance", "BTCUSDT")
+    assert isinstance(record.bids, LadderBookSide)
+    assert store.get_top_of_book("binance", "BTCUSDT")["bid"] == 100.0
+
+    legacy_store = OrderBookStore(side_factory=lambda descending: BookSide(descending=descending))
+    legacy_store.apply_snapshot(
+        venue="okx", symbol="BTCUSDT", bids=[(99.0, 1.0)], asks=[(102.0, 1.0)], last_seq=1
+    )
+    assert isinstance(legacy_store.get_or_create("okx", "BTCUSDT").asks, BookSide)
+    assert legacy_store.get_top_of_book("okx", "BTCUSDT")["ask"] == 102.0
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from app.market.orderbook.book_store import DiffEvent, OrderBookStore, TopOfBook
+
+
+def _diff(symbol: str, seq: int, bid: float, ask: float) -> DiffEvent:
+    return {
+        "symbol": symbol,
+        "bids": [(bid, 1.0)],
+        "asks": [(ask, 1.0)],
+        "seq_from": seq,
+        "seq_to": seq,
+        "ts_ms": 1000 + seq,
+    }
+
+
+def test_top_snapshot_is_immutable_and_versioned() -> None:
+    store = OrderBookStore(now=lambda: 10.0)
+    store.apply_snapshot(
+        venue="binance", symbol="BTCUSDT", bids=[(100.0, 1.0)], asks=[(101.0, 2.0)], last_seq=1
+    )
+    first = store.get_top_snapshot("binance", "BTCUSDT")
+    assert isinstance(first, TopOfBook)
+    assert (first.bid, first.ask, first.seq) == (100.0, 101.0, 1)
+
+    store.apply_diff("binance", _diff("BTCUSDT", 2, 100.5, 100.9))
+    second = store.get_top_snapshot("binance", "BTCUSDT")
+    assert second.version == first.version + 1
+    assert (second.bid, second.ask, second.seq) == (100.5, 100.9, 2)
+    # The earlier snapshot handed to a reader is never mutated in place.
+    assert first.bid == 100.0
+    with pytest.raises(AttributeError):
+        first.bid = 1.0  # type: ignore[misc]
+
+    top = store.get_top_of_book("binance", "BTCUSDT")
+    assert top["bid"] == 100.5
+    assert top["version"] == second.version
+
+
+def test_status_snapshot_does_not_reenter_get_or_create(monkeypatch: pytest.MonkeyPatch) -> None:
+    store = OrderBookStore(now=lambda: 20.0)
+    store.apply_snapshot(
+        venue="okx",
+        symbol="ETHUSDT",
+        bids=[(10.0, 1.0)],
+        asks=[(11.0, 1.0)],
+        last_seq=5,
+        ts_ms=15_000,
+    )
+    store.get_or_create("okx", "BTCUSDT")
+
+    def _fail(*_args: object) -> None:
+        raise AssertionError("status_snapshot must not call get_or_create")
+
+    monkeypatch.setattr(store, "get_or_create", _fail)
+    rows = {row["symbol"]: row for row in store.status_snapshot()}
+    assert rows["ETHUSDT"]["staleness_s"] == pytest.approx(5.0)
+    assert rows["BTCUSDT"]["staleness_s"] == float("inf")
+
+
+def test_concurrent_writers_on_separate_books() -> None:
+    store = OrderBookStore()
+    symbols = [f"SYM{i}USDT" for i in range(8)]
+    for symbol in symbols:
+        store.apply_snapshot(
+            venue="binance", symbol=symbol, bids=[(1.0, 1.0)], asks=[(2.0, 1.0)], last_seq=0
+        )
+
+    def writer(symbol: str) -> None:
+        for seq in range(1, 501):
+            store.apply_diff("binance", _diff(symbol, seq, 1.0 + seq * 0.001, 3.0))
+
+    threads = [threading.Thread(target=writer, args=(symbol,)) for symbol in symbols]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for symbol in symbols:
+        top = store.get_top_snapshot("binance", symbol)
+        assert top.seq == 500
+        assert top.bid == pytest.approx(1.5)
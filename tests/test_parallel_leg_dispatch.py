@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from app.broker.router import ExecutionRouter, _leg_timing_summary
+from app.services.arbitrage import Plan, PlanLeg
+
+
+class _RecordingBroker:
+    def __init__(self) -> None:
+        self.orders: list[dict] = []
+        self.cancels: list[int] = []
+
+    async def create_order(self, **kwargs):
+        self.orders.append(kwargs)
+        return {"order_id": len(self.orders), **kwargs}
+
+    async def cancel(self, *, venue: str, order_id: int) -> None:
+        self.cancels.append(order_id)
+
+
+def _plan() -> Plan:
+    return Plan(
+        symbol="BTCUSDT",
+        notional=1_000.0,
+        used_slippage_bps=0,
+        used_fees_bps={},
+        viable=True,
+        legs=[
+            PlanLeg(exchange="binance", side="buy", price=100.0, qty=1.0, fee_usdt=0.0),
+            PlanLeg(exchange="okx", side="sell", price=101.0, qty=1.0, fee_usdt=0.0),
+        ],
+    )
+
+
+@pytest.fixture
+def router(monkeypatch: pytest.MonkeyPatch):
+    brokers = {"binance-um": _RecordingBroker(), "okx-perp": _RecordingBroker()}
+    instance = ExecutionRouter.__new__(ExecutionRouter)
+    instance.dry_run_only = False
+    instance._brokers = {"paper": _RecordingBroker(), **brokers}
+    events: list[dict] = []
+    monkeypatch.setattr("app.broker.router.register_order_attempt", lambda **_: None)
+    monkeypatch.setattr(
+        "app.broker.router.ledger.record_event", lambda **kwargs: events.append(kwargs)
+    )
+    recorded: dict[str, dict] = {}
+    monkeypatch.setattr("app.broker.router.ledger.get_order_by_key", recorded.get)
+    alerts: list[dict] = []
+    monkeypatch.setattr(
+        "app.broker.router._emit_ops_alert",
+        lambda kind, text, extra=None: alerts.append({"kind": kind, "extra": extra}),
+    )
+    instance.events = events
+    instance.recorded = recorded
+    instance.alerts = alerts
+    return instance
+
+
+def _fake_leg(behaviour: dict[int, object], delay: float = 0.05):
+    async def place(*, venue, symbol, side, qty, price, index, timing=None, **_):
+        if timing is not None:
+            timing["sent_mono"] = time.perf_counter()
+        outcome = behaviour.get(index)
+        if outcome == "hang":
+            await asyncio.sleep(60)
+        await asyncio.sleep(delay)
+        if isinstance(outcome, Exception):
+            raise outcome
+        if timing is not None:
+            timing["ack_mono"] = time.perf_counter()
+        ack = {
+            "order_id": 10 + index,
+            "venue": venue,
+            "symbol": symbol,
+            "side": side,
+            "qty": qty,
+            "price": price,
+        }
+        if isinstance(outcome, dict):
+            ack.update(outcome)
+        return ack
+
+    return place
+
+
+def _timings(router: ExecutionRouter, plan: Plan) -> list[dict]:
+    return [
+        {"index": i, "venue": router._venue_for_exchange(leg.exchange)}
+        for i, leg in enumerate(plan.legs)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_parallel_dispatch_sends_legs_concurrently(router) -> None:
+    plan = _plan()
+    timings = _timings(router, plan)
+    router._place_leg_with_retry = _fake_leg({})
+
+    started = time.perf_counter()
+    orders = await router._dispatch_legs_parallel(
+        plan, plan_key="k", post_only=False, reduce_only=False, strategy_id=None, timings=timings
+    )
+    elapsed = time.perf_counter() - started
+
+    assert [order["venue"] for order in orders] == ["binance-um", "okx-perp"]
+    assert elapsed < 0.09
+    summary = _leg_timing_summary("parallel", timings)
+    assert summary["send_skew_ms"] < 20.0
+    assert all("ack_latency_ms" in leg for leg in summary["legs"])
+
+
+@pytest.mark.asyncio
+async def test_failed_leg_unwinds_filled_sibling(router) -> None:
+    plan = _plan()
+    router._place_leg_with_retry = _fake_leg({1: RuntimeError("order_failed:rejected")})
+
+    with pytest.raises(RuntimeError, match="rejected"):
+        await router._dispatch_legs_parallel(
+            plan,
+            plan_key="k",
+            post_only=False,
+            reduce_only=False,
+            strategy_id=None,
+            timings=_timings(router, plan),
+        )
+
+    unwind = router._brokers["binance-um"].orders
+    assert len(unwind) == 1
+    assert unwind[0]["side"] == "sell"
+    assert unwind[0]["qty"] == pytest.approx(1.0)
+    assert unwind[0]["reduce_only"] is True
+    assert router._brokers["okx-perp"].orders == []
+    assert router.events[-1]["code"] == "parallel_legs_unwound"
+
+
+@pytest.mark.asyncio
+async def test_deadline_cancels_hung_leg(
+    router, monkeypatch: pytest.MonkeyPatch, settings_env
+) -> None:
+    settings_env.setenv("LEG_DISPATCH_DEADLINE_SEC", "0.2")
+    plan = _plan()
+    router._place_leg_with_retry = _fake_leg({1: "hang"})
+
+    with pytest.raises(RuntimeError, match="leg_deadline_exceeded"):
+        await router._dispatch_legs_parallel(
+            plan,
+            plan_key="k",
+            post_only=False,
+            reduce_only=False,
+            strategy_id=None,
+            timings=_timings(router, plan),
+        )
+
+    assert router._brokers["binance-um"].orders[0]["side"] == "sell"
+    assert router.events[-1]["payload"]["abandoned"] == ["k:1"]
+
+
+async def _dispatch_failing(router, plan: Plan, behaviour: dict[int, object]) -> None:
+    router._place_leg_with_retry = _fake_leg(behaviour)
+    with pytest.raises(RuntimeError):
+        await router._dispatch_legs_parallel(
+            plan,
+            plan_key="k",
+            post_only=False,
+            reduce_only=False,
+            strategy_id=None,
+            timings=_timings(router, plan),
+        )
+
+
+@pytest.mark.asyncio
+async def test_unwind_prices_unpriced_ack_from_the_plan_leg(router) -> None:
+    await _dispatch_failing(router, _plan(), {0: {"price": 0.0}, 1: RuntimeError("rejected")})
+
+    unwind = router._brokers["binance-um"].orders
+    assert [(order["side"], order["qty"]) for order in unwind] == [("sell", pytest.approx(1.0))]
+    assert router.alerts == []
+
+
+@pytest.mark.asyncio
+async def test_unwind_alerts_when_no_price_is_available(router) -> None:
+    plan = _plan()
+    plan.legs[0].price = 0.0
+    await _dispatch_failing(router, plan, {0: {"price": None}, 1: RuntimeError("rejected")})
+
+    assert router._brokers["binance-um"].orders == []
+    assert router.alerts[0]["kind"] == "parallel_leg_unhedged"
+    unhedged = router.events[-1]["payload"]["unhedged"]
+    assert [(leg["venue"], leg["error"]) for leg in unhedged] == [("binance-um", "no_price")]
+
+
+@pytest.mark.asyncio
+async def test_partially_filled_leg_is_cancelled_and_unwound_for_filled_qty(router) -> None:
+    await _dispatch_failing(
+        router,
+        _plan(),
+        {0: {"status": "partially_filled", "filled_qty": 0.4}, 1: RuntimeError("rejected")},
+    )
+
+    broker = router._brokers["binance-um"]
+    assert broker.cancels == [10]
+    assert [(order["side"], order["qty"]) for order in broker.orders] == [
+        ("sell", pytest.approx(0.4))
+    ]
+
+
+@pytest.mark.asyncio
+async def test_deadline_cancels_abandoned_leg_found_in_ledger(
+    router, monkeypatch: pytest.MonkeyPatch, settings_env
+) -> None:
+    settings_env.setenv("LEG_DISPATCH_DEADLINE_SEC", "0.2")
+    router.recorded["k:1"] = {
+        "id": 77,
+        "venue": "okx-perp",
+        "symbol": "BTCUSDT",
+        "side": "sell",
+        "qty": 1.0,
+        "price": 101.0,
+        "status": "submitted",
+    }
+    await _dispatch_failing(router, _plan(), {1: "hang"})
+
+    assert router._brokers["okx-perp"].cancels == [77]
+    assert router._brokers["okx-perp"].orders == []
+    assert router.events[-1]["payload"]["abandoned"] == []
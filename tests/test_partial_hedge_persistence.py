@@ -1,9 +1,10 @@
 import importlib
-import json
 
 import pytest
 from fastapi.testclient import TestClient
 
+from log_store import LogStore
+
 
 class _StubClient:
     def __init__(self, venue: str, mark_price: float) -> None:
@@ -98,8 +99,7 @@ def test_partial_position_persisted_after_hold(monkeypatch, tmp_path):
     assert len(open_positions) == 1
     assert open_positions[0]["id"] == partial["id"]
 
-    with store_path.open("r", encoding="utf-8") as handle:
-        persisted = json.load(handle)
+    persisted = LogStore(store_path).records()
     assert persisted and persisted[0]["status"] == "partial"
 
     main_mod = importlib.reload(importlib.import_module("app.main"))
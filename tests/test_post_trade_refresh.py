@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.services import risk
+from app.services.portfolio import PortfolioSnapshot
+from app.services.post_trade import PostTradeRefresher
+from app.services.runtime import get_state
+
+
+class _CountingRefresher(PostTradeRefresher):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.started = 0
+
+    async def refresh(self) -> PortfolioSnapshot:
+        self.started += 1
+        await asyncio.sleep(0.02)
+        self.runs += 1
+        self.last_snapshot = PortfolioSnapshot()
+        return self.last_snapshot
+
+
+@pytest.mark.asyncio
+async def test_burst_of_requests_coalesces_into_one_refresh() -> None:
+    refresher = _CountingRefresher(debounce=0.02)
+    for _ in range(10):
+        refresher.schedule()
+    assert refresher.pending
+    await refresher.flush()
+
+    assert refresher.requests == 10
+    assert refresher.runs == 1
+
+
+@pytest.mark.asyncio
+async def test_request_during_refresh_triggers_one_more_pass() -> None:
+    refresher = _CountingRefresher(debounce=0.0)
+    refresher.schedule()
+    await asyncio.sleep(0.005)
+    assert refresher.started == 1
+    refresher.schedule()
+    refresher.schedule()
+    await refresher.flush()
+
+    assert refresher.runs == 2
+
+
+def test_apply_execution_updates_risk_before_refresh() -> None:
+    state = get_state()
+    state.risk.limits.max_position_usdt = {"BTCUSDT": 150.0}
+    state.risk.current.position_usdt = {"BTCUSDT": 100.0}
+    state.risk.current.open_orders = {}
+
+    risk.apply_execution(
+        [
+            {"venue": "binance-um", "symbol": "btcusdt", "qty": 0.5, "price": 100.0},
+            {"venue": "okx-perp", "symbol": "BTCUSDT", "qty": 0.5, "price": 100.0, "status": "new"},
+            {"venue": "paper", "symbol": "BTCUSDT", "qty": 9.0, "price": 100.0, "simulated": True},
+        ]
+    )
+
+    assert state.risk.current.position_usdt["BTCUSDT"] == pytest.approx(200.0)
+    assert state.risk.current.open_orders == {"okx-perp": 1}
+    assert [breach.limit for breach in state.risk.breaches] == ["max_position_usdt"]
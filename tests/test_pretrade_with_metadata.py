@@ -18,8 +18,8 @@ def reset_metadata_provider() -> None:
 
 
 @pytest.fixture(autouse=True)
-def enable_strict_pretrade(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setenv("FF_PRETRADE_STRICT", "1")
+def enable_strict_pretrade(monkeypatch: pytest.MonkeyPatch, settings_env) -> None:
+    settings_env.setenv("FF_PRETRADE_STRICT", "1")
     monkeypatch.setattr("app.router.smart_router.get_liquidity_status", lambda: {})
 
 
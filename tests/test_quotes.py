@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from app.services import arbitrage
+from app.services.quotes import gather_quotes, gather_quotes_async
+from app.services.runtime import get_market_data, get_state, reset_for_tests
+
+
+def _slow(delay: float, bid: float):
+    def fetch():
+        time.sleep(delay)
+        return {"bid": bid, "ask": bid + 1.0}
+
+    return fetch
+
+
+def test_gather_quotes_fetches_legs_concurrently() -> None:
+    started = time.perf_counter()
+    quotes = gather_quotes({"a": _slow(0.2, 10.0), "b": _slow(0.2, 20.0)}, timeout=2.0)
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.35
+    assert quotes.ok
+    assert quotes.quote("a")["bid"] == 10.0
+    assert quotes.quote("b")["bid"] == 20.0
+    assert all(leg.latency_ms >= 150.0 for leg in quotes.legs.values())
+
+
+def test_gather_quotes_applies_per_venue_timeouts() -> None:
+    def boom():
+        raise RuntimeError("venue down")
+
+    started = time.perf_counter()
+    quotes = gather_quotes(
+        {"fast": _slow(0.0, 1.0), "slow": _slow(1.0, 2.0), "broken": boom},
+        timeout={"fast": 1.0, "slow": 0.05, "broken": 1.0},
+    )
+
+    assert time.perf_counter() - started < 0.5
+    assert quotes.legs["fast"].ok
+    assert isinstance(quotes.legs["slow"].error, TimeoutError)
+    assert str(quotes.legs["broken"].error) == "venue down"
+    assert {leg.venue for leg in quotes.failed()} == {"slow", "broken"}
+    with pytest.raises(TimeoutError):
+        quotes.quote("slow")
+
+
+def test_gather_quotes_async_mixes_sync_and_async_fetchers() -> None:
+    async def async_fetch():
+        await asyncio.sleep(0.2)
+        return {"bid": 5.0, "ask": 6.0, "ts": 1_000.0}
+
+    async def run():
+        started = time.perf_counter()
+        quotes = await gather_quotes_async(
+            {"ws": async_fetch, "rest": _slow(0.2, 7.0)}, timeout=1.0
+        )
+        return quotes, time.perf_counter() - started
+
+    quotes, elapsed = asyncio.run(run())
+
+    assert elapsed < 0.35
+    assert quotes.legs["ws"].ts == 1_000.0
+    assert quotes.quote("rest")["bid"] == 7.0
+    assert quotes.skew_ms() > 1_000.0
+
+
+def test_build_plan_rejects_quotes_too_far_apart(monkeypatch: pytest.MonkeyPatch) -> None:
+    reset_for_tests()
+    state = get_state()
+    state.control.min_spread_bps = 0.0
+    state.control.taker_fee_bps_binance = 0
+    state.control.taker_fee_bps_okx = 0
+    state.risk.limits.max_position_usdt["BTCUSDT"] = 1_000.0
+    now = time.time()
+    aggregator = get_market_data()
+    aggregator.update_from_ws(
+        venue="binance-um", symbol="BTCUSDT", bid=20_000.0, ask=20_001.0, ts=now - 0.5
+    )
+    aggregator.update_from_ws(
+        venue="okx-perp", symbol="BTCUSDT", bid=20_040.0, ask=20_041.0, ts=now
+    )
+
+    monkeypatch.setenv("QUOTE_MAX_SKEW_MS", "100")
+    plan = arbitrage.build_plan("BTCUSDT", 100.0, 0)
+    assert plan.viable is False
+    assert plan.reason is not None and plan.reason.startswith("quote skew")
+    assert plan.quote_skew_ms == pytest.approx(500.0, abs=1.0)
+
+    monkeypatch.setenv("QUOTE_MAX_SKEW_MS", "1000")
+    plan = asyncio.run(arbitrage.build_plan_async("BTCUSDT", 100.0, 0))
+    assert plan.viable is True
+    assert set(plan.as_dict()["quote_ts"]) == {"binance-um", "okx-perp"}
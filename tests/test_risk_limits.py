@@ -152,8 +152,8 @@ def test_consecutive_rejects_trigger_cooloff() -> None:
     assert reason == ""
 
 
-def test_risk_flag_off(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.delenv("FF_RISK_LIMITS", raising=False)
+def test_risk_flag_off(monkeypatch: pytest.MonkeyPatch, settings_env) -> None:
+    settings_env.delenv("FF_RISK_LIMITS", raising=False)
     monkeypatch.setattr("app.router.smart_router.get_liquidity_status", lambda: {})
     state = SimpleNamespace(config=SimpleNamespace(data=None))
     router = SmartRouter(state=state, market_data=SimpleNamespace())
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from app.utils.rolling import RollingCounter, RollingQuantile
+
+
+def test_counter_drops_buckets_that_leave_the_window() -> None:
+    counter = RollingCounter(60.0, buckets=60)
+    counter.add(0.0, "ok")
+    counter.add(10.0, "error", 2)
+    counter.add(30.0, "ok")
+    assert counter.counts(30.0) == {"ok": 2, "error": 2}
+
+    assert counter.counts(60.5) == {"ok": 1, "error": 2}
+    assert counter.count(70.5, "error") == 0
+    assert counter.total(70.5) == 1
+    # A jump past the whole window clears everything.
+    assert counter.total(1_000.0) == 0
+
+    counter.add(1_000.0, "ok")
+    counter.add(900.0, "ok")  # older than the window: ignored
+    counter.add(990.0, "ok")  # late but inside the window
+    assert counter.count(1_000.0, "ok") == 2
+
+
+def test_quantile_tracks_exact_nearest_rank_within_accuracy() -> None:
+    rng = random.Random(7)
+    sketch = RollingQuantile(120.0, relative_accuracy=0.01)
+    samples = []
+    for idx in range(5_000):
+        value = rng.lognormvariate(4.0, 1.0)
+        samples.append(value)
+        sketch.add(idx * 0.01, value)
+    ordered = sorted(samples)
+    for q in (0.5, 0.95, 0.99):
+        exact = ordered[max(int(q * len(ordered) + 0.999999) - 1, 0)]
+        assert sketch.quantile(50.0, q) == pytest.approx(exact, rel=0.01)
+    assert sketch.quantile(50.0, 1.0) == max(samples)
+    assert sketch.quantile(50.0, 0.0) == min(samples)
+
+
+def test_quantile_forgets_expired_samples() -> None:
+    sketch = RollingQuantile(120.0)
+    sketch.add(0.0, 1_500.0)
+    assert sketch.quantile(0.0, 0.95) == 1_500.0
+
+    sketch.add(200.0, 5.0)
+    assert len(sketch) == 1
+    assert sketch.quantile(200.0, 0.95) == 5.0
+    assert sketch.quantile(500.0, 0.95) == 0.0
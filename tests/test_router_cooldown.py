@@ -26,13 +26,15 @@ class _DummyMarketData:
 
 
 @pytest.fixture
-def router_factory(monkeypatch: pytest.MonkeyPatch) -> Callable[[bool, int], SmartRouter]:
+def router_factory(
+    monkeypatch: pytest.MonkeyPatch, settings_env
+) -> Callable[[bool, int], SmartRouter]:
     def factory(enable_cooldown: bool, default_ttl: int = 5) -> SmartRouter:
         for key in intent_stats:
             intent_stats[key] = 0
-        monkeypatch.setenv("FF_PRETRADE_STRICT", "false")
-        monkeypatch.setenv("FF_MD_WATCHDOG", "false")
-        monkeypatch.setenv("FF_RISK_LIMITS", "false")
+        settings_env.setenv("FF_PRETRADE_STRICT", "false")
+        settings_env.setenv("FF_MD_WATCHDOG", "false")
+        settings_env.setenv("FF_RISK_LIMITS", "false")
         monkeypatch.setenv("IDEMPOTENCY_WINDOW_SEC", "5")
         monkeypatch.delenv("IDEMPOTENCY_MAX_KEYS", raising=False)
         monkeypatch.setenv(
@@ -24,12 +24,12 @@ class _DummyMarketData:
 
 
 @pytest.fixture
-def router(monkeypatch: pytest.MonkeyPatch) -> SmartRouter:
+def router(monkeypatch: pytest.MonkeyPatch, settings_env) -> SmartRouter:
     for key in intent_stats:
         intent_stats[key] = 0
-    monkeypatch.setenv("FF_PRETRADE_STRICT", "false")
-    monkeypatch.setenv("FF_MD_WATCHDOG", "false")
-    monkeypatch.setenv("FF_RISK_LIMITS", "false")
+    settings_env.setenv("FF_PRETRADE_STRICT", "false")
+    settings_env.setenv("FF_MD_WATCHDOG", "false")
+    settings_env.setenv("FF_RISK_LIMITS", "false")
     monkeypatch.setenv("IDEMPOTENCY_WINDOW_SEC", "5")
     monkeypatch.delenv("IDEMPOTENCY_MAX_KEYS", raising=False)
 
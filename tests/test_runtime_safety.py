@@ -1,6 +1,7 @@
 import json
 
 import json
+import time
 
 import pytest
 
@@ -193,6 +194,42 @@ def test_hold_reason_persisted_to_runtime_store(monkeypatch, tmp_path):
 
     runtime.engage_safety_hold("audit_hold", source="pytest")
 
-    payload = json.loads(runtime_path.read_text())
+    payload = _wait_for_hold_reason(runtime_path, "audit_hold")
     assert payload["safety"]["hold_active"] is True
     assert payload["safety"]["hold_reason"] == "audit_hold"
+
+
+def _wait_for_hold_reason(path, reason, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    payload = {}
+    while time.monotonic() < deadline:
+        if path.exists():
+            payload = json.loads(path.read_text())
+            if payload.get("safety", {}).get("hold_reason") == reason:
+                break
+        time.sleep(0.01)
+    return payload
+
+
+def test_first_hold_of_a_process_is_persisted_as_critical(monkeypatch, tmp_path):
+    runtime_path = tmp_path / "runtime_state.json"
+    monkeypatch.setenv("RUNTIME_STATE_PATH", str(runtime_path))
+    # Far beyond the test: only a critical submission reaches disk in time.
+    monkeypatch.setenv("RUNTIME_STATE_FLUSH_MS", "600000")
+    runtime.reset_for_tests()
+    runtime._PERSISTED_HOLD.clear()
+    submitted = []
+    submit = runtime._store_submit_runtime_updates
+
+    def _record(updates, *, critical=False):
+        submitted.append((sorted(updates), critical))
+        submit(updates, critical=critical)
+
+    monkeypatch.setattr(runtime, "_store_submit_runtime_updates", _record)
+
+    runtime.engage_safety_hold("review_probe", source="pytest")
+
+    assert (["safety"], True) in submitted
+    payload = _wait_for_hold_reason(runtime_path, "review_probe")
+    assert payload["safety"]["hold_active"] is True
+    assert payload["safety"]["hold_reason"] == "review_probe"
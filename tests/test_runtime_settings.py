@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import os
+from decimal import Decimal
+
+from app.config import feature_flags as ff
+from app.config.runtime_settings import (
+    get_runtime_settings,
+    load_runtime_settings,
+    reload_runtime_settings,
+)
+from app.sor.select import ScoreCalculator
+
+
+def test_load_parses_and_falls_back_on_invalid_values() -> None:
+    settings = load_runtime_settings(
+        {
+            "FEATURE_SMART_ROUTER": " Yes ",
+            "SMART_ROUTER_LATENCY_BPS_PER_MS": "-3",
+            "SOR_MIN_SIZE_USD": "12.5",
+            "SOR_QUOTE_TTL_MS": "soon",
+            "SOR_FEES_BPS": '{"binance": 1.0}',
+            "SOR_VENUE_PREFS": "[1, 2]",
+            "SOR_EDGE_REF": "ASK",
+            "DEFAULT_PROFILE": "paper",
+            "FF_RISK_LIMITS": "0",
+        },
+        version=7,
+    )
+
+    assert settings.version == 7
+    assert settings.smart_router_enabled is True
+    assert settings.smart_router_latency_bps_per_ms == 0.0
+    assert settings.sor_min_size_usd == Decimal("12.5")
+    assert settings.sor_quote_ttl_ms == 200
+    assert dict(settings.sor_fees_bps) == {"binance": 1.0}
+    assert dict(settings.sor_venue_prefs) == {"binance": 1.0, "okx": 1.0, "bybit": 1.0}
+    assert settings.sor_edge_ref == "ask"
+    assert settings.md_watchdog is True  # unset FF_* follows the paper profile
+    assert settings.risk_limits is False
+
+
+def test_execution_path_settings_are_compiled() -> None:
+    settings = load_runtime_settings(
+        {
+            "LEG_DISPATCH_MODE": " Parallel ",
+            "LEG_DISPATCH_DEADLINE_SEC": "0.5",
+            "POST_TRADE_DEBOUNCE_MS": "-10",
+        }
+    )
+    assert settings.leg_dispatch_mode == "parallel"
+    assert settings.leg_dispatch_deadline_sec == 0.5
+    assert settings.post_trade_debounce_ms == 0.0
+
+    fallback = load_runtime_settings(
+        {
+            "LEG_DISPATCH_MODE": "burst",
+            "LEG_DISPATCH_DEADLINE_SEC": "0",
+            "POST_TRADE_DEBOUNCE_MS": "x",
+        }
+    )
+    assert fallback.leg_dispatch_mode == "sequential"
+    assert fallback.leg_dispatch_deadline_sec == 5.0
+    assert fallback.post_trade_debounce_ms == 250.0
+
+
+def test_snapshot_changes_only_on_reload(monkeypatch) -> None:
+    before = get_runtime_settings()
+    monkeypatch.setenv("SOR_MIN_EDGE_BPS", "9.5")
+    monkeypatch.setenv("FF_MD_WATCHDOG", "1")
+
+    assert get_runtime_settings() is before
+    assert ScoreCalculator().min_edge_bps == before.sor_min_edge_bps
+
+    after = reload_runtime_settings()
+    assert after.version == before.version + 1
+    assert ScoreCalculator().min_edge_bps == 9.5
+    assert ff.md_watchdog_on() is True
+
+
+def test_reload_endpoint_reports_changed_fields(client, monkeypatch) -> None:
+    version = client.get("/api/ui/runtime/settings").json()["version"]
+    monkeypatch.setitem(os.environ, "FEATURE_SMART_ROUTER", "1")
+    monkeypatch.setitem(os.environ, "SOR_FUNDING_BPS_1H", '{"okx": 0.5}')
+
+    response = client.post("/api/ui/runtime/settings/reload")
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["previous_version"] == version
+    assert payload["version"] == version + 1
+    assert payload["changed"] == ["smart_router_enabled", "sor_funding_bps_1h"]
+    assert payload["settings"]["sor_funding_bps_1h"] == {"okx": 0.5}
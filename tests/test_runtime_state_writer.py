@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+
+from app.runtime_state_store import RuntimeStateWriter
+
+
+def _read(path) -> dict:
+    return json.loads(path.read_text())
+
+
+def test_burst_is_coalesced_and_matches_on_disk(monkeypatch, tmp_path) -> None:
+    path = tmp_path / "runtime_state.json"
+    monkeypatch.setenv("RUNTIME_STATE_PATH", str(path))
+    writer = RuntimeStateWriter(interval=0.05)
+    writer.submit({"static": {"keep": True}})
+    writer.flush()
+
+    def worker(section: str) -> None:
+        for idx in range(200):
+            writer.submit({section: {"seq": idx}})
+
+    sections = [f"section_{idx}" for idx in range(4)]
+    threads = [threading.Thread(target=worker, args=(name,)) for name in sections]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    deadline = time.monotonic() + 5.0
+    while writer.pending(path) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    writer.flush()
+
+    payload = _read(path)
+    assert payload["static"] == {"keep": True}
+    for name in sections:
+        assert payload[name] == {"seq": 199}
+    assert writer.updates == 801
+    assert writer.writes < writer.updates // 10
+
+
+def test_critical_update_skips_the_coalescing_window(monkeypatch, tmp_path) -> None:
+    path = tmp_path / "runtime_state.json"
+    monkeypatch.setenv("RUNTIME_STATE_PATH", str(path))
+    writer = RuntimeStateWriter(interval=30.0)
+    writer.submit({"control": {"mode": "RUN"}})
+    writer.submit({"safety": {"hold_active": True}}, critical=True)
+
+    deadline = time.monotonic() + 5.0
+    while not path.exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    payload = _read(path)
+    assert payload["safety"] == {"hold_active": True}
+    assert payload["control"] == {"mode": "RUN"}
+
+
+def test_providers_and_replace(monkeypatch, tmp_path) -> None:
+    path = tmp_path / "runtime_state.json"
+    monkeypatch.setenv("RUNTIME_STATE_PATH", str(path))
+    writer = RuntimeStateWriter(interval=30.0)
+    writer.add_provider(lambda: {"summary": {"hold_active": False}})
+    writer.submit({"control": {"mode": "HOLD"}})
+    assert writer.pending(path) == {"control": {"mode": "HOLD"}}
+    assert not path.exists()
+
+    assert writer.flush() == 1
+    assert _read(path) == {"control": {"mode": "HOLD"}, "summary": {"hold_active": False}}
+
+    writer.submit({"control": {"mode": "RUN"}})
+    writer.replace({"fresh": 1})
+    assert writer.pending(path) == {}
+    assert _read(path) == {"fresh": 1, "summary": {"hold_active": False}}
+    assert not list(tmp_path.glob(".runtime_state.json.*"))
@@ -20,7 +20,7 @@ class StubMarketData:
 
 
 @pytest.fixture
-def base_setup(monkeypatch):
+def base_setup(monkeypatch, settings_env):
     state = types.SimpleNamespace(
         control=types.SimpleNamespace(
             post_only=False,
@@ -50,8 +50,8 @@ def base_setup(monkeypatch):
             ("okx-perp", "BTCUSDT"): {"bid": 100.1, "ask": 101.1, "ts": now - 0.2},
         }
     )
-    monkeypatch.setenv("FEATURE_SMART_ROUTER", "1")
-    monkeypatch.setenv("SMART_ROUTER_LATENCY_BPS_PER_MS", "0.01")
+    settings_env.setenv("FEATURE_SMART_ROUTER", "1")
+    settings_env.setenv("SMART_ROUTER_LATENCY_BPS_PER_MS", "0.01")
     monkeypatch.setattr("app.router.smart_router.get_state", lambda: state)
     monkeypatch.setattr("app.router.smart_router.get_market_data", lambda: market)
     monkeypatch.setattr("app.router.smart_router.get_liquidity_status", lambda: {})
@@ -80,13 +80,13 @@ def test_smart_router_prefers_liquidity_and_latency(base_setup, monkeypatch):
     assert scores["binance-um"]["score"] < scores["okx-perp"]["score"]
 
 
-def test_smart_router_penalises_latency_against_rebate(base_setup, monkeypatch):
+def test_smart_router_penalises_latency_against_rebate(base_setup, monkeypatch, settings_env):
     state, _ = base_setup
     state.config.data.derivatives.fees.manual = {
         "binance-um": {"maker_bps": 0.5, "taker_bps": 2.5, "vip_rebate_bps": 0.0},
         "okx-perp": {"maker_bps": 0.0, "taker_bps": -2.0, "vip_rebate_bps": 0.5},
     }
-    monkeypatch.setenv("SMART_ROUTER_LATENCY_BPS_PER_MS", "0.05")
+    settings_env.setenv("SMART_ROUTER_LATENCY_BPS_PER_MS", "0.05")
     router = SmartRouter()
     liquidity = {"binance-um": 2_000_000.0, "okx-perp": 2_000_000.0}
     rest = {"binance-um": 30.0, "okx-perp": 950.0}
@@ -107,13 +107,13 @@ def test_smart_router_penalises_latency_against_rebate(base_setup, monkeypatch):
     state.config.data.derivatives.fees.manual = {}
 
 
-def test_smart_router_tiebreaks_by_canonical_name(base_setup, monkeypatch):
+def test_smart_router_tiebreaks_by_canonical_name(base_setup, monkeypatch, settings_env):
     state, _ = base_setup
     state.config.data.derivatives.fees.manual = {
         "binance-um": {"maker_bps": 1.0, "taker_bps": 1.0, "vip_rebate_bps": 0.0},
         "okx-perp": {"maker_bps": 1.0, "taker_bps": 1.0, "vip_rebate_bps": 0.0},
     }
-    monkeypatch.setenv("SMART_ROUTER_LATENCY_BPS_PER_MS", "0.0")
+    settings_env.setenv("SMART_ROUTER_LATENCY_BPS_PER_MS", "0.0")
     router = SmartRouter()
     liquidity = {"binance-um": 1_000_000.0, "okx-perp": 1_000_000.0}
     rest = {"binance-um": 100.0, "okx-perp": 100.0}
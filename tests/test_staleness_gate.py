@@ -18,10 +18,10 @@ def reset_watchdog() -> None:
 
 
 @pytest.fixture
-def router(monkeypatch: pytest.MonkeyPatch) -> SmartRouter:
-    monkeypatch.setenv("DEFAULT_PROFILE", "paper")
-    monkeypatch.setenv("FF_RISK_LIMITS", "0")
-    monkeypatch.setenv("FF_PRETRADE_STRICT", "0")
+def router(monkeypatch: pytest.MonkeyPatch, settings_env) -> SmartRouter:
+    settings_env.setenv("DEFAULT_PROFILE", "paper")
+    settings_env.setenv("FF_RISK_LIMITS", "0")
+    settings_env.setenv("FF_PRETRADE_STRICT", "0")
     monkeypatch.setattr("app.router.smart_router.get_liquidity_status", lambda: {})
     state = SimpleNamespace(config=None)
     market = SimpleNamespace()
@@ -41,9 +41,9 @@ def _spy_on_register(router: SmartRouter, monkeypatch: pytest.MonkeyPatch) -> li
 
 
 def test_staleness_gate_blocks_and_recovers(
-    router: SmartRouter, monkeypatch: pytest.MonkeyPatch
+    router: SmartRouter, monkeypatch: pytest.MonkeyPatch, settings_env
 ) -> None:
-    monkeypatch.setenv("FF_MD_WATCHDOG", "1")
+    settings_env.setenv("FF_MD_WATCHDOG", "1")
     monkeypatch.setenv("STALE_P95_LIMIT_MS", "1500")
     monkeypatch.setenv("STALE_GATE_COOLDOWN_S", "10")
 
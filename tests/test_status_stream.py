@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import asyncio
+import copy
+import json
+from typing import Any, Dict, List
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.routers import ui_stream
+from app.services import status_stream
+from app.services.status_stream import StatusBroadcaster, diff_status
+
+
+def _apply(document: Dict[str, Any], ops: List[Dict[str, Any]]) -> Dict[str, Any]:
+    result = copy.deepcopy(document)
+    for op in ops:
+        parts = [part.replace("~1", "/").replace("~0", "~") for part in op["path"].split("/")[1:]]
+        target = result
+        for part in parts[:-1]:
+            target = target[part]
+        if op["op"] == "remove":
+            del target[parts[-1]]
+        else:
+            target[parts[-1]] = op["value"]
+    return result
+
+
+def test_diff_round_trips_nested_changes() -> None:
+    previous = {
+        "overall": "OK",
+        "components": [{"id": "a"}],
+        "slo": {"ui/p95": 10, "core": {"lag": 1, "stale": True}},
+        "gone": 1,
+    }
+    current = {
+        "overall": "WARN",
+        "components": [{"id": "a"}],
+        "slo": {"ui/p95": 12, "core": {"lag": 1}, "new~key": 0},
+        "flag": 1,
+    }
+
+    ops = diff_status(previous, current)
+    assert {"op": "replace", "path": "/slo/ui~1p95", "value": 12} in ops
+    assert {"op": "remove", "path": "/slo/core/stale"} in ops
+    assert {"op": "add", "path": "/slo/new~0key", "value": 0} in ops
+    assert not any(op["path"].startswith("/components") for op in ops)
+    assert _apply(previous, ops) == current
+    assert diff_status(current, current) == []
+    assert diff_status({"x": 1}, {"x": True}) == [{"op": "replace", "path": "/x", "value": True}]
+
+
+def test_overview_is_computed_once_per_tick_for_all_subscribers() -> None:
+    calls: List[int] = []
+
+    def source() -> Dict[str, Any]:
+        calls.append(1)
+        return {"overall": "OK", "tick": len(calls), "static": {"a": 1}}
+
+    async def scenario() -> None:
+        broadcaster = StatusBroadcaster(source=source, interval=0.01)
+        async with broadcaster.subscribe() as first, broadcaster.subscribe() as second:
+            async with broadcaster.subscribe(deltas=False) as full:
+                frames = [json.loads(await first.get()) for _ in range(4)]
+                for _ in range(4):
+                    await second.get()
+                plain = json.loads(await full.get())
+        assert broadcaster.subscriber_count == 0
+
+        assert frames[0]["type"] == "snapshot"
+        document = frames[0]["data"]
+        for frame in frames[1:]:
+            assert frame["type"] == "delta"
+            assert frame["seq"] == frames[0]["seq"] + frames.index(frame)
+            assert frame["ops"] == [{"op": "replace", "path": "/tick", "value": frame["seq"]}]
+            document = _apply(document, frame["ops"])
+        assert document["tick"] == frames[-1]["seq"]
+        assert "overall" in plain and "type" not in plain
+        # Three subscribers, one computation per tick.
+        assert len(calls) <= frames[-1]["seq"] + 2
+
+    asyncio.run(scenario())
+
+
+def test_slow_subscriber_is_resynced_with_a_snapshot() -> None:
+    state = {"overall": "OK", "tick": 0}
+
+    async def scenario() -> None:
+        broadcaster = StatusBroadcaster(source=lambda: dict(state), interval=3600, queue_max=2)
+        async with broadcaster.subscribe() as slow, broadcaster.subscribe() as fast:
+            await asyncio.sleep(0)
+            assert json.loads(await fast.get())["type"] == "snapshot"
+            for tick in range(1, 6):
+                state["tick"] = tick
+                broadcaster._publish(dict(state))
+                assert json.loads(await fast.get())["type"] == "delta"
+
+            backlog = [json.loads(slow.get_nowait()) for _ in range(slow.qsize())]
+            assert backlog[0]["type"] == "snapshot"
+            document = backlog[0]["data"]
+            for frame in backlog[1:]:
+                assert frame["type"] == "delta"
+                document = _apply(document, frame["ops"])
+            assert document == state
+            assert len(backlog) <= 2
+
+    asyncio.run(scenario())
+
+
+def test_ui_stream_sends_snapshot_then_deltas(monkeypatch) -> None:
+    monkeypatch.setenv("STATUS_STREAM_INTERVAL_SEC", "0.01")
+    ticks = iter(range(1_000_000))
+    real_overview = status_stream.get_status_overview
+    monkeypatch.setattr(
+        status_stream,
+        "get_status_overview",
+        lambda: {**real_overview(), "tick": next(ticks)},
+    )
+
+    app = FastAPI()
+    app.include_router(ui_stream.router, prefix="/api/ui")
+
+    with TestClient(app).websocket_connect("/api/ui/stream") as ws:
+        snapshot = json.loads(ws.receive_text())
+        assert snapshot["type"] == "snapshot"
+        assert "overall" in snapshot["data"] and "components" in snapshot["data"]
+        delta = json.loads(ws.receive_text())
+        assert delta["type"] == "delta"
+        assert delta["seq"] == snapshot["seq"] + 1
+        document = _apply(snapshot["data"], delta["ops"])
+        assert document["tick"] == snapshot["data"]["tick"] + 1
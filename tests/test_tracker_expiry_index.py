@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import random
+from decimal import Decimal
+
+from app.orders.state import OrderState
+from app.orders.tracker import OrderTracker
+from app.outbox.journal import OutboxJournal, OutboxRecord
+
+_NS = 1_000_000_000
+
+
+def _register(tracker: OrderTracker, coid: str, now_ns: int) -> None:
+    tracker.register_order(
+        coid, venue="binance", symbol="BTCUSDT", side="buy", qty=Decimal("1"), now_ns=now_ns
+    )
+
+
+def test_eviction_follows_last_update_including_external_changes() -> None:
+    tracker = OrderTracker(max_active=10_000, ttl_seconds=60, max_items=10_000)
+    rng = random.Random(7)
+    for idx in range(200):
+        _register(tracker, f"o-{idx}", idx * _NS)
+    for idx in rng.sample(range(200), 60):
+        tracker.apply_event(f"o-{idx}", "submit", None, (300 + idx) * _NS)
+    # Timestamps bumped directly on the entry (as the router does) still count.
+    touched = tracker.get("o-0")
+    touched.updated_ns = 1_000 * _NS
+    touched.updated_ts = 1_000.0
+
+    expected = sorted((item.updated_ts, item.created_ns, item.coid) for item in tracker.snapshot())
+    _, removed = tracker.cleanup(now=0.0, ttl_seconds=0, max_items=150)
+    assert [coid for coid, _ in removed] == [coid for _, _, coid in expected[:50]]
+
+    removed_ttl, _ = tracker.cleanup(now=400.0, ttl_seconds=60, max_items=10_000)
+    survivors = {item.coid for item in tracker.snapshot()}
+    assert all(last > 340.0 for last, _, coid in expected if coid in survivors)
+    assert {coid for coid, _ in removed_ttl} == {
+        coid for last, _, coid in expected[50:] if last < 340.0
+    }
+    assert "o-0" in survivors
+
+
+def test_capacity_and_terminal_purge_evict_oldest_terminal_first() -> None:
+    tracker = OrderTracker(max_active=5)
+    for idx in range(5):
+        _register(tracker, f"o-{idx}", idx * _NS)
+    tracker.mark_terminal("o-3", OrderState.CANCELED, 3.5)
+    tracker.mark_terminal("o-1", OrderState.FILLED, 1.5)
+    tracker.mark_terminal("o-4", OrderState.REJECTED, 4.5)
+
+    _register(tracker, "o-5", 5 * _NS)
+    assert tracker.get("o-1") is None
+    assert len(tracker) == 5
+
+    assert tracker.purge_terminated_older_than(1, now=5.0) == 1
+    assert tracker.get("o-3") is None
+    assert tracker.get("o-4") is not None
+    assert tracker.prune_aged(10 * _NS, 7) == 2
+    assert sorted(item.coid for item in tracker.snapshot()) == ["o-4", "o-5"]
+
+
+def _record(idx: int, ts: float, status: str = "PENDING") -> OutboxRecord:
+    return OutboxRecord(
+        ts=ts,
+        status=status,
+        intent_key=f"intent-{idx}",
+        order_id=f"order-{idx}",
+        strategy="alpha",
+        symbol="BTCUSDT",
+        venue="binance",
+        side="buy",
+        qty="1",
+        px="100",
+    )
+
+
+def test_journal_evicts_oldest_intents_and_maps_orders(tmp_path) -> None:
+    journal = OutboxJournal(str(tmp_path / "outbox.jsonl"), max_inmem=10)
+    order = list(range(11))
+    random.Random(3).shuffle(order)
+    for idx in order:
+        journal._update_index(_record(idx, 1_000.0 + idx))
+    journal._update_index(_record(2, 2_000.0, status="ACKED"))
+    journal._update_index(_record(20, 3_000.0))
+
+    kept = sorted(int(key.split("-")[1]) for key in journal._by_intent)
+    assert kept == [2, 5, 6, 7, 8, 9, 10, 20]
+    assert journal._intent_for_order("order-2") == "intent-2"
+    assert journal._intent_for_order("order-0") == ""
@@ -5,9 +5,9 @@ from fastapi.testclient import TestClient
 from app.services import runtime
 
 
-def test_get_ui_config_basic(client: TestClient, monkeypatch) -> None:
+def test_get_ui_config_basic(client: TestClient, monkeypatch, settings_env) -> None:
     monkeypatch.setenv("EXEC_PROFILE", "paper")
-    monkeypatch.setenv("FF_RISK_LIMITS", "1")
+    settings_env.setenv("FF_RISK_LIMITS", "1")
     runtime.reset_for_tests()
 
     response = client.get("/api/ui/config")
@@ -3,11 +3,11 @@ from fastapi.testclient import TestClient
 from app.services import runtime
 
 
-def test_ui_config_exposes_canary_flags(client: TestClient, monkeypatch) -> None:
+def test_ui_config_exposes_canary_flags(client: TestClient, monkeypatch, settings_env) -> None:
     monkeypatch.setenv("EXEC_PROFILE", "paper")
     monkeypatch.setenv("CANARY_MODE", "1")
     monkeypatch.setenv("CANARY_PROFILE_NAME", "paper-canary")
-    monkeypatch.setenv("FF_RISK_LIMITS", "1")
+    settings_env.setenv("FF_RISK_LIMITS", "1")
     runtime.reset_for_tests()
 
     response = client.get("/api/ui/config")
@@ -580,8 +580,8 @@ def test_ui_events_endpoint_pagination(client):
     assert len(next_page["items"]) <= 2
 
 
-def test_router_preview_endpoint(monkeypatch, client):
-    monkeypatch.setenv("FEATURE_SMART_ROUTER", "1")
+def test_router_preview_endpoint(monkeypatch, client, settings_env):
+    settings_env.setenv("FEATURE_SMART_ROUTER", "1")
 
     class DummyRouter:
         def available_venues(self):
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.market.orderbook.book_store import OrderBookStore
+from app.services import runtime
+from app.services.market_ws import get_orderbook_store, reset_for_tests as reset_store
+from services import opportunity_scanner
+from services.opportunity_scanner import OpportunityScanner
+from services.universe_scanner import ScanVenue, book_symbol, load_quote_matrix, rank_edges
+
+
+def _seed(store: OrderBookStore, venue: str, symbol: str, bid: float, ask: float) -> None:
+    store.apply_snapshot(
+        venue=venue,
+        symbol=book_symbol(venue, symbol),
+        bids=[(bid, 1.0)],
+        asks=[(ask, 1.0)],
+        last_seq=1,
+    )
+
+
+def test_rank_edges_orders_by_fee_and_funding_adjusted_edge() -> None:
+    store = OrderBookStore()
+    _seed(store, "binance", "BTCUSDT", 100.0, 100.1)
+    _seed(store, "okx", "BTCUSDT", 100.5, 100.6)
+    _seed(store, "binance", "ETHUSDT", 10.0, 10.01)
+    _seed(store, "okx", "ETHUSDT", 10.02, 10.03)
+    venues = [ScanVenue("binance", 2.0), ScanVenue("okx", 3.0)]
+
+    matrix = load_quote_matrix(
+        store,
+        ["BTCUSDT", "ETHUSDT", "SOLUSDT"],
+        venues,
+        funding_rates={("okx", "ETHUSDT"): 0.001},
+    )
+    assert matrix.asks[1][0] == 100.6  # okx book keyed as BTC-USDT-SWAP
+    assert matrix.bids[0][2] == 0.0  # missing quotes are zero-filled
+
+    ranked = rank_edges(matrix, funding_horizon=1.0, min_edge_bps=0.0)
+    assert [(item["symbol"], item["long_venue"], item["short_venue"]) for item in ranked] == [
+        ("BTCUSDT", "binance", "okx"),
+        ("ETHUSDT", "binance", "okx"),
+    ]
+    btc = ranked[0]
+    assert btc["spread_bps"] == pytest.approx((100.5 - 100.1) / 100.1 * 10_000)
+    assert btc["edge_bps"] == pytest.approx(btc["spread_bps"] - 5.0)
+    eth = ranked[1]
+    assert eth["funding_bps"] == pytest.approx(10.0)
+    assert eth["edge_bps"] == pytest.approx(eth["spread_bps"] - 5.0 + 10.0)
+
+
+def test_universe_scan_publishes_ranked_candidates(monkeypatch: pytest.MonkeyPatch) -> None:
+    reset_store()
+    store = get_orderbook_store()
+    _seed(store, "binance", "BTCUSDT", 100.0, 100.1)
+    _seed(store, "okx", "BTCUSDT", 101.0, 101.1)
+    _seed(store, "binance", "ETHUSDT", 10.0, 10.01)
+    _seed(store, "okx", "ETHUSDT", 9.0, 9.01)
+    monkeypatch.setattr(
+        opportunity_scanner.UniverseManager,
+        "allowed_pairs",
+        lambda self: {"BTCUSDT", "ETHUSDT"},
+    )
+    monkeypatch.setenv("SCAN_UNIVERSE_VENUES", "binance,okx")
+
+    scanner = OpportunityScanner(interval=1.0, mode="universe")
+    result = asyncio.run(scanner.scan_once())
+
+    candidates = result["candidates"]
+    assert [(c["symbol"], c["long_venue"], c["short_venue"]) for c in candidates[:2]] == [
+        ("ETHUSDT", "okx", "binance"),
+        ("BTCUSDT", "binance", "okx"),
+    ]
+    assert scanner.last_candidates == candidates
+    assert result["candidate"] is candidates[0]
+    published = runtime.get_state().last_opportunity.opportunity
+    assert published is not None and published["symbol"] == "ETHUSDT"
+    assert runtime.get_last_opportunity_candidates() == candidates
+    reset_store()
+
+
+def test_ranked_candidates_are_exposed_on_the_opportunity_endpoint(
+    client, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    reset_store()
+    store = get_orderbook_store()
+    _seed(store, "binance", "BTCUSDT", 100.0, 100.1)
+    _seed(store, "okx", "BTCUSDT", 101.0, 101.1)
+    _seed(store, "binance", "ETHUSDT", 10.0, 10.01)
+    _seed(store, "okx", "ETHUSDT", 9.0, 9.01)
+    monkeypatch.setattr(
+        opportunity_scanner.UniverseManager,
+        "allowed_pairs",
+        lambda self: {"BTCUSDT", "ETHUSDT"},
+    )
+    monkeypatch.setenv("SCAN_UNIVERSE_VENUES", "binance,okx")
+    result = asyncio.run(OpportunityScanner(interval=1.0, mode="universe").scan_once())
+
+    # Later status updates (e.g. a risk block) keep the ranked list.
+    runtime.set_last_opportunity_state(None, "blocked_by_risk")
+    payload = client.get("/api/arb/opportunity").json()
+
+    assert payload["status"] == "blocked_by_risk"
+    assert [c["symbol"] for c in payload["candidates"]] == [
+        c["symbol"] for c in result["candidates"]
+    ]
+    assert payload["candidates"][0]["long_venue"] == "okx"
+    reset_store()
+
+
+def test_rank_universe_skips_symbols_without_books(monkeypatch: pytest.MonkeyPatch) -> None:
+    reset_store()
+    store = get_orderbook_store()
+    _seed(store, "binance", "BTCUSDT", 100.0, 100.1)
+    _seed(store, "okx", "BTCUSDT", 100.05, 100.2)
+    monkeypatch.setenv("SCAN_UNIVERSE_VENUES", "binance,okx")
+
+    scanner = OpportunityScanner(interval=1.0, mode="universe")
+    ranked = scanner.rank_universe(
+        ["BTCUSDT", "NOBOOKUSDT"], [ScanVenue("binance", 2.0), ScanVenue("okx", 3.0)]
+    )
+
+    assert {item["symbol"] for item in ranked} == {"BTCUSDT"}
+    assert all(item["edge_bps"] < 0 for item in ranked)  # unprofitable, still ranked
+    reset_store()
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.metrics.transport import RATE_LIMIT_SHED_TOTAL
+from app.net import (
+    HttpTransport,
+    Lane,
+    LanePolicy,
+    RateLimitScheduler,
+    RateLimitShed,
+    VenuePoolConfig,
+    VenueRateLimiter,
+    VenueRateProfile,
+    request_lane,
+)
+from app.net.ratelimit import BINANCE_FUTURES_PROFILE, OKX_PROFILE, BucketSpec, profile_key
+
+
+def _tiny_profile(capacity: float = 4.0, interval: float = 0.2) -> VenueRateProfile:
+    return VenueRateProfile(
+        name="tiny",
+        buckets={"default": BucketSpec(capacity=capacity, interval=interval)},
+        usage_headers={"x-used": "default"},
+    )
+
+
+_NO_SHED = {lane: LanePolicy() for lane in Lane}
+
+
+def test_binance_profile_weights_and_lanes() -> None:
+    order = BINANCE_FUTURES_PROFILE.classify("POST", "/fapi/v1/order", {"symbol": "BTCUSDT"})
+    cancel = BINANCE_FUTURES_PROFILE.classify("DELETE", "/fapi/v1/order", {"symbol": "BTCUSDT"})
+    scoped = BINANCE_FUTURES_PROFILE.classify("GET", "/fapi/v1/openOrders", {"symbol": "BTCUSDT"})
+    unscoped = BINANCE_FUTURES_PROFILE.classify("GET", "/fapi/v1/openOrders", {})
+    stats = BINANCE_FUTURES_PROFILE.classify("GET", "/fapi/v1/ticker/24hr", None)
+
+    assert (order.lane, order.weight) == (Lane.ORDERS, 1.0)
+    assert cancel.lane is Lane.CANCELS
+    assert (scoped.lane, scoped.weight) == (Lane.POSITIONS, 1.0)
+    assert unscoped.weight == 40.0
+    assert (stats.lane, stats.weight) == (Lane.ANALYTICS, 40.0)
+    assert OKX_PROFILE.classify("POST", "/api/v5/trade/order").bucket == "trade.order"
+    assert profile_key("binance-um") == "binance"
+    assert profile_key("okx_perp") == "okx"
+
+
+def test_waiters_are_served_by_lane_priority() -> None:
+    limiter = VenueRateLimiter(_tiny_profile(), lane_policies=_NO_SHED)
+    served: list[Lane] = []
+
+    async def call(lane: Lane) -> None:
+        await limiter.acquire("GET", "/x", lane=lane, weight=1.0)
+        served.append(lane)
+
+    async def run() -> None:
+        await limiter.acquire("GET", "/x", lane=Lane.ORDERS, weight=4.0)
+        tasks = [asyncio.create_task(call(Lane.ANALYTICS)) for _ in range(2)]
+        await asyncio.sleep(0)
+        tasks += [asyncio.create_task(call(Lane.ORDERS)) for _ in range(2)]
+        await asyncio.gather(*tasks)
+
+    asyncio.run(run())
+    assert served == [Lane.ORDERS, Lane.ORDERS, Lane.ANALYTICS, Lane.ANALYTICS]
+
+
+def test_low_priority_work_is_shed_before_spending_budget() -> None:
+    policies = {Lane.ANALYTICS: LanePolicy(max_wait=0.01, reserve=0.5)}
+    limiter = VenueRateLimiter(_tiny_profile(), lane_policies=policies)
+    before = RATE_LIMIT_SHED_TOTAL.labels(
+        venue="tiny", lane="analytics", reason="budget"
+    )._value.get()
+
+    async def run() -> None:
+        await limiter.acquire("GET", "/x", lane=Lane.ANALYTICS, weight=2.0)
+        # The remaining half of the bucket is reserved for higher lanes.
+        with pytest.raises(RateLimitShed):
+            await limiter.acquire("GET", "/x", lane=Lane.ANALYTICS, weight=1.0)
+        await limiter.acquire("POST", "/x", lane=Lane.ORDERS, weight=2.0)
+
+    asyncio.run(run())
+    after = RATE_LIMIT_SHED_TOTAL.labels(
+        venue="tiny", lane="analytics", reason="budget"
+    )._value.get()
+    assert after == before + 1
+
+
+def test_server_usage_and_429_resync_the_bucket() -> None:
+    now = [100.0]
+    limiter = VenueRateLimiter(_tiny_profile(capacity=10.0, interval=10.0), clock=lambda: now[0])
+
+    limiter.observe(200, {"x-used": "7"}, "default")
+    assert limiter.stats()["buckets"]["default"]["tokens"] == pytest.approx(3.0)
+
+    limiter.observe(429, {"retry-after": "5"}, "default")
+    bucket = limiter.stats()["buckets"]["default"]
+    assert bucket["tokens"] == 0.0
+    assert bucket["blocked_for"] == pytest.approx(5.0)
+
+
+def test_transport_schedules_requests_and_honours_request_lane() -> None:
+    seen: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.path)
+        return httpx.Response(200, json={}, headers={"x-used": "3"})
+
+    def factory(venue: str, config: VenuePoolConfig) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    scheduler = RateLimitScheduler(
+        {"tiny": _tiny_profile(interval=60.0)},
+        lane_policies={Lane.ANALYTICS: LanePolicy(max_wait=0.0, reserve=0.0)},
+    )
+    transport = HttpTransport(client_factory=factory, rate_limits=scheduler)
+    try:
+        transport.request("tiny", "POST", "https://tiny.test/order")
+        assert transport.rate_limit_stats()["tiny"]["buckets"]["default"]["tokens"] < 1.01
+        with request_lane(Lane.ANALYTICS):
+            with pytest.raises(RateLimitShed):
+                transport.request("tiny", "GET", "https://tiny.test/stats", weight=2.0)
+        assert seen == ["/order"]
+    finally:
+        transport.close()
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+import pytest
+
+from app.exchanges.binance_native import BinanceOrderBookStream, build_binance_stream
+from app.exchanges.bybit_native import build_bybit_stream
+from app.exchanges.okx_native import build_okx_stream
+from app.market.orderbook.book_store import DiffEvent, OrderBookStore
+from app.market.streams.base_ws import BackoffPolicy, HeartbeatMonitor, WsConnector
+from app.market.streams.resync import shared_resync_executor
+from app.metrics import market_ws as ws_metrics
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics() -> None:
+    ws_metrics.reset_for_tests()
+
+
+def _connector() -> WsConnector:
+    return WsConnector(
+        venue="binance",
+        heartbeat=HeartbeatMonitor(timeout=0.0),
+        backoff=BackoffPolicy(jitter=lambda a, b: a),
+        reconnect=lambda reason: None,
+    )
+
+
+def _diff(symbol: str, seq: int, bid: float) -> DiffEvent:
+    return {
+        "symbol": symbol,
+        "bids": [(bid, 1.0)],
+        "asks": [],
+        "seq_from": seq,
+        "seq_to": seq,
+        "ts_ms": 1000 + seq,
+    }
+
+
+class _BlockingFetcher:
+    def __init__(self, snapshots: Dict[str, List[Dict[str, object]]]) -> None:
+        self.snapshots = snapshots
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.calls: List[str] = []
+
+    def __call__(self, symbol: str) -> Dict[str, object]:
+        self.calls.append(symbol)
+        self.started.set()
+        assert self.release.wait(5.0)
+        return self.snapshots[symbol].pop(0)
+
+
+def _stream(fetcher: _BlockingFetcher, executor: ThreadPoolExecutor, **kwargs: object):
+    store = OrderBookStore()
+    stream = BinanceOrderBookStream(
+        venue="binance",
+        orderbook=store,
+        connector=_connector(),
+        snapshot_fetcher=fetcher,
+        resync_executor=executor,
+        **kwargs,
+    )
+    for symbol in ("BTCUSDT", "ETHUSDT"):
+        stream.handle_snapshot(
+            symbol, {"lastUpdateId": 10, "bids": [[100.0, 1.0]], "asks": [[101.0, 1.0]]}
+        )
+    return store, stream
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.005)
+
+
+def test_resync_runs_in_background_and_other_symbols_keep_streaming() -> None:
+    fetcher = _BlockingFetcher(
+        {"BTCUSDT": [{"lastUpdateId": 20, "bids": [[90.0, 1.0]], "asks": [[91.0, 1.0]]}]}
+    )
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        store, stream = _stream(fetcher, executor)
+
+        stream.handle_diff(_diff("BTCUSDT", 15, 95.0))  # gap -> background resync
+        assert fetcher.started.wait(5.0)
+        assert stream.is_resyncing("BTCUSDT")
+        stream._resync("BTCUSDT", reason="duplicate")  # single-flight: no second fetch
+
+        stream.handle_diff(_diff("BTCUSDT", 21, 92.0))
+        stream.handle_diff(_diff("BTCUSDT", 22, 93.0))
+        stream.handle_diff(_diff("ETHUSDT", 11, 100.5))
+        assert store.get_top_snapshot("binance", "ETHUSDT").bid == 100.5
+        assert store.get_top_snapshot("binance", "BTCUSDT").seq == 10
+
+        fetcher.release.set()
+        _wait_for(lambda: not stream.is_resyncing("BTCUSDT"))
+    assert fetcher.calls == ["BTCUSDT"]
+    top = store.get_top_snapshot("binance", "BTCUSDT")
+    assert (top.seq, top.bid) == (22, 93.0)
+    high_water = ws_metrics.WS_PENDING_HIGH_WATER.labels(venue="binance", symbol="BTCUSDT")  # type: ignore[union-attr]
+    assert high_water._value.get() == 2
+
+
+def test_pending_overflow_forces_fresh_resync() -> None:
+    fetcher = _BlockingFetcher(
+        {
+            "BTCUSDT": [
+                {"lastUpdateId": 20, "bids": [[90.0, 1.0]], "asks": [[91.0, 1.0]]},
+                {"lastUpdateId": 30, "bids": [[80.0, 1.0]], "asks": [[81.0, 1.0]]},
+            ]
+        }
+    )
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        store, stream = _stream(fetcher, executor, max_pending=2)
+        stream.handle_diff(_diff("BTCUSDT", 15, 95.0))
+        assert fetcher.started.wait(5.0)
+        for seq in (21, 22, 23, 24):
+            stream.handle_diff(_diff("BTCUSDT", seq, 90.0 + seq / 100))
+        fetcher.release.set()
+        _wait_for(lambda: len(fetcher.calls) == 2 and not stream.is_resyncing("BTCUSDT"))
+    assert store.get_top_snapshot("binance", "BTCUSDT").seq == 30
+    dropped = ws_metrics.WS_PENDING_DROPPED_TOTAL.labels(venue="binance", symbol="BTCUSDT")  # type: ignore[union-attr]
+    assert dropped._value.get() == 2
+    assert store.status_snapshot()[0]["resyncs"] == 2
+
+
+def test_stream_builders_resync_on_the_shared_executor() -> None:
+    for build in (build_binance_stream, build_okx_stream, build_bybit_stream):
+        stream = build(
+            orderbook=OrderBookStore(),
+            connector=_connector(),
+            snapshot_fetcher=lambda symbol: {},
+        )
+        assert stream._resync_executor is shared_resync_executor()
+
+    fetcher = _BlockingFetcher(
+        {"BTCUSDT": [{"lastUpdateId": 20, "bids": [[90.0, 1.0]], "asks": [[91.0, 1.0]]}]}
+    )
+    store = OrderBookStore()
+    stream = build_binance_stream(orderbook=store, connector=_connector(), snapshot_fetcher=fetcher)
+    stream.handle_snapshot(
+        "BTCUSDT", {"lastUpdateId": 10, "bids": [[100.0, 1.0]], "asks": [[101.0, 1.0]]}
+    )
+    stream.handle_diff(_diff("BTCUSDT", 15, 95.0))  # returns while the fetch blocks
+    assert fetcher.started.wait(5.0)
+    assert stream.is_resyncing("BTCUSDT")
+    fetcher.release.set()
+    _wait_for(lambda: not stream.is_resyncing("BTCUSDT"))
+    assert store.get_top_snapshot("binance", "BTCUSDT").seq == 20
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import time
+from typing import List
+
+import pytest
+
+from app.exchanges.binance_native import BinanceOrderBookStream
+from app.exchanges.okx_native import OkxOrderBookStream
+from app.market.orderbook.book_store import DiffEvent, OrderBookStore
+from app.market.streams.base_ws import BackoffPolicy, HeartbeatMonitor, WsConnector
+from app.metrics import market_ws as ws_metrics
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics() -> None:
+    ws_metrics.reset_for_tests()
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _connector(venue: str, clock: _Clock) -> WsConnector:
+    return WsConnector(
+        venue=venue,
+        heartbeat=HeartbeatMonitor(timeout=0.0, clock=clock),
+        backoff=BackoffPolicy(jitter=lambda a, b: a, clock=clock),
+        reconnect=lambda reason: None,
+    )
+
+
+def _diff(symbol: str, seq: int, bids: List[tuple[float, float]], asks=None) -> DiffEvent:
+    return {
+        "symbol": symbol,
+        "bids": bids,
+        "asks": asks or [],
+        "seq_from": seq,
+        "seq_to": seq,
+        "ts_ms": 1000 + seq,
+    }
+
+
+def _batch_count(venue: str) -> float:
+    return ws_metrics.WS_DIFF_BATCH_SIZE.labels(venue=venue)._sum.get()  # type: ignore[union-attr]
+
+
+def test_coalesced_batch_applies_merged_levels_once() -> None:
+    clock = _Clock()
+    store = OrderBookStore(now=clock)
+    stream = BinanceOrderBookStream(
+        venue="binance",
+        orderbook=store,
+        connector=_connector("binance", clock),
+        snapshot_fetcher=lambda symbol: {},
+        clock=clock,
+        coalesce=True,
+        max_batch_size=3,
+        max_batch_latency_ms=1000.0,
+    )
+    stream.handle_snapshot(
+        "BTCUSDT", {"lastUpdateId": 10, "bids": [[100.0, 1.0]], "asks": [[101.0, 1.0]]}
+    )
+
+    stream.handle_diff(_diff("BTCUSDT", 11, [(100.5, 1.0)]))
+    stream.handle_diff(_diff("BTCUSDT", 12, [(100.5, 0.0), (100.2, 2.0)]))
+    record = store.get_or_create("binance", "BTCUSDT")
+    assert record.last_applied_seq == 10  # still queued
+
+    stream.handle_diff(_diff("BTCUSDT", 13, [(100.2, 3.0)]))
+    assert record.last_applied_seq == 13
+    assert record.bids.as_list() == [(100.2, 3.0), (100.0, 1.0)]
+    history = record.diff_history.snapshot()
+    assert len(history) == 1
+    assert (history[0]["seq_from"], history[0]["seq_to"]) == (11, 13)
+    assert _batch_count("binance") == 3
+    assert ws_metrics.WS_DIFF_COALESCED_TOTAL.labels(venue="binance")._value.get() == 2  # type: ignore[union-attr]
+
+
+def test_batch_flushes_on_latency_budget() -> None:
+    clock = _Clock()
+    store = OrderBookStore(now=clock)
+    stream = OkxOrderBookStream(
+        venue="okx",
+        orderbook=store,
+        connector=_connector("okx", clock),
+        snapshot_fetcher=lambda symbol: {},
+        clock=clock,
+        coalesce=True,
+        max_batch_latency_ms=5.0,
+    )
+    stream.handle_snapshot(
+        "ETH-USDT-SWAP", {"seq": 1, "bids": [[10.0, 1.0]], "asks": [[11.0, 1.0]]}
+    )
+    stream.handle_diff(_diff("ETH-USDT-SWAP", 2, [(10.5, 1.0)]))
+    stream.handle_diff(_diff("ETH-USDT-SWAP", 3, [(10.6, 1.0)]))
+    stream.flush_due()
+    assert store.get_top_snapshot("okx", "ETH-USDT-SWAP").seq == 1
+
+    clock.now = 0.01
+    stream.flush_due()
+    top = store.get_top_snapshot("okx", "ETH-USDT-SWAP")
+    assert (top.seq, top.bid) == (3, 10.6)
+    assert store.status_snapshot()[0]["resyncs"] == 0
+
+
+def test_gap_inside_batch_applies_prefix_then_resyncs() -> None:
+    clock = _Clock()
+    store = OrderBookStore(now=clock)
+    snapshots = [{"lastUpdateId": 50, "bids": [[99.0, 1.0]], "asks": [[99.5, 1.0]]}]
+    stream = BinanceOrderBookStream(
+        venue="binance",
+        orderbook=store,
+        connector=_connector("binance", clock),
+        snapshot_fetcher=lambda symbol: snapshots[0],
+        clock=clock,
+        coalesce=True,
+        max_batch_size=100,
+    )
+    stream.handle_snapshot(
+        "BTCUSDT", {"lastUpdateId": 10, "bids": [[100.0, 1.0]], "asks": [[101.0, 1.0]]}
+    )
+    stream.handle_diff(_diff("BTCUSDT", 11, [(100.5, 1.0)]))
+    stream.handle_diff(_diff("BTCUSDT", 13, [(100.7, 1.0)]))
+    stream.handle_diff(_diff("BTCUSDT", 51, [(99.2, 1.0)]))
+    stream.flush()
+
+    status = store.status_snapshot()[0]
+    assert status["resyncs"] == 1
+    assert status["last_seq"] == 51
+    assert store.get_top_snapshot("binance", "BTCUSDT").bid == 99.2
+    gaps = ws_metrics.WS_GAP_DETECTED_TOTAL.labels(venue="binance", symbol="BTCUSDT")  # type: ignore[union-attr]
+    assert gaps._value.get() == 1
+
+
+def test_lone_diff_flushes_on_deadline_without_more_traffic() -> None:
+    clock = _Clock()
+    store = OrderBookStore(now=clock)
+    stream = OkxOrderBookStream(
+        venue="okx",
+        orderbook=store,
+        connector=_connector("okx", clock),
+        snapshot_fetcher=lambda symbol: {},
+        coalesce=True,
+        max_batch_latency_ms=5.0,
+    )
+    stream.handle_snapshot(
+        "ETH-USDT-SWAP", {"seq": 1, "bids": [[10.0, 1.0]], "asks": [[11.0, 1.0]]}
+    )
+    stream.handle_diff(_diff("ETH-USDT-SWAP", 2, [(10.5, 1.0)]))
+
+    deadline = time.monotonic() + 2.0
+    while store.get_top_snapshot("okx", "ETH-USDT-SWAP").seq != 2:
+        assert time.monotonic() < deadline, "queued diff was never flushed"
+        time.sleep(0.005)
+    assert store.get_top_snapshot("okx", "ETH-USDT-SWAP").bid == 10.5
+
+
+def test_every_diff_in_batch_must_continue_the_previous_one() -> None:
+    clock = _Clock()
+    store = OrderBookStore(now=clock)
+    snapshots = [{"seq": 40, "bids": [[9.0, 1.0]], "asks": [[9.5, 1.0]]}]
+    stream = OkxOrderBookStream(
+        venue="okx",
+        orderbook=store,
+        connector=_connector("okx", clock),
+        snapshot_fetcher=lambda symbol: snapshots[0],
+        clock=clock,
+        coalesce=True,
+        max_batch_size=100,
+        max_batch_latency_ms=1000.0,
+    )
+    stream.handle_snapshot(
+        "ETH-USDT-SWAP", {"seq": 1, "bids": [[10.0, 1.0]], "asks": [[11.0, 1.0]]}
+    )
+    stream.handle_diff(_diff("ETH-USDT-SWAP", 2, [(10.5, 1.0)]))
+    stream.handle_diff(_diff("ETH-USDT-SWAP", 3, [(10.6, 1.0)]))
+    stream.handle_diff(_diff("ETH-USDT-SWAP", 3, [(10.9, 1.0)]))
+    stream.flush()
+
+    status = store.status_snapshot()[0]
+    assert status["resyncs"] == 1
+    assert status["last_seq"] == 40
+    assert store.get_top_snapshot("okx", "ETH-USDT-SWAP").bid == 9.0